@@ -34,6 +34,7 @@ import os
 import posixpath
 import shutil
 import sys
+import tempfile
 
 
 PY3K = sys.version_info >= (3, 0)
@@ -195,6 +196,32 @@ def fromurl(url):
 
 # --- Utility functions ---
 # [ ] reuse more universal pathsplit()
+def _splitlines(data):
+  """ Split `data` in lines, keeping the lineends (only "\\n" ends a line,
+      like when a file is read line by line in binary mode)
+  """
+  lines = [line + b"\n" for line in data.split(b"\n")]
+  lines[-1] = lines[-1][:-1]
+  if not lines[-1]:
+    lines.pop()
+  return lines
+
+def _lineend(lines):
+  """ Return the lineend of `lines` if all the lines have the same one
+      (ignoring the last line if it has none), None otherwise
+  """
+  ends = set()
+  for line in lines:
+    if line.endswith(b"\r\n"):
+      ends.add(b"\r\n")
+    elif line.endswith(b"\n"):
+      ends.add(b"\n")
+    elif line.endswith(b"\r"):
+      ends.add(b"\r")
+  if len(ends) == 1:
+    return ends.pop()
+  return None
+
 def pathstrip(path, n):
   """ Strip n leading components from the given path """
   pathlist = [path]
@@ -868,91 +895,25 @@ class PatchSet(object):
       # [ ] check absolute paths security here
       debug("processing %d/%d:\t %s" % (i+1, total, filename))
 
-      # validate before patching
+      # the file is read once and patched in memory, then replaced atomically
       f2fp = open(filename, 'rb')
-      hunkno = 0
-      hunk = p.hunks[hunkno]
-      hunkfind = []
-      hunkreplace = []
-      validhunks = 0
-      canpatch = False
-      for lineno, line in enumerate(f2fp):
-        if lineno+1 < hunk.startsrc:
-          continue
-        elif lineno+1 == hunk.startsrc:
-          hunkfind = [x[1:].rstrip(b"\r\n") for x in hunk.text if x[0] in b" -"]
-          hunkreplace = [x[1:].rstrip(b"\r\n") for x in hunk.text if x[0] in b" +"]
-          #pprint(hunkreplace)
-          hunklineno = 0
-
-          # todo \ No newline at end of file
-
-        # check hunks in source file
-        if lineno+1 < hunk.startsrc+len(hunkfind)-1:
-          if line.rstrip(b"\r\n") == hunkfind[hunklineno]:
-            hunklineno+=1
-          else:
-            info("file %d/%d:\t %s" % (i+1, total, filename))
-            info(" hunk no.%d doesn't match source file at line %d" % (hunkno+1, lineno+1))
-            info("  expected: %s" % hunkfind[hunklineno])
-            info("  actual  : %s" % line.rstrip(b"\r\n"))
-            # not counting this as error, because file may already be patched.
-            # check if file is already patched is done after the number of
-            # invalid hunks if found
-            # TODO: check hunks against source/target file in one pass
-            #   API - check(stream, srchunks, tgthunks)
-            #           return tuple (srcerrs, tgterrs)
-
-            # continue to check other hunks for completeness
-            hunkno += 1
-            if hunkno < len(p.hunks):
-              hunk = p.hunks[hunkno]
-              continue
-            else:
-              break
-
-        # check if processed line is the last line
-        if lineno+1 == hunk.startsrc+len(hunkfind)-1:
-          debug(" hunk no.%d for file %s  -- is ready to be patched" % (hunkno+1, filename))
-          hunkno+=1
-          validhunks+=1
-          if hunkno < len(p.hunks):
-            hunk = p.hunks[hunkno]
-          else:
-            if validhunks == len(p.hunks):
-              # patch file
-              canpatch = True
-              break
-      else:
-        if hunkno < len(p.hunks):
-          warning("premature end of source file %s at hunk %d" % (filename, hunkno+1))
-          errors += 1
-
+      data = f2fp.read()
       f2fp.close()
 
-      if validhunks < len(p.hunks):
-        if self._match_file_hunks(filename, p.hunks):
+      patched = self.patch_data(p, data)
+      if patched is None:
+        if self.data_is_patched(p, data):
           warning("already patched  %s" % filename)
         else:
           warning("source file is different - %s" % filename)
           errors += 1
-      if canpatch:
-        backupname = filename+b".orig"
-        if exists(backupname):
-          warning("can't backup original file to %s - aborting" % backupname)
-        else:
-          import shutil
-          shutil.move(filename, backupname)
-          if self.write_hunks(backupname, filename, p.hunks):
-            info("successfully patched %d/%d:\t %s" % (i+1, total, filename))
-            os.unlink(backupname)
-          else:
-            errors += 1
-            warning("error patching file %s" % filename)
-            shutil.copy(filename, filename+".invalid")
-            warning("invalid version is saved to %s" % filename+".invalid")
-            # todo: proper rejects
-            shutil.move(backupname, filename)
+        continue
+
+      if self._write_atomic(filename, patched):
+        info("successfully patched %d/%d:\t %s" % (i+1, total, filename))
+      else:
+        errors += 1
+        warning("error patching file %s" % filename)
 
     if root:
       os.chdir(prevdir)
@@ -961,6 +922,88 @@ class PatchSet(object):
     return (errors == 0)
 
 
+  def patch_data(self, p, data):
+    """ Return `data`, the content of the source file of `p` (an item of
+        this patch set), patched with the hunks of `p`, or None if a hunk
+        doesn't match the source.
+
+        All the hunks are matched against the array of lines of `data`
+        before anything is patched. Lineends of the patched lines are
+        converted like in patch_stream.
+    """
+    lines = _splitlines(data)
+    newline = _lineend(lines)
+
+    out = []
+    srcpos = 0  # index of the next line of the source to copy
+    for hno, h in enumerate(p.hunks):
+      start = max(h.startsrc - 1, 0)
+      hunkfind = [x[1:].rstrip(b"\r\n") for x in h.text if x[0:1] in (b" ", b"-")]
+      if start < srcpos or len(lines) < start + len(hunkfind):
+        debug("hunk no.%d is out of the source file" % (hno+1))
+        return None
+      for k, line in enumerate(hunkfind):
+        if lines[start+k].rstrip(b"\r\n") != line:
+          info(" hunk no.%d doesn't match source file at line %d" % (hno+1, start+k+1))
+          info("  expected: %s" % line)
+          info("  actual  : %s" % lines[start+k].rstrip(b"\r\n"))
+          return None
+      out.extend(lines[srcpos:start])
+      for hline in h.text:
+        if hline[0:1] in (b" ", b"+"):
+          if newline:
+            out.append(hline[1:].rstrip(b"\r\n") + newline)
+          else: # newlines are mixed
+            out.append(hline[1:])
+      srcpos = start + len(hunkfind)
+    out.extend(lines[srcpos:])
+    return b"".join(out)
+
+
+  def data_is_patched(self, p, data):
+    """ Check that `data` (content of a file) is already patched with the
+        hunks of `p` (an item of this patch set)
+    """
+    lines = _splitlines(data)
+    for hno, h in enumerate(p.hunks):
+      start = max(h.starttgt - 1, 0)
+      hunkrepl = [x[1:].rstrip(b"\r\n") for x in h.text if x[0:1] in (b" ", b"+")]
+      if len(lines) < start + len(hunkrepl):
+        debug("check failed - premature eof on hunk: %d" % (hno+1))
+        return False
+      for k, line in enumerate(hunkrepl):
+        if lines[start+k].rstrip(b"\r\n") != line:
+          debug("file is not patched - failed hunk: %d" % (hno+1))
+          return False
+    return True
+
+
+  def _write_atomic(self, filename, data):
+    """ Replace the content of `filename` by `data` (the file is written
+        under a temporary name in the same directory, then renamed).
+        Return True on success
+    """
+    if isinstance(filename, bytes):
+      dirname, prefix = os.path.dirname(filename) or b".", b"."
+    else:
+      dirname, prefix = os.path.dirname(filename) or ".", "."
+    fd, tmpname = tempfile.mkstemp(dir=dirname, prefix=prefix + os.path.basename(filename))
+    try:
+      tgt = os.fdopen(fd, "wb")
+      tgt.write(data)
+      tgt.close()
+      shutil.copymode(filename, tmpname)
+      if sys.platform == "win32": # rename does not replace existing files
+        os.unlink(filename)
+      os.rename(tmpname, filename)
+    except EnvironmentError as e:
+      warning("cannot write %s: %s" % (filename, e))
+      if exists(tmpname):
+        os.unlink(tmpname)
+      return False
+    return True
+
+
   def _reverse(self):
     """ reverse patch direction (this doesn't touch filenames) """
     for p in self.items:
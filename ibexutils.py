@@ -1,4 +1,4 @@
-import os, tarfile, functools, sys, shutil, copy
+import os, tarfile, functools, sys, shutil, copy, tempfile, threading
 
 from waflib import Logs, Errors, Utils, Build
 from waflib.Configure import conf, ConfigurationContext
@@ -16,6 +16,31 @@ class BenchmarksContext (Build.BuildContext):
     bench_results = {}
     bench_cmp = {}
     bench_errors = []
+    bench_profiles = {}
+
+# Stages of the profile-guided optimization (see the 'pgo' command in the main
+# wscript): each one builds the library with the flags of its stage (see
+# pgo_flags) and runs the benchmarks. The results are not shared between stages.
+class PgoBenchmarksMixin (object):
+    fun = "benchmarks"
+    def __init__ (self, **kw):
+        super (PgoBenchmarksMixin, self).__init__ (**kw)
+        self.bench_results = {}
+        self.bench_cmp = {}
+        self.bench_errors = []
+        self.bench_profiles = {}
+
+class PgoRefContext (PgoBenchmarksMixin, BenchmarksContext):
+    cmd = "pgo_ref"
+    pgo_stage = "off"
+
+class PgoTrainContext (PgoBenchmarksMixin, BenchmarksContext):
+    cmd = "pgo_train"
+    pgo_stage = "generate"
+
+class PgoOptimizeContext (PgoBenchmarksMixin, BenchmarksContext):
+    cmd = "pgo_optimize"
+    pgo_stage = "use"
 
 # not @Configure.conf because, the function is also called by 'options'
 def get_dirlist (node):
@@ -29,12 +54,16 @@ def setting_define (conf, key, val, key_format = "_IBEX_%s_", **kwargs):
     conf.setenv("")
 
 @conf
-def apply_all_relevant_patches (conf, name):
+def relevant_patches (conf, name):
     patch_ant_glob = "3rd/%s.all.all*patch" % name
     patch_ant_glob += " 3rd/%s.%s.all*patch" % (name, sys.platform)
     patch_ant_glob += " 3rd/%s.all.%s*patch" % (name, conf.env.CC_NAME)
     patch_ant_glob += " 3rd/%s.%s.%s*patch" % (name,sys.platform,conf.env.CC_NAME)
-    for p in conf.path.ant_glob (patch_ant_glob):
+    return conf.path.ant_glob (patch_ant_glob)
+
+@conf
+def apply_all_relevant_patches (conf, name):
+    for p in conf.relevant_patches (name):
         conf.apply_patch (p.abspath())
 
 
@@ -77,26 +106,74 @@ def apply_patch (conf, patch_abspath):
     if not p.apply (root = conf.bldnode.make_node ("3rd").abspath()):
         conf.fatal ("Cannot apply patch %s" % patch_abspath)
 
-@conf
-def extract_archive (conf, archive_path, name, destnode):
+# not @Configure.conf because, the function is also called by the builds of
+# third-party libraries in the background (see build_3rd_party).
+# The files of the archive modified by the patches (nodes of patch files) are
+# patched in memory when they are extracted, so that they are written only
+# once. Raise a WafError if a patch cannot be applied.
+def extract_archive_to (archive_path, name, destnode, patches = []):
     # path is the destination folder where the file will be extracted 
     path = os.path.join (destnode.abspath (), name)
 
-    conf.start_msg("Extracting %s" % os.path.basename(archive_path))
-
     if os.path.isdir (path): # if output directory already exists, remove it
         shutil.rmtree (path, ignore_errors = True)
 
+    # patched files, by name in the archive
+    targets = {}
+    patchsets = []
+    for p in patches:
+        ps = patch.fromfile (p.abspath ())
+        if not ps:
+            raise Errors.WafError ("Cannot parse patch %s" % p.abspath ())
+        patchsets.append ((p, ps))
+        for item in ps:
+            for f in [ item.source, item.target ]:
+                f = patch.tostr (f)
+                if f.startswith (("a/", "b/")) and not f in targets:
+                    f = f[2:] # see patch.PatchSet.findfile
+                targets.setdefault (f, []).append ((p, ps, item))
+
     # extract the sources
     os.makedirs (path)
 
     t = tarfile.open (archive_path)
-    t.extractall (destnode.abspath ())
+    members = t.getmembers ()
+    patched = [ m for m in members if m.isfile () and m.name in targets ]
+    t.extractall (destnode.abspath (),
+                  members = [ m for m in members if not m in patched ])
+    applied = set ()
+    for m in patched:
+        data = t.extractfile (m).read ()
+        for (p, ps, item) in targets[m.name]:
+            if item in applied:
+                continue
+            new = ps.patch_data (item, data)
+            if new is not None:
+                data = new
+            elif not ps.data_is_patched (item, data):
+                raise Errors.WafError ("Cannot apply patch %s to %s" % (p.abspath (), m.name))
+            applied.add (item)
+        dst = os.path.join (destnode.abspath (), m.name)
+        if not os.path.isdir (os.path.dirname (dst)):
+            os.makedirs (os.path.dirname (dst))
+        Utils.writef (dst, data, m = "wb")
+        os.chmod (dst, m.mode)
     t.close()
 
-    conf.end_msg("done")
+    # patches of files that are not in the archive (applied as usual)
+    for (p, ps) in patchsets:
+        if any (not item in applied for item in ps):
+            if not ps.apply (root = destnode.abspath ()):
+                raise Errors.WafError ("Cannot apply patch %s" % p.abspath ())
 
-    return path
+    return "done"
+
+@conf
+def extract_archive (conf, archive_path, name, destnode):
+    conf.start_msg("Extracting %s" % os.path.basename(archive_path))
+    extract_archive_to (archive_path, name, destnode)
+    conf.end_msg("done")
+    return os.path.join (destnode.abspath (), name)
 
 # convert path from windows format to format compatible with mingw.
 # Ex: C:\path/to/dir becomes /c/path/to/dir
@@ -137,78 +214,535 @@ def path_pc (conf, path):
     path = path.replace (conf.env.LIBDIR, "${libdir}")
     return escape_backslash_on_win32 (path)
 
+# Cache of the third-party libraries built by configure_3rd_party_with_autotools.
+# Each entry of the cache is a directory named after the key of the build (see
+# cache_3rd_key) containing the files installed by the build in 'include' and
+# 'lib', with the occurrences of the installation prefix replaced by
+# CACHE_3RD_PREFIX (so that an entry can be used by any build directory).
+CACHE_3RD_VERSION = 1
+CACHE_3RD_PREFIX = "@IBEX_3RD_PREFIX@"
+CACHE_3RD_SUBDIRS = [ "include", "lib" ]
+
+def options_3rd_party (opt):
+    if os.getenv ("IBEX_3RD_CACHE"):
+        default = os.getenv ("IBEX_3RD_CACHE")
+    else:
+        cache_home = os.getenv ("XDG_CACHE_HOME", os.path.join ("~", ".cache"))
+        default = os.path.join (cache_home, "ibex", "3rd")
+    opt.add_option ("--3rd-cache", action="store", dest="CACHE_3RD",
+            default = default,
+            help = "directory where the third-party libraries built during "
+                   "configure are cached [default: %default]")
+    opt.add_option ("--disable-3rd-cache", action="store_false",
+            dest="ENABLE_CACHE_3RD", default = True,
+            help = "always build the third-party libraries from the archives "
+                   "in 3rd/ (the cache is neither read nor updated)")
+    opt.add_option ("--disable-3rd-parallel", action="store_false",
+            dest="PARALLEL_3RD", default = True,
+            help = "build the third-party libraries one after the other, "
+                   "instead of building the independent ones concurrently")
+
+def cache_3rd_dir (conf):
+    if not getattr (conf.options, "ENABLE_CACHE_3RD", False):
+        return None
+    return os.path.abspath (os.path.expanduser (conf.options.CACHE_3RD))
+
+# Key of a build: everything that can change the installed files, i.e., the
+# archive, the patches, the compilers, the flags and the arguments of the build.
 @conf
-def configure_3rd_party_with_autotools (conf, archive_name,
-            without_configure=False, without_make_install=False, conf_args = "", cflags_args = ""):
-    name = archive_name_without_suffix (archive_name)
-    Logs.pprint ("BLUE", "Starting installation of %s"%name)
-    conf.to_log ((" Starting installation of %s " % name).center (80, "="))
-
-    archive_path = os.path.join (conf.path.abspath (), "3rd", archive_name)
-    destnode = conf.bldnode.make_node ("3rd")
-
-    # Install everything in build directory, in '3rd' subdirectory (the 'lib' and
-    # 'include' directory can be copied in conf.env.PREFIX when ./waf install is
-    # called, if needed)
-    incdir = destnode.find_or_declare ("include").abspath()
-    libdir = destnode.find_or_declare ("lib").abspath()
-
-    srcdir = conf.extract_archive (archive_path, name, destnode)
-
-    conf.find_program ("make")
-
-    # Apply patches 
-    conf.apply_all_relevant_patches (name)
-
-    # always build static library, even if ibex is built as a shared library.
-    conf_args += " --enable-static --disable-shared"
+def cache_3rd_key (conf, archive_path, patches, *args):
+    m = Utils.md5 (("%d" % CACHE_3RD_VERSION).encode ())
+    def update (s):
+        m.update (repr (s).encode ())
+    m.update (Utils.h_file (archive_path))
+    for p in patches:
+        update (p.name)
+        m.update (Utils.h_file (p.abspath ()))
+    for var in [ "CC", "CXX", "CC_VERSION", "CFLAGS_cshlib",
+                 "CXXFLAGS_cxxshlib", "ENABLE_SHARED" ]:
+        update (conf.env[var])
+    for var in [ "CC", "CXX", "CFLAGS", "CXXFLAGS", "CPPFLAGS", "LDFLAGS" ]:
+        update (os.getenv (var, ""))
+    update (sys.platform)
+    for a in args:
+        if hasattr (a, "__code__"): # function: use its code
+            update ((a.__code__.co_code, a.__code__.co_consts))
+        else:
+            update (a)
+    return Utils.to_hex (m.digest ())
+
+# Files in the 'include' and 'lib' directories of destnode, with their size and
+# modification and change times (a file copied with its modification time, like
+# the headers of soplex, is still detected as installed by its change time)
+def cache_3rd_snapshot (destnode):
+    files = {}
+    for d in CACHE_3RD_SUBDIRS:
+        top = os.path.join (destnode.abspath (), d)
+        for dirpath, dirnames, filenames in os.walk (top):
+            for f in filenames:
+                path = os.path.join (dirpath, f)
+                st = os.lstat (path)
+                files[os.path.relpath (path, destnode.abspath ())] = (st.st_size, st.st_mtime, st.st_ctime)
+    return files
+
+# Copy a file, replacing the occurrences of the string 'old' by 'new' in text
+# files (files without NUL character)
+def cache_3rd_copy (src, dst, old, new):
+    if not os.path.isdir (os.path.dirname (dst)):
+        os.makedirs (os.path.dirname (dst))
+    if os.path.islink (src):
+        if os.path.lexists (dst):
+            os.remove (dst)
+        os.symlink (os.readlink (src), dst)
+        return
+    data = Utils.readf (src, m = "rb")
+    if not b"\0" in data and old.encode () in data:
+        Utils.writef (dst, data.replace (old.encode (), new.encode ()), m = "wb")
+        shutil.copystat (src, dst)
+    else:
+        shutil.copy2 (src, dst)
 
-    if conf.env.ENABLE_SHARED:
+# Store the files installed by a build (paths relative to destnode) in the cache
+@conf
+def cache_3rd_store (conf, key, destnode, installed):
+    cachedir = cache_3rd_dir (conf)
+    entry = os.path.join (cachedir, key)
+    if os.path.isdir (entry):
+        return
+    tmp = None
+    try:
+        if not os.path.isdir (cachedir):
+            os.makedirs (cachedir)
+        # the entry is written in a temporary directory, then renamed, so that
+        # an incomplete entry is never used
+        tmp = tempfile.mkdtemp (prefix = key + ".", dir = cachedir)
+        for f in installed:
+            cache_3rd_copy (os.path.join (destnode.abspath (), f),
+                    os.path.join (tmp, f), destnode.abspath (), CACHE_3RD_PREFIX)
+        os.rename (tmp, entry)
+        conf.to_log ("Stored %d file(s) in the cache: %s" % (len (installed), entry))
+    except EnvironmentError as e:
+        Logs.warn ("Cannot store the build in the cache (%s)" % e)
+        if tmp:
+            shutil.rmtree (tmp, ignore_errors = True)
+
+# Install the files of a cache entry in destnode. Return False if the key is
+# not in the cache.
+@conf
+def cache_3rd_restore (conf, key, destnode):
+    cachedir = cache_3rd_dir (conf)
+    if cachedir is None:
+        return False
+    entry = os.path.join (cachedir, key)
+    if not os.path.isdir (entry):
+        return False
+    for dirpath, dirnames, filenames in os.walk (entry):
+        for f in filenames:
+            path = os.path.join (dirpath, f)
+            dst = os.path.join (destnode.abspath (), os.path.relpath (path, entry))
+            cache_3rd_copy (path, dst, CACHE_3RD_PREFIX, destnode.abspath ())
+    return True
+
+# A build of a third-party library from an archive of the 3rd/ directory (see
+# configure_3rd_party_with_autotools). The build does not use the configuration
+# context, so that it can run in a background thread: the output of the
+# commands is written in a log file (3rd/<name>.log in the build directory) and
+# the messages are printed by wait_3rd_party.
+class build_3rd_party (object):
+    # The libraries are installed in the same directories: installations are
+    # serialised so that the files installed by each build are known (see
+    # cache_3rd_store).
+    install_lock = threading.Lock ()
+
+    # Number of builds running concurrently: the jobs given by -j are split
+    # between them (see make_jobs).
+    running = 0
+    running_lock = threading.Lock ()
+
+    def __init__ (self, conf, archive_name, without_configure, without_make_install,
+                  conf_args, cflags_args, install_fun, after):
+        self.args = (without_configure, without_make_install, conf_args,
+                     cflags_args, install_fun)
+        self.name = archive_name_without_suffix (archive_name)
+        self.archive_path = os.path.join (conf.path.abspath (), "3rd", archive_name)
+        self.destnode = conf.bldnode.make_node ("3rd")
+        self.destnode.mkdir ()
+        self.incdir = self.destnode.find_or_declare ("include").abspath()
+        self.libdir = self.destnode.find_or_declare ("lib").abspath()
+        self.srcdir = os.path.join (self.destnode.abspath (), self.name)
+        self.logfile = os.path.join (self.destnode.abspath (), self.name + ".log")
+        self.patches = conf.relevant_patches (self.name)
+        self.install_fun = install_fun
+        self.after = after
+        self.thread = None
+        self.messages = [] # (message, result) pairs, printed by wait_3rd_party
+        self.error = None
+        self.installed = []
+        self.from_cache = False
+        self.jobs = conf.options.jobs
+
+        if cache_3rd_dir (conf):
+            self.key = conf.cache_3rd_key (self.archive_path, self.patches,
+                                           *self.args)
+        else:
+            self.key = None
+
+        # always build static library, even if ibex is built as a shared library.
+        conf_args += " --enable-static --disable-shared"
+
+        self.env = dict (os.environ)
         cflags = os.getenv("CFLAGS", "")
         cxxflags = os.getenv("CXXFLAGS", "")
-        os.environ["CFLAGS"] = cflags + " " + cflags_args +"  ".join(conf.env.CFLAGS_cshlib)
-        os.environ["CXXFLAGS"] = cxxflags+" " + " ".join(conf.env.CXXFLAGS_cxxshlib)
+        if conf.env.ENABLE_SHARED:
+            self.env["CFLAGS"] = cflags + " " + cflags_args + " " + " ".join(conf.env.CFLAGS_cshlib)
+            self.env["CXXFLAGS"] = cxxflags+" " + " ".join(conf.env.CXXFLAGS_cxxshlib)
+        else:
+            self.env["CFLAGS"] = cflags + " " + cflags_args
+            self.env["CXXFLAGS"] = cxxflags+" "
+
+        if not conf.env.MAKE:
+            conf.find_program ("make")
+        if Utils.is_win32:
+            conf_args += " --prefix=%s" % convert_path_win2msys (self.destnode.abspath ())
+            conf.find_program ("sh")
+            cmd_conf = [conf.env.SH, "-c", "./configure %s"%conf_args]
+            cmd_make = conf.env.MAKE
+        else:
+            conf_args += " --prefix=%s" % self.destnode.abspath ()
+            cmd_conf = "./configure %s" % (conf_args)
+            cmd_make = conf.env.MAKE + [self.make_jobs]
+        cmd_install = conf.env.MAKE + ["install"]
+
+        self.stages = []
+        if not without_configure:
+            self.stages += [ (cmd_conf, "configure") ]
+        self.stages += [ (cmd_make, "make") ]
+        if not without_make_install:
+            self.stages += [ (cmd_install, "install") ]
+
+    def start (self, background):
+        if background:
+            self.thread = threading.Thread (target = self.run)
+            self.thread.daemon = True
+            self.thread.start ()
+        else:
+            self.run ()
+
+    def join (self):
+        if self.thread:
+            self.thread.join ()
+            self.thread = None
+
+    def run (self):
+        try:
+            if self.after:
+                self.after.join ()
+                if self.after.error:
+                    raise Errors.WafError ("%s was not installed" % self.after.name)
+            build_3rd_party.add_running (1)
+            try:
+                log = open (self.logfile, "w")
+                try:
+                    self.build (log)
+                finally:
+                    log.close ()
+            finally:
+                build_3rd_party.add_running (-1)
+        except Exception as e:
+            self.error = e
+
+    # The -j option of make: the jobs are split between the builds running
+    # when make is called (at least one job each).
+    def make_jobs (self):
+        running = max (1, build_3rd_party.running)
+        return "-j%d" % max (1, self.jobs // running)
+
+    @staticmethod
+    def add_running (n):
+        build_3rd_party.running_lock.acquire ()
+        try:
+            build_3rd_party.running += n
+        finally:
+            build_3rd_party.running_lock.release ()
+
+    def build (self, log):
+        self.messages.append (("Extracting %s" % os.path.basename (self.archive_path),
+                               extract_archive_to (self.archive_path, self.name,
+                                                   self.destnode, self.patches)))
+        for p in self.patches:
+            self.messages.append (("Applying patch", p.name))
+
+        def call (cmd, stage):
+            if not isinstance (cmd, str):
+                cmd = [ c () if callable (c) else c for c in Utils.to_list (cmd) ]
+                cmd = [ x for c in cmd for x in Utils.to_list (c) ]
+            log.write ("%s\n%r\n" % ((" %s " % stage).center (80, "-"), cmd))
+            log.flush ()
+            ret = Utils.subprocess.Popen (cmd, shell = isinstance (cmd, str),
+                        cwd = self.srcdir, env = self.env, stdout = log,
+                        stderr = Utils.subprocess.STDOUT).wait ()
+            if ret:
+                self.messages.append (("Calling %s" % stage, False))
+                raise Errors.WafError ("failed to %s %s (%s)" % (stage, self.name, cmd))
+            self.messages.append (("Calling %s" % stage, "done"))
+
+        stages = self.stages
+        if stages[-1][1] == "install":
+            stages = stages[:-1]
+        for cmd, stage in stages:
+            call (cmd, stage)
+
+        self.install_lock.acquire ()
+        try:
+            before = cache_3rd_snapshot (self.destnode)
+            if len (stages) < len (self.stages):
+                call (*self.stages[-1])
+            if self.install_fun:
+                if not os.path.exists (self.incdir):
+                    os.makedirs (self.incdir)
+                if not os.path.exists (self.libdir):
+                    os.makedirs (self.libdir)
+                self.install_fun (self.srcdir, self.incdir, self.libdir)
+                self.messages.append (("Installing %s" % self.name, "done"))
+            after = cache_3rd_snapshot (self.destnode)
+            self.installed = [ f for f in sorted (after) if before.get (f) != after[f] ]
+        finally:
+            self.install_lock.release ()
+
+# Start the build of a third-party library (see configure_3rd_party_with_autotools),
+# in the background if 'background' is True. The build is started after the one
+# given by 'after', if any (e.g., a library that it depends on). If the build is
+# in the cache, the library is installed immediately.
+@conf
+def start_3rd_party_with_autotools (conf, archive_name,
+            without_configure=False, without_make_install=False, conf_args = "",
+            cflags_args = "", install_fun = None, after = None, background = False):
+    if not hasattr (conf, "builds_3rd"):
+        conf.builds_3rd = {}
+    job = conf.builds_3rd.get (archive_name)
+    args = (without_configure, without_make_install, conf_args, cflags_args, install_fun)
+    if job:
+        if job.args == args:
+            return job
+        # started (by prefetch_3rd_party) with other arguments: build it again
+        job.join ()
+        conf.to_log ("The build of %s was not used (other arguments)" % job.name)
+
+    job = build_3rd_party (conf, archive_name, without_configure,
+                           without_make_install, conf_args, cflags_args,
+                           install_fun, after)
+    conf.builds_3rd[archive_name] = job
+    if job.key:
+        build_3rd_party.install_lock.acquire ()
+        try:
+            job.from_cache = conf.cache_3rd_restore (job.key, job.destnode)
+        finally:
+            build_3rd_party.install_lock.release ()
+        if job.from_cache:
+            job.messages.append (("Looking for %s in the cache" % job.name, job.key[:12]))
+            return job
+        job.messages.append (("Looking for %s in the cache" % job.name, "not found"))
+
+    if background:
+        conf.to_log ("Starting the build of %s in the background (log in %s)"
+                     % (job.name, job.logfile))
+    job.start (background)
+    return job
+
+# Wait for the end of the build of a third-party library, print its messages
+# and return the directories of its sources, headers and libraries.
+@conf
+def wait_3rd_party (conf, job):
+    Logs.pprint ("BLUE", "Starting installation of %s" % job.name)
+    conf.to_log ((" Starting installation of %s " % job.name).center (80, "="))
+    if job.thread:
+        conf.start_msg ("Waiting for the build of %s" % job.name)
+        job.join ()
+        conf.end_msg ("failed" if job.error else "done",
+                      color = "RED" if job.error else "GREEN")
+
+    for (msg, result) in job.messages:
+        conf.start_msg (msg)
+        if result is False:
+            conf.end_msg ("failed", color = "RED")
+        else:
+            conf.end_msg (result, color = "YELLOW" if result == "not found" else "GREEN")
+    if os.path.exists (job.logfile):
+        conf.to_log (Utils.readf (job.logfile))
+
+    if job.error:
+        if os.path.exists (job.logfile):
+            log = Utils.readf (job.logfile).splitlines ()
+            Logs.error (os.linesep.join (log[-20:]))
+        conf.fatal ("%s (complete log in %s)" % (job.error, job.logfile))
+
+    if job.from_cache:
+        conf.to_log ((" Installation of %s: from the cache " % job.name).center (80, "="))
     else:
-        cflags = os.getenv("CFLAGS", "")
-        cxxflags = os.getenv("CXXFLAGS", "")
-        os.environ["CFLAGS"] = cflags + " " + cflags_args 
-        os.environ["CXXFLAGS"] = cxxflags+" "
-        
+        conf.to_log ((" Installation of %s: done " % job.name).center (80, "="))
+        if job.key:
+            conf.cache_3rd_store (job.key, job.destnode, job.installed)
+            job.key = None # stored only once
+
+    return job.srcdir, job.incdir, job.libdir
+
+# Build a third-party library from an archive of the 3rd/ directory and
+# install it in the '3rd' subdirectory of the build directory. If the same build
+# (see cache_3rd_key) was already done, by this build directory or another one,
+# the installed files are taken from the cache (see --3rd-cache). If the build
+# was started in the background (see prefetch_3rd_party), wait for its end.
+# 'install_fun', if given, is called with the directories of the sources, the
+# headers and the libraries after the build (for libraries without a working
+# 'make install').
+@conf
+def configure_3rd_party_with_autotools (conf, archive_name,
+            without_configure=False, without_make_install=False, conf_args = "",
+            cflags_args = "", install_fun = None):
+    job = conf.start_3rd_party_with_autotools (archive_name, without_configure,
+            without_make_install, conf_args, cflags_args, install_fun)
+    return conf.wait_3rd_party (job)
+
+# Start in the background the builds of the third-party libraries needed by the
+# libraries for interval arithmetic and LP and by the plugins, by calling the
+# function 'prefetch_3rd_party' of their wscript (if any). Such a function calls
+# start_3rd_party_with_autotools with background=True, with the same arguments
+# as the call to configure_3rd_party_with_autotools in its 'configure' function,
+# which then only waits for the end of the build. So the independent libraries
+# are built concurrently.
+@conf
+def prefetch_3rd_party (conf):
+    if not conf.options.PARALLEL_3RD:
+        return
+    plugins = get_dirlist (conf.path.find_node ("plugins"))
+    first = [ conf.env.ITVLIB_PLUGIN_PREFIX + str (conf.options.INTERVAL_LIB),
+              LPLIB_PLUGIN_PREFIX + str (conf.options.LP_LIB) ]
+    others = [ p for p in plugins if not p.startswith (
+                        (conf.env.ITVLIB_PLUGIN_PREFIX, LPLIB_PLUGIN_PREFIX)) ]
+    for p in first + sorted (others):
+        if p in plugins:
+            conf.recurse (os.path.join ("plugins", p), name = "prefetch_3rd_party",
+                          mandatory = False)
+
+# Wait for the builds started by prefetch_3rd_party that were not used (for
+# example, if a library was finally found on the system).
+@conf
+def wait_all_3rd_party (conf):
+    for job in getattr (conf, "builds_3rd", {}).values ():
+        if job.thread:
+            job.join ()
+            conf.to_log ("The build of %s was not used" % job.name)
 
-    if Utils.is_win32:
-        conf_args += " --prefix=%s" % convert_path_win2msys (destnode.abspath ())
-        conf.find_program ("sh")
-        cmd_conf = [conf.env.SH, "-c", "./configure %s"%conf_args]
-        cmd_make = conf.env.MAKE
+# functions that handle the profile-guided optimization (see the 'pgo' command
+# in the main wscript)
+
+@conf
+def check_pgo (conf):
+    conf.start_msg ("Profile-guided optimization")
+    if not conf.options.WITH_PGO:
+        conf.end_msg ("no", color = "YELLOW")
+        return
+    if conf.env.DEBUG:
+        conf.end_msg ("no", color = "RED")
+        conf.fatal ("--with-pgo cannot be used with --with-debug")
+    if not conf.options.WITH_OPTIM: # the training runs benchmark_optim
+        conf.end_msg ("no", color = "RED")
+        conf.fatal ("--with-pgo requires --with-optim")
+
+    conf.env.PGO_DIR = conf.bldnode.make_node ("pgo").abspath ()
+    if conf.env.CXX_NAME == "gcc":
+        gen = [ "-fprofile-generate=" + conf.env.PGO_DIR ]
+        use = [ "-fprofile-use=" + conf.env.PGO_DIR, "-fprofile-correction" ]
+    elif conf.env.CXX_NAME == "clang":
+        # the raw profiles are merged by llvm-profdata before being used
+        conf.env.PGO_PROFDATA = os.path.join (conf.env.PGO_DIR, "ibex.profdata")
+        gen = [ "-fprofile-generate=" + conf.env.PGO_DIR ]
+        use = [ "-fprofile-use=" + conf.env.PGO_PROFDATA ]
     else:
-        conf_args += " --prefix=%s" % destnode.abspath ()
-        cmd_conf = "./configure %s" % (conf_args)
-        cmd_make = conf.env.MAKE + ["-j%d"%conf.options.jobs]
-    cmd_install = conf.env.MAKE + ["install"] 
-
-    stages = []
-    if not without_configure:
-        stages += [ (cmd_conf, "configure") ]
-    stages += [ (cmd_make, "make") ]
-    if not without_make_install:
-        stages += [ (cmd_install, "install") ]
-    for cmd, stage in stages:
-        conf.start_msg("Calling %s" % stage)
-        try: 
-            out = conf.cmd_and_log (cmd, cwd=srcdir, env=os.environ)
-            conf.end_msg("done")
-        except Errors.WafError as e:
-            conf.end_msg("failed", color="RED")
-            print(e)
-            conf.fatal ("failed to %s %s (%s)" % (stage, name, cmd))
-
-    conf.to_log ((" Installation of %s: done " % name).center (80, "="))
+        conf.end_msg ("not supported by %s" % conf.env.CXX_NAME, color = "RED")
+        conf.fatal ("--with-pgo requires gcc or clang")
+    conf.end_msg ("yes (profiles in %s)" % conf.env.PGO_DIR)
 
-    if conf.env.ENABLE_SHARED:
-        os.environ["CFLAGS"] = cflags
-        os.environ["CXXFLAGS"] = cxxflags
+    conf.check_cxx (cxxflags = gen, linkflags = gen)
+    if conf.env.CXX_NAME == "clang":
+        conf.find_program ("llvm-profdata", var = "LLVM_PROFDATA")
+    else:
+        conf.check_cxx (cxxflags = use)
+        # The sources that are not run by the training benchmarks have no
+        # profile, and the profile of a modified source is outdated: this is
+        # not an error.
+        for f in [ "-Wno-missing-profile", "-Wno-error=coverage-mismatch" ]:
+            if conf.check_cxx (cxxflags = f, mandatory = False):
+                use.append (f)
+
+    linkflags = []
+    conf.start_msg ("Link-time optimization with PGO")
+    if conf.options.PGO_LTO:
+        lto = [ "-flto" ]
+        if conf.env.CXX_NAME == "gcc": # the static library also works without LTO
+            lto.append ("-ffat-lto-objects")
+        conf.end_msg ("yes")
+        conf.check_cxx (cxxflags = lto, linkflags = lto)
+        use += lto
+        linkflags += lto
+        # ar needs the LTO plugin to index the symbols of the static library
+        if not conf.env.ENABLE_SHARED:
+            ar = "gcc-ar" if conf.env.CXX_NAME == "gcc" else "llvm-ar"
+            conf.find_program (ar, var = "PGO_AR",
+                                mandatory = conf.env.CXX_NAME == "clang")
+    else:
+        conf.end_msg ("no", color = "YELLOW")
+
+    conf.env.PGO = True
+    conf.env.PGO_GEN_FLAGS = gen
+    conf.env.PGO_USE_CXXFLAGS = use
+    conf.env.PGO_USE_LINKFLAGS = linkflags
 
-    return srcdir, incdir, libdir
+@conf
+def pgo_has_profile (bld):
+    if bld.env.PGO_PROFDATA:
+        return os.path.isfile (bld.env.PGO_PROFDATA)
+    else:
+        for root, dirs, files in os.walk (bld.env.PGO_DIR):
+            if any (f.endswith (".gcda") for f in files):
+                return True
+        return False
+
+# Add the flags of the current stage of the profile-guided optimization to env.
+# The stage is given by the command (see PgoRefContext, ...), other commands use
+# the profile of the last training, if any.
+@conf
+def pgo_flags (bld):
+    stage = getattr (bld, "pgo_stage", None)
+    if not bld.env.PGO:
+        if stage:
+            bld.fatal ("'%s' requires to configure with --with-pgo" % bld.cmd)
+        return
+    elif stage is None:
+        stage = "use" if bld.pgo_has_profile () else "off"
+
+    if stage == "generate":
+        # the counters are accumulated in existing profiles: start from scratch
+        shutil.rmtree (bld.env.PGO_DIR, ignore_errors = True)
+        bld.env.append_value ("CXXFLAGS", bld.env.PGO_GEN_FLAGS)
+        bld.env.append_value ("LINKFLAGS", bld.env.PGO_GEN_FLAGS)
+    elif stage == "use":
+        if bld.env.LLVM_PROFDATA and getattr (bld, "pgo_stage", None) == "use":
+            raw = []
+            if os.path.isdir (bld.env.PGO_DIR):
+                raw = [ os.path.join (bld.env.PGO_DIR, f)
+                            for f in os.listdir (bld.env.PGO_DIR)
+                            if f.endswith (".profraw") ]
+            if raw:
+                cmd = bld.env.LLVM_PROFDATA + [ "merge",
+                                "-output=" + bld.env.PGO_PROFDATA ] + raw
+                if bld.exec_command (cmd):
+                    bld.fatal ("Could not merge the profiles with llvm-profdata")
+        if not bld.pgo_has_profile ():
+            bld.fatal ("No profile in %s, run 'waf pgo' first" % bld.env.PGO_DIR)
+        bld.env.append_value ("CXXFLAGS", bld.env.PGO_USE_CXXFLAGS)
+        bld.env.append_value ("LINKFLAGS", bld.env.PGO_USE_LINKFLAGS)
+        if bld.env.PGO_AR:
+            bld.env.AR = bld.env.PGO_AR
 
 # Add verbose wrapper around pre_recurse and post_recurse methods of
 # ConfigurationContext class, in order to a a more verbose output.
@@ -5,17 +5,23 @@
 // Author      : Jordan Ninin
 // License     : See the LICENSE file
 // Created     : Nov 5, 2013
-// Last Update : Nov 5, 2013
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #include "ibex_AmplInterface.h"
 #include "ibex_Exception.h"
+#include "ibex_ExprSubNodes.h"
+#include "ibex_NodeMap.h"
 
 #include "amplsolvers/asl.h"
 #include "amplsolvers/nlp.h"
 #include "amplsolvers/getstub.h"
 #include "amplsolvers/opcode.hd"
 #include <stdint.h>
+#include <stdio.h>
+#include <string.h>
+#include <fstream>
+#include <vector>
 
 
 #define OBJ_DE    ((const ASL_fg *) asl) -> I.obj_de_
@@ -129,7 +135,9 @@ namespace ibex {
 //const double AmplInterface::default_max_bound= 1.e20;
 
 
-AmplInterface::AmplInterface(std::string nlfile) : asl(NULL), _nlfile(nlfile), _x(NULL){
+AmplInterface::AmplInterface(std::string nlfile, std::string cachefile) : asl(NULL), _nlfile(nlfile), _cachefile(cachefile), _x(NULL){
+
+	if (_cachefile!="" && read_cache()) return;
 
 	if (!readASLfg()) {
 		ibex_error("Fail to read the ampl file.\n");
@@ -139,6 +147,9 @@ AmplInterface::AmplInterface(std::string nlfile) : asl(NULL), _nlfile(nlfile), _
 		ibex_error("Fail to read the nl file.\n");
 	}
 
+	if (_cachefile!="" && !write_cache()) {
+		ibex_warning("AmplInterface: cannot write the cache file");
+	}
 }
 
 AmplInterface::~AmplInterface() {
@@ -154,6 +165,10 @@ AmplInterface::~AmplInterface() {
 bool AmplInterface::writeSolution(double * sol, bool found) {
 	const char* message;
 
+	// the ASL structure is not built if the system was loaded from the cache
+	if (!asl && !readASLfg())
+		return false;
+
 	//TODO setup a nicer message
 	if (found) {
 		message = "IBEX found a solution.\n";
@@ -659,6 +674,342 @@ const ExprNode& AmplInterface::nl2expr(expr *e) {
 	return ExprConstant::new_scalar(0.);
 }
 
+// Cache file ///////////////////////////////////////////////////////////////////////////////////////
+//
+// The cache file contains:
+// - a header: signature, format version, size and hash of the .nl file
+// - the bounds of the variables
+// - the goal function (if any) and the constraints, each expression being stored
+//   as the list of its nodes (a DAG), children first. A node is an opcode followed
+//   by the numbers of its children (in the list) and its specific data (value of a
+//   constant, index, exponent).
+// All the numbers are written in binary, with the native byte order.
+
+namespace {
+
+const char* CACHE_SIGNATURE = "IBEX AMPL CACHE    ";
+const int CACHE_SIGNATURE_LENGTH = 20;
+const uint32_t CACHE_FORMAT_VERSION = 1;
+
+// opcodes of the nodes
+enum { NODE_SYMBOL, NODE_CONSTANT, NODE_INDEX,
+	NODE_ADD, NODE_MUL, NODE_SUB, NODE_DIV, NODE_MAX, NODE_MIN, NODE_ATAN2,
+	NODE_MINUS, NODE_ABS, NODE_POWER, NODE_SQR, NODE_SQRT, NODE_EXP, NODE_LOG, NODE_COS, NODE_SIN, NODE_TAN, NODE_COSH, NODE_SINH, NODE_TANH,
+	NODE_ACOS, NODE_ASIN, NODE_ATAN, NODE_ACOSH, NODE_ASINH, NODE_ATANH };
+
+template<typename T>
+void write(std::ostream& os, T x) {
+	os.write((char*) &x, sizeof(T));
+}
+
+template<typename T>
+T read(std::istream& is) {
+	T x=0;
+	is.read((char*) &x, sizeof(T));
+	return x;
+}
+
+// Number of bytes between the current position and the end of the stream.
+// The counts read from the cache are checked against it before allocating
+// anything, so that a corrupted file is rejected.
+uint64_t remaining_bytes(std::istream& is) {
+	std::streampos pos=is.tellg();
+	is.seekg(0, std::ios::end);
+	std::streampos end=is.tellg();
+	is.seekg(pos);
+	return !is || end<pos ? 0 : (uint64_t) (end-pos);
+}
+
+// Size and FNV-1a hash of a file
+bool nl_signature(const std::string& file, uint64_t& size, uint64_t& hash) {
+	std::ifstream f(file.c_str(), std::ios::in | std::ios::binary);
+	if (f.fail()) return false;
+
+	char buf[65536];
+	size=0;
+	hash=14695981039346656037ULL;
+	while (f.read(buf,sizeof(buf)) || f.gcount()>0) {
+		std::streamsize n=f.gcount();
+		for (std::streamsize i=0; i<n; i++) {
+			hash^=(unsigned char) buf[i];
+			hash*=1099511628211ULL;
+		}
+		size+=n;
+	}
+	return true;
+}
+
+// Write the nodes of an expression (with a single vector argument)
+class CacheWriter : public ExprVisitor {
+public:
+	CacheWriter(std::ostream& os) : os(os), ok(true) { }
+
+	// return false if the expression contains a node that cannot be stored
+	bool write_expr(const ExprNode& e) {
+		ExprSubNodes nodes(e);
+		int n=nodes.size();
+		write<uint32_t>(os,n);
+		// subnodes are sorted by decreasing height
+		for (int i=n-1; ok && i>=0; i--) {
+			nodes[i].acceptVisitor(*this);
+			num.insert(nodes[i],n-1-i);
+		}
+		num.clean();
+		return ok;
+	}
+
+protected:
+	void visit(const ExprNode&)       { ok=false; }
+	void visit(const ExprSymbol& e)   { write<uint8_t>(os,NODE_SYMBOL); }
+	void visit(const ExprConstant& e) {
+		if (!e.dim.is_scalar()) { ok=false; return; }
+		write<uint8_t>(os,NODE_CONSTANT);
+		write<double>(os,e.get_value().lb());
+		write<double>(os,e.get_value().ub());
+	}
+	void visit(const ExprIndex& e)    {
+		write<uint8_t>(os,NODE_INDEX);
+		write<uint32_t>(os,num[e.expr]);
+		write<int32_t>(os,e.index.first_row());
+		write<int32_t>(os,e.index.last_row());
+		write<int32_t>(os,e.index.first_col());
+		write<int32_t>(os,e.index.last_col());
+	}
+	void visit(const ExprAdd& e)   { binary(NODE_ADD,e); }
+	void visit(const ExprMul& e)   { binary(NODE_MUL,e); }
+	void visit(const ExprSub& e)   { binary(NODE_SUB,e); }
+	void visit(const ExprDiv& e)   { binary(NODE_DIV,e); }
+	void visit(const ExprMax& e)   { binary(NODE_MAX,e); }
+	void visit(const ExprMin& e)   { binary(NODE_MIN,e); }
+	void visit(const ExprAtan2& e) { binary(NODE_ATAN2,e); }
+	void visit(const ExprMinus& e) { unary(NODE_MINUS,e); }
+	void visit(const ExprAbs& e)   { unary(NODE_ABS,e); }
+	void visit(const ExprPower& e) { unary(NODE_POWER,e); write<int32_t>(os,e.expon); }
+	void visit(const ExprSqr& e)   { unary(NODE_SQR,e); }
+	void visit(const ExprSqrt& e)  { unary(NODE_SQRT,e); }
+	void visit(const ExprExp& e)   { unary(NODE_EXP,e); }
+	void visit(const ExprLog& e)   { unary(NODE_LOG,e); }
+	void visit(const ExprCos& e)   { unary(NODE_COS,e); }
+	void visit(const ExprSin& e)   { unary(NODE_SIN,e); }
+	void visit(const ExprTan& e)   { unary(NODE_TAN,e); }
+	void visit(const ExprCosh& e)  { unary(NODE_COSH,e); }
+	void visit(const ExprSinh& e)  { unary(NODE_SINH,e); }
+	void visit(const ExprTanh& e)  { unary(NODE_TANH,e); }
+	void visit(const ExprAcos& e)  { unary(NODE_ACOS,e); }
+	void visit(const ExprAsin& e)  { unary(NODE_ASIN,e); }
+	void visit(const ExprAtan& e)  { unary(NODE_ATAN,e); }
+	void visit(const ExprAcosh& e) { unary(NODE_ACOSH,e); }
+	void visit(const ExprAsinh& e) { unary(NODE_ASINH,e); }
+	void visit(const ExprAtanh& e) { unary(NODE_ATANH,e); }
+
+	void binary(uint8_t op, const ExprBinaryOp& e) {
+		write<uint8_t>(os,op);
+		write<uint32_t>(os,num[e.left]);
+		write<uint32_t>(os,num[e.right]);
+	}
+
+	void unary(uint8_t op, const ExprUnaryOp& e) {
+		write<uint8_t>(os,op);
+		write<uint32_t>(os,num[e.expr]);
+	}
+
+	std::ostream& os;
+	bool ok;
+	// number of the nodes already written
+	NodeMap<uint32_t> num;
+};
+
+// Read the nodes of an expression written by CacheWriter.
+// All the nodes created (except the symbol) are pushed in "created".
+// Return NULL if the file is corrupted.
+const ExprNode* read_expr(std::istream& is, const ExprSymbol& x, std::vector<const ExprNode*>& created) {
+	uint32_t n=read<uint32_t>(is);
+	// each node takes at least one byte (its opcode)
+	if (!is || n==0 || n>remaining_bytes(is)) return NULL;
+
+	std::vector<const ExprNode*> nodes;
+	nodes.reserve(n);
+
+	try {
+		for (uint32_t i=0; i<n; i++) {
+			uint8_t op=read<uint8_t>(is);
+			const ExprNode* e;
+
+			if (op==NODE_SYMBOL) {
+				nodes.push_back(&x);
+				continue;
+			} else if (op==NODE_CONSTANT) {
+				double lb=read<double>(is);
+				double ub=read<double>(is);
+				e=&ExprConstant::new_scalar(Interval(lb,ub));
+			} else {
+				uint32_t j=read<uint32_t>(is);
+				if (!is || j>=i) return NULL;
+				const ExprNode& c=*nodes[j];
+
+				if (op==NODE_INDEX) {
+					int32_t r1=read<int32_t>(is);
+					int32_t r2=read<int32_t>(is);
+					int32_t c1=read<int32_t>(is);
+					int32_t c2=read<int32_t>(is);
+					if (r1<0 || r2<r1 || r2>=c.dim.nb_rows() || c1<0 || c2<c1 || c2>=c.dim.nb_cols()) return NULL;
+					e=&ExprIndex::new_(c,DoubleIndex(c.dim,r1,r2,c1,c2));
+				} else if (op>=NODE_ADD && op<=NODE_ATAN2) {
+					uint32_t k=read<uint32_t>(is);
+					if (!is || k>=i) return NULL;
+					const ExprNode& c2=*nodes[k];
+					switch (op) {
+					case NODE_ADD:   e=&ExprAdd::new_(c,c2);   break;
+					case NODE_MUL:   e=&ExprMul::new_(c,c2);   break;
+					case NODE_SUB:   e=&ExprSub::new_(c,c2);   break;
+					case NODE_DIV:   e=&ExprDiv::new_(c,c2);   break;
+					case NODE_MAX:   e=&ExprMax::new_(c,c2);   break;
+					case NODE_MIN:   e=&ExprMin::new_(c,c2);   break;
+					default:    e=&ExprAtan2::new_(c,c2); break;
+					}
+				} else {
+					switch (op) {
+					case NODE_MINUS: e=&ExprMinus::new_(c); break;
+					case NODE_ABS:   e=&ExprAbs::new_(c);   break;
+					case NODE_POWER: e=&ExprPower::new_(c,read<int32_t>(is)); break;
+					case NODE_SQR:   e=&ExprSqr::new_(c);   break;
+					case NODE_SQRT:  e=&ExprSqrt::new_(c);  break;
+					case NODE_EXP:   e=&ExprExp::new_(c);   break;
+					case NODE_LOG:   e=&ExprLog::new_(c);   break;
+					case NODE_COS:   e=&ExprCos::new_(c);   break;
+					case NODE_SIN:   e=&ExprSin::new_(c);   break;
+					case NODE_TAN:   e=&ExprTan::new_(c);   break;
+					case NODE_COSH:  e=&ExprCosh::new_(c);  break;
+					case NODE_SINH:  e=&ExprSinh::new_(c);  break;
+					case NODE_TANH:  e=&ExprTanh::new_(c);  break;
+					case NODE_ACOS:  e=&ExprAcos::new_(c);  break;
+					case NODE_ASIN:  e=&ExprAsin::new_(c);  break;
+					case NODE_ATAN:  e=&ExprAtan::new_(c);  break;
+					case NODE_ACOSH: e=&ExprAcosh::new_(c); break;
+					case NODE_ASINH: e=&ExprAsinh::new_(c); break;
+					case NODE_ATANH: e=&ExprAtanh::new_(c); break;
+					default: return NULL;
+					}
+				}
+			}
+			created.push_back(e);
+			nodes.push_back(e);
+			if (!is) return NULL;
+		}
+	} catch(DimException&) {
+		return NULL;
+	}
+
+	return nodes.back();
+}
+
+}
+
+bool AmplInterface::write_cache() const {
+	uint64_t size, hash;
+	if (!nl_signature(_nlfile,size,hash)) return false;
+
+	// only systems with a single vector variable (as built by readnl)
+	if (nb_arg!=1) return false;
+
+	// write in a temporary file first, so that the
+	// cache file is never left incomplete
+	std::string tmpname=_cachefile+".tmp";
+	std::ofstream f(tmpname.c_str(), std::ios::out | std::ios::binary);
+	if (f.fail()) return false;
+
+	f.write(CACHE_SIGNATURE, CACHE_SIGNATURE_LENGTH*sizeof(char));
+	write<uint32_t>(f,CACHE_FORMAT_VERSION);
+	write<uint64_t>(f,size);
+	write<uint64_t>(f,hash);
+
+	write<uint32_t>(f,nb_var);
+	for (int i=0; i<nb_var; i++) {
+		write<double>(f,bound_init[i].lb());
+		write<double>(f,bound_init[i].ub());
+	}
 
+	CacheWriter w(f);
+	bool ok=true;
+
+	write<uint8_t>(f,goal!=NULL);
+	if (goal) ok = w.write_expr(goal->expr());
+
+	write<uint32_t>(f,ctrs.size());
+	for (std::vector<NumConstraint*>::const_iterator it=ctrs.begin(); ok && it!=ctrs.end(); it++) {
+		write<uint8_t>(f,(*it)->op);
+		ok = w.write_expr((*it)->f.expr());
+	}
+
+	f.close();
+
+	if (!ok || f.fail() || rename(tmpname.c_str(),_cachefile.c_str())!=0) {
+		remove(tmpname.c_str());
+		return false;
+	}
+	return true;
 }
 
+bool AmplInterface::read_cache() {
+	uint64_t size, hash;
+	if (!nl_signature(_nlfile,size,hash)) return false;
+
+	std::ifstream f(_cachefile.c_str(), std::ios::in | std::ios::binary);
+	if (f.fail()) return false;
+
+	char sig[CACHE_SIGNATURE_LENGTH];
+	f.read(sig, CACHE_SIGNATURE_LENGTH*sizeof(char));
+	if (!f || strncmp(sig,CACHE_SIGNATURE,CACHE_SIGNATURE_LENGTH)!=0) return false;
+	if (read<uint32_t>(f)!=CACHE_FORMAT_VERSION) return false;
+	if (read<uint64_t>(f)!=size) return false;
+	if (read<uint64_t>(f)!=hash) return false;
+
+	uint32_t n=read<uint32_t>(f);
+	if (!f || n==0 || n>remaining_bytes(f)/(2*sizeof(double))) return false;
+
+	IntervalVector bound(n);
+	for (uint32_t i=0; i<n; i++) {
+		double lb=read<double>(f);
+		double ub=read<double>(f);
+		bound[i]=Interval(lb,ub);
+	}
+
+	Variable* x=new Variable(n,"x");
+	std::vector<const ExprNode*> created;
+	const ExprNode* goal_expr=NULL;
+	std::vector<const ExprNode*> ctr_expr;
+	std::vector<CmpOp> ctr_op;
+	bool ok=(bool) f;
+
+	if (ok && read<uint8_t>(f)) {
+		goal_expr = read_expr(f,*x,created);
+		ok = goal_expr!=NULL;
+	}
+
+	uint32_t m = ok ? read<uint32_t>(f) : 0;
+	for (uint32_t i=0; ok && i<m; i++) {
+		uint8_t op=read<uint8_t>(f);
+		const ExprNode* e=read_expr(f,*x,created);
+		ok = e!=NULL && op<=GT;
+		ctr_expr.push_back(e);
+		ctr_op.push_back((CmpOp) op);
+	}
+
+	if (ok) {
+		// fill the factory (the expressions are copied)
+		_x=x;
+		add_var(*_x, bound);
+		if (goal_expr) add_goal(*goal_expr);
+		for (uint32_t i=0; i<m; i++)
+			add_ctr(ExprCtr(*ctr_expr[i],ctr_op[i]));
+	}
+
+	for (std::vector<const ExprNode*>::iterator it=created.begin(); it!=created.end(); it++)
+		delete (ExprNode*) *it;
+
+	if (!ok) delete x;
+
+	return ok;
+}
+
+}
@@ -4,7 +4,7 @@
 // Author      : Jordan Ninin
 // License     : See the LICENSE file
 // Created     : Nov 5, 2013
-// Last Update : Nov 5, 2013
+// Last Update : Oct 19, 2026
 //============================================================================
 
 
@@ -41,6 +41,7 @@ private:
 
 	ASL*     asl;
 	std::string _nlfile;
+	std::string _cachefile;
 	Variable* _x;
 
 
@@ -65,9 +66,21 @@ private:
 	bool readASLfg();
 	const ExprNode& nl2expr(expr *e);
 
+	bool read_cache();
+	bool write_cache() const;
+
 
 public:
-	AmplInterface(std::string nlfile);
+	/**
+	 * \brief Load an AMPL model from a .nl file.
+	 *
+	 * If \a cachefile is not empty, the converted system is stored in
+	 * this (binary) file, together with the size and a hash of the .nl file.
+	 * The next loads of the same .nl file read the cache file directly,
+	 * without ASL parsing and expression reconstruction. The cache file is
+	 * rewritten if the .nl file has changed.
+	 */
+	AmplInterface(std::string nlfile, std::string cachefile="");
 
 	virtual ~AmplInterface();
 
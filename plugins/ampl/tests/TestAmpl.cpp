@@ -15,6 +15,9 @@
 #include "ibex_NormalizedSystem.h"
 
 #include <sstream>
+#include <stdio.h>
+
+#define TMP_CACHE_FILE_NAME "__tmp__.ibc"
 
 using namespace std;
 
@@ -256,4 +259,54 @@ void TestAmpl::variable3() {
 	CPPUNIT_ASSERT(sys.ops[1]==GEQ);
 	CPPUNIT_ASSERT(sys.ops[2]==LEQ);
 }
+
+void TestAmpl::cache() {
+	remove(TMP_CACHE_FILE_NAME);
+
+	// the first load writes the cache file
+	AmplInterface i1(SRCDIR_TESTS "/../plugins/ampl/tests/ex_ampl/ex6.nl", TMP_CACHE_FILE_NAME);
+	System sys1(i1);
+	FILE* fd=fopen(TMP_CACHE_FILE_NAME,"rb");
+	CPPUNIT_ASSERT(fd!=NULL);
+	fclose(fd);
+
+	// the second one reads it
+	AmplInterface i2(SRCDIR_TESTS "/../plugins/ampl/tests/ex_ampl/ex6.nl", TMP_CACHE_FILE_NAME);
+	System sys2(i2);
+	CPPUNIT_ASSERT(sys2.nb_var==sys1.nb_var);
+	CPPUNIT_ASSERT(sys2.box==sys1.box);
+	CPPUNIT_ASSERT(sameExpr(sys2.goal->expr(),sys1.goal->expr()));
+	CPPUNIT_ASSERT(sys2.nb_ctr==sys1.nb_ctr);
+	for (int i=0; i<sys1.nb_ctr; i++) {
+		CPPUNIT_ASSERT(sameExpr(sys2.f_ctrs[i].expr(),sys1.f_ctrs[i].expr()));
+		CPPUNIT_ASSERT(sys2.ops[i]==sys1.ops[i]);
+	}
+
+	// the cache of another .nl file is ignored (and overwritten)
+	AmplInterface i3(SRCDIR_TESTS "/../plugins/ampl/tests/ex_ampl/ex4.nl", TMP_CACHE_FILE_NAME);
+	System sys3(i3);
+	CPPUNIT_ASSERT(sys3.nb_ctr==3);
+	CPPUNIT_ASSERT(sameExpr(sys3.goal->expr(),"(x(1)+x(2))"));
+	CPPUNIT_ASSERT(sameExpr(sys3.f_ctrs[0].expr(),"(x(1)+x(2))"));
+
+	// a corrupted count (of variables, then of nodes) in the cache
+	// is rejected and the .nl file is parsed again
+	long offsets[2] = { 40, 77 }; // see AmplInterface::write_cache()
+	for (int k=0; k<2; k++) {
+		unsigned int huge=0xffffffff;
+		fd=fopen(TMP_CACHE_FILE_NAME,"r+b");
+		CPPUNIT_ASSERT(fd!=NULL);
+		fseek(fd,offsets[k],SEEK_SET);
+		fwrite(&huge,sizeof(huge),1,fd);
+		fclose(fd);
+
+		AmplInterface i4(SRCDIR_TESTS "/../plugins/ampl/tests/ex_ampl/ex4.nl", TMP_CACHE_FILE_NAME);
+		System sys4(i4);
+		CPPUNIT_ASSERT(sys4.nb_ctr==3);
+		CPPUNIT_ASSERT(sameExpr(sys4.goal->expr(),"(x(1)+x(2))"));
+	}
+
+	remove(TMP_CACHE_FILE_NAME);
+}
+
 } // end namespace
@@ -36,6 +36,7 @@ public:
 		CPPUNIT_TEST(variable1);
 		CPPUNIT_TEST(variable2);
 		CPPUNIT_TEST(variable3);
+		CPPUNIT_TEST(cache);
 	CPPUNIT_TEST_SUITE_END();
 
 	void factory01();
@@ -46,6 +47,7 @@ public:
 	void variable1();
 	void variable2();
 	void variable3();
+	void cache();
 };
 
 CPPUNIT_TEST_SUITE_REGISTRATION(TestAmpl);
@@ -0,0 +1,80 @@
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+
+import org.junit.runner.JUnitCore;
+import org.junit.runner.Result;
+import org.junit.runner.notification.Failure;
+
+/**
+ * Run several test classes in the same JVM, so that the JVM is started and
+ * the JNI library is loaded only once.
+ *
+ * Usage: java BatchRunner class...
+ *
+ * The classes with JUnit tests are run with JUnit. For the other classes,
+ * the "main" method is called and the test fails if it throws an exception.
+ *
+ * The output of each class is enclosed in the lines
+ *   ##### BEGIN class
+ *   ##### END class status time
+ * and the line before the END line is the summary of the tests of the class
+ * ("OK (n tests)" or "Run: n Failures: f Errors: 0").
+ */
+public class BatchRunner {
+
+	public final static String BEGIN = "##### BEGIN ";
+	public final static String END = "##### END ";
+
+	private static boolean hasJUnitTests(Class<?> c) {
+		for (Method m : c.getMethods()) {
+			if (m.isAnnotationPresent(org.junit.Test.class))
+				return true;
+		}
+		return false;
+	}
+
+	public static void main(String[] args) {
+		// the messages of a class must appear in its own section
+		System.setErr(System.out);
+
+		int nfailed=0;
+		for (String name : args) {
+			System.out.println(BEGIN+name);
+			long start=System.nanoTime();
+			int run=1;
+			int failures=0;
+			try {
+				Class<?> c=Class.forName(name);
+				if (hasJUnitTests(c)) {
+					Result result=new JUnitCore().run(c);
+					for (Failure f : result.getFailures()) {
+						System.out.println(f.toString());
+						System.out.println(f.getTrace());
+					}
+					run=result.getRunCount();
+					failures=result.getFailureCount();
+				} else {
+					Method m=c.getMethod("main", String[].class);
+					m.invoke(null, (Object) new String[0]);
+				}
+			} catch (InvocationTargetException e) {
+				e.getCause().printStackTrace();
+				failures=1;
+			} catch (Throwable e) {
+				e.printStackTrace();
+				failures=1;
+			}
+			double time=(System.nanoTime()-start)/1e9;
+
+			if (failures==0)
+				System.out.println("OK ("+run+" test"+(run>1? "s" : "")+")");
+			else
+				System.out.println("Run: "+run+" Failures: "+failures+" Errors: 0");
+			System.out.println(END+name+" "+(failures==0? 0 : 1)+" "+time);
+			System.out.flush();
+
+			if (failures>0) nfailed++;
+		}
+		System.exit(nfailed==0? 0 : 1);
+	}
+}
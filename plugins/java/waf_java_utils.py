@@ -1,9 +1,9 @@
 #!/usr/bin/env python
 # encoding: utf-8
 
-import os
-from waflib import Task, Utils, TaskGen, Node
-from waflib.Tools import ccroot
+import os, re
+from waflib import Task, Utils, TaskGen, Node, Logs, Options
+from waflib.Tools import ccroot, waf_unit_test
 
 ######################
 ##### configure ######
@@ -109,23 +109,89 @@ ccroot.USELIB_VARS['javatest']=set(["CLASSPATH", "LD_LIBRARY_PATH"])
 @TaskGen.feature("javatest")
 @TaskGen.after_method("process_source")
 def make_test_java (self):
-	if len (self.tasks) != 1 or len(self.tasks[0].outputs) != 1:
+	if len (self.tasks) != 1:
+		self.bld.fatal ("Expecting 1 task in %r" % self)
+	outputs = self.tasks[0].outputs
+	classes = [ os.path.splitext (n.name)[0] for n in outputs ]
+	runner = getattr (self, "runner", None)
+	if runner:
+		# all the test classes are run in one JVM by the runner
+		if not runner in classes:
+			self.bld.fatal ("The runner %s is not compiled by %r" % (runner, self))
+		classes.remove (runner)
+		self.java_classes = classes
+		self.name = "utest_java"
+		cl = " ".join ([ runner ] + classes)
+		self.ut_run = java_run_batch
+	elif len (outputs) != 1:
 		self.bld.fatal ("Expecting 1 task with 1 output in %r" % self)
-	tgtnode = self.tasks[0].outputs[0]
-	cl = os.path.splitext(os.path.basename(tgtnode.abspath()))[0]
-	self.name = "utest_java_" + cl
+	else:
+		cl = classes[0]
+		self.name = "utest_java_" + cl
 	if hasattr (self, "classname_extra"):
 		cl = self.classname_extra + " " + cl
+	tgtnode = outputs[0]
 	outnode = tgtnode.parent.make_node (self.name)
 
 	tsk = self.create_task ("java_gen_test", tgt = outnode, classnames = cl,
-		classpath_extra = [ tgtnode.parent.abspath(), "." ])
+		classpath_extra = [ tgtnode.parent.abspath(), "." ], batch = bool (runner))
 
 	tsk.set_run_after (self.tasks[0])
 	self.link_task = tsk
 	self.ut_paths = self.path.abspath()
 	self.meths.append("make_test")
 
+JAVA_BATCH_RE = re.compile (br"^##### (BEGIN|END) (\S+)(?: (\d+) (\S+))?\s*$")
+
+# function run by the 'utest' task of a batch of test classes instead of the
+# generated script: the output of the runner (see tests/BatchRunner.java) is
+# split in one result per class, named <script>:<class>.
+def java_run_batch (tsk):
+	cmd = [ tsk.inputs[0].abspath () ]
+	testcmd = getattr (Options.options, "testcmd", False)
+	if testcmd:
+		cmd = (testcmd % " ".join (cmd)).split (" ")
+	Logs.debug ("runner: %r", cmd)
+	proc = Utils.subprocess.Popen (cmd, cwd = tsk.get_cwd ().abspath (),
+			env = tsk.get_test_env (), stdout = Utils.subprocess.PIPE,
+			stderr = Utils.subprocess.PIPE)
+	(stdout, stderr) = proc.communicate ()
+	prog = tsk.inputs[0].abspath ()
+	tsk.waf_unit_test_results = (prog, proc.returncode, stdout, stderr)
+
+	outputs = {}
+	status = {}
+	cur = None
+	for l in stdout.splitlines (True):
+		m = JAVA_BATCH_RE.match (l)
+		if m and m.group (1) == b"BEGIN":
+			cur = m.group (2).decode ()
+			outputs[cur] = []
+		elif m and m.group (3) is not None:
+			status[m.group (2).decode ()] = (int (m.group (3)), float (m.group (4)))
+			cur = None
+		elif cur:
+			outputs[cur].append (l)
+
+	bld = tsk.generator.bld
+	waf_unit_test.testlock.acquire ()
+	try:
+		if not hasattr (bld, "utest_timings"):
+			bld.utest_timings = {}
+		for cl in tsk.generator.java_classes:
+			name = "%s:%s" % (prog, cl)
+			out = b"".join (outputs.get (cl, []))
+			if cl in status:
+				(ret, wall) = status[cl]
+				err = b""
+				bld.utest_timings[os.path.basename (name)] = (wall, None)
+			else: # the JVM stopped before the end of the tests of this class
+				ret = proc.returncode or 1
+				err = stderr
+			tsk.generator.add_test_results ((name, ret, out, err))
+	finally:
+		waf_unit_test.testlock.release ()
+
 class java_gen_test (Task.Task):
 	"""
 	Generate a java test
@@ -137,6 +203,14 @@ class java_gen_test (Task.Task):
 	script_format += "if [ $? -eq 0 ] ; then\n  echo 'OK (1 test)'\n  exit 0\n"
 	script_format += "else\n  echo 'Run: 1 Failures: 1 Errors: 0'\n  exit 1\nfi\n"
 
+	# the runner of a batch reports the results of each class itself
+	batch_script_format = "#!/bin/bash\nexec %s -Djava.library.path=%s -cp %s %s\n"
+
+	# the script must be generated again if the list of classes changes
+	def sig_vars (self):
+		super (java_gen_test, self).sig_vars ()
+		self.m.update (self.classnames.encode ())
+
 	def run (self):
 		if isinstance (self.env.JAVA, list):
 			java = self.env.JAVA[0]
@@ -150,6 +224,7 @@ class java_gen_test (Task.Task):
 
 		cp = self.env.CLASSPATH + os.pathsep.join(self.classpath_extra) + os.pathsep
 
-		s = self.script_format % (java, ldlibpath, cp, self.classnames) 
+		fmt = self.batch_script_format if self.batch else self.script_format
+		s = fmt % (java, ldlibpath, cp, self.classnames)
 		self.outputs[0].write(s)
 		self.outputs[0].chmod (Utils.O755)
@@ -8,6 +8,8 @@ using namespace ibex;
 #define MIN(a,b) ((a < b) ? a : b)
 
 double tot_time = 0.0;
+bool buffer_stats = false;
+bool phase_counters = false;
 
 double
 double_from_arg (const char *argname, const char *str)
@@ -48,10 +50,27 @@ usage (const char *errmsg)
 	  << "  --time-limit <t>      optimizer will stop after <t> seconds" << std::endl
 	  << "  --prec-ndigits-min <d>        " << std::endl
 	  << "  --prec-ndigits-max <d>        " << std::endl
-	  << "  --iter <i>        " << std::endl;
+	  << "  --iter <i>        " << std::endl
+	  << "Optional parameter are:" << std::endl
+	  << "  --buffer-stats        report cell buffer statistics" << std::endl
+	  << "  --phase-counters      report the time and number of calls of each" << std::endl
+	  << "                        phase/component of the optimizer" << std::endl;
 	ibex_error (s.str().c_str());
 }
 
+/* Return the name of a counter of the profiler as a key for the output: all
+ * non alphanumeric characters are replaced by '_'.
+ */
+string
+key_from_name (const string &name)
+{
+	string key (name);
+	for (size_t i = 0; i < key.size(); i++)
+		if (!isalnum (key[i]))
+			key[i] = '_';
+	return key;
+}
+
 /* Return true if timeout was reached for at least one of the #iter run(s).
  * Return false otherwise.
  */
@@ -70,6 +89,13 @@ do_benchs_iter (System &sys, double prec, double time_limit, unsigned int iter)
 		/* Set the time limit */
 		DefOpt.timeout = time_limit;
 
+		/* Count the time and number of calls of each phase/component
+		 * (off by default, as it perturbs the time of the search) */
+		DefOpt.profiler.enable(phase_counters);
+
+		/* Record the size/memory of the cell buffer */
+		DefOpt.buffer_stats.enabled = buffer_stats;
+
 		/* Do the actual computation */
 		Optimizer::Status status = DefOpt.optimize (sys.box);
 
@@ -80,8 +106,36 @@ do_benchs_iter (System &sys, double prec, double time_limit, unsigned int iter)
 	            << " ; nb_cells = " << DefOpt.get_nb_cells()
 	            << " ; uplo = " << DefOpt.get_uplo()
 	            << " ; loup = " << DefOpt.get_loup()
-	            << " ; random_seed = " << random_seed
-	            << std::endl;
+	            << " ; random_seed = " << random_seed;
+		for (int j = 0; phase_counters && j < DefOpt.profiler.size(); j++)
+		{
+			string key = key_from_name (DefOpt.profiler.name(j));
+			std::cout << " ; time_" << key << " = " << DefOpt.profiler[j].time
+			          << " ; calls_" << key << " = " << DefOpt.profiler[j].nb_calls;
+		}
+		if (buffer_stats)
+		{
+			const CellBufferStats &bs = DefOpt.buffer_stats;
+			std::cout << " ; buffer_max_size = " << bs.max_size
+			          << " ; buffer_max_bytes = " << bs.max_bytes()
+			          << " ; buffer_max_depth = " << bs.max_depth
+			          << " ; buffer_pushes = " << bs.nb_pushes
+			          << " ; buffer_pops = " << bs.nb_pops
+			          << " ; buffer_contracted = " << bs.nb_contracted
+			          << " ; buffer_empty = " << bs.nb_empty;
+		}
+		std::cout << std::endl;
+		if (buffer_stats)
+		{
+			const vector<CellBufferStats::Sample> &S = DefOpt.buffer_stats.samples;
+			for (size_t j = 0; j < S.size(); j++)
+				std::cout << "# BUFFER: time = " << S[j].time
+				          << " ; size = " << S[j].size
+				          << " ; bytes = " << S[j].bytes
+				          << " ; pushes = " << S[j].nb_pushes
+				          << " ; pops = " << S[j].nb_pops
+				          << " ; contracted = " << S[j].nb_contracted << std::endl;
+		}
 
 		tot_time += DefOpt.get_time();
 		timeout |= status == Optimizer::TIME_OUT;
@@ -102,9 +156,21 @@ main (int argc, char *argv[])
 
 		argc--; argv++; /* skip argv[0] = binary name */
 
-		while (argc >= 2)
+		while (argc >= 1)
 		{
-			if (strcmp (argv[0], "--bench-file") == 0)
+			if (strcmp (argv[0], "--buffer-stats") == 0)
+			{
+				buffer_stats = true;
+				argc--; argv++;
+			}
+			else if (strcmp (argv[0], "--phase-counters") == 0)
+			{
+				phase_counters = true;
+				argc--; argv++;
+			}
+			else if (argc < 2)
+				usage ("too many command-line parameter");
+			else if (strcmp (argv[0], "--bench-file") == 0)
 			{
 				benchfile = argv[1];
 				argc-=2; argv+=2;
@@ -132,8 +198,6 @@ main (int argc, char *argv[])
 			else
 				usage ("unrecognized command-line parameter");
 		}
-		if (argc != 0)
-			usage ("too many command-line parameter");
 
 		cout << "# INPUT: bench file: " << benchfile << endl;
 		cout << "# INPUT: time limit: " << time_limit << "s" << endl;
@@ -8,7 +8,7 @@
 // Author      : Gilles Chabert
 // Copyright   : IMT Atlantique (France)
 // License     : See the LICENSE file
-// Last Update : Jul 09, 2017
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #include "ibex.h"
@@ -25,12 +25,14 @@ using namespace ibex;
 
 int main(int argc, char** argv) {
 
-	stringstream _rel_eps_f, _abs_eps_f, _eps_h, _random_seed, _eps_x;
+	stringstream _rel_eps_f, _abs_eps_f, _eps_h, _random_seed, _eps_x, _buffer_stats_period, _checkpoint_period;
 	_rel_eps_f << "Relative precision on the objective. Default value is 1e" << round(::log10(Optimizer::default_rel_eps_f)) << ".";
 	_abs_eps_f << "Absolute precision on the objective. Default value is 1e" << round(::log10(Optimizer::default_abs_eps_f)) << ".";
 	_eps_h << "Equality relaxation value. Default value is 1e" << round(::log10(NormalizedSystem::default_eps_h)) << ".";
 	_random_seed << "Random seed (useful for reproducibility). Default value is " << DefaultOptimizer::default_random_seed << ".";
 	_eps_x << "Precision on the variable (**Deprecated**). Default value is 0.";
+	_buffer_stats_period << "Number of popped cells between two samples of the cell buffer (with --buffer-stats). The value 0 means no sampling. Default value is " << CellBufferStats::default_sampling_period << ".";
+	_checkpoint_period << "CPU time between two checkpoints (time in seconds, see --checkpoint). Default value is " << Optimizer::default_checkpoint_period << ".";
 
 	args::ArgumentParser parser("********* IbexOpt (defaultoptimizer) *********.", "Solve a Minibex file.");
 	args::HelpFlag help(parser, "help", "Display this help menu", {'h', "help"});
@@ -43,6 +45,17 @@ int main(int argc, char** argv) {
 	args::ValueFlag<double> initial_loup(parser, "float", "Intial \"loup\" (a priori known upper bound).", {"initial-loup"});
 	args::Flag rigor(parser, "rigor", "Activate rigor mode (certify feasibility of equalities).", {"rigor"});
 	args::Flag trace(parser, "trace", "Activate trace. Updates of loup/uplo are printed while minimizing.", {"trace"});
+	args::Flag profile(parser, "profile", "Activate profiling. The time and number of calls of each phase/component are reported.", {"profile"});
+	args::Flag buffer_stats(parser, "buffer-stats", "Activate cell buffer statistics. The size, memory and depth of the buffer and the number of pushed/popped/contracted cells are reported.", {"buffer-stats"});
+	args::ValueFlag<unsigned int> buffer_stats_period(parser, "int", _buffer_stats_period.str(), {"buffer-stats-period"});
+	args::ValueFlag<string> trace_record(parser, "filename", "Record the search tree (popped cells and bisection points) in a binary trace file.", {"trace-record"});
+	args::ValueFlag<string> trace_replay(parser, "filename", "Replay the search tree recorded in a trace file (see --trace-record).", {"trace-replay"});
+	args::ValueFlag<string> checkpoint(parser, "filename", "Checkpoint file. The state of the search (the cell buffer, the loup and "
+			"the uplo) is saved periodically in this (binary) file, so that the search can be resumed after an interruption (see --resume).", {"checkpoint"});
+	args::ValueFlag<double> checkpoint_period(parser, "float", _checkpoint_period.str(), {"checkpoint-period"});
+	args::Flag resume(parser, "resume", "Resume the search from the checkpoint file (see --checkpoint) if it exists, or start a new search otherwise. "
+			"This allows to run the same command again after an interruption. The timeout bounds the total time, including the time "
+			"of the interrupted runs.", {"resume"});
 	args::Flag format(parser, "format", "Display the output format in quiet mode", {"format"});
 	args::Flag quiet(parser, "quiet", "Print no message and display minimal information (for automatic output processing). See --format.",{'q',"quiet"});
 
@@ -100,6 +113,11 @@ int main(int argc, char** argv) {
 		exit(1);
 	}
 
+	if (resume && !checkpoint) {
+		ibex_error("--resume requires a checkpoint file (try ibexopt --help)");
+		exit(1);
+	}
+
 	try {
 
 		// Load a system of equations
@@ -157,6 +175,18 @@ int main(int argc, char** argv) {
 			inHC4=false;
 		}
 
+		// These options record/replay the search tree
+		SearchTrace search_trace;
+		if (trace_record) {
+			if (!quiet)
+				cout << "  trace record:\t" << trace_record.Get() << endl;
+			search_trace.record(trace_record.Get().c_str());
+		} else if (trace_replay) {
+			if (!quiet)
+				cout << "  trace replay:\t" << trace_replay.Get() << endl;
+			search_trace.replay(trace_replay.Get().c_str());
+		}
+
 		// Build the default optimizer
 		DefaultOptimizer o(sys,
 				rel_eps_f? rel_eps_f.Get() : Optimizer::default_rel_eps_f,
@@ -164,7 +194,8 @@ int main(int argc, char** argv) {
 				eps_h ?    eps_h.Get() :     NormalizedSystem::default_eps_h,
 				rigor, inHC4,
 				random_seed? random_seed.Get() : DefaultOptimizer::default_random_seed,
-				eps_x ?    eps_x.Get() :     Optimizer::default_eps_x
+				eps_x ?    eps_x.Get() :     Optimizer::default_eps_x,
+				trace_record || trace_replay ? &search_trace : NULL
 				);
 
 		// This option limits the search time
@@ -181,6 +212,43 @@ int main(int argc, char** argv) {
 			o.trace=trace.Get();
 		}
 
+		// This option counts the time and number of calls of each phase/component
+		if (profile) {
+			if (!quiet)
+				cout << "  profiling:\tON" << endl;
+			o.profiler.enable();
+		}
+
+		// This option records the size/memory of the cell buffer over time
+		if (buffer_stats) {
+			if (!quiet)
+				cout << "  buffer stats:\tON" << endl;
+			o.buffer_stats.enabled=true;
+			if (buffer_stats_period)
+				o.buffer_stats.sampling_period=buffer_stats_period.Get();
+		}
+
+		// These options save the state of the search periodically
+		bool resumed=false;
+		if (checkpoint) {
+			o.checkpoint_file=checkpoint.Get();
+			if (checkpoint_period)
+				o.checkpoint_period=checkpoint_period.Get();
+
+			if (resume) {
+				ifstream file;
+				file.open(checkpoint.Get().c_str(), ios::in); // to check if it exists
+				resumed=file.is_open();
+				file.close();
+			}
+
+			if (!quiet) {
+				cout << "  checkpoint:\t" << checkpoint.Get() << " (every " << o.checkpoint_period << "s)" << endl;
+				if (resumed)
+					cout << "  resume:\tON" << endl;
+			}
+		}
+
 		if (!inHC4) {
 			cerr << "\n  \033[33mwarning: inHC4 disabled\033[0m (does not support vector/matrix operations)" << endl;
 		}
@@ -196,7 +264,9 @@ int main(int argc, char** argv) {
 			cout << "running............" << endl << endl;
 
 		// Search for the optimum
-		if (initial_loup)
+		if (resumed)
+			o.optimize(checkpoint.Get().c_str());
+		else if (initial_loup)
 			o.optimize(sys.box, initial_loup.Get());
 		else
 			o.optimize(sys.box);
@@ -207,6 +277,9 @@ int main(int argc, char** argv) {
 
 		o.report(!quiet);
 
+		if (trace_replay && !quiet && search_trace.nb_mismatches>0)
+			cout << " " << search_trace.nb_mismatches << " trace events could not be replayed" << endl;
+
 		return 0;
 
 	}
@@ -28,6 +28,7 @@ std::pair<IntervalVector, double> LoupFinderDefault::find(const IntervalVector&
 	bool found=false;
 
 	try {
+		Profiler::Scope scope(probing_counter);
 		p=finder_probing.find(box,p.first,p.second);
 		found=true;
 	} catch(NotFound&) { }
@@ -35,6 +36,7 @@ std::pair<IntervalVector, double> LoupFinderDefault::find(const IntervalVector&
 	try {
 		// TODO
 		// in_x_taylor.set_inactive_ctr(entailed->norm_entailed);
+		Profiler::Scope scope(x_taylor_counter);
 		p=finder_x_taylor.find(box,p.first,p.second);
 		found=true;
 	} catch(NotFound&) { }
@@ -13,6 +13,7 @@
 #include "ibex_LoupFinder.h"
 #include "ibex_System.h"
 #include "ibex_LoupFinderXTaylor.h"
+#include "ibex_Profiler.h"
 
 namespace ibex {
 
@@ -71,6 +72,16 @@ public:
 	 * Loup finder using inner polytopes.
 	 */
 	LoupFinderXTaylor finder_x_taylor;
+
+	/**
+	 * Time and number of calls of finder_probing (disabled by default).
+	 */
+	Profiler::Counter probing_counter;
+
+	/**
+	 * Time and number of calls of finder_x_taylor (disabled by default).
+	 */
+	Profiler::Counter x_taylor_counter;
 };
 
 } /* namespace ibex */
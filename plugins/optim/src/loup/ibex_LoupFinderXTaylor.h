@@ -5,7 +5,7 @@
 // Copyright   : IMT Atlantique (France)
 // License     : See the LICENSE file
 // Created     : Jul 12, 2012
-// Last Update : Jul 09, 2017
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #ifndef __IBEX_LOUP_FINDER_X_TAYLOR_H__
@@ -50,6 +50,11 @@ public:
 	 */
 	const System& sys;
 
+	/**
+	 * \brief Time and number of calls of the LP solver (see #LPSolver::solve_counter).
+	 */
+	Profiler::Counter& lp_solve_counter();
+
 protected:
 
 	/** Linearization technique. */
@@ -63,6 +68,12 @@ protected:
 //	double diam_simplex;
 };
 
+/*============================================ inline implementation ============================================ */
+
+inline Profiler::Counter& LoupFinderXTaylor::lp_solve_counter() {
+	return lp_solver.solve_counter;
+}
+
 } /* namespace ibex */
 
 #endif /* __IBEX_LOUP_FINDER_X_TAYLOR_H__ */
@@ -96,6 +96,12 @@ Cell* CellBeamSearch::top() const {
 		}
 }
 
+void CellBeamSearch::get_cells(std::vector<const Cell*>& cells) const {
+	currentbuffer.get_cells(cells);
+	futurebuffer.get_cells(cells);
+	CellHeap::get_cells(cells);
+}
+
 // the minimum of all open nodes
 double CellBeamSearch::minimum() const {
 	assert (!(empty()));
@@ -71,6 +71,9 @@ public :
 	/** \brief Return the next cell (but does not pop it).*/
 	virtual Cell* top() const;
 
+	/** \brief Add the cells of all 3 buffers (global, current and future) to a vector. */
+	virtual void get_cells(std::vector<const Cell*>& cells) const;
+
 	/** \brief Returns the minimum LB of all 3 buffers (global , current and future). */
 	virtual double minimum() const;
 
@@ -0,0 +1,116 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_CellBufferOptimTrace.cpp
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#include "ibex_CellBufferOptimTrace.h"
+
+using namespace std;
+
+namespace ibex {
+
+CellBufferOptimTrace::CellBufferOptimTrace(CellBufferOptim& buffer, SearchTrace& trace, int goal_var) :
+		buffer(buffer), trace(trace), goal_var(goal_var) {
+
+}
+
+CellBufferOptimTrace::~CellBufferOptimTrace() {
+
+}
+
+void CellBufferOptimTrace::add_backtrackable(Cell& root) {
+	buffer.add_backtrackable(root);
+}
+
+void CellBufferOptimTrace::flush() {
+	buffer.flush();
+	trace.flush();
+	costs.clear();
+}
+
+unsigned int CellBufferOptimTrace::size() const {
+	if (trace.mode()==SearchTrace::REPLAY)
+		return trace.pending().size();
+	else
+		return buffer.size();
+}
+
+bool CellBufferOptimTrace::empty() const {
+	if (trace.mode()==SearchTrace::REPLAY)
+		return trace.empty();
+	else
+		return buffer.empty();
+}
+
+void CellBufferOptimTrace::push(Cell* cell) {
+	if (trace.mode()==SearchTrace::REPLAY) {
+		trace.push(cell);
+		costs.insert(make_pair(cell->box[goal_var].lb(), SearchTrace::id(*cell)));
+	} else
+		buffer.push(cell);
+}
+
+Cell* CellBufferOptimTrace::pop() {
+	switch (trace.mode()) {
+	case SearchTrace::RECORD:
+	{
+		Cell* c=buffer.pop();
+		trace.popped(*c);
+		return c;
+	}
+	case SearchTrace::REPLAY:
+	{
+		Cell* c=trace.pop();
+		if (c) costs.erase(make_pair(c->box[goal_var].lb(), SearchTrace::id(*c)));
+		return c;
+	}
+	default:
+		return buffer.pop();
+	}
+}
+
+Cell* CellBufferOptimTrace::top() const {
+	if (trace.mode()==SearchTrace::REPLAY)
+		return trace.top();
+	else
+		return buffer.top();
+}
+
+void CellBufferOptimTrace::get_cells(vector<const Cell*>& cells) const {
+	if (trace.mode()==SearchTrace::REPLAY) {
+		for (map<uint32_t,Cell*>::const_iterator it=trace.pending().begin(); it!=trace.pending().end(); it++)
+			cells.push_back(it->second);
+	} else
+		buffer.get_cells(cells);
+}
+
+double CellBufferOptimTrace::minimum() const {
+	if (trace.mode()==SearchTrace::REPLAY)
+		return costs.empty()? POS_INFINITY : costs.begin()->first;
+	else
+		return buffer.minimum();
+}
+
+void CellBufferOptimTrace::contract(double loup) {
+	if (trace.mode()==SearchTrace::REPLAY) {
+		while (!costs.empty() && costs.rbegin()->first > loup) {
+			set<pair<double,uint32_t> >::iterator it=--costs.end();
+			trace.remove(it->second);
+			costs.erase(it);
+		}
+	} else
+		buffer.contract(loup);
+}
+
+ostream& CellBufferOptimTrace::print(ostream& os) const {
+	if (trace.mode()==SearchTrace::REPLAY)
+		return CellBuffer::print(os);
+	else
+		return os << buffer;
+}
+
+} // end namespace ibex
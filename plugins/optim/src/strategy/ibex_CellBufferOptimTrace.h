@@ -0,0 +1,103 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_CellBufferOptimTrace.h
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#ifndef __IBEX_CELL_BUFFER_OPTIM_TRACE_H__
+#define __IBEX_CELL_BUFFER_OPTIM_TRACE_H__
+
+#include "ibex_CellBufferOptim.h"
+#include "ibex_SearchTrace.h"
+
+#include <set>
+
+namespace ibex {
+
+/**
+ * \ingroup optim
+ *
+ * \brief Traced cell buffer (for global optimization).
+ *
+ * This buffer calls another buffer and records the cells popped
+ * in a search trace (RECORD mode) or returns the cells in the recorded
+ * order, the sub-buffer being ignored (REPLAY mode).
+ * See #ibex::SearchTrace and #ibex::CellBufferTrace.
+ *
+ * In REPLAY mode, the cost of a cell is the lower bound of the objective
+ * domain (as for the first heap of #ibex::CellDoubleHeap).
+ *
+ * If the trace is OFF, this buffer behaves exactly as the sub-buffer.
+ */
+class CellBufferOptimTrace : public CellBufferOptim {
+public:
+	/**
+	 * \brief Create a traced version of \a buffer.
+	 *
+	 * \param buffer   - the sub-buffer
+	 * \param trace    - the search trace
+	 * \param goal_var - index of the objective variable
+	 */
+	CellBufferOptimTrace(CellBufferOptim& buffer, SearchTrace& trace, int goal_var);
+
+	/**
+	 * \brief Delete *this.
+	 */
+	virtual ~CellBufferOptimTrace();
+
+	/** \brief Add backtrackable data required by the sub-buffer. */
+	virtual void add_backtrackable(Cell& root);
+
+	/** \brief Flush the buffer. */
+	virtual void flush();
+
+	/** \brief Return the size of the buffer. */
+	virtual unsigned int size() const;
+
+	/** \brief Return true if the buffer is empty. */
+	virtual bool empty() const;
+
+	/** \brief Push a new cell on the buffer. */
+	virtual void push(Cell* cell);
+
+	/** \brief Pop a cell from the buffer and return it.*/
+	virtual Cell* pop();
+
+	/** \brief Return the next cell (but does not pop it).*/
+	virtual Cell* top() const;
+
+	/** \brief Add the cells of the buffer (or the pending cells, in REPLAY mode) to a vector. */
+	virtual void get_cells(std::vector<const Cell*>& cells) const;
+
+	/** \brief Return the minimum cost of the buffer. */
+	virtual double minimum() const;
+
+	/** \brief Remove (and delete) the cells with a cost greater than \a loup. */
+	virtual void contract(double loup);
+
+	/**
+	 * \brief The sub-buffer.
+	 */
+	CellBufferOptim& buffer;
+
+	/**
+	 * \brief The trace.
+	 */
+	SearchTrace& trace;
+
+protected:
+	virtual std::ostream& print(std::ostream& os) const;
+
+	/** Index of the objective variable. */
+	const int goal_var;
+
+	/** REPLAY mode: costs of the pending cells (sorted). */
+	std::set<std::pair<double,uint32_t> > costs;
+};
+
+} // namespace ibex
+
+#endif // __IBEX_CELL_BUFFER_OPTIM_TRACE_H__
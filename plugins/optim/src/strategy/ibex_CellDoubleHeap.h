@@ -84,6 +84,9 @@ public:
 	/** \brief Return the next box (but does not pop it).*/
 	Cell* top() const;
 
+	/** \brief Add the cells of the heap to a vector. */
+	void get_cells(std::vector<const Cell*>& cells) const;
+
 
 	std::ostream& print(std::ostream& os) const;
 
@@ -175,6 +178,10 @@ inline void CellDoubleHeap::push(Cell* cell) {
 inline Cell* CellDoubleHeap::pop()                { return DoubleHeap<Cell>::pop(); }
 inline Cell* CellDoubleHeap::top() const          { return DoubleHeap<Cell>::top(); }
 
+inline void CellDoubleHeap::get_cells(std::vector<const Cell*>& cells) const {
+	DoubleHeap<Cell>::get_data(cells);
+}
+
 inline double CellDoubleHeap::minimum() const     { return DoubleHeap<Cell>::minimum(); }
 
 inline std::ostream& CellDoubleHeap::print(std::ostream& os) const {
@@ -5,7 +5,7 @@
 // Copyright   : Ecole des Mines de Nantes (France)
 // License     : See the LICENSE file
 // Created     : September 7, 2017
-// Last Update : September 8, 2017
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #include "ibex_CellHeap.h"
@@ -36,6 +36,11 @@ Cell* CellHeap::pop()                    { return Heap<Cell>::pop(); }
 
 Cell* CellHeap::top() const              { return Heap<Cell>::top(); }
 
+void CellHeap::get_cells(vector<const Cell*>& cells) const {
+	for (vector<pair<Cell*,double> >::const_iterator it=l.begin(); it!=l.end(); it++)
+		cells.push_back(it->first);
+}
+
 double CellHeap::minimum() const         { return Heap<Cell>::minimum(); }
 
 void CellHeap::contract(double new_loup) { Heap<Cell>::contract(new_loup); }
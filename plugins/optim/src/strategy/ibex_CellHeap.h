@@ -63,6 +63,9 @@ public:
 	/** \brief Return the top cell (but does not pop it).*/
 	virtual Cell* top() const;
 
+	/** \brief Add the cells of the heap to a vector. */
+	virtual void get_cells(std::vector<const Cell*>& cells) const;
+
 	virtual std::ostream& print(std::ostream& os) const;
 
 	/**
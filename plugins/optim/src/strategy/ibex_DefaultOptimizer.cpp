@@ -5,7 +5,7 @@
 // Copyright   : Ecole des Mines de Nantes (France)
 // License     : See the LICENSE file
 // Created     : Aug 27, 2012
-// Last Update : Nov 21, 2017
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #include "ibex_DefaultOptimizer.h"
@@ -25,6 +25,9 @@
 #include "ibex_Random.h"
 #include "ibex_CellBeamSearch.h"
 #include "ibex_CellHeap.h"
+#include "ibex_CtcProfiled.h"
+#include "ibex_BscTrace.h"
+#include "ibex_CellBufferOptimTrace.h"
 
 using namespace std;
 
@@ -34,6 +37,12 @@ const double DefaultOptimizer::default_random_seed = 1.0;
 
 #define NORMALIZED_SYSTEM_TAG 1
 #define EXTENDED_SYSTEM_TAG 2
+#define LOUP_FINDER_TAG 3
+#define CTC_HC4_TAG 4
+#define CTC_ACID_TAG 5
+#define CTC_XNEWTON_TAG 6
+#define CTC_POLYTOPE_HULL_TAG 8
+#define LSMEAR_TAG 9
 
 #define default_relax_ratio 0.2
 
@@ -58,14 +67,42 @@ ExtendedSystem& DefaultOptimizer::get_ext_sys(const System& sys, double eps_h) {
 	}
 }
 
-DefaultOptimizer::DefaultOptimizer(const System& sys, double rel_eps_f, double abs_eps_f, double eps_h, bool rigor, bool inHC4, double random_seed, double eps_x) :
+LoupFinderDefault& DefaultOptimizer::get_loup_finder(const System& sys, double eps_h, bool inHC4) {
+	if (found(LOUP_FINDER_TAG)) {
+		return get<LoupFinderDefault>(LOUP_FINDER_TAG);
+	} else {
+		return rec(new LoupFinderDefault(get_norm_sys(sys,eps_h),inHC4), LOUP_FINDER_TAG);
+	}
+}
+
+// The bisector and the buffer are only wrapped if the search is traced
+// (the wrappers add an indirection to each operation).
+
+Bsc& DefaultOptimizer::get_bsc(const System& sys, double eps_h, double eps_x, SearchTrace* search_trace) {
+	Bsc& bsc=rec(new LSmear(get_ext_sys(sys,eps_h),eps_x), LSMEAR_TAG);
+	if (search_trace)
+		return rec(new BscTrace(bsc, *search_trace));
+	else
+		return bsc;
+}
+
+CellBufferOptim& DefaultOptimizer::get_buffer(const System& sys, double eps_h, SearchTrace* search_trace) {
+	CellBufferOptim& buffer=rec(new CellDoubleHeap(get_ext_sys(sys,eps_h)));
+	if (search_trace)
+		return (CellBufferOptim&) rec(new CellBufferOptimTrace(buffer, *search_trace, get_ext_sys(sys,eps_h).goal_var()));
+	else
+		return buffer;
+}
+
+DefaultOptimizer::DefaultOptimizer(const System& sys, double rel_eps_f, double abs_eps_f, double eps_h, bool rigor, bool inHC4, double random_seed, double eps_x,
+		SearchTrace* search_trace) :
 		Optimizer(sys.nb_var,
 			  ctc(get_ext_sys(sys,eps_h)), // warning: we don't know which argument is evaluated first
 //			  rec(new SmearSumRelative(get_ext_sys(sys,eps_h),eps_x)),
-			  rec(new LSmear(get_ext_sys(sys,eps_h),eps_x)),
-			  rec(rigor? (LoupFinder*) new LoupFinderCertify(sys,rec(new LoupFinderDefault(get_norm_sys(sys,eps_h),inHC4))) :
-						 (LoupFinder*) new LoupFinderDefault(get_norm_sys(sys,eps_h),inHC4)),
-			  (CellBufferOptim&) rec(new CellDoubleHeap(get_ext_sys(sys,eps_h))),
+			  get_bsc(sys,eps_h,eps_x,search_trace),
+			  rigor? (LoupFinder&) rec(new LoupFinderCertify(sys,get_loup_finder(sys,eps_h,inHC4))) :
+					 (LoupFinder&) get_loup_finder(sys,eps_h,inHC4),
+			  get_buffer(sys,eps_h,search_trace),
 //			  (CellBufferOptim&) rec (new  CellBeamSearch (
 //								       (CellHeap&) rec (new CellHeap (get_ext_sys(sys,eps_h))),
 //								       (CellHeap&) rec (new CellHeap (get_ext_sys(sys,eps_h))),
@@ -74,27 +111,41 @@ DefaultOptimizer::DefaultOptimizer(const System& sys, double rel_eps_f, double a
 			  eps_x,
 			  rel_eps_f,
 			  abs_eps_f) {
-  
 
 	RNG::srand(random_seed);
 
+	// counters of the components (see Optimizer::profiler)
+	profiler.add("contraction/HC4",       get<CtcProfiled>(CTC_HC4_TAG).counter);
+	profiler.add("contraction/ACID",      get<CtcProfiled>(CTC_ACID_TAG).counter);
+	profiler.add("contraction/X-Newton",  get<CtcProfiled>(CTC_XNEWTON_TAG).counter);
+	profiler.add("loup finding/inner box", get_loup_finder(sys,eps_h,inHC4).probing_counter);
+	profiler.add("loup finding/XTaylor",  get_loup_finder(sys,eps_h,inHC4).x_taylor_counter);
+
+	// counters of the LP solvers of the components
+#ifndef _IBEX_WITH_NOLP_
+	profiler.add("LP solves/X-Newton",    get<CtcPolytopeHull>(CTC_POLYTOPE_HULL_TAG).lp_solve_counter());
+#endif
+	profiler.add("LP solves/LSmear",      get<LSmear>(LSMEAR_TAG).mylinearsolver->solve_counter);
+	profiler.add("LP solves/XTaylor",     get_loup_finder(sys,eps_h,inHC4).finder_x_taylor.lp_solve_counter());
 }
 
 Ctc&  DefaultOptimizer::ctc(const System& ext_sys) {
 	Array<Ctc> ctc_list(3);
 
+	// Each contractor is profiled (see Optimizer::profiler)
+
 	// first contractor on ext_sys : incremental HC4 (propag ratio=0.01)
-	ctc_list.set_ref(0, rec(new CtcHC4 (ext_sys.ctrs,0.01,true)));
+	ctc_list.set_ref(0, rec(new CtcProfiled(rec(new CtcHC4 (ext_sys.ctrs,0.01,true))), CTC_HC4_TAG));
 	// second contractor on ext_sys : "Acid" with incremental HC4 (propag ratio=0.1)
-	ctc_list.set_ref(1, rec(new CtcAcid (ext_sys,rec(new CtcHC4 (ext_sys.ctrs,0.1,true)),true)));
+	ctc_list.set_ref(1, rec(new CtcProfiled(rec(new CtcAcid (ext_sys,rec(new CtcHC4 (ext_sys.ctrs,0.1,true)),true))), CTC_ACID_TAG));
 	// the last contractor is "XNewton"
 	if (ext_sys.nb_ctr > 1) {
-		ctc_list.set_ref(2,rec(new CtcFixPoint
+		ctc_list.set_ref(2,rec(new CtcProfiled(rec(new CtcFixPoint
 				(rec(new CtcCompo(
-						rec(new CtcPolytopeHull(rec(new LinearizerCombo (ext_sys,LinearizerCombo::XNEWTON)))),
-								rec(new CtcHC4(ext_sys.ctrs,0.01)))), default_relax_ratio)));
+						rec(new CtcPolytopeHull(rec(new LinearizerCombo (ext_sys,LinearizerCombo::XNEWTON))), CTC_POLYTOPE_HULL_TAG),
+								rec(new CtcHC4(ext_sys.ctrs,0.01)))), default_relax_ratio))), CTC_XNEWTON_TAG));
 	} else {
-		ctc_list.set_ref(2,rec(new CtcPolytopeHull(rec(new LinearizerCombo (ext_sys,LinearizerCombo::XNEWTON)))));
+		ctc_list.set_ref(2,rec(new CtcProfiled(rec(new CtcPolytopeHull(rec(new LinearizerCombo (ext_sys,LinearizerCombo::XNEWTON))), CTC_POLYTOPE_HULL_TAG)), CTC_XNEWTON_TAG));
 	}
 	return rec(new CtcCompo(ctc_list));
 }
@@ -5,7 +5,7 @@
 // Copyright   : IMT Atlantique (France)
 // License     : See the LICENSE file
 // Created     : Aug 27, 2012
-// Last Update : Jul 25, 2017
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #ifndef __IBEX_DEFAULT_OPTIMIZER_H__
@@ -16,6 +16,8 @@
 #include "ibex_Memory.h"
 #include "ibex_NormalizedSystem.h"
 #include "ibex_ExtendedSystem.h"
+#include "ibex_LoupFinderDefault.h"
+#include "ibex_SearchTrace.h"
 
 namespace ibex {
 
@@ -41,6 +43,11 @@ public:
 	 *                      reproducibility). Set by default to #default_random_seed.
 	 * \param eps_x       - Stopping criterion for box splitting (absolute precision).
 	 *                      (**deprecated**).
+	 * \param search_trace - If not NULL, the search tree is recorded in or replayed
+	 *                      from this trace, depending on its mode (see #SearchTrace).
+	 *                      The bisector and the cell buffer are only wrapped
+	 *                      (see #BscTrace and #CellBufferOptimTrace) in this case.
+	 *                      The trace is not deleted by the optimizer. By default: NULL.
 	 */
     DefaultOptimizer(const System& sys,
     		double rel_eps_f=Optimizer::default_rel_eps_f,
@@ -48,11 +55,19 @@ public:
 			double eps_h=NormalizedSystem::default_eps_h,
 			bool rigor=false, bool inHC4=true,
 			double random_seed=default_random_seed,
-    		double eps_x=Optimizer::default_eps_x);
+    		double eps_x=Optimizer::default_eps_x,
+			SearchTrace* search_trace=NULL);
 
 	/** Default random seed: 1.0. */
 	static const double default_random_seed;
 
+	/*
+	 * Note: in addition to the phases of the Optimizer, the profiler
+	 * counts the time and number of calls of each contractor (HC4, ACID
+	 * and X-Newton), of each loup finder (inner box and XTaylor) and of
+	 * the LP solvers of X-Newton, LSmear and XTaylor.
+	 */
+
 private:
 
     /**
@@ -64,6 +79,12 @@ private:
 
 	ExtendedSystem& get_ext_sys(const System& sys, double eps_h);
 
+	LoupFinderDefault& get_loup_finder(const System& sys, double eps_h, bool inHC4);
+
+	Bsc& get_bsc(const System& sys, double eps_h, double eps_x, SearchTrace* search_trace);
+
+	CellBufferOptim& get_buffer(const System& sys, double eps_h, SearchTrace* search_trace);
+
 };
 
 } // end namespace ibex
@@ -4,7 +4,7 @@
 // Copyright   : Ecole des Mines de Nantes (France)
 // License     : See the LICENSE file
 // Created     : May 14, 2012
-// Last Update : December 24, 2012
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #include "ibex_Optimizer.h"
@@ -16,7 +16,11 @@
 
 #include <float.h>
 #include <stdlib.h>
+#include <stdint.h>
+#include <cstdio>
+#include <cstring>
 #include <iomanip>
+#include <fstream>
 
 using namespace std;
 
@@ -25,6 +29,69 @@ namespace ibex {
 const double Optimizer::default_eps_x = 0;
 const double Optimizer::default_rel_eps_f = 1e-03;
 const double Optimizer::default_abs_eps_f = 1e-07;
+const double Optimizer::default_checkpoint_period = 600;
+
+namespace {
+
+const char* CHECKPOINT_SIGNATURE = "IBEX OPTIMIZER CHECKPOINT";
+const int CHECKPOINT_SIGNATURE_LENGTH = 26; // including the null character
+const uint32_t CHECKPOINT_FORMAT_VERSION = 1;
+
+void write_int(ofstream& f, uint32_t x) {
+	f.write((const char*) &x, sizeof(uint32_t));
+}
+
+void write_long(ofstream& f, uint64_t x) {
+	f.write((const char*) &x, sizeof(uint64_t));
+}
+
+void write_double(ofstream& f, double x) {
+	f.write((const char*) &x, sizeof(double));
+}
+
+void write_box(ofstream& f, const IntervalVector& box) {
+	for (int i=0; i<box.size(); i++) {
+		write_double(f,box[i].lb());
+		write_double(f,box[i].ub());
+	}
+}
+
+uint32_t read_int(ifstream& f) {
+	uint32_t x=0;
+	f.read((char*) &x, sizeof(uint32_t));
+	return x;
+}
+
+uint64_t read_long(ifstream& f) {
+	uint64_t x=0;
+	f.read((char*) &x, sizeof(uint64_t));
+	return x;
+}
+
+double read_double(ifstream& f) {
+	double x=0;
+	f.read((char*) &x, sizeof(double));
+	return x;
+}
+
+void read_box(ifstream& f, IntervalVector& box) {
+	for (int i=0; i<box.size(); i++) {
+		double lb=read_double(f);
+		double ub=read_double(f);
+		box[i]=Interval(lb,ub);
+	}
+}
+
+/* Number of bytes between the current position and the end of the file. */
+uint64_t remaining_bytes(ifstream& f) {
+	streampos pos=f.tellg();
+	f.seekg(0, ios::end);
+	streampos end=f.tellg();
+	f.seekg(pos);
+	return f.fail() || end<pos ? 0 : (uint64_t) (end-pos);
+}
+
+}
 
 void Optimizer::write_ext_box(const IntervalVector& box, IntervalVector& ext_box) {
 	int i2=0;
@@ -48,12 +115,16 @@ Optimizer::Optimizer(int n, Ctc& ctc, Bsc& bsc, LoupFinder& finder,
                 				n(n), goal_var(goal_var),
                 				ctc(ctc), bsc(bsc), loup_finder(finder), buffer(buffer),
                 				eps_x(eps_x), rel_eps_f(rel_eps_f), abs_eps_f(abs_eps_f),
-                				trace(0), timeout(-1),
+                				trace(0), timeout(-1), checkpoint_period(default_checkpoint_period),
                 				status(SUCCESS),
                 				//kkt(normalized_user_sys),
 						uplo(NEG_INFINITY), uplo_of_epsboxes(POS_INFINITY), loup(POS_INFINITY),
                 				loup_point(n), initial_loup(POS_INFINITY), loup_changed(false),
-                                                time(0), nb_cells(0) {
+                                                time(0), optim_init_box(n), nb_cells(0),
+                                                ctc_counter(profiler.add("contraction")),
+                                                loup_counter(profiler.add("loup finding")),
+                                                bsc_counter(profiler.add("bisection")),
+                                                buffer_counter(profiler.add("buffer")) {
 
 	if (trace) cout.precision(12);
 }
@@ -73,6 +144,8 @@ double Optimizer::compute_ymax() {
 
 bool Optimizer::update_loup(const IntervalVector& box) {
 
+	Profiler::Scope scope(loup_counter);
+
 	try {
 		pair<IntervalVector,double> p=loup_finder.find(box,loup_point,loup);
 		loup_point = p.first;
@@ -112,7 +185,9 @@ void Optimizer::update_uplo() {
 	double new_uplo=POS_INFINITY;
 
 	if (! buffer.empty()) {
+		buffer_counter.start();
 		new_uplo= buffer.minimum();
+		buffer_counter.stop();
 		if (new_uplo > loup) {
 			cout << " loup = " << loup << " new_uplo=" << new_uplo << endl;
 			ibex_error("optimizer: new_uplo>loup (please report bug)");
@@ -167,9 +242,12 @@ void Optimizer::handle_cell(Cell& c, const IntervalVector& init_box ){
 	contract_and_bound(c, init_box);
 
 	if (c.box.is_empty()) {
+		buffer_stats.empty_cell();
 		delete &c;
 	} else {
+		Profiler::Scope scope(buffer_counter);
 		buffer.push(&c);
+		buffer_stats.push(c,buffer.size());
 	}
 }
 
@@ -195,7 +273,10 @@ void Optimizer::contract_and_bound(Cell& c, const IntervalVector& init_box) {
 	//cout << " [contract]  x before=" << c.box << endl;
 	//cout << " [contract]  y before=" << y << endl;
 
-	ctc.contract(c.box);
+	{
+		Profiler::Scope scope(ctc_counter);
+		ctc.contract(c.box);
+	}
 
 	if (c.box.is_empty()) return;
 
@@ -265,8 +346,12 @@ Optimizer::Status Optimizer::optimize(const IntervalVector& init_box, double obj
 
 	nb_cells=0;
 
+	profiler.reset();
+
 	buffer.flush();
 
+	buffer_stats.reset();
+
 	Cell* root=new Cell(IntervalVector(n+1));
 
 	write_ext_box(init_box,root->box);
@@ -285,35 +370,124 @@ Optimizer::Status Optimizer::optimize(const IntervalVector& init_box, double obj
 
 	loup_changed=false;
 	initial_loup=obj_init_bound;
+	optim_init_box=init_box;
 
 	// TODO: no loup-point if handle_cell contracts everything
 	loup_point=init_box;
 	time=0;
-	Timer timer;
-	timer.start();
+	timer.restart();
 	handle_cell(*root,init_box);
 	
 	update_uplo();
 
+	return search();
+}
+
+Optimizer::Status Optimizer::optimize(const char* checkpoint) {
+
+	ifstream f(checkpoint, ios::in | ios::binary);
+	if (f.fail()) ibex_error("[optimizer]: cannot open checkpoint file.\n");
+
+	char sig[CHECKPOINT_SIGNATURE_LENGTH];
+	f.read(sig, CHECKPOINT_SIGNATURE_LENGTH);
+	if (f.fail() || memcmp(sig, CHECKPOINT_SIGNATURE, CHECKPOINT_SIGNATURE_LENGTH)!=0)
+		ibex_error("[optimizer]: not a checkpoint file.");
+
+	if (read_int(f)!=CHECKPOINT_FORMAT_VERSION)
+		ibex_error("[optimizer]: wrong checkpoint format version.");
+
+	if ((int) read_int(f)!=n || (int) read_int(f)!=goal_var)
+		ibex_error("[optimizer]: bad checkpoint file (number of variables does not match).");
+
+	initial_loup     = read_double(f);
+	loup             = read_double(f);
+	uplo             = read_double(f);
+	uplo_of_epsboxes = read_double(f);
+	time             = read_double(f);
+	nb_cells         = read_long(f);
+
+	read_box(f,optim_init_box);
+	read_box(f,loup_point);
+
+	uint64_t nb_boxes=read_long(f);
+	if (f.fail()) ibex_error("[optimizer]: unexpected end of checkpoint file.");
+
+	// check the number of boxes before allocating them (corrupted file)
+	if (nb_boxes > remaining_bytes(f)/(2*(n+1)*sizeof(double)))
+		ibex_error("[optimizer]: bad checkpoint file (number of boxes does not match the file size).");
+
+	vector<IntervalVector> boxes(nb_boxes, IntervalVector(n+1));
+	for (vector<IntervalVector>::iterator it=boxes.begin(); it!=boxes.end(); it++)
+		read_box(f,*it);
+
+	if (f.fail()) ibex_error("[optimizer]: unexpected end of checkpoint file.");
+	f.close();
+
+	// Just to initialize the "loup" for the buffer
+	buffer.contract(loup);
+
+	profiler.reset();
+
+	buffer.flush();
+
+	buffer_stats.reset();
+
+	loup_changed=false;
+	timer.restart();
+
+	// The data of the cells (bisector, buffer) are not saved: the cells are
+	// handled again as new cells (with the current loup).
+	for (vector<IntervalVector>::const_iterator it=boxes.begin(); it!=boxes.end(); it++) {
+		Cell* c=new Cell(*it);
+		bsc.add_backtrackable(*c);
+		buffer.add_backtrackable(*c);
+		handle_cell(*c,optim_init_box);
+	}
+
+	if (loup_changed) {
+		unsigned int size_before=buffer.size();
+		buffer.contract(compute_ymax());
+		buffer_stats.contract(size_before,buffer.size());
+	}
+
+	update_uplo();
+
+	return search();
+}
+
+Optimizer::Status Optimizer::search() {
+
+	// time of the interrupted search, if any
+	double time0=time;
+	double last_checkpoint=time0;
+
 	try {
 	     while (!buffer.empty()) {
 		  
 			loup_changed=false;
 			// for double heap , choose randomly the buffer : top  has to be called before pop
+			buffer_counter.start();
 			Cell *c = buffer.top(); 
+			buffer_counter.stop();
 			if (trace >= 2) cout << " current box " << c->box << endl;
 
 			try {
 
-
-				pair<Cell*,Cell*> new_cells=bsc.bisect(*c);
+				pair<Cell*,Cell*> new_cells;
+				{
+					Profiler::Scope scope(bsc_counter);
+					new_cells=bsc.bisect(*c);
+				}
+				buffer_counter.start();
 				buffer.pop();
+				buffer_counter.stop();
+				buffer_stats.pop(*c,buffer.size());
 				delete c; // deletes the cell.
 
 				nb_cells+=2;  // counting the cells handled ( in previous versions nb_cells was the number of cells put into the buffer after being handled)
                 
-				handle_cell(*new_cells.first, init_box);
-				handle_cell(*new_cells.second, init_box);
+				handle_cell(*new_cells.first, optim_init_box);
+				handle_cell(*new_cells.second, optim_init_box);
 
 				if (uplo_of_epsboxes == NEG_INFINITY) {
 					cout << " possible infinite minimum " << endl;
@@ -328,7 +502,11 @@ Optimizer::Status Optimizer::optimize(const IntervalVector& init_box, double obj
 
 					double ymax=compute_ymax();
 
+					unsigned int size_before=buffer.size();
+					buffer_counter.start();
 					buffer.contract(ymax);
+					buffer_counter.stop();
+					buffer_stats.contract(size_before,buffer.size());
 				
 					//cout << " now buffer is contracted and min=" << buffer.minimum() << endl;
 
@@ -339,13 +517,20 @@ Optimizer::Status Optimizer::optimize(const IntervalVector& init_box, double obj
 					}
 				}
 				update_uplo();
-				if (timeout>0) timer.check(timeout); // TODO: not reentrant, JN: done
-				time = timer.get_time();
+				if (timeout>0) timer.check(timeout-time0); // TODO: not reentrant, JN: done
+				time = time0+timer.get_time();
 
+				if (!checkpoint_file.empty() && time-last_checkpoint>=checkpoint_period) {
+					checkpoint(checkpoint_file.c_str());
+					last_checkpoint=time;
+				}
 			}
 			catch (NoBisectableVariableException& ) {
 				update_uplo_of_epsboxes((c->box)[goal_var].lb());
+				buffer_counter.start();
 				buffer.pop();
+				buffer_counter.stop();
+				buffer_stats.pop(*c,buffer.size());
 				delete c; // deletes the cell.
 				update_uplo(); // the heap has changed -> recalculate the uplo (eg: if not in best-first search)
 
@@ -353,12 +538,19 @@ Optimizer::Status Optimizer::optimize(const IntervalVector& init_box, double obj
 		}
 	}
 	catch (TimeOutException& ) {
+		buffer_stats.sample(buffer.size());
 		status = TIME_OUT;
+		if (!checkpoint_file.empty()) {
+			time = time0+timer.get_time();
+			checkpoint(checkpoint_file.c_str());
+		}
 		return status;
 	}
 
+	buffer_stats.sample(buffer.size());
+
 	timer.stop();
-	time = timer.get_time();
+	time = time0+timer.get_time();
 
 	if (uplo_of_epsboxes == POS_INFINITY && (loup==POS_INFINITY || (loup==initial_loup && abs_eps_f==0 && rel_eps_f==0)))
 		status=INFEASIBLE;
@@ -371,9 +563,48 @@ Optimizer::Status Optimizer::optimize(const IntervalVector& init_box, double obj
 	else
 		status=SUCCESS;
 
+	// the last checkpoint is the final state
+	if (!checkpoint_file.empty()) checkpoint(checkpoint_file.c_str());
+
 	return status;
 }
 
+void Optimizer::checkpoint(const char* filename) const {
+	string tmp_file=string(filename)+".tmp";
+
+	ofstream f(tmp_file.c_str(), ios::out | ios::binary);
+	if (f.fail()) ibex_error("[optimizer]: cannot create checkpoint file.\n");
+
+	f.write(CHECKPOINT_SIGNATURE, CHECKPOINT_SIGNATURE_LENGTH);
+	write_int(f,CHECKPOINT_FORMAT_VERSION);
+	write_int(f,n);
+	write_int(f,goal_var);
+	write_double(f,initial_loup);
+	write_double(f,loup);
+	write_double(f,uplo);
+	write_double(f,uplo_of_epsboxes);
+	write_double(f,time);
+	write_long(f,nb_cells);
+
+	write_box(f,optim_init_box);
+	write_box(f,loup_point);
+
+	vector<const Cell*> cells;
+	buffer.get_cells(cells);
+	write_long(f,cells.size());
+	for (vector<const Cell*>::const_iterator it=cells.begin(); it!=cells.end(); it++)
+		write_box(f,(*it)->box);
+
+	f.close();
+	if (f.fail()) ibex_error("[optimizer]: cannot write checkpoint file.\n");
+
+#ifdef _WIN32
+	remove(filename); // rename does not overwrite an existing file
+#endif
+	if (rename(tmp_file.c_str(), filename)!=0)
+		ibex_error("[optimizer]: cannot write checkpoint file.\n");
+}
+
 void Optimizer::report(bool verbose) {
 
 	if (!verbose) {
@@ -433,6 +664,16 @@ void Optimizer::report(bool verbose) {
 	}
 	cout << " cpu time used: " << time << "s." << endl;
 	cout << " number of cells: " << nb_cells << endl;
+
+	if (profiler.enabled()) {
+		cout << endl << " profile (wall-clock time and number of calls):" << endl;
+		cout << profiler;
+	}
+
+	if (buffer_stats.enabled) {
+		cout << endl << " cell buffer:" << endl;
+		cout << buffer_stats;
+	}
 }
 
 
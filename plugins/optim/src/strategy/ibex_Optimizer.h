@@ -5,7 +5,7 @@
 // Copyright   : IMT Atlantique (France)
 // License     : See the LICENSE file
 // Created     : May 14, 2012
-// Last Update : Jul 24, 2017
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #ifndef __IBEX_OPTIMIZER_H__
@@ -17,6 +17,11 @@
 #include "ibex_CellBufferOptim.h"
 //#include "ibex_EntailedCtr.h"
 #include "ibex_CtcKhunTucker.h"
+#include "ibex_Profiler.h"
+#include "ibex_CellBufferStats.h"
+#include "ibex_Timer.h"
+
+#include <string>
 
 namespace ibex {
 
@@ -121,6 +126,36 @@ public:
 	 */
 	Status optimize(const IntervalVector& init_box, double obj_init_bound=POS_INFINITY);
 
+	/**
+	 * \brief Continue an optimization from a checkpoint file.
+	 *
+	 * The search continues with the initial box, the initial bound, the loup,
+	 * the loup point, the uplo and the cells of the buffer saved in the file
+	 * by an interrupted call to optimize(...) (see #checkpoint_file), possibly
+	 * on another machine. The cells are contracted again before the search
+	 * continues.
+	 *
+	 * The time and the number of cells include those of the interrupted
+	 * search and the time limit (#timeout) bounds the total time.
+	 *
+	 * \return same as optimize(init_box, obj_init_bound).
+	 */
+	Status optimize(const char* checkpoint);
+
+	/**
+	 * \brief Save the state of the current search in a file.
+	 *
+	 * The file (binary, native byte order) contains the initial box, the
+	 * initial bound, the loup, the loup point, the uplo, the time, the number
+	 * of cells and the (extended) boxes of the cells of the buffer.
+	 * See optimize(const char*).
+	 *
+	 * The file is first written in a temporary file ("filename.tmp") which
+	 * is then renamed, so that an interruption during the writing does not
+	 * corrupt a previous checkpoint.
+	 */
+	void checkpoint(const char* filename) const;
+
 	/* =========================== Output ============================= */
 
 	/**
@@ -131,6 +166,10 @@ public:
 	 *     <li> the best feasible point found
 	 *     <li> total running time
 	 *     <li> total number of cells (~boxes) created during the exploration
+	 *     <li> time and number of calls of each phase/component (in verbose
+	 *          mode, if the profiler is enabled)
+	 *     <li> cell buffer statistics (in verbose mode, if #buffer_stats
+	 *          is enabled)
 	 * </ul>
 	 */
 	void report(bool verbose=true);
@@ -270,9 +309,60 @@ public:
 	 * Maximum CPU time used by the strategy.
 	 * This parameter allows to bound time consumption.
 	 * The value can be fixed by the user.
+	 *
+	 * When the search is resumed (see optimize(const char*)), the time of
+	 * the interrupted search is included: the limit bounds the total time
+	 * (see #get_time()).
 	 */
 	double timeout;
 
+	/**
+	 * \brief Checkpoint file.
+	 *
+	 * If not empty, the state of the search is saved in this file every
+	 * #checkpoint_period seconds, when time is out and at the end of
+	 * optimize(...) (see #checkpoint()), so that a long search survives an
+	 * interruption. By default, it is empty (no checkpoint).
+	 */
+	std::string checkpoint_file;
+
+	/**
+	 * \brief CPU time between two checkpoints (in seconds).
+	 *
+	 * By default, it is #default_checkpoint_period.
+	 */
+	double checkpoint_period;
+
+	/** Default time between two checkpoints: 600s. */
+	static const double default_checkpoint_period;
+
+	/**
+	 * \brief Time and call counters.
+	 *
+	 * Disabled by default. Once enabled (profiler.enable()), the time spent
+	 * and the number of calls are counted during optimize(...) for each phase
+	 * of the search:
+	 * - "contraction" (the contractor #ctc)
+	 * - "loup finding" (the loup finder)
+	 * - "bisection" (the bisector)
+	 * - "buffer" (push, pop and contraction of the cell buffer)
+	 *
+	 * Subclasses can add counters for their components, including the
+	 * LP solvers of the components (see, e.g., #DefaultOptimizer).
+	 */
+	Profiler profiler;
+
+	/**
+	 * \brief Cell buffer telemetry.
+	 *
+	 * Disabled by default. Once enabled (buffer_stats.enabled=true),
+	 * the size of the buffer, its estimated memory, the maximal depth
+	 * of the cells and the number of pushed, popped and contracted cells
+	 * are recorded during optimize(...), with a sample of the buffer
+	 * state every buffer_stats.sampling_period pops (see #CellBufferStats).
+	 */
+	CellBufferStats buffer_stats;
+
 
 protected:
 
@@ -300,6 +390,13 @@ protected:
 	 */
 	void contract_and_bound(Cell& c, const IntervalVector& init_box);
 
+	/**
+	 * \brief Main loop (process the cells of the buffer until the search is over).
+	 *
+	 * Called by optimize(...) once the buffer is initialized.
+	 */
+	Status search();
+
 	/**
 	 * \brief Update the entailed constraint for the current box
 	 *
@@ -392,8 +489,20 @@ private:
 	/* CPU running time of the current optimization. */
 	double time;
 
+	/* Timer of the current optimization. */
+	Timer timer;
+
+	/* Initial box of the current optimization. */
+	IntervalVector optim_init_box;
+
 	/** Number of cells pushed into the heap (which passed through the contractors) */
 	size_t nb_cells;
+
+	/** Counters of the phases (see #profiler). */
+	Profiler::Counter& ctc_counter;
+	Profiler::Counter& loup_counter;
+	Profiler::Counter& bsc_counter;
+	Profiler::Counter& buffer_counter;
 };
 
 inline Optimizer::Status Optimizer::get_status() const { return status; }
@@ -7,7 +7,7 @@
  *
  * Author(s)   : Gilles Chabert
  * Created     : Mar 2, 2012
- * Last update : Oct 17, 2017
+ * Last update : Oct 19, 2026
  * ---------------------------------------------------------------------------- */
 
 #include "TestOptimizer.h"
@@ -15,6 +15,8 @@
 #include "ibex_DefaultOptimizer.h"
 #include "ibex_SystemFactory.h"
 
+#include <stdio.h>
+
 using namespace std;
 
 namespace ibex {
@@ -107,5 +109,138 @@ void TestOptimizer::issue50_4() {
 	CPPUNIT_ASSERT(issue50(-1e-10, 0)==Optimizer::INFEASIBLE);
 }
 
+void TestOptimizer::buffer_stats() {
+	const ExprSymbol& x=ExprSymbol::new_(Dim::col_vec(3));
+
+	SystemFactory f;
+	f.add_var(x);
+	f.add_ctr(x[0]*x[1]*x[2]>=1);
+	f.add_goal(x*x);
+	System sys(f);
+
+	DefaultOptimizer o(sys,
+			Optimizer::default_rel_eps_f,
+			Optimizer::default_abs_eps_f,
+			NormalizedSystem::default_eps_h, false, false); // no INHC4
+
+	o.buffer_stats.enabled=true;
+	o.buffer_stats.sampling_period=1;
+	o.optimize(IntervalVector(3,Interval(0,10)));
+
+	const CellBufferStats& s=o.buffer_stats;
+	CPPUNIT_ASSERT(s.nb_pushes>0);
+	CPPUNIT_ASSERT(s.nb_pushes+s.nb_empty==(unsigned long) o.get_nb_cells()+1);
+	CPPUNIT_ASSERT(s.nb_pushes==s.nb_pops+s.nb_contracted+s.size);
+	CPPUNIT_ASSERT(s.max_size>=1);
+	CPPUNIT_ASSERT(s.max_depth>0);
+	CPPUNIT_ASSERT(s.max_bytes()>0);
+	// the search is over: the buffer is empty
+	CPPUNIT_ASSERT(s.size==0 && s.bytes()==0);
+	// one sample per pop + the final one
+	CPPUNIT_ASSERT(s.samples.size()==s.nb_pops+1);
+}
+
+void TestOptimizer::search_trace() {
+	const ExprSymbol& x=ExprSymbol::new_(Dim::col_vec(3));
+
+	SystemFactory f;
+	f.add_var(x);
+	f.add_ctr(x[0]*x[1]*x[2]>=1);
+	f.add_goal(x*x);
+	System sys(f);
+
+	const char* filename="search_trace.tmp";
+
+	Optimizer::Status status;
+	int nb_cells;
+	double loup, uplo;
+	unsigned long nb_events;
+	{
+		SearchTrace trace;
+		trace.record(filename);
+
+		DefaultOptimizer o(sys,
+				Optimizer::default_rel_eps_f,
+				Optimizer::default_abs_eps_f,
+				NormalizedSystem::default_eps_h, false, false,
+				DefaultOptimizer::default_random_seed,
+				Optimizer::default_eps_x, &trace);
+
+		status=o.optimize(IntervalVector(3,Interval(0,10)));
+		nb_cells=o.get_nb_cells();
+		loup=o.get_loup();
+		uplo=o.get_uplo();
+		nb_events=trace.nb_events();
+		CPPUNIT_ASSERT(nb_events>0);
+	}
+
+	// the same tree is explored
+	{
+		SearchTrace trace;
+		trace.replay(filename);
+		CPPUNIT_ASSERT(trace.nb_events()==nb_events);
+
+		DefaultOptimizer o(sys,
+				Optimizer::default_rel_eps_f,
+				Optimizer::default_abs_eps_f,
+				NormalizedSystem::default_eps_h, false, false,
+				DefaultOptimizer::default_random_seed,
+				Optimizer::default_eps_x, &trace);
+
+		CPPUNIT_ASSERT(o.optimize(IntervalVector(3,Interval(0,10)))==status);
+		CPPUNIT_ASSERT(trace.nb_mismatches==0);
+		CPPUNIT_ASSERT(o.get_nb_cells()==nb_cells);
+		CPPUNIT_ASSERT(o.get_loup()==loup);
+		CPPUNIT_ASSERT(o.get_uplo()==uplo);
+	}
+
+	remove(filename);
+}
+
+void TestOptimizer::checkpoint() {
+	const ExprSymbol& x=ExprSymbol::new_(Dim::col_vec(3));
+
+	SystemFactory f;
+	f.add_var(x);
+	f.add_ctr(x[0]*x[1]*x[2]>=1);
+	f.add_goal(x*x);
+	System sys(f);
+
+	const char* filename="optimizer_checkpoint.tmp";
+
+	size_t nb_cells;
+	double loup, uplo;
+	{
+		DefaultOptimizer o(sys,
+				Optimizer::default_rel_eps_f,
+				Optimizer::default_abs_eps_f,
+				NormalizedSystem::default_eps_h, false, false);
+
+		// the search is interrupted after the first bisection
+		o.checkpoint_file=filename;
+		o.timeout=1e-9;
+		CPPUNIT_ASSERT(o.optimize(IntervalVector(3,Interval(0,10)))==Optimizer::TIME_OUT);
+		nb_cells=o.get_nb_cells();
+		loup=o.get_loup();
+		uplo=o.get_uplo();
+	}
+
+	{
+		DefaultOptimizer o(sys,
+				Optimizer::default_rel_eps_f,
+				Optimizer::default_abs_eps_f,
+				NormalizedSystem::default_eps_h, false, false);
+
+		// the search is over (the status may depend on the order of the cells)
+		CPPUNIT_ASSERT(o.optimize(filename)!=Optimizer::TIME_OUT);
+		CPPUNIT_ASSERT(o.get_nb_cells()>nb_cells);
+		CPPUNIT_ASSERT(o.get_loup()<=loup && o.get_uplo()>=uplo);
+		CPPUNIT_ASSERT(o.get_loup()>=3 && o.get_uplo()<=3);
+		CPPUNIT_ASSERT(almost_eq(o.get_loup_point(),Vector::ones(3),0.1));
+	}
+
+	remove(filename);
+}
+
 
 } // end namespace
@@ -30,6 +30,9 @@ public:
 	CPPUNIT_TEST(issue50_2);
 	CPPUNIT_TEST(issue50_3);
 	CPPUNIT_TEST(issue50_4);
+	CPPUNIT_TEST(buffer_stats);
+	CPPUNIT_TEST(search_trace);
+	CPPUNIT_TEST(checkpoint);
 #endif
 	CPPUNIT_TEST_SUITE_END();
 
@@ -46,6 +49,15 @@ public:
 	void issue50_3();
 	// upperbounding with goal_prec=0 will make the optimizer fail (initial loup < true minimum) --> INFEASIBLE
 	void issue50_4();
+
+	// consistency of the cell buffer statistics
+	void buffer_stats();
+
+	// record and replay of the search tree
+	void search_trace();
+
+	// interrupted search resumed from a checkpoint file
+	void checkpoint();
 };
 
 CPPUNIT_TEST_SUITE_REGISTRATION(TestOptimizer);
@@ -0,0 +1,464 @@
+#include "ibex.h"
+#include "ibex_Random.h"
+#include <sstream>
+#include <fstream>
+#include <list>
+#include <chrono>
+
+#ifndef _IBEX_WITH_PARAM_ESTIM_
+#error "You need the plugin Param Estim to run this benchmark."
+#endif
+
+using namespace std;
+using namespace ibex;
+
+#define MIN(a,b) ((a < b) ? a : b)
+
+/* Same values as the status of the optimizer */
+#define STATUS_SUCCESS 0
+#define STATUS_INFEASIBLE 1
+#define STATUS_TIME_OUT 4
+
+double tot_time = 0.0;
+
+double
+double_from_arg (const char *argname, const char *str)
+{
+	char *endptr = NULL;
+	double val = strtod (str, &endptr);
+	if (endptr != str + strlen(str))
+	{
+		stringstream s;
+		s << "\"" << argname << "\" must be a real number";
+		ibex_error (s.str().c_str());
+	}
+	return val;
+}
+
+unsigned int
+uint_from_arg (const char *argname, const char *str)
+{
+	char *endptr = NULL;
+	unsigned int val = (unsigned int) strtoul (str, &endptr, 10);
+	if (endptr != str + strlen(str))
+	{
+		stringstream s;
+		s << "\"" << argname << "\" must be a real number";
+		ibex_error (s.str().c_str());
+	}
+	return val;
+}
+
+void
+usage (const char *errmsg)
+{
+	stringstream s;
+	s << errmsg << std::endl
+	  << "Usage: benchmark_qinter ARGS" << std::endl
+	  << "Mandatory parameter are:" << std::endl
+	  << "  --bench-file <file>   file containing the problem" << std::endl
+	  << "  --time-limit <t>      search will stop after <t> seconds" << std::endl
+	  << "  --prec-ndigits-min <d>        " << std::endl
+	  << "  --prec-ndigits-max <d>        " << std::endl
+	  << "  --iter <i>        " << std::endl
+	  << "Optional parameter are:" << std::endl
+	  << "  --buffer-stats        ignored (no cell buffer)" << std::endl
+	  << "  --phase-counters      ignored (no optimizer)" << std::endl;
+	ibex_error (s.str().c_str());
+}
+
+/*
+ * Localization problem with outliers, generated as in the examples
+ * robust_estim*.cpp of the plugin.
+ *
+ * The bench file contains lines "key = value" (lines starting with '#'
+ * are comments). The keys are:
+ *   algo     q-intersection algorithm: qinter2, projf or coref (default: coref)
+ *   n        dimension of the problem (default: 2)
+ *   p        number of measurements (default: 500)
+ *   q        number of consistent measurements (default: p/5)
+ *   seed     seed of the random generator (default: 1111)
+ *   threads  number of threads of the q-intersection, 0 for the number of
+ *            hardware threads (default: 0)
+ *   incremental  1 to update the intersection graph from the parent node
+ *            (qinter2 and coref only, see CtcQInter2::contract(Cell&)),
+ *            0 to build it in each node (default: 0)
+ */
+class QInterBench
+{
+public:
+	QInterBench (const char *filename);
+	~QInterBench ();
+
+	/* Search the first box of diameter less than prec with nb_threads threads. */
+	int run (double prec, double time_limit, int nb_threads, double &time,
+	         unsigned int &nb_cells);
+
+	string algo;
+	int n, p, q;
+	unsigned int seed;
+	int threads;
+	bool incremental;
+
+private:
+	IntervalVector box;
+	Function *m_distance;
+	Array<Ctc> m_ctc;
+	vector<Function*> m_func;
+};
+
+QInterBench::QInterBench (const char *filename)
+	: algo ("coref"), n (2), p (500), q (-1), seed (1111), threads (0),
+	  incremental (false), box (1)
+{
+	ifstream in (filename);
+	if (!in)
+	{
+		stringstream s;
+		s << "cannot open " << filename;
+		ibex_error (s.str().c_str());
+	}
+
+	string line;
+	while (getline (in, line))
+	{
+		if (line.empty() || line[0] == '#')
+			continue;
+		size_t eq = line.find ('=');
+		if (eq == string::npos)
+			continue;
+		string key, value;
+		stringstream (line.substr (0, eq)) >> key;
+		stringstream (line.substr (eq+1)) >> value;
+		if (key == "algo")
+			algo = value;
+		else if (key == "n")
+			n = (int) uint_from_arg ("n", value.c_str());
+		else if (key == "p")
+			p = (int) uint_from_arg ("p", value.c_str());
+		else if (key == "q")
+			q = (int) uint_from_arg ("q", value.c_str());
+		else if (key == "seed")
+			seed = uint_from_arg ("seed", value.c_str());
+		else if (key == "threads")
+			threads = (int) uint_from_arg ("threads", value.c_str());
+		else if (key == "incremental")
+			incremental = uint_from_arg ("incremental", value.c_str()) != 0;
+		else
+		{
+			stringstream s;
+			s << "unknown key \"" << key << "\" in " << filename;
+			ibex_error (s.str().c_str());
+		}
+	}
+	if (q < 0)
+		q = p / 5;
+	if (algo != "qinter2" && algo != "projf" && algo != "coref")
+		ibex_error ("algo must be qinter2, projf or coref");
+	if (incremental && algo == "projf")
+		ibex_error ("incremental mode requires qinter2 or coref");
+	if (n <= 0 || q <= 0 || q > p)
+		ibex_error ("bad values of n, p or q");
+
+	/* Generate the measurements */
+	const double L = 10;               // the target & the beacons are in [0,L]^n
+	const double BEACON_ERROR = 0.1;   // the uncertainty on the beacon position
+	const double DIST_ERROR = 0.1;     // the uncertainty on the distance
+	const double OUTLIERS_ERROR = L/2; // average error on each dimension for outliers
+
+	box = IntervalVector (n, Interval (0,L));
+
+	RNG::srand (seed);
+	vector<double> center (n);
+	for (int j = 0; j < n; j++)
+		center[j] = RNG::rand (0,L);
+
+	Variable x (n), y (n);
+	const ExprNode *e = &(sqr (x[0]-y[0]));
+	for (int j = 1; j < n; j++)
+		e = &(*e + sqr (x[j]-y[j]));
+	m_distance = new Function (x, y, sqrt (*e));
+
+	m_ctc.resize (p);
+	for (int i = 0; i < p; i++)
+	{
+		IntervalVector a (n);
+		double sum = 0;
+		for (int j = 0; j < n; j++)
+		{
+			double beacon = RNG::rand (0,L);
+			sum += pow (beacon-center[j], 2);
+			a[j] = beacon + BEACON_ERROR*Interval(-1,1);
+		}
+		double dist = sqrt (sum);
+		/* the first q+3 measurements are consistent */
+		if (i >= q+3)
+			dist += RNG::rand (0,OUTLIERS_ERROR);
+
+		Variable z (n);
+		Function *f = new Function (z, (*m_distance) (z,a) - (dist + DIST_ERROR*Interval(-1,1)));
+		m_func.push_back (f);
+		m_ctc.set_ref (i, *new CtcFwdBwd (*f));
+	}
+}
+
+QInterBench::~QInterBench ()
+{
+	for (int i = 0; i < m_ctc.size(); i++)
+		delete &m_ctc[i];
+	for (size_t i = 0; i < m_func.size(); i++)
+		delete m_func[i];
+	delete m_distance;
+}
+
+int
+QInterBench::run (double prec, double time_limit, int nb_threads, double &time,
+                  unsigned int &nb_cells)
+{
+	CtcQInter2 *qinter2 = NULL;
+	CtcQInterCoreF *coref = NULL;
+	Ctc *ctc;
+	if (algo == "qinter2")
+	{
+		ctc = qinter2 = new CtcQInter2 (m_ctc, q);
+		qinter2->nb_threads = nb_threads;
+	}
+	else if (algo == "projf")
+	{
+		CtcQInterProjF *projf = new CtcQInterProjF (m_ctc, q);
+		projf->nb_threads = nb_threads;
+		ctc = projf;
+	}
+	else
+	{
+		ctc = coref = new CtcQInterCoreF (m_ctc, q);
+		coref->nb_threads = nb_threads;
+	}
+
+	/* The q-intersection may run on several threads: measure the wall-clock
+	 * time. A Timer gives the CPU time of the process, i.e., the sum of the
+	 * times of all the threads, which does not decrease with more threads
+	 * and would hide the speedup. */
+	chrono::steady_clock::time_point start = chrono::steady_clock::now();
+
+	/* Depth-first search of the first box of diameter less than prec */
+	list<Cell*> pending;
+	Cell *root = new Cell (box);
+	if (incremental)
+	{
+		if (qinter2) qinter2->add_backtrackable (*root);
+		else coref->add_backtrackable (*root);
+	}
+	pending.push_back (root);
+	int status = STATUS_INFEASIBLE;
+	nb_cells = 0;
+	try
+	{
+		while (!pending.empty())
+		{
+			if (chrono::duration<double> (chrono::steady_clock::now() - start).count() >= time_limit)
+				throw TimeOutException();
+			nb_cells++;
+			Cell *c = pending.front();
+			pending.pop_front();
+
+			if (!incremental)
+				ctc->contract (c->box);
+			else if (qinter2)
+				qinter2->contract (*c);
+			else
+				coref->contract (*c);
+
+			IntervalVector &b = c->box;
+			if (b.is_empty())
+			{
+				delete c;
+				continue;
+			}
+
+			if (b.max_diam() > prec && b.is_bisectable())
+			{
+				BisectionPoint pt (b.extr_diam_index (false), 0.5, true);
+				pair<Cell*,Cell*> pr = c->subcells (pt);
+				pending.push_front (pr.first);
+				pending.push_front (pr.second);
+				delete c;
+			}
+			else
+			{
+				status = STATUS_SUCCESS;
+				delete c;
+				break;
+			}
+		}
+	}
+	catch (TimeOutException&)
+	{
+		status = STATUS_TIME_OUT;
+	}
+	time = chrono::duration<double> (chrono::steady_clock::now() - start).count();
+
+	for (list<Cell*>::iterator it = pending.begin(); it != pending.end(); it++)
+		delete *it;
+	delete ctc;
+	return status;
+}
+
+/* Return true if timeout was reached for at least one of the #iter run(s).
+ * Return false otherwise.
+ */
+bool
+do_benchs_iter (QInterBench &bench, double prec, double time_limit, unsigned int iter)
+{
+	bool timeout = false;
+
+	for (unsigned int i = 0; i < iter; i++)
+	{
+		double time, time_sequential;
+		unsigned int nb_cells, nb_cells_sequential;
+
+		/* The sequential run is the reference of the speedup */
+		bench.run (prec, time_limit, 1, time_sequential, nb_cells_sequential);
+		int status = bench.run (prec, time_limit, bench.threads, time, nb_cells);
+
+		/* Report some information (computation time, etc.) */
+		std::cout << "BENCH: eps = " << prec
+		          << " ; status = " << status
+		          << " ; time = " << time
+		          << " ; nb_cells = " << nb_cells
+		          << " ; uplo = " << NAN
+		          << " ; loup = " << NAN
+		          << " ; random_seed = " << bench.seed
+		          << " ; time_sequential = " << time_sequential
+		          << std::endl;
+
+		tot_time += time;
+		timeout |= status == STATUS_TIME_OUT;
+	}
+
+	return timeout;
+}
+
+int
+main (int argc, char *argv[])
+{
+	try
+	{
+		const char *benchfile = NULL;
+		double prec_ndigits_max = NAN, prec_ndigits_min = NAN, time_limit = NAN;
+		double prec_min = NAN, prec_max = NAN;
+		unsigned int iter = 0;
+
+		argc--; argv++; /* skip argv[0] = binary name */
+
+		while (argc >= 1)
+		{
+			if (strcmp (argv[0], "--buffer-stats") == 0
+			    || strcmp (argv[0], "--phase-counters") == 0)
+			{
+				argc--; argv++;
+			}
+			else if (argc < 2)
+				usage ("too many command-line parameter");
+			else if (strcmp (argv[0], "--bench-file") == 0)
+			{
+				benchfile = argv[1];
+				argc-=2; argv+=2;
+			}
+			else if (strcmp (argv[0], "--iter") == 0)
+			{
+				iter = uint_from_arg ("--iter", argv[1]);
+				argc-=2; argv+=2;
+			}
+			else if (strcmp (argv[0], "--time-limit") == 0)
+			{
+				time_limit = double_from_arg ("--time-limit", argv[1]);
+				argc-=2; argv+=2;
+			}
+			else if (strcmp (argv[0], "--prec-ndigits-min") == 0)
+			{
+				prec_ndigits_min = double_from_arg ("--prec-ndigits-min", argv[1]);
+				argc-=2; argv+=2;
+			}
+			else if (strcmp (argv[0], "--prec-ndigits-max") == 0)
+			{
+				prec_ndigits_max = double_from_arg ("--prec-ndigits-max", argv[1]);
+				argc-=2; argv+=2;
+			}
+			else
+				usage ("unrecognized command-line parameter");
+		}
+
+		/* Check for missing command-line parameter */
+		if (benchfile == NULL)
+			usage ("missing --bench-file command-line parameter");
+
+		cout << "# INPUT: bench file: " << benchfile << endl;
+		cout << "# INPUT: time limit: " << time_limit << "s" << endl;
+		cout << "# INPUT: prec ndigits max: " << prec_ndigits_max << endl;
+		cout << "# INPUT: prec ndigits min: " << prec_ndigits_min << endl;
+
+		if (isnan (prec_ndigits_max))
+			usage ("missing --prec-ndigits-max command-line parameter");
+		else
+			prec_max = pow (10, -prec_ndigits_max);
+
+		if (isnan (prec_ndigits_min))
+			usage ("missing --prec-ndigits-min command-line parameter");
+		else
+			prec_min = pow (10, -prec_ndigits_min);
+
+		if (prec_ndigits_min > prec_ndigits_max)
+			usage ("--prec-ndigits-min should not be larger than --prec-ndigits-max");
+
+		cout << "# INFO: prec max: " << prec_max << endl;
+		cout << "# INFO: prec min: " << prec_min << endl;
+
+		/* Generate the problem */
+		QInterBench bench (benchfile);
+
+		cout << "# INFO: algo: " << bench.algo << endl;
+		cout << "# INFO: threads: " << qinter_nb_threads (bench.threads) << endl;
+
+		/* always bench prec_min */
+		bool has_timeout = do_benchs_iter (bench, prec_min, time_limit, iter);
+		if (!has_timeout)
+		{
+			double prec_ndigits = 0.;
+			for ( ; prec_ndigits < MIN (8., prec_ndigits_max); prec_ndigits += 1.)
+			{
+				if (prec_ndigits_min < prec_ndigits)
+				{
+					double prec = pow (10, -prec_ndigits);
+					has_timeout = do_benchs_iter (bench, prec, time_limit, iter);
+					if (has_timeout)
+						break;
+				}
+			}
+			prec_ndigits -= 0.9;
+			for (unsigned int i = 1; i < 10; i++, prec_ndigits += 0.1)
+			{
+				if (prec_ndigits <= prec_ndigits_min)
+					continue;
+				else if (prec_ndigits > prec_ndigits_max)
+					break;
+				else
+				{
+					double prec = pow (10, -prec_ndigits);
+					has_timeout = do_benchs_iter (bench, prec, time_limit, iter);
+					if (has_timeout)
+						break;
+				}
+			}
+			if (!has_timeout && prec_ndigits_max != prec_ndigits_min)
+				do_benchs_iter (bench, prec_max, time_limit, iter);
+		}
+		std::cout << "# Total time: " << tot_time << std::endl;
+		return EXIT_SUCCESS;
+	}
+	catch (ibex::SyntaxError& e)
+	{
+		cout << e << endl;
+		return EXIT_FAILURE;
+	}
+}
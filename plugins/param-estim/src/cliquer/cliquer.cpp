@@ -80,19 +80,27 @@ clique_options *clique_default_options=&clique_default_options_struct;
 
 
 /* Global variables used: */
+/* They are local to each thread, so that several searches can run
+ * concurrently (see the q-intersection in ibex_QInter2.cpp). */
+#ifdef _WIN32
+#define CLIQUER_TLS
+#else
+#define CLIQUER_TLS thread_local
+#endif
+
 /* These must be saved and restored in re-entrance. */
-static int *clique_size;      /* c[i] == max. clique size in {0,1,...,i-1} */
-static set_t current_clique;  /* Current clique being searched. */
-static set_t best_clique;     /* Largest/heaviest clique found so far. */
-static struct tms cputimer;      /* Timer for opts->time_function() */
-static struct timeval realtimer; /* Timer for opts->time_function() */
-static int clique_list_count=0;  /* No. of cliques in opts->clique_list[] */
-static int weight_multiplier=1;  /* Weights multiplied by this when passing
+static CLIQUER_TLS int *clique_size;      /* c[i] == max. clique size in {0,1,...,i-1} */
+static CLIQUER_TLS set_t current_clique;  /* Current clique being searched. */
+static CLIQUER_TLS set_t best_clique;     /* Largest/heaviest clique found so far. */
+static CLIQUER_TLS struct tms cputimer;      /* Timer for opts->time_function() */
+static CLIQUER_TLS struct timeval realtimer; /* Timer for opts->time_function() */
+static CLIQUER_TLS int clique_list_count=0;  /* No. of cliques in opts->clique_list[] */
+static CLIQUER_TLS int weight_multiplier=1;  /* Weights multiplied by this when passing
  * to time_function(). */
 
 /* List cache (contains memory blocks of size g->n * sizeof(int)) */
-static int **temp_list=NULL;
-static int temp_count=0;
+static CLIQUER_TLS int **temp_list=NULL;
+static CLIQUER_TLS int temp_count=0;
 
 
 /*
@@ -101,7 +109,7 @@ static int temp_count=0;
  * variables to original values.  entrance_level should be increased
  * and decreased accordingly.
  */
-static int entrance_level=0;  /* How many levels for entrance have occurred? */
+static CLIQUER_TLS int entrance_level=0;  /* How many levels for entrance have occurred? */
 
 #define ENTRANCE_SAVE() \
 		int *old_clique_size = clique_size;                     \
@@ -129,7 +137,7 @@ static int entrance_level=0;  /* How many levels for entrance have occurred? */
 
 
 /* Number of clock ticks per second (as returned by sysconf(_SC_CLK_TCK)) */
-static int clocks_per_sec=0;
+static CLIQUER_TLS int clocks_per_sec=0;
 
 
 
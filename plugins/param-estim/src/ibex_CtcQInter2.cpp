@@ -5,15 +5,16 @@
 // Copyright   : Ecole des Mines de Nantes (France)
 // License     : See the LICENSE file
 // Created     : Apr 30, 2012
-// Last Update : Apr 30, 2012
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #include "ibex_CtcQInter2.h"
 #include "ibex_QInter2.h"
+#include "ibex_QInterGraph.h"
 
 namespace ibex {
 
-CtcQInter2::CtcQInter2(const Array<Ctc>& list, int q) : Ctc(list), list(list), q(q), boxes(list.size(), nb_var) { }
+CtcQInter2::CtcQInter2(const Array<Ctc>& list, int q) : Ctc(list), list(list), q(q), nb_threads(1), boxes(list.size(), nb_var) { }
 
 
 void CtcQInter2::contract(IntervalVector& box) {
@@ -25,10 +26,32 @@ void CtcQInter2::contract(IntervalVector& box) {
 		refs.set_ref(i,boxes[i]);
 	}
 
-	box = qinter2(refs,q);
+	box = qinter2(refs,q,nb_threads);
 }
 
-CtcQInterProjF::CtcQInterProjF(const Array<Ctc>& list, int q) : Ctc(list), list(list), q(q), boxes(list.size(), nb_var) { }
+void CtcQInter2::add_backtrackable(Cell& root) {
+	root.add<QInterGraph>();
+}
+
+void CtcQInter2::contract(Cell& cell) {
+	IntervalVector& box=cell.box;
+	Array<IntervalVector> refs(list.size());
+
+	for (int i=0; i<list.size(); i++) {
+		boxes[i]=box;
+		list[i].contract(boxes[i]);
+		refs.set_ref(i,boxes[i]);
+	}
+
+	QInterGraph& g=cell.get<QInterGraph>();
+	g.update(refs,q-1,nb_threads);
+
+	KCoreGraph* graph=g.graph();
+	box = qinter2(refs,q,*graph,nb_threads);
+	delete graph;
+}
+
+CtcQInterProjF::CtcQInterProjF(const Array<Ctc>& list, int q) : Ctc(list), list(list), q(q), nb_threads(1), boxes(list.size(), nb_var) { }
 
 
 void CtcQInterProjF::contract(IntervalVector& box) {
@@ -40,10 +63,10 @@ void CtcQInterProjF::contract(IntervalVector& box) {
 		refs.set_ref(i,boxes[i]);
 	}
 
-	box = qinter_projf(refs,q);
+	box = qinter_projf(refs,q,nb_threads);
 }
 
-CtcQInterCoreF::CtcQInterCoreF(const Array<Ctc>& list, int q) :  Ctc(list), list(list), q(q), boxes(list.size(), nb_var) { }
+CtcQInterCoreF::CtcQInterCoreF(const Array<Ctc>& list, int q) :  Ctc(list), list(list), q(q), nb_threads(1), boxes(list.size(), nb_var) { }
 
 
 void CtcQInterCoreF::contract(IntervalVector& box) {
@@ -55,7 +78,29 @@ void CtcQInterCoreF::contract(IntervalVector& box) {
 		refs.set_ref(i,boxes[i]);
 	}
 
-	box = qinter_coref(refs,q);
+	box = qinter_coref(refs,q,nb_threads);
+}
+
+void CtcQInterCoreF::add_backtrackable(Cell& root) {
+	root.add<QInterGraph>();
+}
+
+void CtcQInterCoreF::contract(Cell& cell) {
+	IntervalVector& box=cell.box;
+	Array<IntervalVector> refs(list.size());
+
+	for (int i=0; i<list.size(); i++) {
+		boxes[i]=box;
+		list[i].contract(boxes[i]);
+		refs.set_ref(i,boxes[i]);
+	}
+
+	QInterGraph& g=cell.get<QInterGraph>();
+	g.update(refs,q-1,nb_threads);
+
+	KCoreGraph* graph=g.graph();
+	box = qinter_coref(refs,q,*graph,nb_threads);
+	delete graph;
 }
 
 } // end namespace ibex
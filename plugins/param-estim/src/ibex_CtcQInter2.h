@@ -5,7 +5,7 @@
 // Copyright   : Ecole des Mines de Nantes (France)
 // License     : See the LICENSE file
 // Created     : Apr 30, 2012
-// Last Update : Apr 30, 2012
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #ifndef __IBEX_CTC_Q_INTER_2_H__
@@ -14,6 +14,7 @@
 #include "ibex_Ctc.h"
 #include "ibex_Array.h"
 #include "ibex_IntervalMatrix.h"
+#include "ibex_Cell.h"
 
 namespace ibex {
 
@@ -21,6 +22,11 @@ namespace ibex {
  * \ingroup contractor
  * \brief Q-intersection contractor.
  *
+ * The incremental mode (see #contract(Cell&)) is not used by the generic
+ * strategies: Solver and Optimizer only call contract(IntervalVector&), which
+ * builds the intersection graph from scratch. A search that wants the
+ * incremental mode must call #add_backtrackable with the root cell and
+ * then contract(Cell&) itself on each cell (see benchmark_qinter.cpp).
  */
 class CtcQInter2 : public Ctc {
 public:
@@ -36,6 +42,25 @@ public:
 	 */
 	virtual void contract(IntervalVector& box);
 
+	/**
+	 * \brief Add the intersection graph to the root cell (incremental mode).
+	 *
+	 * See #contract(Cell&).
+	 */
+	void add_backtrackable(Cell& root);
+
+	/**
+	 * \brief Contract the box of a cell (incremental mode).
+	 *
+	 * The intersection graph of the boxes and its (q-1)-core (see #QInterGraph)
+	 * are updated from the ones of the parent cell instead of being built
+	 * from scratch. Only one q-intersection contractor can be
+	 * used in this mode in a search.
+	 *
+	 * \pre #add_backtrackable has been called with the root cell.
+	 */
+	void contract(Cell& cell);
+
 	/**
 	 * List of contractors
 	 */
@@ -47,6 +72,13 @@ public:
 	 */
 	int q;
 
+	/**
+	 * Number of threads of the q-intersection (1 by default,
+	 * 0 means the number of hardware threads). The contractors
+	 * of the list are still applied sequentially.
+	 */
+	int nb_threads;
+
 protected:
 	IntervalMatrix boxes; // store boxes for each contraction
 };
@@ -76,10 +108,25 @@ public:
 	 */
 	int q;
 
+	/**
+	 * Number of threads of the q-intersection (1 by default,
+	 * 0 means the number of hardware threads). The contractors
+	 * of the list are still applied sequentially.
+	 */
+	int nb_threads;
+
 protected:
 	IntervalMatrix boxes; // store boxes for each contraction
 };
 
+/**
+ * \ingroup contractor
+ * \brief Q-intersection contractor (core filtering).
+ *
+ * As for #CtcQInter2, the incremental mode (see #contract(Cell&)) is only
+ * used if the caller calls #add_backtrackable and contract(Cell&) itself:
+ * Solver and Optimizer only call contract(IntervalVector&).
+ */
 class CtcQInterCoreF : public Ctc {
 public:
 	/**
@@ -94,6 +141,25 @@ public:
 	 */
 	virtual void contract(IntervalVector& box);
 
+	/**
+	 * \brief Add the intersection graph to the root cell (incremental mode).
+	 *
+	 * See #contract(Cell&).
+	 */
+	void add_backtrackable(Cell& root);
+
+	/**
+	 * \brief Contract the box of a cell (incremental mode).
+	 *
+	 * The intersection graph of the boxes and its (q-1)-core (see #QInterGraph)
+	 * are updated from the ones of the parent cell instead of being built
+	 * from scratch. Only one q-intersection contractor can be
+	 * used in this mode in a search.
+	 *
+	 * \pre #add_backtrackable has been called with the root cell.
+	 */
+	void contract(Cell& cell);
+
 	/**
 	 * List of contractors
 	 */
@@ -105,6 +171,13 @@ public:
 	 */
 	int q;
 
+	/**
+	 * Number of threads of the q-intersection (1 by default,
+	 * 0 means the number of hardware threads). The contractors
+	 * of the list are still applied sequentially.
+	 */
+	int nb_threads;
+
 protected:
 	IntervalMatrix boxes; // store boxes for each contraction
 };
@@ -107,8 +107,12 @@ void KCoreGraph::apply_coreness() {
 };
 
 int KCoreGraph::qcoloring(const std::pair<double, int>* boxes, int nboxes, int q) {
+	return qcoloring(boxes, nboxes, q, colors, used);
+};
+
+int KCoreGraph::qcoloring(const std::pair<double, int>* boxes, int nboxes, int q, int* colors, BitSet* used) {
 	
-	assert(maxsize() == nboxes);
+	assert(nboxes <= maxsize());
 	
 	/* Reinit the coloring vector, just in case */
 	for (int i=0; i<maxsize(); i++) {
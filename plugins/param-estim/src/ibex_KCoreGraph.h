@@ -61,9 +61,15 @@ public:
 	void apply_coreness();
 	
 	/* Performs a greedy coloring accroding to the order given by "boxes".
-	 * Returns the first box of color at least q (or -1 if none is found) */
+	 * Returns the first box of color at least q (or -1 if none is found).
+	 * The vertices that are not in "boxes" (or not in the graph) are not colored. */
 	int qcoloring(const std::pair<double, int>* boxes, int nboxes, int q);
 	
+	/* Same as above, with coloring structures given by the caller ("colors" of size maxsize()
+	 * and "used" over [0,maxsize()]). The graph is not modified, so several colorings can
+	 * be performed at the same time by different threads. */
+	int qcoloring(const std::pair<double, int>* boxes, int nboxes, int q, int* colors, Mistral::BitSet* used);
+	
 	/* Misc */
 	inline int maxsize() {return neighbourhoods.size();};
 	graph_t *subgraph(IntStack *vset);
@@ -5,12 +5,13 @@
 // Copyright   : Ecole des Mines de Nantes (France)
 // License     : See the LICENSE file
 // Created     : Jul 24, 2013
-// Last Update : Jul 24, 2013
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #include "ibex_QInter2.h"
 #include "ibex_Exception.h"
 #include "ibex_KCoreGraph.h"
+#include "ibex_QInterThreads.h"
 
 #include <algorithm>
 
@@ -114,15 +115,129 @@ void propagate_no_ub(const Array<IntervalVector>& boxes, IntStack ***dirboxes, i
 	nogoods.push_back(newNogood);
 }
 
+namespace {
+
+/*
+ * Search, in a sorted list of boxes, of the first box that belongs to a q-intersection
+ * made of this box and boxes that precede it in the list.
+ *
+ * The candidate boxes are tested by batches of nb_threads boxes, one by thread.
+ * Each thread has its own structures and the graph and the nogoods are only read.
+ * The first successful candidate of a batch is kept, so that the result does
+ * not depend on the number of threads.
+ */
+class NeighbourhoodSearch {
+public:
+	NeighbourhoodSearch(const Array<IntervalVector>& boxes, KCoreGraph* origin, const vector<BitSet *>& nogoods, int q, int nb_threads) :
+		boxes(boxes), origin(origin), nogoods(nogoods), q(q), nb_threads(nb_threads),
+		curr_sets(nb_threads), neighboxes(nb_threads), n_indices(nb_threads),
+		results(nb_threads, IntervalVector(boxes[0].size())), called(nb_threads), x(NULL), first(0) {
+
+		int p=boxes.size();
+		for (int t=0; t<nb_threads; t++) {
+			curr_sets[t] = new BitSet(0,p-1,BitSet::empt);
+			neighboxes[t].reserve(p);
+			n_indices[t].reserve(p);
+		}
+	}
+
+	~NeighbourhoodSearch() {
+		for (int t=0; t<nb_threads; t++)
+			delete curr_sets[t];
+	}
+
+	/*
+	 * x is the sorted list of boxes and nboxes its size.
+	 *
+	 * Return true if a q-intersection is found, in which case curr_qinter is set to it.
+	 * Otherwise, curr_qinter is set to the empty box, unless no existence procedure
+	 * has been called (curr_qinter is left unchanged).
+	 */
+	bool find(const pair<double,int>* x, int nboxes, IntervalVector& curr_qinter) {
+		this->x = x;
+		for (first=q-1; first<nboxes; first+=nb_threads) {
+			int batch = nboxes-first < nb_threads ? nboxes-first : nb_threads;
+
+			qinter_parallel_for(batch, nb_threads, *this);
+
+			for (int k=0; k<batch; k++) {
+				if (!called[k]) continue;
+				curr_qinter = results[k];
+				if (!curr_qinter.is_empty()) return true;
+			}
+		}
+		return false;
+	}
+
+	/*
+	 * Test the box #(first+k) of the list, with the structures of the thread #t.
+	 */
+	void operator()(int k, int t) {
+		BitSet* curr_set = curr_sets[t];
+		called[k] = false;
+
+		curr_set->clear();
+		int b = x[first+k].second;
+		curr_set->add(b);
+
+		/* Find the neighbors */
+		neighboxes[t].clear();
+		n_indices[t].clear();
+		for (int l=0; l<first+k; l++) {
+			int b2 = x[l].second;
+			if (origin->is_edge(b,b2)) {
+				neighboxes[t].push_back(&(boxes[b2]));
+				n_indices[t].push_back(b2);
+				curr_set->add(b2);
+			}
+		}
+
+		if (((int)neighboxes[t].size()) < q-1) return;
+
+		/* Check if it's a nogood */
+		for (unsigned int z=0; z<nogoods.size(); z++) {
+			if (nogoods.at(z)->includes(curr_set)) return;
+		}
+
+		/* Call to the existence procedure */
+		results[k] = qinterex_cliquer(neighboxes[t], n_indices[t], q-1, origin);
+		results[k] &= boxes[b];
+		called[k] = true;
+	}
+
+private:
+	const Array<IntervalVector>& boxes;
+	KCoreGraph* origin;
+	const vector<BitSet *>& nogoods;
+	const int q;
+	const int nb_threads;
+
+	/* Structures of each thread */
+	vector<BitSet *> curr_sets;
+	vector<vector<IntervalVector *> > neighboxes;
+	vector<vector<int> > n_indices;
+
+	/* Result of each candidate of the current batch */
+	vector<IntervalVector> results;
+	vector<char> called;
+
+	/* Current list and first candidate of the current batch */
+	const pair<double,int>* x;
+	int first;
+};
+
+} // end anonymous namespace
+
 /* 
  * Improved q-intersection algorithm.
  */
-IntervalVector qinter2(const Array<IntervalVector>& _boxes, int q) {
+IntervalVector qinter2(const Array<IntervalVector>& _boxes, int q, int nb_threads) {
 	
 
 #ifndef _WIN32
 	assert(q>0);
 	assert(_boxes.size()>0);
+	nb_threads = qinter_nb_threads(nb_threads);
 	int n = _boxes[0].size();
 	
 	/* Remove the empty boxes from the list */
@@ -140,25 +255,49 @@ IntervalVector qinter2(const Array<IntervalVector>& _boxes, int q) {
 		if (!_boxes[i].is_empty()) boxes.set_ref(j++,_boxes[i]);
 	}
 	
-	/* Create the sets of available boxes for each direction */
-	
-	IntStack ***dirboxes = (IntStack ***)malloc(n*sizeof(IntStack **));
-	for (int i=0; i<n; i++) {
-		dirboxes[i] = (IntStack **)malloc(2*sizeof(IntStack *));
-		for (int j=0; j<2;j++) {
-			dirboxes[i][j] = new IntStack(0,p-1,true);
-		}
-	}
-	
 	/* Create the original intersection graph */
 	
 	KCoreGraph *origin = new KCoreGraph(p,q-1,true);
 	
 	/* Add edges */
 	
-	for (int i=0; i<p; i++) {
-		for (int j=i+1; j<p; j++) {
-			if (boxes[i].intersects(boxes[j])) origin->add_edge(i,j);
+	qinter_add_edges(boxes, *origin, nb_threads);
+	
+	IntervalVector hull_qinter = qinter2(boxes, q, *origin, nb_threads);
+	
+	delete(origin);
+	
+	return hull_qinter;
+#else
+	not_implemented("Cliquer-based q-intersection under Windows");
+	return IntervalVector::empty(_boxes[0].size());
+#endif
+
+}
+
+IntervalVector qinter2(const Array<IntervalVector>& boxes, int q, KCoreGraph& graph, int nb_threads) {
+
+#ifndef _WIN32
+	assert(q>0);
+	assert(boxes.size()>0);
+	assert(boxes.size()==graph.maxsize());
+	nb_threads = qinter_nb_threads(nb_threads);
+	int n = boxes[0].size();
+	int p = boxes.size();
+	KCoreGraph *origin = &graph;
+	
+	if (origin->empty()) return IntervalVector::empty(n);
+	
+	/* Create the sets of available boxes for each direction (the vertices of the graph) */
+	
+	IntStack ***dirboxes = (IntStack ***)malloc(n*sizeof(IntStack **));
+	for (int i=0; i<n; i++) {
+		dirboxes[i] = (IntStack **)malloc(2*sizeof(IntStack *));
+		for (int j=0; j<2;j++) {
+			dirboxes[i][j] = new IntStack(0,p-1,false);
+			for (int b=0; b<p; b++) {
+				if (origin->contain(b)) dirboxes[i][j]->add(b);
+			}
 		}
 	}
 	
@@ -166,22 +305,17 @@ IntervalVector qinter2(const Array<IntervalVector>& _boxes, int q) {
 	
 	vector<BitSet *> nogoods;
 	nogoods.reserve(2*n);
-	BitSet *curr_set = new BitSet(0,p-1,BitSet::empt);
 	
 	IntervalVector curr_qinter(n);
 	curr_qinter.set_empty();
 	IntervalVector hull_qinter(n);
 	hull_qinter.set_empty();
 	
-	vector<IntervalVector *> neighboxes;
-	neighboxes.reserve(p);
-	vector<int> n_indices;
-	n_indices.reserve(p);
-	
-	int b,b2,nboxes;
+	int b,nboxes;
 	pair<double,int>  *x = new pair<double,int>[p];
 	bool first_pass = true;
-	bool ng;
+	
+	NeighbourhoodSearch search(boxes, origin, nogoods, q, nb_threads);
 	
 	/* Compute the q-inter hull */
 	
@@ -207,46 +341,10 @@ IntervalVector qinter2(const Array<IntervalVector>& _boxes, int q) {
 		
 		/* For each box, look for a (q-1)-inter in its left neighbourhood */
 		
-		for (int k=q-1; k<nboxes; k++) {
-			curr_set->clear();
-			b = x[k].second;
-			curr_set->add(b);
-			
-			/* Find the left neighbors */
-			neighboxes.clear();
-			n_indices.clear();
-			for (int l=0; l<k; l++) {
-				b2 = x[l].second;
-				if (origin->is_edge(b,b2)) {
-					neighboxes.push_back(&(boxes[b2]));
-					n_indices.push_back(b2);
-					curr_set->add(b2);
-				}
-			}
-			
-			if (((int)neighboxes.size() )< q-1) continue;
-			
-			/* Check if it's a nogood */
-			ng = false;
-			for (unsigned int z=0; z<nogoods.size(); z++) {
-				if (nogoods.at(z)->includes(curr_set)) {
-					ng = true;
-					break;
-				}
-			}
-			
-			if (ng) continue;
-			
-			/* Call to the existence procedure */
-			curr_qinter = qinterex_cliquer(neighboxes, n_indices, q-1, origin);
-			curr_qinter = curr_qinter & boxes[b];
-		
-			if (curr_qinter.is_empty()) continue;
-			
+		if (search.find(x, nboxes, curr_qinter)) {
 			/* Optimal q-inter found : extend the q-inter hull and propagate the bounds */
 			hull_qinter = hull_qinter | curr_qinter;
 			propagate(boxes, dirboxes, i, true, curr_qinter, nogoods);
-			break;
 		}
 		
 		if (first_pass && curr_qinter.is_empty()) {
@@ -282,46 +380,10 @@ IntervalVector qinter2(const Array<IntervalVector>& _boxes, int q) {
 		
 		/* For each box, look for a (q-1)-inter in its right neighbourhood */
 		
-		for (int k=q-1; k<nboxes; k++) {
-			curr_set->clear();
-			b = x[k].second;
-			curr_set->add(b);
-			
-			/* Find the right neighbors */
-			neighboxes.clear();
-			n_indices.clear();
-			for (int l=0; l<k; l++) {
-				b2 = x[l].second;
-				if (origin->is_edge(b,b2)) {
-					neighboxes.push_back(&(boxes[b2]));
-					n_indices.push_back(b2);
-					curr_set->add(b2);
-				}
-			}
-			
-			if (((int)neighboxes.size()) < q-1) continue;
-			
-			/* Check if it's a nogood */
-			ng = false;
-			for (unsigned int z=0; z<nogoods.size(); z++) {
-				if (nogoods.at(z)->includes(curr_set)) {
-					ng = true;
-					break;
-				}
-			}
-			
-			if (ng) continue;
-			
-			/* Call to the existence procedure */
-			curr_qinter = qinterex_cliquer(neighboxes, n_indices, q-1, origin);
-			curr_qinter = curr_qinter & boxes[b];
-			
-			if (curr_qinter.is_empty()) continue;
-			
+		if (search.find(x, nboxes, curr_qinter)) {
 			/* Optimal q-inter found : extend the q-inter hull and propagate the bounds */
 			hull_qinter = hull_qinter | curr_qinter;
 			if (i!=n) propagate(boxes, dirboxes, i, false, curr_qinter, nogoods);
-			break;
 		}
 		
 		if (curr_qinter.is_empty() && (i!=n)) {
@@ -341,15 +403,13 @@ IntervalVector qinter2(const Array<IntervalVector>& _boxes, int q) {
 	free(dirboxes);
 	
 	delete [] x;
-	delete(origin);
 	
-	delete(curr_set);
 	for (unsigned int i=0; i<nogoods.size(); i++) delete(nogoods.at(i));
 	
 	return hull_qinter;
 #else
 	not_implemented("Cliquer-based q-intersection under Windows");
-	return IntervalVector::empty(_boxes[0].size());
+	return IntervalVector::empty(boxes[0].size());
 #endif
 
 }
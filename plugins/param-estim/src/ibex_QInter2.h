@@ -5,7 +5,7 @@
 // Copyright   : Ecole des Mines de Nantes (France)
 // License     : See the LICENSE file
 // Created     : Apr 25, 2012
-// Last Update : Apr 25, 2012
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #ifndef __IBEX_Q_INTER_2_H__
@@ -23,23 +23,60 @@
 
 namespace ibex {
 
+/*
+ * The q-intersection functions below can run on several threads.
+ * The number of threads is \a nb_threads (1 by default), or the number
+ * of hardware threads if \a nb_threads is 0 (see #qinter_nb_threads).
+ * The result does not depend on the number of threads.
+ */
+
 /**
  * \ingroup combinatorial
  * \brief Q-intersection - HEURISTIC - Projective filtering
+ *
+ * The dimensions are processed in parallel.
  */
-IntervalVector qinter_projf(const Array<IntervalVector>& _boxes, int q);
+IntervalVector qinter_projf(const Array<IntervalVector>& _boxes, int q, int nb_threads=1);
 
 /**
  * \ingroup combinatorial
  * \brief Q-intersection - HEURISTIC - k-core filtering + greedy coloring
+ *
+ * The intersection graph is built and the dimensions are processed in parallel.
+ */
+IntervalVector qinter_coref(const Array<IntervalVector>& _boxes, int q, int nb_threads=1);
+
+/**
+ * \ingroup combinatorial
+ * \brief Q-intersection - HEURISTIC - k-core filtering + greedy coloring, with a given intersection graph
+ *
+ * Same conditions on \a graph as for #qinter2(const Array<IntervalVector>&, int, KCoreGraph&, int).
+ * The graph is reduced to its (q-1)-core.
  */
-IntervalVector qinter_coref(const Array<IntervalVector>& _boxes, int q);
+IntervalVector qinter_coref(const Array<IntervalVector>& boxes, int q, KCoreGraph& graph, int nb_threads=1);
 
 /**
  * \ingroup combinatorial
  * \brief Q-intersection - EXACT - QInter2 : Cliquer-based solver
+ *
+ * The intersection graph is built in parallel and, for each face of the
+ * q-intersection hull, several clique searches are run in parallel.
+ */
+IntervalVector qinter2(const Array<IntervalVector>& _boxes, int q, int nb_threads=1);
+
+/**
+ * \ingroup combinatorial
+ * \brief Q-intersection - EXACT - QInter2, with a given intersection graph
+ *
+ * The vertex i of \a graph is the box boxes[i] and only the boxes of the vertices
+ * of the graph are considered. The graph must contain the edges of the
+ * intersection graph of these boxes, but vertices that cannot belong to a
+ * q-intersection may have been removed (e.g., the graph may be reduced to its
+ * (q-1)-core, see #QInterGraph).
+ *
+ * \pre graph.maxsize()==boxes.size()
  */
-IntervalVector qinter2(const Array<IntervalVector>& _boxes, int q);
+IntervalVector qinter2(const Array<IntervalVector>& boxes, int q, KCoreGraph& graph, int nb_threads=1);
 
 /**
  * \ingroup combinatorial
@@ -0,0 +1,393 @@
+//============================================================================
+//                                  I B E X
+// File        : Incremental intersection graph of a q-intersection
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#include "ibex_QInterGraph.h"
+#include "ibex_QInterThreads.h"
+
+#include <algorithm>
+
+using namespace std;
+
+namespace ibex {
+
+/*
+ * The changes made by a cell. Each change can be undone (to get the state of
+ * the parent cell) and redone (to get the state of the cell).
+ */
+class QInterGraph::Node {
+public:
+	enum { BOX, KILL, DEG, EDGE };
+
+	class Change {
+	public:
+		Change(char type, int i, int a, int b) : type(type), i(i), a(a), b(b) { }
+		char type;
+		int i;
+		/* BOX: a is the index of the old box in "boxes" (the new one is at a+1),
+		 * DEG: the old and new degree, EDGE: a is the neighbour removed from adj[i]. */
+		int a, b;
+	};
+
+	Node(Node* parent) : parent(parent), depth(parent? parent->depth+1 : 0), ref(1) {
+		if (parent) parent->ref++;
+	}
+
+	Node* parent;
+	int depth;
+
+	/* Number of data and nodes pointing to this node */
+	int ref;
+
+	std::vector<Change> changes;
+
+	/* Old and new boxes of the BOX changes */
+	std::vector<IntervalVector> boxes;
+};
+
+/*
+ * The graph, in the state of the node "current".
+ */
+class QInterGraph::State {
+public:
+	State() : ref(1), k(0), nb_alive(0), current(NULL) { }
+
+	/* Number of data pointing to this state */
+	int ref;
+
+	int k;
+
+	/* The boxes of the last update */
+	std::vector<IntervalVector> boxes;
+
+	/* Adjacency lists of the vertices. They may contain vertices that are not
+	 * in the k-core anymore (the list of such vertex is not updated). */
+	std::vector<std::vector<int> > adj;
+
+	/* deg[i] is the number of neighbours of i in the k-core */
+	std::vector<int> deg;
+
+	/* alive[i]!=0 iff i is in the k-core */
+	std::vector<char> alive;
+
+	int nb_alive;
+
+	/* The node of the current state. The changes are recorded in this
+	 * node (if not NULL). */
+	Node* current;
+
+	/* Vertices to be removed */
+	std::vector<int> tbr;
+
+	void set_box(int i, const IntervalVector& box);
+	void kill(int i);
+	void set_deg(int i, int d);
+
+	/* Remove the marked vertices from the adjacency list of i */
+	int remove_edges(int i, const std::vector<char>& mark);
+
+	/* Remove the vertices of "tbr" and the vertices out of the k-core in cascade. */
+	void propagate();
+
+	void undo(const Node& n);
+	void redo(const Node& n);
+	void move_to(Node* n);
+};
+
+void QInterGraph::State::set_box(int i, const IntervalVector& box) {
+	if (current) {
+		current->changes.push_back(Node::Change(Node::BOX, i, current->boxes.size(), 0));
+		current->boxes.push_back(boxes[i]);
+		current->boxes.push_back(box);
+	}
+	boxes[i]=box;
+}
+
+void QInterGraph::State::kill(int i) {
+	if (current) current->changes.push_back(Node::Change(Node::KILL, i, 0, 0));
+	alive[i]=0;
+	nb_alive--;
+	tbr.push_back(i);
+}
+
+void QInterGraph::State::set_deg(int i, int d) {
+	if (current) current->changes.push_back(Node::Change(Node::DEG, i, deg[i], d));
+	deg[i]=d;
+}
+
+int QInterGraph::State::remove_edges(int i, const vector<char>& mark) {
+	vector<int>& a=adj[i];
+	int n=0;
+	int nb_removed=0; // among the vertices of the k-core
+	for (unsigned int l=0; l<a.size(); l++) {
+		if (!mark[a[l]])
+			a[n++]=a[l];
+		else {
+			if (current) current->changes.push_back(Node::Change(Node::EDGE, i, a[l], 0));
+			if (alive[a[l]]) nb_removed++;
+		}
+	}
+	a.resize(n);
+	return nb_removed;
+}
+
+void QInterGraph::State::propagate() {
+	/* Note: the vertices in "tbr" are already marked as removed. The removed
+	 * vertices are not erased from the adjacency lists of their neighbours
+	 * (which would be quadratic in the degree) but their degree is decreased. */
+	while (!tbr.empty()) {
+		int i=tbr.back();
+		tbr.pop_back();
+
+		for (vector<int>::const_iterator it=adj[i].begin(); it!=adj[i].end(); it++) {
+			int j=*it;
+			if (alive[j]) {
+				set_deg(j, deg[j]-1);
+				if (deg[j]<k) kill(j);
+			}
+		}
+	}
+}
+
+void QInterGraph::State::undo(const Node& n) {
+	for (vector<Node::Change>::const_reverse_iterator it=n.changes.rbegin(); it!=n.changes.rend(); it++) {
+		switch (it->type) {
+		case Node::BOX:  boxes[it->i]=n.boxes[it->a]; break;
+		case Node::KILL: alive[it->i]=1; nb_alive++; break;
+		case Node::DEG:  deg[it->i]=it->a; break;
+		case Node::EDGE: adj[it->i].push_back(it->a); break;
+		}
+	}
+}
+
+void QInterGraph::State::redo(const Node& n) {
+	for (vector<Node::Change>::const_iterator it=n.changes.begin(); it!=n.changes.end(); it++) {
+		switch (it->type) {
+		case Node::BOX:  boxes[it->i]=n.boxes[it->a+1]; break;
+		case Node::KILL: alive[it->i]=0; nb_alive--; break;
+		case Node::DEG:  deg[it->i]=it->b; break;
+		case Node::EDGE: {
+			vector<int>& a=adj[it->i];
+			vector<int>::iterator j=find(a.begin(), a.end(), it->a);
+			assert(j!=a.end());
+			*j=a.back();
+			a.pop_back();
+			break;
+		}
+		}
+	}
+}
+
+void QInterGraph::State::move_to(Node* n) {
+	if (n==current) return;
+
+	Node* a=current;
+	Node* b=n;
+	vector<Node*> path; // from n up to the common ancestor (excluded)
+
+	while (a->depth > b->depth) { undo(*a); a=a->parent; }
+	while (b->depth > a->depth) { path.push_back(b); b=b->parent; }
+	while (a!=b) {
+		undo(*a); a=a->parent;
+		path.push_back(b); b=b->parent;
+	}
+	for (vector<Node*>::reverse_iterator it=path.rbegin(); it!=path.rend(); it++)
+		redo(**it);
+
+	n->ref++;
+	release(current);
+	current=n;
+}
+
+void QInterGraph::release(Node* n) {
+	while (n && --n->ref==0) {
+		Node* parent=n->parent;
+		delete n;
+		n=parent;
+	}
+}
+
+QInterGraph::QInterGraph() : nb_checks(0), state(NULL), node(NULL) {
+
+}
+
+QInterGraph::QInterGraph(const QInterGraph& g) : Backtrackable(), nb_checks(0), state(g.state), node(NULL) {
+	if (state) {
+		state->ref++;
+		node=new Node(g.node);
+	}
+}
+
+QInterGraph::~QInterGraph() {
+	detach();
+}
+
+void QInterGraph::detach() {
+	release(node);
+	if (state && --state->ref==0) {
+		release(state->current);
+		delete state;
+	}
+	node=NULL;
+	state=NULL;
+}
+
+Backtrackable* QInterGraph::copy() const {
+	return new QInterGraph(*this);
+}
+
+pair<Backtrackable*,Backtrackable*> QInterGraph::down(const BisectionPoint&) {
+	return pair<Backtrackable*,Backtrackable*>(copy(),copy());
+}
+
+void QInterGraph::build(Array<IntervalVector>& _boxes, int k, int nb_threads) {
+	int p=_boxes.size();
+
+	detach();
+	state=new State();
+	node=new Node(NULL);
+
+	State& g=*state;
+	g.k=k;
+	g.boxes.reserve(p);
+	for (int i=0; i<p; i++) g.boxes.push_back(_boxes[i]);
+
+	vector<vector<int> > rows;
+	qinter_intersections(_boxes, rows, nb_threads);
+	nb_checks=((long) p)*(p-1)/2;
+
+	g.adj.assign(p, vector<int>());
+	for (int i=0; i<p; i++) {
+		for (vector<int>::const_iterator it=rows[i].begin(); it!=rows[i].end(); it++) {
+			g.adj[i].push_back(*it);
+			g.adj[*it].push_back(i);
+		}
+	}
+
+	g.deg.resize(p);
+	for (int i=0; i<p; i++) g.deg[i]=g.adj[i].size();
+
+	g.alive.assign(p, 1);
+	g.nb_alive=p;
+
+	/* Apply the coreness (the changes are not recorded: this is the root) */
+	for (int i=0; i<p; i++) {
+		if (g.boxes[i].is_empty() || g.deg[i]<k) g.kill(i);
+	}
+	g.propagate();
+
+	node->ref++;
+	g.current=node;
+}
+
+void QInterGraph::restore() const {
+	state->move_to(node);
+}
+
+void QInterGraph::update(Array<IntervalVector>& _boxes, int k, int nb_threads) {
+	int p=_boxes.size();
+
+	if (!state || k!=state->k || p!=(int) state->boxes.size()) {
+		build(_boxes, k, nb_threads);
+	} else {
+		restore();
+		State& g=*state;
+		nb_checks=0;
+
+		/* Shrink the boxes and find the changed ones */
+		vector<int> changed;
+		vector<char> is_changed(p, 0);
+		for (int i=0; i<p; i++) {
+			if (!g.alive[i]) continue;
+			_boxes[i] &= g.boxes[i];
+			if (_boxes[i].is_empty()) {
+				g.kill(i);
+			} else if (_boxes[i]!=g.boxes[i]) {
+				g.set_box(i,_boxes[i]);
+				changed.push_back(i);
+				is_changed[i]=1;
+			}
+		}
+		g.propagate();
+
+		/* Check the edges of the changed boxes (an edge between two
+		 * changed boxes is checked once) */
+		vector<pair<int,int> > removed;
+		for (vector<int>::const_iterator it=changed.begin(); it!=changed.end(); it++) {
+			int i=*it;
+			if (!g.alive[i]) continue;
+			for (vector<int>::const_iterator it2=g.adj[i].begin(); it2!=g.adj[i].end(); it2++) {
+				int j=*it2;
+				if (!g.alive[j] || (is_changed[j] && j<i)) continue;
+				nb_checks++;
+				if (!g.boxes[i].intersects(g.boxes[j])) removed.push_back(pair<int,int>(i,j));
+			}
+		}
+
+		/* Remove the edges (only the removed edges are recorded in the trail) */
+		if (!removed.empty()) {
+			vector<vector<int> > rem(p);
+			for (vector<pair<int,int> >::const_iterator it=removed.begin(); it!=removed.end(); it++) {
+				rem[it->first].push_back(it->second);
+				rem[it->second].push_back(it->first);
+			}
+			vector<char> mark(p, 0);
+			for (int i=0; i<p; i++) {
+				if (rem[i].empty()) continue;
+				for (vector<int>::const_iterator it=rem[i].begin(); it!=rem[i].end(); it++) mark[*it]=1;
+				g.set_deg(i, g.deg[i]-g.remove_edges(i, mark));
+				for (vector<int>::const_iterator it=rem[i].begin(); it!=rem[i].end(); it++) mark[*it]=0;
+			}
+			for (int i=0; i<p; i++) {
+				if (g.alive[i] && g.deg[i]<k) g.kill(i);
+			}
+			g.propagate();
+		}
+	}
+
+	/* The boxes out of the k-core cannot belong to a q-intersection */
+	for (int i=0; i<p; i++) {
+		if (!state->alive[i]) _boxes[i].set_empty();
+	}
+}
+
+KCoreGraph* QInterGraph::graph() const {
+	assert(state);
+	restore();
+	const State& g=*state;
+	int p=g.boxes.size();
+
+	KCoreGraph* kg=new KCoreGraph(p,g.k,false);
+	for (int i=0; i<p; i++) {
+		if (g.alive[i]) kg->add(i);
+	}
+	for (int i=0; i<p; i++) {
+		if (!g.alive[i]) continue;
+		for (vector<int>::const_iterator it=g.adj[i].begin(); it!=g.adj[i].end(); it++) {
+			if (i<*it && g.alive[*it]) kg->add_edge(i,*it);
+		}
+	}
+	return kg;
+}
+
+int QInterGraph::size() const {
+	if (!state) return 0;
+	restore();
+	return state->nb_alive;
+}
+
+long QInterGraph::nb_edges() const {
+	if (!state) return 0;
+	restore();
+	long m=0;
+	for (unsigned int i=0; i<state->deg.size(); i++)
+		if (state->alive[i]) m+=state->deg[i];
+	return m/2;
+}
+
+} // end namespace ibex
@@ -0,0 +1,150 @@
+//============================================================================
+//                                  I B E X
+// File        : Incremental intersection graph of a q-intersection
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#ifndef __IBEX_Q_INTER_GRAPH_H__
+#define __IBEX_Q_INTER_GRAPH_H__
+
+#include "ibex_Backtrackable.h"
+#include "ibex_IntervalVector.h"
+#include "ibex_Array.h"
+#include "ibex_KCoreGraph.h"
+
+#include <vector>
+
+namespace ibex {
+
+/**
+ * \ingroup combinatorial
+ * \brief Intersection graph of the boxes of a q-intersection, maintained along the search tree.
+ *
+ * This backtrackable data stores the boxes of the last q-intersection performed
+ * in a cell and the k-core (k=q-1) of their intersection graph. A box that is not
+ * in the k-core cannot belong to a q-intersection.
+ *
+ * A subcell inherits the data of its parent. Since the box of a subcell is included
+ * in the box of its parent, the i-th box of the q-intersection in the subcell
+ * can be intersected with the i-th box of the parent. The boxes can therefore only
+ * shrink along a branch of the search tree, so that the edges of the graph and the
+ * vertices of the k-core can only be removed: the update of the graph only checks
+ * the edges of the boxes that have changed and its cost is proportional to the
+ * number of these edges (instead of p<sup>2</sup> for p boxes).
+ *
+ * The graph is not copied in the subcells: it is shared by all the cells of the
+ * search tree and each cell only records in a trail the changes it has made
+ * (shrunk boxes, removed vertices and edges). Before a cell is updated, the graph
+ * is brought back to the state of this cell by undoing the changes up to the
+ * common ancestor of this cell and of the last updated cell, and by redoing the
+ * changes from this ancestor. In depth-first search, the changes are only undone
+ * (backtrack).
+ *
+ * The graph is built from scratch in the root cell, or if the number of boxes
+ * or k changes.
+ */
+class QInterGraph : public Backtrackable {
+public:
+	/**
+	 * \brief Create the data of the root cell (the graph is not built).
+	 */
+	QInterGraph();
+
+	/**
+	 * \brief Delete this.
+	 */
+	~QInterGraph();
+
+	/**
+	 * \brief Create a copy.
+	 *
+	 * The copy shares the graph and is a child of this data in the trail.
+	 */
+	Backtrackable* copy() const;
+
+	/**
+	 * \brief Create the data of the subcells (copies of this).
+	 */
+	std::pair<Backtrackable*,Backtrackable*> down(const BisectionPoint&);
+
+	/**
+	 * \brief Update the graph with the boxes of the current cell.
+	 *
+	 * Each box boxes[i] is intersected with the i-th box of the last update
+	 * (i.e., in the parent cell) and set to the empty box if i is not in the
+	 * k-core anymore. The edges of the boxes that have changed are checked
+	 * and the k-core is updated.
+	 *
+	 * \param nb_threads - number of threads used to build the graph from scratch
+	 *                     (see #qinter_nb_threads).
+	 */
+	void update(Array<IntervalVector>& boxes, int k, int nb_threads=1);
+
+	/**
+	 * \brief Create the k-core as a KCoreGraph (to be deleted by the caller).
+	 *
+	 * The vertex i corresponds to boxes[i] in the last update of this data.
+	 * Only the vertices of the k-core are in the graph.
+	 *
+	 * \pre #update has been called.
+	 */
+	KCoreGraph* graph() const;
+
+	/**
+	 * \brief True if the graph has been built.
+	 */
+	bool is_built() const;
+
+	/**
+	 * \brief Number of vertices in the k-core.
+	 */
+	int size() const;
+
+	/**
+	 * \brief Number of edges in the k-core.
+	 */
+	long nb_edges() const;
+
+	/**
+	 * \brief Number of intersection tests performed by the last update.
+	 */
+	long nb_checks;
+
+protected:
+	class Node;
+	class State;
+
+	/* Build the graph from scratch. */
+	void build(Array<IntervalVector>& boxes, int k, int nb_threads);
+
+	/* Bring the graph back to the state of this data. */
+	void restore() const;
+
+	/* Stop sharing the graph. */
+	void detach();
+
+	/* Decrement the references of n and delete the unreferenced nodes. */
+	static void release(Node* n);
+
+	/* The graph shared with the other cells (NULL if not built) */
+	State* state;
+
+	/* The changes of this data in the trail (NULL if not built) */
+	Node* node;
+
+private:
+	QInterGraph(const QInterGraph&); // forbidden
+};
+
+/*============================================ inline implementation ============================================ */
+
+inline bool QInterGraph::is_built() const {
+	return state!=NULL;
+}
+
+} // end namespace ibex
+
+#endif // __IBEX_Q_INTER_GRAPH_H__
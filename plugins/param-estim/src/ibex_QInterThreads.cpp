@@ -0,0 +1,61 @@
+//============================================================================
+//                                  I B E X
+// File        : Multi-threaded loops of the q-intersection
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#include "ibex_QInterThreads.h"
+
+using namespace std;
+
+namespace ibex {
+
+namespace {
+
+class IntersectionEdges {
+public:
+	IntersectionEdges(const Array<IntervalVector>& boxes, vector<vector<int> >& rows) : boxes(boxes), rows(rows) {
+		rows.assign(boxes.size(), vector<int>());
+	}
+
+	void operator()(int i, int t) {
+		for (int j=i+1; j<boxes.size(); j++) {
+			if (boxes[i].intersects(boxes[j])) rows[i].push_back(j);
+		}
+	}
+
+	const Array<IntervalVector>& boxes;
+	vector<vector<int> >& rows; // neighbours of greater index
+};
+
+} // end anonymous namespace
+
+int qinter_nb_threads(int nb_threads) {
+#ifndef _WIN32
+	if (nb_threads>0) return nb_threads;
+	int n=std::thread::hardware_concurrency();
+	return n>0 ? n : 1;
+#else
+	return 1;
+#endif
+}
+
+void qinter_intersections(const Array<IntervalVector>& boxes, vector<vector<int> >& rows, int nb_threads) {
+	IntersectionEdges edges(boxes, rows);
+	qinter_parallel_for(boxes.size(), nb_threads, edges);
+}
+
+void qinter_add_edges(const Array<IntervalVector>& boxes, KCoreGraph& graph, int nb_threads) {
+	vector<vector<int> > rows;
+	qinter_intersections(boxes, rows, nb_threads);
+
+	for (int i=0; i<boxes.size(); i++) {
+		for (vector<int>::const_iterator it=rows[i].begin(); it!=rows[i].end(); it++)
+			graph.add_edge(i,*it);
+	}
+}
+
+} // end namespace ibex
@@ -0,0 +1,94 @@
+//============================================================================
+//                                  I B E X
+// File        : Multi-threaded loops of the q-intersection
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#ifndef __IBEX_Q_INTER_THREADS_H__
+#define __IBEX_Q_INTER_THREADS_H__
+
+#include "ibex_IntervalVector.h"
+#include "ibex_Array.h"
+#include "ibex_KCoreGraph.h"
+
+#include <vector>
+
+#ifndef _WIN32 // MinGW does not support threads
+#include <thread>
+#endif
+
+namespace ibex {
+
+/**
+ * \ingroup combinatorial
+ * \brief Actual number of threads of a q-intersection.
+ *
+ * Return the number of hardware threads if \a nb_threads is 0 (or
+ * negative), \a nb_threads otherwise. Always return 1 under Windows.
+ */
+int qinter_nb_threads(int nb_threads);
+
+/**
+ * \ingroup combinatorial
+ * \brief Compute the intersection graph of the boxes.
+ *
+ * On return, rows[i] contains the indices j>i (in ascending order) such that
+ * boxes[i] and boxes[j] intersect. The rows are computed on \a nb_threads threads.
+ */
+void qinter_intersections(const Array<IntervalVector>& boxes, std::vector<std::vector<int> >& rows, int nb_threads);
+
+/**
+ * \ingroup combinatorial
+ * \brief Add the edges of the intersection graph of the boxes.
+ *
+ * The edge (i,j) is added to \a graph if boxes[i] and boxes[j] intersect.
+ * The intersections are computed on \a nb_threads threads but the edges
+ * are added in the same order as by a sequential loop.
+ */
+void qinter_add_edges(const Array<IntervalVector>& boxes, KCoreGraph& graph, int nb_threads);
+
+/**
+ * \ingroup combinatorial
+ * \brief Parallel loop.
+ *
+ * Call f(i,t) for all i in [0,n), where t is the number of the thread
+ * (in [0,nb_threads)) that performs the call. The range is split into
+ * nb_threads contiguous chunks of (almost) the same size and the chunk #t
+ * is processed in ascending order by the thread #t. The calling thread
+ * is the thread #0 and the function returns when all the calls are done.
+ *
+ * \pre nb_threads>0.
+ */
+template<class F>
+void qinter_parallel_for(int n, int nb_threads, F& f);
+
+/*============================================ inline implementation ============================================ */
+
+template<class F>
+void qinter_chunk(int first, int last, int t, F* f) {
+	for (int i=first; i<last; i++) (*f)(i,t);
+}
+
+template<class F>
+void qinter_parallel_for(int n, int nb_threads, F& f) {
+#ifndef _WIN32
+	if (nb_threads>n) nb_threads=n;
+	if (nb_threads>1) {
+		std::vector<std::thread> threads;
+		for (int t=1; t<nb_threads; t++)
+			threads.push_back(std::thread(qinter_chunk<F>, (int) ((long) n*t/nb_threads), (int) ((long) n*(t+1)/nb_threads), t, &f));
+		qinter_chunk(0, n/nb_threads, 0, &f);
+		for (int t=0; t<nb_threads-1; t++)
+			threads[t].join();
+		return;
+	}
+#endif
+	qinter_chunk(0, n, 0, &f);
+}
+
+} // end namespace ibex
+
+#endif // __IBEX_Q_INTER_THREADS_H__
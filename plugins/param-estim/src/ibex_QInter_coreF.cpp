@@ -5,12 +5,15 @@
 // Copyright   : Ecole des Mines de Nantes (France)
 // License     : See the LICENSE file
 // Created     : Jul 24, 2013
-// Last Update : Jul 24, 2013
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #include "ibex_QInter.h"
 #include "ibex_KCoreGraph.h"
+#include "ibex_QInterThreads.h"
+#include "ibex_mistral_Bitset.h"
 #include <algorithm>
+#include <vector>
 
 using namespace std;
 
@@ -19,11 +22,108 @@ namespace ibex {
 bool leftcompC(const pair<double,int>& i, const pair<double,int>& j) { return (i.first<j.first); }
 bool rightcompC(const pair<double,int>& i, const pair<double,int>& j) { return (i.first>j.first); }
 
-IntervalVector qinter_coref(const Array<IntervalVector>& _boxes, int q) {
+namespace {
+
+/*
+ * For each direction, performs a greedy coloring of the given vertices and keeps the left (resp. right)
+ * bound of the first box with color q. Each thread has its own coloring structures.
+ */
+class CoreFilter {
+public:
+	CoreFilter(const Array<IntervalVector>& boxes, KCoreGraph* origin, const vector<int>& vertices, int q, int nb_threads, IntervalVector& res) :
+		boxes(boxes), origin(origin), vertices(vertices), q(q), p(boxes.size()), m(vertices.size()),
+		x(nb_threads), colors(nb_threads), used(nb_threads), res(res) {
+		for (int t=0; t<nb_threads; t++) {
+			x[t].resize(m);
+			colors[t].resize(p);
+			used[t] = new Mistral::BitSet(0,p,Mistral::BitSet::empt);
+		}
+	}
+
+	~CoreFilter() {
+		for (unsigned int t=0; t<used.size(); t++)
+			delete used[t];
+	}
+
+	void operator()(int i, int t) {
+		pair<double,int>* x = &this->x[t][0];
+		int b;
+		double lb0,ub0;
+
+		/* Left bound */
+		
+		for (int j=0; j<m; j++) {
+			x[j] = make_pair(boxes[vertices[j]][i].lb(),vertices[j]);
+		}
+		
+		sort(x,x+m,leftcompC);
+		
+		b = origin->qcoloring(x, m, q, &colors[t][0], used[t]);
+		
+		if (b == -1) {
+			res[i].set_empty();
+			return;
+		}
+		
+		lb0 = boxes[b][i].lb();
+		
+		/* Right bound */
+		
+		for (int j=0; j<m; j++) {
+			x[j] = make_pair(boxes[vertices[j]][i].ub(),vertices[j]);
+		}
+		
+		sort(x,x+m,rightcompC);
+		
+		b = origin->qcoloring(x, m, q, &colors[t][0], used[t]);
+		
+		if (b == -1) {
+			res[i].set_empty();
+			return;
+		}
+		
+		ub0 = boxes[b][i].ub();
+		
+		res[i] = Interval(lb0,ub0);
+	}
+
+private:
+	const Array<IntervalVector>& boxes;
+	KCoreGraph* origin;
+	const vector<int>& vertices;
+	const int q;
+	const int p;
+	const int m;
+	vector<vector<pair<double,int> > > x;
+	vector<vector<int> > colors;
+	vector<Mistral::BitSet*> used;
+	IntervalVector& res;
+};
+
+IntervalVector coref_filter(const Array<IntervalVector>& boxes, KCoreGraph* origin, const vector<int>& vertices, int q, int nb_threads) {
+	int n = boxes[0].size();
+	
+	IntervalVector res(n);
+	CoreFilter filter(boxes, origin, vertices, q, nb_threads, res);
+	qinter_parallel_for(n, nb_threads, filter);
+	
+	for (int i=0; i<n; i++) {
+		if (res[i].is_empty()) {
+			res.set_empty();
+			break;
+		}
+	}
+	return res;
+}
+
+} // end anonymous namespace
+
+IntervalVector qinter_coref(const Array<IntervalVector>& _boxes, int q, int nb_threads) {
 	
 	assert(q>0);
 	assert(_boxes.size()>0);
 	int n = _boxes[0].size();
+	nb_threads = qinter_nb_threads(nb_threads);
 	
 	/* Remove the empty boxes from the list */
 	
@@ -46,11 +146,7 @@ IntervalVector qinter_coref(const Array<IntervalVector>& _boxes, int q) {
 	
 	/* Add edges */
 	
-	for (int i=0; i<p; i++) {
-		for (int j=i+1; j<p; j++) {
-			if (boxes[i].intersects(boxes[j])) origin->add_edge(i,j);
-		}
-	}
+	qinter_add_edges(boxes, *origin, nb_threads);
 	
 	IntervalVector res(n);
 	res.set_empty();
@@ -65,53 +161,38 @@ IntervalVector qinter_coref(const Array<IntervalVector>& _boxes, int q) {
 	
 	/* For each direction, perform a greedy coloring and keep the left bound of the first box with color q. */
 	
-	int b;
-	double lb0,ub0;
-	std::pair<double, int> *x = new std::pair<double, int>[p];
-
-	for (int i=0; i<n; i++) {
-		
-		/* Left bound */
-		
-		for (int j=0; j<p; j++) {
-			x[j] = make_pair(boxes[j][i].lb(),j);
-		}
-		
-		sort(x,x+p,leftcompC);
-		
-		b = origin->qcoloring(x, p, q);
-		
-		if (b == -1) {
-			res.set_empty();
-			break;
-		}
-		
-		lb0 = boxes[b][i].lb();
-		
-		/* Right bound */
-		
-		for (int j=0; j<p; j++) {
-			x[j] = make_pair(boxes[j][i].ub(),j);
-		}
-		
-		sort(x,x+p,rightcompC);
-		
-		b = origin->qcoloring(x, p, q);
-		
-		if (b == -1) {
-			res.set_empty();
-			break;
-		}
-		
-		ub0 = boxes[b][i].ub();
-		
-		res[i] = Interval(lb0,ub0);
-	}
+	vector<int> vertices(p);
+	for (int i=0; i<p; i++) vertices[i]=i;
+	
+	res = coref_filter(boxes, origin, vertices, q, nb_threads);
 	
 	/* Cleanup */
 	delete(origin);
-	delete [] x;
 	return res;
 }
 
+IntervalVector qinter_coref(const Array<IntervalVector>& boxes, int q, KCoreGraph& graph, int nb_threads) {
+	
+	assert(q>0);
+	assert(boxes.size()>0);
+	assert(boxes.size()==graph.maxsize());
+	int n = boxes[0].size();
+	nb_threads = qinter_nb_threads(nb_threads);
+	
+	/* Perform the (q-1)-core filtering */
+	
+	graph.apply_coreness();
+	if (graph.empty()) return IntervalVector::empty(n);
+	
+	/* Greedy colorings of the remaining vertices */
+	
+	vector<int> vertices;
+	vertices.reserve(graph.size());
+	for (int i=0; i<boxes.size(); i++) {
+		if (graph.contain(i)) vertices.push_back(i);
+	}
+	
+	return coref_filter(boxes, &graph, vertices, q, nb_threads);
+}
+
 } // end namespace ibex
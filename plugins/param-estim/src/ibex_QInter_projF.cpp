@@ -5,11 +5,13 @@
 // Copyright   : Ecole des Mines de Nantes (France)
 // License     : See the LICENSE file
 // Created     : Jul 24, 2013
-// Last Update : Jul 24, 2013
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #include "ibex_QInter.h"
+#include "ibex_QInterThreads.h"
 #include <algorithm>
+#include <vector>
 
 using namespace std;
 
@@ -20,35 +22,24 @@ bool paircomp (const pair<double,int>& i, const pair<double,int>& j) { return (i
 
 namespace ibex {
 
-IntervalVector qinter_projf(const Array<IntervalVector>& _boxes, int q) {
-	
-	assert(q>0);
-	assert(_boxes.size()>0);
-	int n = _boxes[0].size();
-	
-	/* Remove the empty boxes from the list */
-	
-	int p=0;	
-	for (int i=0; i<_boxes.size(); i++) {
-		if (!_boxes[i].is_empty()) p++;
-	}
-	
-	if (p==0) return IntervalVector::empty(n);
-	
-	Array<IntervalVector> boxes(p);
-	int j=0;
-	for (int i=0; i<_boxes.size(); i++) {
-		if (!_boxes[i].is_empty()) boxes.set_ref(j++,_boxes[i]);
+namespace {
+
+/*
+ * Solves the q-inter independently on each dimension. Each thread has its own array.
+ */
+class ProjFilter {
+public:
+	ProjFilter(const Array<IntervalVector>& boxes, int q, int nb_threads, IntervalVector& res) :
+		boxes(boxes), q(q), p(boxes.size()), x(nb_threads), res(res) {
+		for (int t=0; t<nb_threads; t++)
+			x[t].resize(2*p);
 	}
-	
-	/* Main loop : solve the q-inter independently on each dimension, and return the cartesian product */
-	
-	double lb0,rb0;
-	IntervalVector res(n);
-	pair<double,int>  *x = new pair<double,int>[2*p];
-	int c;
-	for (int i=0; i<n; i++) {
-		
+
+	void operator()(int i, int t) {
+		pair<double,int>* x = &this->x[t][0];
+		double lb0,rb0;
+		int c;
+
 		/* Solve the q-inter for dimension i */
 		
 		for (int j=0; j<p; j++) {
@@ -70,8 +61,8 @@ IntervalVector qinter_projf(const Array<IntervalVector>& _boxes, int q) {
 		}
 		
 		if (lb0 == POS_INFINITY) {
-			res.set_empty();
-			break;
+			res[i].set_empty();
+			return;
 		}
 		
 		/* Find the right bound */
@@ -86,8 +77,52 @@ IntervalVector qinter_projf(const Array<IntervalVector>& _boxes, int q) {
 		
 		res[i] = Interval(lb0,rb0);
 	}
+
+private:
+	const Array<IntervalVector>& boxes;
+	const int q;
+	const int p;
+	vector<vector<pair<double,int> > > x;
+	IntervalVector& res;
+};
+
+} // end anonymous namespace
+
+IntervalVector qinter_projf(const Array<IntervalVector>& _boxes, int q, int nb_threads) {
+	
+	assert(q>0);
+	assert(_boxes.size()>0);
+	int n = _boxes[0].size();
+	nb_threads = qinter_nb_threads(nb_threads);
+	
+	/* Remove the empty boxes from the list */
+	
+	int p=0;	
+	for (int i=0; i<_boxes.size(); i++) {
+		if (!_boxes[i].is_empty()) p++;
+	}
+	
+	if (p==0) return IntervalVector::empty(n);
+	
+	Array<IntervalVector> boxes(p);
+	int j=0;
+	for (int i=0; i<_boxes.size(); i++) {
+		if (!_boxes[i].is_empty()) boxes.set_ref(j++,_boxes[i]);
+	}
+	
+	/* Main loop : solve the q-inter independently on each dimension, and return the cartesian product */
+	
+	IntervalVector res(n);
+	ProjFilter filter(boxes, q, nb_threads, res);
+	qinter_parallel_for(n, nb_threads, filter);
+
+	for (int i=0; i<n; i++) {
+		if (res[i].is_empty()) {
+			res.set_empty();
+			break;
+		}
+	}
 	
-	delete [] x;
 	return res;
 }
 
@@ -10,6 +10,9 @@
 #include "TestQInter2.h"
 #include "ibex_Function.h"
 #include "ibex_QInter2.h"
+#include "ibex_QInterGraph.h"
+#include "ibex_Random.h"
+#include "ibex_BisectionPoint.h"
 
 using namespace std;
 
@@ -77,5 +80,171 @@ void TestQInter::test_projF_3(){
     CPPUNIT_ASSERT(!x_res.is_empty());
 }
 
+void TestQInter::test_threads(){
+    RNG::srand(1);
+    int n = 3;
+    int p = 120;
+    vector<IntervalVector> V(p, IntervalVector(n));
+    Array<IntervalVector> boxes(p);
+    for(int i = 0; i < p; i++){
+        for(int j = 0; j < n; j++){
+            double c = RNG::rand(0, 10);
+            double r = RNG::rand(0, 3);
+            V[i][j] = Interval(c - r, c + r);
+        }
+        boxes.set_ref(i, V[i]);
+    }
+    for(int q = 2; q < 20; q += 3){
+        IntervalVector res2 = qinter2(boxes, q);
+        IntervalVector resP = qinter_projf(boxes, q);
+        IntervalVector resC = qinter_coref(boxes, q);
+        for(int nb_threads = 0; nb_threads <= 4; nb_threads++){
+            CPPUNIT_ASSERT(qinter2(boxes, q, nb_threads) == res2);
+            CPPUNIT_ASSERT(qinter_projf(boxes, q, nb_threads) == resP);
+            CPPUNIT_ASSERT(qinter_coref(boxes, q, nb_threads) == resC);
+        }
+    }
+}
+
+void TestQInter::test_incremental(){
+    RNG::srand(2);
+    int n = 2;
+    int p = 100;
+    int q = 6;
+    vector<IntervalVector> V(p, IntervalVector(n));
+    for(int i = 0; i < p; i++){
+        for(int j = 0; j < n; j++){
+            double c = RNG::rand(0, 10);
+            double r = RNG::rand(0, 2);
+            V[i][j] = Interval(c - r, c + r);
+        }
+    }
+    Array<IntervalVector> boxes(p);
+    for(int i = 0; i < p; i++) boxes.set_ref(i, V[i]);
+
+    QInterGraph root;
+    root.update(boxes, q - 1);
+    CPPUNIT_ASSERT(root.is_built());
+
+    // a subcell: the boxes are contracted (to the left half of the domain)
+    QInterGraph* child = (QInterGraph*) root.copy();
+    IntervalVector half(n, Interval(0, 10));
+    half[0] = Interval(0, 5);
+    vector<IntervalVector> W(p, IntervalVector(n));
+    Array<IntervalVector> subboxes(p);
+    for(int i = 0; i < p; i++){
+        W[i] = V[i] & half;
+        subboxes.set_ref(i, W[i]);
+    }
+    IntervalVector res = qinter2(subboxes, q);
+    child->update(subboxes, q - 1);
+    CPPUNIT_ASSERT(child->nb_checks < p*(p-1)/2);
+
+    // the graph must be the (q-1)-core of the intersection graph built from scratch
+    KCoreGraph ref(p, q - 1, true);
+    for(int i = 0; i < p; i++)
+        for(int j = i + 1; j < p; j++)
+            if (W[i].intersects(W[j])) ref.add_edge(i, j);
+    ref.apply_coreness();
+
+    KCoreGraph* graph = child->graph();
+    CPPUNIT_ASSERT(graph->size() == ref.size());
+    CPPUNIT_ASSERT(child->size() == ref.size());
+    for(int i = 0; i < p; i++){
+        CPPUNIT_ASSERT(graph->contain(i) == ref.contain(i));
+        if (!ref.contain(i)) continue;
+        for(int j = 0; j < p; j++)
+            if (j != i && ref.contain(j))
+                CPPUNIT_ASSERT(graph->is_edge(i, j) == ref.is_edge(i, j));
+    }
+
+    CPPUNIT_ASSERT(qinter2(subboxes, q, *graph) == res);
+    delete graph;
+    delete child;
+}
+
+/* Check that g is the k-core of the intersection graph of W */
+static void check_core(const QInterGraph& g, const vector<IntervalVector>& W, int k){
+    int p = W.size();
+    KCoreGraph ref(p, k, true);
+    for(int i = 0; i < p; i++)
+        for(int j = i + 1; j < p; j++)
+            if (W[i].intersects(W[j])) ref.add_edge(i, j);
+    ref.apply_coreness();
+
+    KCoreGraph* graph = g.graph();
+    CPPUNIT_ASSERT(graph->size() == ref.size());
+    CPPUNIT_ASSERT(g.size() == ref.size());
+    for(int i = 0; i < p; i++){
+        CPPUNIT_ASSERT(graph->contain(i) == ref.contain(i));
+        if (!ref.contain(i)) continue;
+        for(int j = 0; j < p; j++)
+            if (j != i && ref.contain(j))
+                CPPUNIT_ASSERT(graph->is_edge(i, j) == ref.is_edge(i, j));
+    }
+    delete graph;
+}
+
+void TestQInter::test_backtrack(){
+    RNG::srand(3);
+    int n = 2;
+    int p = 100;
+    int q = 6;
+    vector<IntervalVector> V(p, IntervalVector(n));
+    for(int i = 0; i < p; i++){
+        for(int j = 0; j < n; j++){
+            double c = RNG::rand(0, 10);
+            double r = RNG::rand(0, 2);
+            V[i][j] = Interval(c - r, c + r);
+        }
+    }
+    Array<IntervalVector> boxes(p);
+    for(int i = 0; i < p; i++) boxes.set_ref(i, V[i]);
+
+    QInterGraph root;
+    root.update(boxes, q - 1);
+
+    // the boxes of a subcell
+    IntervalVector half(n, Interval(0, 10));
+    vector<IntervalVector> L(V), R(V), LL(V);
+    Array<IntervalVector> lboxes(p), rboxes(p), llboxes(p);
+    for(int i = 0; i < p; i++){
+        half[0] = Interval(0, 5);
+        L[i] &= half;
+        half[1] = Interval(0, 5);
+        LL[i] &= half;
+        half[1] = Interval(0, 10);
+        half[0] = Interval(5, 10);
+        R[i] &= half;
+        lboxes.set_ref(i, L[i]);
+        rboxes.set_ref(i, R[i]);
+        llboxes.set_ref(i, LL[i]);
+    }
+
+    pair<Backtrackable*,Backtrackable*> sub = root.down(BisectionPoint(0, 5, false));
+    QInterGraph* left = (QInterGraph*) sub.first;
+    QInterGraph* right = (QInterGraph*) sub.second;
+    QInterGraph* leftleft = (QInterGraph*) left->copy();
+
+    // depth-first, then a jump to another branch
+    left->update(lboxes, q - 1);
+    leftleft->update(llboxes, q - 1);
+    check_core(*leftleft, LL, q - 1);
+    right->update(rboxes, q - 1);
+    check_core(*right, R, q - 1);
+
+    // the graph is restored in the state of each cell
+    check_core(root, V, q - 1);
+    check_core(*leftleft, LL, q - 1);
+    check_core(*left, L, q - 1);
+    check_core(*right, R, q - 1);
+
+    // the ancestors can be deleted first
+    delete left;
+    check_core(*leftleft, LL, q - 1);
+    delete leftleft;
+    delete right;
+}
+
 } // end namespace
 
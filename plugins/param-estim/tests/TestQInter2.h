@@ -5,7 +5,7 @@
 // Copyright   : Ecole des Mines de Nantes (France)
 // License     : See the LICENSE file
 // Created     : Jan 02, 2015
-// Last Update : Jan 02, 2015
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #ifndef __TEST_Q_INTER__
@@ -26,11 +26,17 @@ public:
 	CPPUNIT_TEST( test_projF_1 );
 	CPPUNIT_TEST( test_projF_2 );
 	CPPUNIT_TEST( test_projF_3 );
+	CPPUNIT_TEST( test_threads );
+	CPPUNIT_TEST( test_incremental );
+	CPPUNIT_TEST( test_backtrack );
 	CPPUNIT_TEST_SUITE_END();
 
     void test_projF_1();
     void test_projF_2();
     void test_projF_3();
+    void test_threads();
+    void test_incremental();
+    void test_backtrack();
 };
 
 CPPUNIT_TEST_SUITE_REGISTRATION( TestQInter );
@@ -0,0 +1,361 @@
+#include "ibex.h"
+#include <sstream>
+#include <fstream>
+#include <chrono>
+
+#ifndef _IBEX_WITH_OPTIM_
+#error "You need the IBEXOPT plugin to run this benchmark."
+#endif
+
+#ifndef _IBEX_WITH_SIP_
+#error "You need the SIP plugin to run this benchmark."
+#endif
+
+using namespace std;
+using namespace ibex;
+
+#define MIN(a,b) ((a < b) ? a : b)
+
+/* Same values as the status of the optimizer */
+#define STATUS_SUCCESS 0
+#define STATUS_TIME_OUT 4
+
+double tot_time = 0.0;
+
+double
+double_from_arg (const char *argname, const char *str)
+{
+	char *endptr = NULL;
+	double val = strtod (str, &endptr);
+	if (endptr != str + strlen(str))
+	{
+		stringstream s;
+		s << "\"" << argname << "\" must be a real number";
+		ibex_error (s.str().c_str());
+	}
+	return val;
+}
+
+unsigned int
+uint_from_arg (const char *argname, const char *str)
+{
+	char *endptr = NULL;
+	unsigned int val = (unsigned int) strtoul (str, &endptr, 10);
+	if (endptr != str + strlen(str))
+	{
+		stringstream s;
+		s << "\"" << argname << "\" must be an unsigned integer";
+		ibex_error (s.str().c_str());
+	}
+	return val;
+}
+
+void
+usage (const char *errmsg)
+{
+	stringstream s;
+	s << errmsg << std::endl
+	  << "Usage: benchmark_sip ARGS" << std::endl
+	  << "Mandatory parameter are:" << std::endl
+	  << "  --bench-file <file>   file containing the problem" << std::endl
+	  << "  --time-limit <t>      no run is started after a run of more than <t> seconds" << std::endl
+	  << "  --prec-ndigits-min <d>        " << std::endl
+	  << "  --prec-ndigits-max <d>        " << std::endl
+	  << "  --iter <i>        " << std::endl
+	  << "Optional parameter are:" << std::endl
+	  << "  --buffer-stats        ignored (no cell buffer)" << std::endl
+	  << "  --phase-counters      ignored (no optimizer)" << std::endl;
+	ibex_error (s.str().c_str());
+}
+
+/*
+ * SIP problem "min f(x) s.t. g(x,y)<=0 for all y", solved with MitsosSIP.
+ *
+ * The bench file is a Minibex file. Its comment lines of the form
+ * "// key = value" give the settings of the benchmark. The keys are:
+ *   parameters  names of the parameters y, separated by spaces (mandatory)
+ *   threads     number of threads for the LLP problems, 0 for the number
+ *               of hardware threads (default: 0)
+ *   llp_boxes   number of parameter boxes of a LLP problem (default: 4)
+ */
+class SIPBench
+{
+public:
+	SIPBench (const char *filename);
+	~SIPBench ();
+
+	/* Solve the problem with precision prec and nb_threads threads. */
+	int run (double prec, int nb_threads, double &time, int &nb_iter,
+	         double &uplo, double &loup);
+
+	vector<string> parameters;
+	int threads;
+	int llp_boxes;
+
+private:
+	System *m_sys;
+	vector<const ExprSymbol*> m_vars;
+	vector<const ExprSymbol*> m_params;
+	BitSet *m_is_param;
+};
+
+SIPBench::SIPBench (const char *filename)
+	: threads (0), llp_boxes (4)
+{
+	ifstream in (filename);
+	if (!in)
+	{
+		stringstream s;
+		s << "cannot open " << filename;
+		ibex_error (s.str().c_str());
+	}
+
+	string line;
+	while (getline (in, line))
+	{
+		if (line.compare (0, 2, "//") != 0)
+			continue;
+		size_t eq = line.find ('=');
+		if (eq == string::npos)
+			continue;
+		string key, value;
+		stringstream (line.substr (2, eq-2)) >> key;
+		stringstream (line.substr (eq+1)) >> value;
+		if (key == "parameters")
+		{
+			stringstream names (line.substr (eq+1));
+			string name;
+			while (names >> name)
+				parameters.push_back (name);
+		}
+		else if (key == "threads")
+			threads = (int) uint_from_arg ("threads", value.c_str());
+		else if (key == "llp_boxes")
+			llp_boxes = (int) uint_from_arg ("llp_boxes", value.c_str());
+		else
+		{
+			stringstream s;
+			s << "unknown key \"" << key << "\" in " << filename;
+			ibex_error (s.str().c_str());
+		}
+	}
+	if (parameters.empty())
+		ibex_error ("no parameter in the bench file");
+	if (llp_boxes < 1)
+		ibex_error ("llp_boxes must be positive");
+
+	m_sys = new System (filename);
+
+	m_is_param = new BitSet (BitSet::empty (m_sys->f_ctrs.nb_arg()));
+	for (int K = 0; K < m_sys->f_ctrs.nb_arg(); K++)
+	{
+		const ExprSymbol &x = m_sys->f_ctrs.arg(K);
+		bool found = false;
+		for (size_t J = 0; J < parameters.size(); J++)
+			found |= parameters[J] == x.name;
+		if (found)
+		{
+			m_params.push_back (&x);
+			m_is_param->add (K);
+		}
+		else
+			m_vars.push_back (&x);
+	}
+	if (m_params.size() != parameters.size())
+		ibex_error ("one parameter does not exist");
+}
+
+SIPBench::~SIPBench ()
+{
+	delete m_is_param;
+	delete m_sys;
+}
+
+int
+SIPBench::run (double prec, int nb_threads, double &time, int &nb_iter,
+               double &uplo, double &loup)
+{
+	MitsosSIP sip (*m_sys, m_vars, m_params, *m_is_param);
+	sip.trace = 0;
+	sip.nb_threads = nb_threads;
+	sip.llp_boxes = llp_boxes;
+
+	/* The LLP problems run on several threads: measure the real time */
+	chrono::steady_clock::time_point start = chrono::steady_clock::now();
+	sip.optimize (prec);
+	time = chrono::duration<double> (chrono::steady_clock::now() - start).count();
+
+	nb_iter = sip.nb_iter;
+	uplo = sip.uplo;
+	loup = sip.loup;
+	return STATUS_SUCCESS;
+}
+
+/* Return true if timeout was reached for at least one of the #iter run(s).
+ * Return false otherwise.
+ *
+ * Note: the SIP solver cannot be interrupted, a run that lasts more than
+ * time_limit is reported as a timeout (and no other run is started).
+ */
+bool
+do_benchs_iter (SIPBench &bench, double prec, double time_limit, unsigned int iter)
+{
+	bool timeout = false;
+
+	for (unsigned int i = 0; i < iter && !timeout; i++)
+	{
+		double time, time_sequential, uplo, loup;
+		int nb_iter;
+
+		/* The sequential run is the reference of the speedup */
+		bench.run (prec, 1, time_sequential, nb_iter, uplo, loup);
+		int status = bench.run (prec, bench.threads, time, nb_iter, uplo, loup);
+		if (time > time_limit || time_sequential > time_limit)
+			status = STATUS_TIME_OUT;
+
+		/* Report some information (computation time, etc.) */
+		std::cout << "BENCH: eps = " << prec
+		          << " ; status = " << status
+		          << " ; time = " << time
+		          << " ; nb_cells = " << nb_iter
+		          << " ; uplo = " << uplo
+		          << " ; loup = " << loup
+		          << " ; random_seed = " << 1
+		          << " ; time_sequential = " << time_sequential
+		          << std::endl;
+
+		tot_time += time;
+		timeout |= status == STATUS_TIME_OUT;
+	}
+
+	return timeout;
+}
+
+int
+main (int argc, char *argv[])
+{
+	try
+	{
+		const char *benchfile = NULL;
+		double prec_ndigits_max = NAN, prec_ndigits_min = NAN, time_limit = NAN;
+		double prec_min = NAN, prec_max = NAN;
+		unsigned int iter = 0;
+
+		argc--; argv++; /* skip argv[0] = binary name */
+
+		while (argc >= 1)
+		{
+			if (strcmp (argv[0], "--buffer-stats") == 0
+			    || strcmp (argv[0], "--phase-counters") == 0)
+			{
+				argc--; argv++;
+			}
+			else if (argc < 2)
+				usage ("too many command-line parameter");
+			else if (strcmp (argv[0], "--bench-file") == 0)
+			{
+				benchfile = argv[1];
+				argc-=2; argv+=2;
+			}
+			else if (strcmp (argv[0], "--iter") == 0)
+			{
+				iter = uint_from_arg ("--iter", argv[1]);
+				argc-=2; argv+=2;
+			}
+			else if (strcmp (argv[0], "--time-limit") == 0)
+			{
+				time_limit = double_from_arg ("--time-limit", argv[1]);
+				argc-=2; argv+=2;
+			}
+			else if (strcmp (argv[0], "--prec-ndigits-min") == 0)
+			{
+				prec_ndigits_min = double_from_arg ("--prec-ndigits-min", argv[1]);
+				argc-=2; argv+=2;
+			}
+			else if (strcmp (argv[0], "--prec-ndigits-max") == 0)
+			{
+				prec_ndigits_max = double_from_arg ("--prec-ndigits-max", argv[1]);
+				argc-=2; argv+=2;
+			}
+			else
+				usage ("unrecognized command-line parameter");
+		}
+
+		/* Check for missing command-line parameter */
+		if (benchfile == NULL)
+			usage ("missing --bench-file command-line parameter");
+
+		cout << "# INPUT: bench file: " << benchfile << endl;
+		cout << "# INPUT: time limit: " << time_limit << "s" << endl;
+		cout << "# INPUT: prec ndigits max: " << prec_ndigits_max << endl;
+		cout << "# INPUT: prec ndigits min: " << prec_ndigits_min << endl;
+
+		if (isnan (prec_ndigits_max))
+			usage ("missing --prec-ndigits-max command-line parameter");
+		else
+			prec_max = pow (10, -prec_ndigits_max);
+
+		if (isnan (prec_ndigits_min))
+			usage ("missing --prec-ndigits-min command-line parameter");
+		else
+			prec_min = pow (10, -prec_ndigits_min);
+
+		if (prec_ndigits_min > prec_ndigits_max)
+			usage ("--prec-ndigits-min should not be larger than --prec-ndigits-max");
+
+		cout << "# INFO: prec max: " << prec_max << endl;
+		cout << "# INFO: prec min: " << prec_min << endl;
+
+		/* Load the problem */
+		SIPBench bench (benchfile);
+
+		cout << "# INFO: threads: " << bench.threads << endl;
+		cout << "# INFO: llp boxes: " << bench.llp_boxes << endl;
+
+		/* always bench prec_min */
+		bool has_timeout = do_benchs_iter (bench, prec_min, time_limit, iter);
+		if (!has_timeout)
+		{
+			double prec_ndigits = 0.;
+			for ( ; prec_ndigits < MIN (8., prec_ndigits_max); prec_ndigits += 1.)
+			{
+				if (prec_ndigits_min < prec_ndigits)
+				{
+					double prec = pow (10, -prec_ndigits);
+					has_timeout = do_benchs_iter (bench, prec, time_limit, iter);
+					if (has_timeout)
+						break;
+				}
+			}
+			prec_ndigits -= 0.9;
+			for (unsigned int i = 1; i < 10; i++, prec_ndigits += 0.1)
+			{
+				if (prec_ndigits <= prec_ndigits_min)
+					continue;
+				else if (prec_ndigits > prec_ndigits_max)
+					break;
+				else
+				{
+					double prec = pow (10, -prec_ndigits);
+					has_timeout = do_benchs_iter (bench, prec, time_limit, iter);
+					if (has_timeout)
+						break;
+				}
+			}
+			if (!has_timeout && prec_ndigits_max != prec_ndigits_min)
+				do_benchs_iter (bench, prec_max, time_limit, iter);
+		}
+		std::cout << "# Total time: " << tot_time << std::endl;
+		return EXIT_SUCCESS;
+	}
+	catch (ibex::SyntaxError& e)
+	{
+		cout << e << endl;
+		return EXIT_FAILURE;
+	}
+	catch (ibex::UnknownFileException& e)
+	{
+		cout << "cannot open file" << endl;
+		return EXIT_FAILURE;
+	}
+}
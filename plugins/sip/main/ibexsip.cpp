@@ -42,10 +42,23 @@ int main(int argc, char** argv) {
 	try {
 		if (argc<3) {
 			cout << "error: missing parameters" << endl;
-			cout << "usage: ./ibexsip <filename> <precision> [param-name] ... [param-name]" << endl;
+			cout << "usage: ./ibexsip <filename> <precision> [--threads=N] [--llp-boxes=N] [param-name] ... [param-name]" << endl;
 			exit(0);
 		}
 
+		// Options and parameter names
+		int nb_threads=1;
+		int llp_boxes=1;
+		vector<const char*> param_names;
+		for (int J=3; J<argc; J++) {
+			if (strncmp(argv[J],"--threads=",10)==0)
+				nb_threads=(int) convert("threads",argv[J]+10);
+			else if (strncmp(argv[J],"--llp-boxes=",12)==0)
+				llp_boxes=(int) convert("llp-boxes",argv[J]+12);
+			else
+				param_names.push_back(argv[J]);
+		}
+
 		// Load a system of equations
 		System sys(argv[1]);
 
@@ -61,12 +74,12 @@ int main(int argc, char** argv) {
 
 		for (int K=0; K<sys.f_ctrs.nb_arg(); K++) {
 			bool found=false;
-			for (int J=3; J<argc; J++) {
-				if (strcmp(sys.f_ctrs.arg(K).name, argv[J])==0) {
+			for (unsigned int J=0; J<param_names.size(); J++) {
+				if (strcmp(sys.f_ctrs.arg(K).name, param_names[J])==0) {
 					if (is_param[K])
 						ibex_error("duplicated parameter");
 					params.push_back(&sys.f_ctrs.arg(K));
-					//cout << "add " << argv[J] << " as parameter" << endl;
+					//cout << "add " << param_names[J] << " as parameter" << endl;
 					p_arg++;
 					is_param.add(K);
 					found=true;
@@ -77,13 +90,15 @@ int main(int argc, char** argv) {
 				n_arg++;
 			}
 		}
-		if (p_arg<argc-3) {
+		if (p_arg<(int) param_names.size()) {
 			ibex_error("one parameter does not exist");
 		}
 
 		MitsosSIP sip(sys, vars, params, is_param);
 
 		sip.trace = 1;
+		sip.nb_threads = nb_threads;
+		sip.llp_boxes = llp_boxes;
 
 		sip.optimize(eps_f);
 	}
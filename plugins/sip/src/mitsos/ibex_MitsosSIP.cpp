@@ -13,16 +13,158 @@
 #include "ibex_BD_Factory.h"
 #include "ibex_LLP_Factory.h"
 #include "ibex_DefaultOptimizer.h"
+#include "ibex_Random.h"
 
 #include <sstream>
 
+#ifndef _WIN32 // MinGW does not support threads
+#include <thread>
+#include <atomic>
+#endif
+
 using namespace std;
 
 namespace ibex {
 
+namespace {
+
+/*
+ * A sub-problem of the LLP problem: maximize g_c(x_opt,y)
+ * for y in the slice n°k of the parameter domain.
+ */
+struct LLPTask {
+	int c;
+	int k;
+	bool param_free;      // the constraint n°c does not involve any parameter
+	bool failed;          // the optimizer has failed
+	double lb, ub;        // enclosure of the maximum
+	vector<int> j;        // the parameters of the LLP problem...
+	vector<double> y;     // ... and their values at the maximizer (if lb>0)
+	uint32_t rng[3];      // state of the random generator at the end
+};
+
+/*
+ * Solve the LLP tasks on several threads. Each thread takes the
+ * next task not solved yet, so that all the threads are busy until
+ * the end. If MitsosSIP::nb_threads is not 1, every task starts with
+ * the same state of the random generator (the one of the calling
+ * thread), so that the result of a task does not depend on the thread
+ * that solves it. In this case, each thread draws its random numbers
+ * from its own generator (see RNG::ThreadLocal) while it solves
+ * tasks. Otherwise, the tasks are solved in order by the
+ * calling thread and the random sequence simply goes on from one task
+ * to the next (as in the sequential algorithm).
+ */
+class LLPSolver {
+public:
+	LLPSolver(const MitsosSIP& sip, const Vector& x_opt, double eps, int llp_boxes, vector<LLPTask>& tasks) :
+		sip(sip), x_opt(x_opt), eps(eps), llp_boxes(llp_boxes), tasks(tasks) {
+		sequential=(sip.nb_threads==1);
+		if (!sequential) RNG::get_state(rng);
+	}
+
+	void run(int nb_threads) {
+		next=0;
+#ifndef _WIN32
+		if (nb_threads>(int) tasks.size()) nb_threads=tasks.size();
+		vector<thread> threads;
+		for (int t=1; t<nb_threads; t++)
+			threads.push_back(thread(&LLPSolver::worker, this));
+		worker();
+		for (unsigned int t=0; t<threads.size(); t++)
+			threads[t].join();
+#else
+		worker();
+#endif
+	}
+
+	void worker() {
+		if (sequential) {
+			solve_tasks();
+		} else {
+			RNG::ThreadLocal local_rng;
+			solve_tasks();
+		}
+	}
+
+	void solve_tasks() {
+		int i;
+		while ((i=next++)<(int) tasks.size())
+			solve(tasks[i]);
+	}
+
+	void solve(LLPTask& t) {
+		if (!sequential) RNG::set_state(rng);
+		t.param_free=false;
+		t.failed=false;
+		try {
+			LLP_Factory lpp_fac(sip,t.c,x_opt);
+
+			System max_sys(lpp_fac);
+
+			// Mitsos algorithm works with absolute precision
+			DefaultOptimizer o(max_sys,0,eps);
+
+			VarSet param_LLP_var(sip.p, lpp_fac.param_LLP_var);
+
+			IntervalVector param_box=param_LLP_var.var_box(sip.param_init_domain);
+
+			if (llp_boxes>1) {
+				// the slice n°k along the largest dimension
+				int i=param_box.extr_diam_index(false);
+				Interval x=param_box[i];
+				double lb=t.k==0? x.lb() : x.lb()+t.k*(x.diam()/llp_boxes);
+				double ub=t.k==llp_boxes-1? x.ub() : x.lb()+(t.k+1)*(x.diam()/llp_boxes);
+				param_box[i]=Interval(lb,ub) & x;
+			}
+
+			Optimizer::Status status=o.optimize(param_box);
+
+			if (status!=Optimizer::SUCCESS) {
+				t.failed=true;
+			} else {
+				// Note: LLP is actually min -g_i(x)
+				t.ub=-o.get_uplo();
+				t.lb=-o.get_loup();
+
+				if (t.lb>0) {
+					Vector y_opt=o.get_loup_point().lb().subvector(0,max_sys.nb_var-1);
+					int j2=0;
+					for (int j=0; j<sip.p; j++) {
+						if (lpp_fac.param_LLP_var[j]) {
+							t.j.push_back(j);
+							t.y.push_back(y_opt[j2++]);
+						}
+					}
+				}
+			}
+
+		} catch(LLP_Factory::ParameterFreeConstraint&) {
+			t.param_free=true;
+		}
+		if (!sequential) RNG::get_state(t.rng);
+	}
+
+	const MitsosSIP& sip;
+	const Vector& x_opt;
+	const double eps;
+	const int llp_boxes;
+	vector<LLPTask>& tasks;
+	uint32_t rng[3];
+	bool sequential;
+#ifndef _WIN32
+	atomic<int> next;
+#else
+	int next;
+#endif
+};
+
+} // end anonymous namespace
+
 MitsosSIP::MitsosSIP(System& sys, const std::vector<const ExprSymbol*>& vars,  const std::vector<const ExprSymbol*>& params, const BitSet& is_param, bool shared_discretization) :
 			SIP(sys, vars, params, is_param), p_domain(p_arg),
-			trace(1), l_max(20), LBD_samples(new vector<double>[p]),
+			trace(1), l_max(20), nb_threads(1), llp_boxes(1), uplo(NEG_INFINITY), loup(POS_INFINITY),
+			nb_iter(0), LBD_samples(new vector<double>[p]),
 			UBD_samples(shared_discretization? LBD_samples : new vector<double>[p]),
 			ORA_samples(shared_discretization? LBD_samples : new vector<double>[p]),
 			shared_discretization(shared_discretization) {
@@ -277,12 +419,18 @@ void MitsosSIP::optimize(double eps_f) {
 	}
 	double time = (clock() - start)/(double) CLOCKS_PER_SEC;
 
-	cout << endl << endl << "f* in [" << f_LBD << "," << f_UBD << "]" << endl;
-	cout << endl << endl << "x*=" << x_opt << endl << endl;
-	cout << endl << endl << iteration << " iterations" << endl;
-	cout << time << "s (real time)" << endl;
-	cout << time/iteration << "s per iteration" << endl;
-	cout << "Last iteration time: " << last_iter_time << endl;
+	uplo = f_LBD;
+	loup = f_UBD;
+	nb_iter = iteration;
+
+	if (trace>=1) {
+		cout << endl << endl << "f* in [" << f_LBD << "," << f_UBD << "]" << endl;
+		cout << endl << endl << "x*=" << x_opt << endl << endl;
+		cout << endl << endl << iteration << " iterations" << endl;
+		cout << time << "s (real time)" << endl;
+		cout << time/iteration << "s per iteration" << endl;
+		cout << "Last iteration time: " << last_iter_time << endl;
+	}
 }
 
 bool MitsosSIP::solve_LBD(double eps, Vector& x_opt, double& uplo, double& loup) {
@@ -336,60 +484,69 @@ bool MitsosSIP::solve(const System& sub_sys, double eps, Vector& x_opt, double&
 
 Interval MitsosSIP::solve_LLP(bool LBD, const Vector& x_opt, double eps) {
 
-	cout << "   LLP: ";
+	if (trace>=1) cout << "   LLP: ";
 
 	double lb=NEG_INFINITY;
 	double ub=NEG_INFINITY;
 
+	int nb_boxes=llp_boxes<1? 1 : llp_boxes;
+
+	vector<LLPTask> tasks(sys.nb_ctr*nb_boxes);
 	for (int c=0; c<sys.nb_ctr; c++) {
-		try {
-			LLP_Factory lpp_fac(*this,c,x_opt);
+		for (int k=0; k<nb_boxes; k++) {
+			tasks[c*nb_boxes+k].c=c;
+			tasks[c*nb_boxes+k].k=k;
+		}
+	}
 
-			System max_sys(lpp_fac);
-            //cout << max_sys << endl;
+	int threads=nb_threads;
+#ifndef _WIN32
+	if (threads<=0) threads=thread::hardware_concurrency();
+#endif
+	if (threads<=0) threads=1;
 
-			// Mitsos algorithm works with absolute precision
-			DefaultOptimizer o(max_sys,0,eps);
+	LLPSolver(*this, x_opt, eps, nb_boxes, tasks).run(threads);
 
-			VarSet param_LLP_var(p, lpp_fac.param_LLP_var);
+	// Merge the results in the order of the tasks
+	for (int c=0; c<sys.nb_ctr; c++) {
 
-			IntervalVector param_box=param_LLP_var.var_box(param_init_domain);
+		LLPTask* best=NULL; // the task with the greatest lower bound
 
-			//cout << "param box=" << param_box << endl;
+		for (int k=0; k<nb_boxes; k++) {
+			LLPTask& t=tasks[c*nb_boxes+k];
 
-			Optimizer::Status status=o.optimize(param_box);
-			//o.report();
+			if (t.param_free) continue;
 
-			if (status!=Optimizer::SUCCESS) {
+			if (t.failed) {
 				ibex_error("LLP failed");
 			}
 
-			// Note: LLP is actually min -g_i(x)
-			if (-o.get_uplo()>ub)
-				ub=-o.get_uplo();
+			if (t.ub>ub)
+				ub=t.ub;
 
-			if (-o.get_loup()>lb)
-				lb=-o.get_loup();
+			if (t.lb>lb)
+				lb=t.lb;
 
-			if (-o.get_loup()<=0) continue; // satisfied constraint
-
-			Vector y_opt=o.get_loup_point().lb().subvector(0,max_sys.nb_var-1);
-			int j2=0;
-			for (int j=0; j<p; j++) {
-				if (lpp_fac.param_LLP_var[j]) {
-					//cout << "param n°" << j << " : add sample value " << y_opt[j2] << endl;
-					if (LBD)
-						LBD_samples[j].push_back(y_opt[j2++]);
-					else
-						UBD_samples[j].push_back(y_opt[j2++]);
-				}
-			}
+			if (!best || t.lb>best->lb)
+				best=&t;
+		}
 
-		} catch(LLP_Factory::ParameterFreeConstraint&) {
+		if (!best || best->lb<=0) continue; // satisfied constraint
 
+		for (unsigned int l=0; l<best->j.size(); l++) {
+			//cout << "param n°" << best->j[l] << " : add sample value " << best->y[l] << endl;
+			if (LBD)
+				LBD_samples[best->j[l]].push_back(best->y[l]);
+			else
+				UBD_samples[best->j[l]].push_back(best->y[l]);
 		}
 	}
 
+	// In parallel, the random generator is left in its state at the end
+	// of the last task, whatever the number of threads
+	if (nb_threads!=1 && !tasks.empty())
+		RNG::set_state(tasks.back().rng);
+
 	if (trace>=1) {
 		if (ub<=0)
 			cout << " SIP-feasible!" << endl;
@@ -55,6 +55,43 @@ public:
 	 */
 	int l_max;
 
+	/**
+	 * \brief Number of threads used to solve the LLP problems.
+	 *
+	 * 0 means the number of hardware threads. Always 1 under Windows.
+	 *
+	 * With 1, the LLP problems are solved in sequence and the random
+	 * sequence goes on from one problem to the next. Otherwise, each
+	 * problem starts from the same random state, so that the result
+	 * does not depend on the number of threads (0 or greater than 1).
+	 *
+	 * By default: 1
+	 */
+	int nb_threads;
+
+	/**
+	 * \brief Number of parameter boxes of a LLP problem.
+	 *
+	 * The parameter domain of each LLP problem is split into llp_boxes
+	 * slices (along its largest dimension) and the maximum is computed
+	 * independently in each slice. These sub-problems are the tasks run by the
+	 * #nb_threads threads. The results are merged in the order of the tasks,
+	 * so that they do not depend on the number of threads.
+	 *
+	 * By default: 1
+	 */
+	int llp_boxes;
+
+	/**
+	 * \brief Enclosure [uplo,loup] of the minimum, found by the last call to #optimize.
+	 */
+	double uplo, loup;
+
+	/**
+	 * \brief Number of iterations of the last call to #optimize.
+	 */
+	int nb_iter;
+
 protected:
 
 	/**
@@ -100,6 +137,9 @@ protected:
 	 *
 	 * with relative precision less or equal to "eps".
 	 *
+	 * The sub-problems (one for each SIC and each of the #llp_boxes
+	 * parameter boxes) are solved on #nb_threads threads.
+	 *
 	 * --> If ub<=0, then x_opt is SIP-feasible.
 	 *
 	 * --> Otherwise, for all SIC n°i such that max_y g_i(x_opt, y)>0
@@ -8,7 +8,7 @@
 // Author      : Gilles Chabert
 // Copyright   : IMT Atlantique (France)
 // License     : See the LICENSE file
-// Last Update : Oct 01, 2017
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #include "ibex.h"
@@ -25,13 +25,14 @@ using namespace ibex;
 
 int main(int argc, char** argv) {
 
-	stringstream _random_seed, _eps_x_min, _eps_x_max;
+	stringstream _random_seed, _eps_x_min, _eps_x_max, _checkpoint_period;
 	_random_seed << "Random seed (useful for reproducibility). Default value is " << DefaultSolver::default_random_seed << ".";
 	_eps_x_min << "Minimal width of output boxes. This is a criterion to _stop_ bisection: a "
 			"non-validated box will not be larger than 'eps-min'. Default value is 1e" << round(::log10(DefaultSolver::default_eps_x_min)) << ".";
 	_eps_x_max << "Maximal width of output boxes. This is a criterion to _force_ bisection: a "
 			"validated box will not be larger than 'eps-max' (unless there is no equality and it is fully inside inequalities)."
 			" Default value is +oo (none)";
+	_checkpoint_period << "CPU time between two checkpoints (time in seconds, see --checkpoint). Default value is " << Solver::default_checkpoint_period << ".";
 
 	args::ArgumentParser parser("********* IbexSolve (defaultsolver) *********.", "Solve a Minibex file.");
 	args::HelpFlag help(parser, "help", "Display this help menu", {'h', "help"});
@@ -39,12 +40,25 @@ int main(int argc, char** argv) {
 	args::ValueFlag<double> eps_x_max(parser, "float", _eps_x_max.str(), {'E', "eps-max"});
 	args::ValueFlag<double> timeout(parser, "float", "Timeout (time in seconds). Default value is +oo (none).", {'t', "timeout"});
 	args::ValueFlag<string> input_file(parser, "filename", "Manifold input file. The file contains a "
-			"(intermediate) description of the manifold with boxes in the MNF (binary) format.", {'i',"input"});
+			"(intermediate) description of the manifold with boxes in the MNF (binary) format. The timeout does not include "
+			"the time of this manifold (see --resume).", {'i',"input"});
 	args::ValueFlag<string> output_file(parser, "filename", "Manifold output file. The file will contain the "
 			"description of the manifold with boxes in the MNF (binary) format.", {'o',"output"});
 	args::Flag format(parser, "format", "Show the output text format", {"format"});
 	args::Flag bfs(parser, "bfs", "Perform breadth-first search (instead of depth-first search, by default)", {"bfs"});
 	args::Flag txt(parser, "txt", "Write the output manifold in a easy-to-parse text file. See --format", {"txt"});
+	args::Flag mapped(parser, "map", "Write the output manifold in the mapped binary format, which can be read in place "
+			"with mmap (see ibex_ManifoldMap.h). The output file must be a regular file. Both formats are accepted for --input.", {"map"});
+	args::Flag stream(parser, "stream", "Write the \"solutions\" (output boxes) in the output file as and when they are found, "
+			"instead of keeping them in memory until the end (the output file can be a pipe). The boxes are not sorted by status and "
+			"the summary at the beginning of the file is only rewritten at the end if the file is not a pipe. --sols has no effect with this option.", {"stream"});
+	args::ValueFlag<string> checkpoint(parser, "filename", "Checkpoint file. The state of the search (the output boxes found so far and the "
+			"pending boxes) is saved periodically in this file in the MNF (binary) format, so that the search can be resumed after an "
+			"interruption (see --resume). Cannot be used with --stream.", {"checkpoint"});
+	args::ValueFlag<double> checkpoint_period(parser, "float", _checkpoint_period.str(), {"checkpoint-period"});
+	args::Flag resume(parser, "resume", "Resume the search from the checkpoint file (see --checkpoint) if it exists, or start a new search otherwise. "
+			"This allows to run the same command again after an interruption. The timeout bounds the total time, including the time "
+			"of the interrupted runs.", {"resume"});
 	args::Flag trace(parser, "trace", "Activate trace. \"Solutions\" (output boxes) are displayed as and when they are found.", {"trace"});
 	args::ValueFlag<string> boundary_test_arg(parser, "true|full-rank|half-ball|false", "Boundary test strength. Possible values are:\n"
 			"\t\t* true:\talways satisfied. Set by default for under constrained problems (0<m<n).\n"
@@ -54,6 +68,8 @@ int main(int argc, char** argv) {
 			{"boundary"});
 	args::Flag sols(parser, "sols", "Display the \"solutions\" (output boxes) on the standard output.", {'s',"sols"});
 	args::ValueFlag<double> random_seed(parser, "float", _random_seed.str(), {"random-seed"});
+	args::ValueFlag<string> trace_record(parser, "filename", "Record the search tree (popped cells and bisection points) in a binary trace file.", {"trace-record"});
+	args::ValueFlag<string> trace_replay(parser, "filename", "Replay the search tree recorded in a trace file (see --trace-record).", {"trace-replay"});
 	args::Flag quiet(parser, "quiet", "Print no report on the standard output.",{'q',"quiet"});
 	args::ValueFlag<string> forced_params(parser, "vars","Force some variables to be parameters in the parametric proofs.",{"forced-params"});
 	args::Positional<std::string> filename(parser, "filename", "The name of the MINIBEX file.");
@@ -90,6 +106,21 @@ int main(int argc, char** argv) {
 		exit(1);
 	}
 
+	if (resume && !checkpoint) {
+		ibex_error("--resume requires a checkpoint file (try ibexsolve --help)");
+		exit(1);
+	}
+
+	if (resume && input_file) {
+		ibex_error("--resume and --input cannot be used together (try ibexsolve --help)");
+		exit(1);
+	}
+
+	if (checkpoint && stream) {
+		ibex_error("--checkpoint and --stream cannot be used together (try ibexsolve --help)");
+		exit(1);
+	}
+
 	try {
 
 		// Load a system of equations
@@ -148,6 +179,22 @@ int main(int argc, char** argv) {
 			cout << "  output file:\t\t" << output_manifold_file << "\n";
 			if (txt)
 				cout << "  output format:\tTXT" << endl;
+			else if (mapped)
+				cout << "  output format:\tMAP" << endl;
+			if (stream)
+				cout << "  stream:\t\tON" << endl;
+		}
+
+		// These options record/replay the search tree
+		SearchTrace search_trace;
+		if (trace_record) {
+			if (!quiet)
+				cout << "  trace record:\t\t" << trace_record.Get() << endl;
+			search_trace.record(trace_record.Get().c_str());
+		} else if (trace_replay) {
+			if (!quiet)
+				cout << "  trace replay:\t\t" << trace_replay.Get() << endl;
+			search_trace.replay(trace_replay.Get().c_str());
 		}
 
 		// Build the default solver
@@ -155,7 +202,8 @@ int main(int argc, char** argv) {
 				eps_x_min ? eps_x_min.Get() : DefaultSolver::default_eps_x_min,
 				eps_x_max ? eps_x_max.Get() : DefaultSolver::default_eps_x_max,
 				!bfs,
-				random_seed? random_seed.Get() : DefaultSolver::default_random_seed);
+				random_seed? random_seed.Get() : DefaultSolver::default_random_seed,
+				trace_record || trace_replay ? &search_trace : NULL);
 
 		if (boundary_test_arg) {
 
@@ -210,6 +258,27 @@ int main(int argc, char** argv) {
 			s.time_limit=timeout.Get();
 		}
 
+		// These options save the state of the search periodically
+		bool resumed=false;
+		if (checkpoint) {
+			s.checkpoint_file=checkpoint.Get();
+			if (checkpoint_period)
+				s.checkpoint_period=checkpoint_period.Get();
+
+			if (resume) {
+				ifstream file;
+				file.open(checkpoint.Get().c_str(), ios::in); // to check if it exists
+				resumed=file.is_open();
+				file.close();
+			}
+
+			if (!quiet) {
+				cout << "  checkpoint:\t\t" << checkpoint.Get() << " (every " << s.checkpoint_period << "s)" << endl;
+				if (resumed)
+					cout << "  resume:\t\tON" << endl;
+			}
+		}
+
 		// This option prints each better feasible point when it is found
 		if (trace) {
 			if (!quiet)
@@ -217,6 +286,16 @@ int main(int argc, char** argv) {
 			s.trace=trace.Get();
 		}
 
+		// This option writes the output boxes as and when they are found
+		ManifoldStream manif_stream(output_manifold_file.c_str(), txt);
+		ManifoldMapWriter map_stream(output_manifold_file.c_str());
+		if (stream) {
+			if (mapped)
+				s.set_output_sink(&map_stream);
+			else
+				s.set_output_sink(&manif_stream);
+		}
+
 		if (!quiet) {
 			cout << "*****************************************************************" << endl << endl;
 		}
@@ -225,7 +304,9 @@ int main(int argc, char** argv) {
 			cout << "running............" << endl << endl;
 
 		// Get the solutions
-		if (input_file)
+		if (resumed)
+			s.solve(checkpoint.Get().c_str(), true);
+		else if (input_file)
 			s.solve(input_file.Get().c_str());
 		else
 			s.solve(sys.box);
@@ -234,12 +315,19 @@ int main(int argc, char** argv) {
 
 		if (!quiet) s.report();
 
-		if (sols) cout << s.get_manifold() << endl;
+		if (trace_replay && !quiet && search_trace.nb_mismatches>0)
+			cout << " " << search_trace.nb_mismatches << " trace events could not be replayed" << endl;
 
-		if (txt)
-			s.get_manifold().write_txt(output_manifold_file.c_str());
-		else
-			s.get_manifold().write(output_manifold_file.c_str());
+		if (sols && !stream) cout << s.get_manifold() << endl;
+
+		if (!stream) { // otherwise: already written
+			if (txt)
+				s.get_manifold().write_txt(output_manifold_file.c_str());
+			else if (mapped)
+				s.get_manifold().write_map(output_manifold_file.c_str());
+			else
+				s.get_manifold().write(output_manifold_file.c_str());
+		}
 
 		if (!quiet) {
 			cout << " results written in " << output_manifold_file << "\n";
@@ -5,7 +5,7 @@
 // Copyright   : Ecole des Mines de Nantes (France)
 // License     : See the LICENSE file
 // Created     : Aug 27, 2012
-// Last Update : Nov 21, 2017
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #include "ibex_DefaultSolver.h"
@@ -23,6 +23,8 @@
 #include "ibex_Array.h"
 #include "ibex_Random.h"
 #include "ibex_NormalizedSystem.h"
+#include "ibex_BscTrace.h"
+#include "ibex_CellBufferTrace.h"
 
 using namespace std;
 
@@ -57,6 +59,24 @@ System* get_square_eq_sys(Memory& memory, System& sys) {
 	}
 }
 
+// The bisector and the buffer are only wrapped if the search is traced
+// (the wrappers add an indirection to each operation).
+
+Bsc& get_bsc(Memory& memory, Bsc& bsc, SearchTrace* search_trace) {
+	if (search_trace)
+		return memory.rec(new BscTrace(bsc, *search_trace));
+	else
+		return bsc;
+}
+
+CellBuffer& get_buffer(Memory& memory, bool dfs, SearchTrace* search_trace) {
+	CellBuffer& buffer=memory.rec(dfs? (CellBuffer*) new CellStack() : (CellBuffer*) new CellList());
+	if (search_trace)
+		return memory.rec(new CellBufferTrace(buffer, *search_trace));
+	else
+		return buffer;
+}
+
 } // end namespace
 
 // the corners for  Xnewton
@@ -95,11 +115,11 @@ Ctc* DefaultSolver::ctc (System& sys, double prec) {
 }
 
 DefaultSolver::DefaultSolver(System& sys, double eps_x_min, double eps_x_max,
-		bool dfs, double random_seed) : Solver(sys, rec(ctc(sys,eps_x_min)),
-		get_square_eq_sys(*this, sys)!=NULL?
+		bool dfs, double random_seed, SearchTrace* search_trace) : Solver(sys, rec(ctc(sys,eps_x_min)),
+		get_bsc(*this, get_square_eq_sys(*this, sys)!=NULL?
 				(Bsc&) rec(new SmearSumRelative(*get_square_eq_sys(*this, sys), eps_x_min)) :
-				(Bsc&) rec(new RoundRobin(eps_x_min)),
-				rec(dfs? (CellBuffer*) new CellStack() : (CellBuffer*) new CellList()),
+				(Bsc&) rec(new RoundRobin(eps_x_min)), search_trace),
+				get_buffer(*this, dfs, search_trace),
 				Vector(sys.nb_var,eps_x_min), Vector(sys.nb_var,eps_x_max)),
 		sys(sys) {
 
@@ -109,11 +129,11 @@ DefaultSolver::DefaultSolver(System& sys, double eps_x_min, double eps_x_max,
 
 // Note: we set the precision for Newton to the minimum of the precisions.
 DefaultSolver::DefaultSolver(System& sys, const Vector& eps_x_min, double eps_x_max,
-		bool dfs, double random_seed) : Solver(sys, rec(ctc(sys,eps_x_min.min())),
-		get_square_eq_sys(*this, sys)!=NULL?
+		bool dfs, double random_seed, SearchTrace* search_trace) : Solver(sys, rec(ctc(sys,eps_x_min.min())),
+		get_bsc(*this, get_square_eq_sys(*this, sys)!=NULL?
 				(Bsc&) rec(new SmearSumRelative(*get_square_eq_sys(*this, sys), eps_x_min)) :
-				(Bsc&) rec(new RoundRobin(eps_x_min)),
-		rec(dfs? (CellBuffer*) new CellStack() : (CellBuffer*) new CellList()),
+				(Bsc&) rec(new RoundRobin(eps_x_min)), search_trace),
+		get_buffer(*this, dfs, search_trace),
 		eps_x_min, Vector(sys.nb_var,eps_x_max)),
 		sys(sys) {
 
@@ -5,7 +5,7 @@
 // Copyright   : IMT Atlantique (France)
 // License     : See the LICENSE file
 // Created     : Sep 27, 2012
-// Last Update : Jul 06, 2014
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #ifndef __IBEX_DEFAULT_SOLVER_H__
@@ -16,6 +16,7 @@
 #include "ibex_CellBuffer.h"
 #include "ibex_CtcCompo.h"
 #include "ibex_Memory.h"
+#include "ibex_SearchTrace.h"
 
 namespace ibex {
 
@@ -33,8 +34,14 @@ public:
 	 * \param eps_x_min - Criterion for stopping bisection (absolute precision)
 	 * \param eps_x_max - Criterion for forcing bisection  (absolute precision)
 	 * \param dfs       - true: depth-first search. false: breadth-first search
+	 * \param search_trace - If not NULL, the search tree is recorded in or replayed
+	 *                  from this trace, depending on its mode (see #SearchTrace).
+	 *                  The bisector and the cell buffer are only wrapped (see
+	 *                  #BscTrace and #CellBufferTrace) in this case. The trace
+	 *                  is not deleted by the solver. By default: NULL.
 	 */
-    DefaultSolver(System& sys, double eps_x_min=default_eps_x_min, double eps_x_max=default_eps_x_max, bool dfs=true, double random_seed=default_random_seed);
+    DefaultSolver(System& sys, double eps_x_min=default_eps_x_min, double eps_x_max=default_eps_x_max, bool dfs=true, double random_seed=default_random_seed,
+    		SearchTrace* search_trace=NULL);
 
     /**
 	 * \brief Create a default solver.
@@ -44,8 +51,10 @@ public:
 	 *                    precisions, one for each variable)
 	 * \param eps_x_max - Criterion for forcing bisection  (absolute precision)
 	 * \param dfs       - true: depth-first search. false: breadth-first search
+	 * \param search_trace - See above.
 	 */
-    DefaultSolver(System& sys, const Vector& eps_x_min, double eps_x_max=default_eps_x_max, bool dfs=true, double random_seed=default_random_seed);
+    DefaultSolver(System& sys, const Vector& eps_x_min, double eps_x_max=default_eps_x_max, bool dfs=true, double random_seed=default_random_seed,
+    		SearchTrace* search_trace=NULL);
 
 	/**
 	 * \brief Default minimal width: 1e-6.
@@ -5,10 +5,11 @@
 // Copyright   : IMT Atlantique (France)
 // License     : See the LICENSE file
 // Created     : Oct 01, 2017
-// Last update : Oct 12, 2017
+// Last update : Oct 19, 2026
 //============================================================================
 
 #include "ibex_Manifold.h"
+#include "ibex_ManifoldMap.h"
 
 #include <cassert>
 #include <fstream>
@@ -145,6 +146,11 @@ void Manifold::write_output_box(ofstream& f, const SolverOutputBox& sol) const {
 }
 
 void Manifold::load(const char* filename) {
+	if (ManifoldMap::is_map(filename)) {
+		ManifoldMap(filename).load(*this);
+		return;
+	}
+
 	ifstream f;
 
 	f.open(filename, ios::in | ios::binary);
@@ -218,6 +224,26 @@ void Manifold::write(const char* filename) const {
 	f.close();
 }
 
+void Manifold::write_map(const char* filename) const {
+	ManifoldMapWriter w(filename);
+
+	w.start(*this);
+
+	for (vector<SolverOutputBox>::const_iterator it=inner.begin(); it!=inner.end(); it++)
+		w.add(*it);
+
+	for (vector<SolverOutputBox>::const_iterator it=boundary.begin(); it!=boundary.end(); it++)
+		w.add(*it);
+
+	for (vector<SolverOutputBox>::const_iterator it=unknown.begin(); it!=unknown.end(); it++)
+		w.add(*it);
+
+	for (vector<SolverOutputBox>::const_iterator it=pending.begin(); it!=pending.end(); it++)
+		w.add(*it);
+
+	w.end(*this);
+}
+
 string Manifold::format() {
 	return
 	"\n"
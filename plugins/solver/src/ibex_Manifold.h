@@ -39,6 +39,9 @@ public:
 
 	/**
 	 * \brief Load a manifold from a file.
+	 *
+	 * The file is either in the manifold (binary) format or in
+	 * the mapped format (see #ManifoldMap).
 	 */
 	void load(const char* filename);
 
@@ -54,6 +57,13 @@ public:
 	 */
 	void write_txt(const char* filename) const;
 
+	/**
+	 * \brief Write the manifold into a file (in the mapped format)
+	 *
+	 * See #ManifoldMap.
+	 */
+	void write_map(const char* filename) const;
+
 	/**
 	 * \brief Clear all.
 	 */
@@ -129,6 +139,7 @@ public:
 	static const int FORMAT_VERSION;
 
 protected:
+	friend class ManifoldStream;
 
 	static const int  SIGNATURE_LENGTH;
 	static const char* SIGNATURE;
@@ -0,0 +1,346 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_ManifoldMap.cpp
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#include "ibex_ManifoldMap.h"
+#include "ibex_Manifold.h"
+
+#include <cassert>
+#include <cstring>
+#include <algorithm>
+
+#ifndef _WIN32 // MinGW does not support mmap
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <fcntl.h>
+#include <unistd.h>
+#endif
+
+using namespace std;
+
+namespace ibex {
+
+namespace {
+
+/* The header of the file (see ManifoldMap). */
+struct Header {
+	char signature[20];
+	uint32_t version;
+	uint32_t n, m, nb_ineq;
+	uint32_t status;
+	uint32_t nb_params;
+	uint32_t chunk_size;
+	uint32_t padding;
+	uint64_t nb_boxes;
+	double time;
+	uint64_t nb_cells;
+	char reserved[48];
+};
+
+static_assert(sizeof(Header)==128, "unexpected size of the manifold map header");
+
+size_t align8(size_t x) {
+	return (x+7) & ~((size_t) 7);
+}
+
+}
+
+const char* ManifoldMap::SIGNATURE = "IBEX MANIFOLD MAP  ";
+const int ManifoldMap::FORMAT_VERSION = 1;
+const int ManifoldMap::DEFAULT_CHUNK_SIZE = 1024;
+
+void ManifoldMap::chunk_layout(unsigned int n, unsigned int nb_params, unsigned int chunk_size,
+		size_t& status_offset, size_t& params_offset, size_t& chunk_bytes) {
+	status_offset = ((size_t) chunk_size)*2*n*sizeof(double);
+	params_offset = align8(status_offset + chunk_size*sizeof(uint8_t));
+	chunk_bytes   = align8(params_offset + ((size_t) chunk_size)*nb_params*sizeof(uint32_t));
+}
+
+bool ManifoldMap::is_map(const char* filename) {
+	ifstream f(filename, ios::in | ios::binary);
+	char sig[20];
+	f.read(sig, 20);
+	return !f.fail() && memcmp(sig, SIGNATURE, 20)==0;
+}
+
+ManifoldMap::ManifoldMap(const char* filename) : data(NULL), data_size(0) {
+#ifndef _WIN32
+	int fd=open(filename, O_RDONLY);
+	if (fd==-1) ibex_error("[manifold]: cannot open input file.\n");
+
+	// the file descriptor is closed before any error
+	struct stat st;
+	if (fstat(fd, &st)==-1) {
+		close(fd);
+		ibex_error("[manifold]: cannot open input file.\n");
+	}
+	data_size=st.st_size;
+
+	if (data_size<sizeof(Header)) {
+		close(fd);
+		ibex_error("[manifold]: not a \"manifold map\" file.");
+	}
+
+	void* p=mmap(NULL, data_size, PROT_READ, MAP_SHARED, fd, 0);
+	close(fd);
+	if (p==MAP_FAILED) ibex_error("[manifold]: cannot map input file.\n");
+	data=(const char*) p;
+#else
+	// no mapping: the file is read in memory
+	ifstream f(filename, ios::in | ios::binary);
+	if (f.fail()) ibex_error("[manifold]: cannot open input file.\n");
+	f.seekg(0, ios::end);
+	data_size=f.tellg();
+	f.seekg(0, ios::beg);
+
+	if (data_size<sizeof(Header)) ibex_error("[manifold]: not a \"manifold map\" file.");
+
+	char* buf=new char[data_size];
+	f.read(buf, data_size);
+	data=buf;
+#endif
+
+	const Header& h=*(const Header*) data;
+
+	if (memcmp(h.signature, SIGNATURE, 20)!=0)
+		ibex_error("[manifold]: not a \"manifold map\" file.");
+	if (h.version!=(uint32_t) FORMAT_VERSION)
+		ibex_error("[manifold]: wrong format version");
+	if (h.status>Solver::CELL_OVERFLOW || h.chunk_size==0)
+		ibex_error("[manifold]: bad input file (bad header).");
+
+	n=h.n;
+	m=h.m;
+	nb_ineq=h.nb_ineq;
+	nb_params=h.nb_params;
+	status=(Solver::Status) h.status;
+	time=h.time;
+	nb_cells=h.nb_cells;
+	nb_boxes=h.nb_boxes;
+	chunk_size=h.chunk_size;
+
+	if (nb_params!=(m>0 && m<n ? n-m : 0))
+		ibex_error("[manifold]: bad input file (bad number of parameters)");
+
+	// The header is checked against the file size before computing the
+	// layout of the chunks, so that no product can overflow: a chunk
+	// takes at least chunk_size*box_bytes bytes.
+	size_t box_bytes=2*((size_t) n)*sizeof(double) + sizeof(uint8_t) + ((size_t) nb_params)*sizeof(uint32_t);
+	size_t body_size=data_size-sizeof(Header);
+	if (nb_boxes>0 && box_bytes>body_size/chunk_size)
+		ibex_error("[manifold]: unexpected end of file.");
+
+	chunk_layout(n, nb_params, chunk_size, status_offset, params_offset, chunk_bytes);
+
+	size_t nb_chunks=nb_boxes/chunk_size + (nb_boxes%chunk_size>0 ? 1 : 0);
+	if (nb_chunks>0 && nb_chunks>body_size/chunk_bytes)
+		ibex_error("[manifold]: unexpected end of file.");
+}
+
+ManifoldMap::~ManifoldMap() {
+#ifndef _WIN32
+	munmap((void*) data, data_size);
+#else
+	delete[] data;
+#endif
+}
+
+IntervalVector ManifoldMap::box(size_t i) const {
+	IntervalVector box(n);
+	const double* b=bounds(i);
+	for (unsigned int j=0; j<n; j++)
+		box[j]=Interval(b[2*j],b[2*j+1]);
+	return box;
+}
+
+void ManifoldMap::load(Manifold& manif) const {
+
+	if (n!=manif.n) ibex_error("[manifold]: bad input file (number of variables does not match).");
+
+	if (m!=manif.m) ibex_error("[manifold]: bad input file (number of equalities does not match).");
+
+	if (nb_ineq!=manif.nb_ineq) ibex_error("[manifold]: bad input file (number of inequalities does not match).");
+
+	for (size_t i=0; i<nb_boxes; i++) {
+		SolverOutputBox sol(n);
+
+		int _status=box_status(i);
+		if (_status<0 || _status>=4) {
+			ibex_error("[manifold]: bad input file (bad status code).");
+		}
+		(SolverOutputBox::sol_status&) sol.status = (SolverOutputBox::sol_status) _status;
+
+		sol._existence = box(i);
+
+		if (nb_params>0) {
+			const uint32_t* p=params(i);
+			BitSet _params(n);
+			for (unsigned int j=0; j<nb_params; j++) {
+				if (p[j]>n) {
+					ibex_error("[manifold]: bad input file (bad parameter index)");
+				}
+				if (p[j]!=0) _params.add(p[j]-1); // index starting from 1 in the raw format
+			}
+			if (!_params.empty()) {
+				if (_params.size()!=(int) nb_params)
+					ibex_error("[manifold]: bad input file (bad number of parameters)");
+				else
+					sol.varset = new VarSet(n,_params,false);
+			}
+		}
+
+		switch(sol.status) {
+		case SolverOutputBox::INNER:    manif.inner.push_back(sol); break;
+		case SolverOutputBox::BOUNDARY: manif.boundary.push_back(sol); break;
+		case SolverOutputBox::UNKNOWN:  manif.unknown.push_back(sol); break;
+		case SolverOutputBox::PENDING:  manif.pending.push_back(sol); break;
+		}
+	}
+
+	manif.status = status;
+	manif.time = time;
+	manif.nb_cells = nb_cells;
+}
+
+ManifoldMapWriter::ManifoldMapWriter(const char* filename, bool append, int chunk_size) :
+		filename(filename), append(append), n(0), m(0), nb_ineq(0), nb_params(0),
+		status(Solver::INFEASIBLE), time(0), nb_cells(0), chunk_size(chunk_size),
+		status_offset(0), params_offset(0), chunk_bytes(0), nb_boxes(0) {
+	assert(chunk_size>0);
+}
+
+ManifoldMapWriter::~ManifoldMapWriter() {
+	if (f.is_open()) {
+		flush();
+		f.close();
+	}
+}
+
+void ManifoldMapWriter::start(const Manifold& manif) {
+	if (f.is_open()) f.close();
+
+	n=manif.n;
+	m=manif.m;
+	nb_ineq=manif.nb_ineq;
+	nb_params=(m>0 && m<n) ? n-m : 0;
+	status=manif.status;
+	time=manif.time;
+	nb_cells=manif.nb_cells;
+	nb_boxes=0;
+
+	if (append) f.open(filename.c_str(), ios::in | ios::out | ios::binary);
+
+	if (append && f.is_open()) {
+		Header h;
+		f.read((char*) &h, sizeof(Header));
+		if (f.fail() || memcmp(h.signature, ManifoldMap::SIGNATURE, 20)!=0)
+			ibex_error("[manifold]: not a \"manifold map\" file.");
+		if (h.version!=(uint32_t) ManifoldMap::FORMAT_VERSION)
+			ibex_error("[manifold]: wrong format version");
+		if (h.n!=n) ibex_error("[manifold]: bad input file (number of variables does not match).");
+		if (h.m!=m) ibex_error("[manifold]: bad input file (number of equalities does not match).");
+		if (h.nb_ineq!=nb_ineq) ibex_error("[manifold]: bad input file (number of inequalities does not match).");
+
+		chunk_size=h.chunk_size;
+		nb_boxes=h.nb_boxes;
+		status=h.status;
+		time=h.time;
+		nb_cells=h.nb_cells;
+	} else {
+		f.open(filename.c_str(), ios::in | ios::out | ios::binary | ios::trunc);
+		if (f.fail())
+			ibex_error("[manifold]: cannot create output file.\n");
+	}
+
+	ManifoldMap::chunk_layout(n, nb_params, chunk_size, status_offset, params_offset, chunk_bytes);
+	chunk.assign(chunk_bytes, 0);
+
+	// the last chunk of an existing file is completed
+	if (nb_boxes%chunk_size!=0) {
+		f.seekg(sizeof(Header)+(nb_boxes/chunk_size)*chunk_bytes);
+		f.read(&chunk[0], chunk_bytes);
+		if (f.fail()) ibex_error("[manifold]: unexpected end of file.");
+	}
+
+	write_header();
+	f.flush();
+}
+
+void ManifoldMapWriter::add(const SolverOutputBox& sol) {
+	assert(f.is_open());
+	assert(sol.varset==NULL || sol.varset->nb_param==(int) nb_params);
+
+	size_t k=nb_boxes%chunk_size;
+
+	double* b=((double*) &chunk[0]) + k*2*n;
+	const IntervalVector& box=sol.existence();
+	for (unsigned int j=0; j<n; j++) {
+		b[2*j]=box[j].lb();
+		b[2*j+1]=box[j].ub();
+	}
+
+	chunk[status_offset+k]=(char) sol.status;
+
+	if (nb_params>0) {
+		uint32_t* p=((uint32_t*) &chunk[params_offset]) + k*nb_params;
+		for (unsigned int i=0; i<nb_params; i++)
+			p[i]=sol.varset!=NULL ? sol.varset->param(i)+1 : 0;
+	}
+
+	nb_boxes++;
+
+	if (nb_boxes%chunk_size==0) {
+		f.seekp(sizeof(Header)+((nb_boxes-1)/chunk_size)*chunk_bytes);
+		f.write(&chunk[0], chunk_bytes);
+		write_header();
+		fill(chunk.begin(), chunk.end(), 0);
+	}
+}
+
+void ManifoldMapWriter::end(const Manifold& manif) {
+	status=manif.status;
+	time=manif.time;
+	nb_cells=manif.nb_cells;
+	flush();
+	f.close();
+}
+
+void ManifoldMapWriter::flush() {
+	assert(f.is_open());
+
+	if (nb_boxes%chunk_size!=0) {
+		f.seekp(sizeof(Header)+(nb_boxes/chunk_size)*chunk_bytes);
+		f.write(&chunk[0], chunk_bytes);
+	}
+	write_header();
+	f.flush();
+}
+
+void ManifoldMapWriter::write_header() {
+	Header h;
+	memset(&h, 0, sizeof(Header));
+	memcpy(h.signature, ManifoldMap::SIGNATURE, 20);
+	h.version=ManifoldMap::FORMAT_VERSION;
+	h.n=n;
+	h.m=m;
+	h.nb_ineq=nb_ineq;
+	h.status=status;
+	h.nb_params=nb_params;
+	h.chunk_size=chunk_size;
+	h.nb_boxes=nb_boxes;
+	h.time=time;
+	h.nb_cells=nb_cells;
+
+	// the boxes are written before the header, so that
+	// the header never counts boxes not yet written
+	f.seekp(0);
+	f.write((const char*) &h, sizeof(Header));
+	if (f.fail()) ibex_error("[manifold]: cannot write output file.\n");
+}
+
+} // end namespace ibex
@@ -0,0 +1,275 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_ManifoldMap.h
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#ifndef __IBEX_MANIFOLD_MAP_H__
+#define __IBEX_MANIFOLD_MAP_H__
+
+#include "ibex_SolverOutputSink.h"
+#include "ibex_Solver.h"
+
+#include <fstream>
+#include <string>
+#include <vector>
+#include <stdint.h>
+
+namespace ibex {
+
+class Manifold;
+
+/**
+ * \ingroup strategy
+ *
+ * \brief Manifold file that can be mapped in memory (read-only).
+ *
+ * Contrary to the manifold format (see #Manifold::format()), the boxes of
+ * this format can be read in place (without parsing nor copy) once the file
+ * is mapped in memory, and boxes can be appended to an existing file (see
+ * #ManifoldMapWriter).
+ *
+ * All values are in the native byte order. The file contains a header of
+ * 128 bytes:
+ *   - the null-terminated signature "IBEX MANIFOLD MAP  " (20 characters)
+ *   - uint32: the format version (#FORMAT_VERSION), n, m, the number of
+ *     inequalities, the status of the search, the number p of parameter
+ *     indices of a box (n-m if 0<m<n, 0 otherwise), the number B of boxes
+ *     in a chunk and 0 (padding)
+ *   - uint64: the number of boxes, double: the time, uint64: the number of cells
+ *   - 48 null bytes (reserved)
+ *
+ * followed by chunks of B boxes (the last chunk may be partially filled). A chunk
+ * contains three arrays (each one starting at an offset multiple of 8):
+ *   - B*2n doubles: lb(x1), ub(x1), ..., lb(xn), ub(xn) for each box,
+ *   - B uint8: the status of each box (same values as #SolverOutputBox::sol_status),
+ *   - B*p uint32: the indices (starting from 1, or 0 if no proof was achieved)
+ *     of the parameters of each box (see #Manifold::format()).
+ *
+ * The boxes are in the order they were written (not sorted by status).
+ */
+class ManifoldMap {
+public:
+	/**
+	 * \brief Map a file in memory (read-only).
+	 */
+	explicit ManifoldMap(const char* filename);
+
+	/**
+	 * \brief Unmap the file.
+	 */
+	~ManifoldMap();
+
+	/**
+	 * \brief True if the file is a mapped manifold file.
+	 */
+	static bool is_map(const char* filename);
+
+	/**
+	 * \brief Number of boxes.
+	 */
+	size_t size() const;
+
+	/**
+	 * \brief Bounds of the ith box: lb(x1), ub(x1), ..., lb(xn), ub(xn).
+	 *
+	 * The pointer is valid until this object is deleted.
+	 */
+	const double* bounds(size_t i) const;
+
+	/**
+	 * \brief Status of the ith box.
+	 */
+	SolverOutputBox::sol_status box_status(size_t i) const;
+
+	/**
+	 * \brief Indices of the parameters of the ith box (NULL if p=0).
+	 *
+	 * See #Manifold::format().
+	 */
+	const uint32_t* params(size_t i) const;
+
+	/**
+	 * \brief The ith box (copy).
+	 */
+	IntervalVector box(size_t i) const;
+
+	/**
+	 * \brief Add the boxes to a manifold (conversion).
+	 *
+	 * The status, the time and the number of cells of the manifold
+	 * are also set.
+	 */
+	void load(Manifold& manif) const;
+
+	/**
+	 * \brief Number of variables
+	 */
+	unsigned int n;
+
+	/**
+	 * \brief Number of equalities.
+	 */
+	unsigned int m;
+
+	/**
+	 * \brief Number of inequalities.
+	 */
+	unsigned int nb_ineq;
+
+	/**
+	 * \brief Number of parameter indices of a box.
+	 */
+	unsigned int nb_params;
+
+	/**
+	 * \brief Return status of the solving.
+	 */
+	Solver::Status status;
+
+	/**
+	 * \brief CPU running time used to obtain this manifold.
+	 */
+	double time;
+
+	/**
+	 * \brief Number of cells used to obtain this manifold.
+	 */
+	unsigned long nb_cells;
+
+	/**
+	 * \brief Format version.
+	 */
+	static const int FORMAT_VERSION;
+
+	/**
+	 * \brief Default number of boxes in a chunk.
+	 */
+	static const int DEFAULT_CHUNK_SIZE;
+
+protected:
+	friend class ManifoldMapWriter;
+
+	static const char* SIGNATURE;
+
+	/* Offsets of the arrays in a chunk and size of a chunk */
+	static void chunk_layout(unsigned int n, unsigned int nb_params, unsigned int chunk_size,
+			size_t& status_offset, size_t& params_offset, size_t& chunk_bytes);
+
+	/* Address of the chunk of the ith box */
+	const char* chunk(size_t i) const;
+
+	const char* data;
+	size_t data_size;
+	size_t nb_boxes;
+	unsigned int chunk_size;
+	size_t status_offset, params_offset, chunk_bytes;
+};
+
+/**
+ * \ingroup strategy
+ *
+ * \brief Write the output boxes of a solver in a mapped manifold file (see #ManifoldMap).
+ *
+ * The boxes are written chunk by chunk, as and when they are found. The header
+ * (number of boxes and summary) is updated each time a chunk is written, so that
+ * the file can be read while the search is running.
+ *
+ * In append mode, the boxes are added to the existing file (if any).
+ */
+class ManifoldMapWriter : public SolverOutputSink {
+public:
+	/**
+	 * \brief Create a writer.
+	 *
+	 * \param filename   - the output file (opened when the search starts)
+	 * \param append     - keep the boxes of an existing file
+	 * \param chunk_size - number of boxes in a chunk (for a new file)
+	 */
+	ManifoldMapWriter(const char* filename, bool append=false, int chunk_size=ManifoldMap::DEFAULT_CHUNK_SIZE);
+
+	/**
+	 * \brief Delete this (flush and close the file).
+	 */
+	~ManifoldMapWriter();
+
+	/**
+	 * \brief Open the file and write the header.
+	 *
+	 * The boxes of the manifold are not written.
+	 */
+	void start(const Manifold& manif);
+
+	/**
+	 * \brief Write an output box.
+	 */
+	void add(const SolverOutputBox& sol);
+
+	/**
+	 * \brief Write the summary of the manifold and close the file.
+	 */
+	void end(const Manifold& manif);
+
+	/**
+	 * \brief Write the current chunk and the header.
+	 */
+	void flush();
+
+	/**
+	 * \brief Output file name.
+	 */
+	const std::string filename;
+
+	/**
+	 * \brief Append mode.
+	 */
+	const bool append;
+
+protected:
+	void write_header();
+
+	std::fstream f;
+
+	unsigned int n, m, nb_ineq, nb_params;
+	int status;
+	double time;
+	uint64_t nb_cells;
+
+	unsigned int chunk_size;
+	size_t status_offset, params_offset, chunk_bytes;
+
+	/* Number of boxes in the file, including the current chunk */
+	uint64_t nb_boxes;
+
+	/* Current (last) chunk */
+	std::vector<char> chunk;
+};
+
+/*============================================ inline implementation ============================================ */
+
+inline size_t ManifoldMap::size() const {
+	return nb_boxes;
+}
+
+inline const char* ManifoldMap::chunk(size_t i) const {
+	return data + 128 + (i/chunk_size)*chunk_bytes;
+}
+
+inline const double* ManifoldMap::bounds(size_t i) const {
+	return ((const double*) chunk(i)) + (i%chunk_size)*2*n;
+}
+
+inline SolverOutputBox::sol_status ManifoldMap::box_status(size_t i) const {
+	return (SolverOutputBox::sol_status) ((const uint8_t*) (chunk(i) + status_offset))[i%chunk_size];
+}
+
+inline const uint32_t* ManifoldMap::params(size_t i) const {
+	return nb_params==0? NULL : ((const uint32_t*) (chunk(i) + params_offset)) + (i%chunk_size)*nb_params;
+}
+
+} // end namespace ibex
+
+#endif // __IBEX_MANIFOLD_MAP_H__
@@ -0,0 +1,101 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_ManifoldStream.cpp
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#include "ibex_ManifoldStream.h"
+#include "ibex_Manifold.h"
+
+#include <cassert>
+#include <iomanip>
+
+using namespace std;
+
+namespace ibex {
+
+ManifoldStream::ManifoldStream(const char* filename, bool txt) : filename(filename), txt(txt),
+		header(NULL), summary_pos(-1) {
+	for (int i=0; i<4; i++) nb_boxes[i]=0;
+}
+
+ManifoldStream::~ManifoldStream() {
+	if (f.is_open()) f.close();
+	if (header) delete header;
+}
+
+void ManifoldStream::start(const Manifold& manif) {
+	if (f.is_open()) f.close();
+	if (header) delete header;
+
+	header = new Manifold(manif.n, manif.m, manif.nb_ineq);
+	for (int i=0; i<4; i++) nb_boxes[i]=0;
+
+	f.open(filename.c_str(), txt ? ios::out : ios::out | ios::binary);
+
+	if (f.fail())
+		ibex_error("[manifold]: cannot create output file.\n");
+
+	if (txt) {
+		char s=' ';
+		f << Manifold::SIGNATURE << s << Manifold::FORMAT_VERSION << '\n';
+		f << manif.n << s << manif.m << s << manif.nb_ineq << '\n';
+	} else {
+		header->write_signature(f);
+		header->write_int(f,manif.n);
+		header->write_int(f,manif.m);
+		header->write_int(f,manif.nb_ineq);
+	}
+
+	// tellp() fails on a pipe
+	summary_pos = f.tellp();
+	if (summary_pos==streampos(-1)) f.clear();
+
+	write_summary(*header);
+	f.flush();
+}
+
+void ManifoldStream::add(const SolverOutputBox& sol) {
+	assert(header!=NULL);
+
+	if (txt)
+		header->write_output_box_txt(f,sol);
+	else
+		header->write_output_box(f,sol);
+
+	nb_boxes[sol.status]++;
+	f.flush();
+}
+
+void ManifoldStream::end(const Manifold& manif) {
+	assert(header!=NULL);
+
+	if (summary_pos!=streampos(-1)) {
+		f.seekp(summary_pos);
+		write_summary(manif);
+	}
+
+	f.close();
+}
+
+void ManifoldStream::write_summary(const Manifold& manif) {
+	if (txt) {
+		// fixed widths, so that the summary can be rewritten
+		char s=' ';
+		f << left << setw(10) << manif.status << '\n';
+		for (int i=0; i<4; i++)
+			f << left << setw(10) << nb_boxes[i] << (i<3 ? s : '\n');
+		f << left << setw(12) << manif.time << s << setw(10) << manif.nb_cells << '\n';
+	} else {
+		header->write_int(f,manif.status);
+		for (int i=0; i<4; i++)
+			header->write_int(f,nb_boxes[i]);
+		header->write_double(f,manif.time);
+		header->write_int(f,manif.nb_cells);
+	}
+}
+
+} // end namespace ibex
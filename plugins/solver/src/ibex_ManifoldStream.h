@@ -0,0 +1,103 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_ManifoldStream.h
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#ifndef __IBEX_MANIFOLD_STREAM_H__
+#define __IBEX_MANIFOLD_STREAM_H__
+
+#include "ibex_SolverOutputSink.h"
+
+#include <fstream>
+#include <string>
+
+namespace ibex {
+
+/**
+ * \ingroup strategy
+ *
+ * \brief Write the output boxes of a solver in a manifold file, as they are found.
+ *
+ * The file has the same format as a manifold written by #Manifold::write()
+ * (or #Manifold::write_txt() in text mode), except that the boxes appear in
+ * the order they are found (not sorted by status). The file can be a pipe.
+ *
+ * The summary (status, number of boxes of each status, time and number of
+ * cells) is not known before the end of the search: it is first written with
+ * the values of an empty manifold and rewritten at the end of the search if
+ * the file is seekable (i.e., not a pipe). In text mode, the values of the
+ * summary are padded with spaces for this purpose.
+ *
+ * Each box is flushed as soon as it is written.
+ */
+class ManifoldStream : public SolverOutputSink {
+public:
+	/**
+	 * \brief Create a stream to a file.
+	 *
+	 * \param filename - the output file (created when the search starts)
+	 * \param txt      - write in text format (see #Manifold::format())
+	 */
+	ManifoldStream(const char* filename, bool txt=false);
+
+	/**
+	 * \brief Delete this (close the file).
+	 */
+	~ManifoldStream();
+
+	/**
+	 * \brief Create the file and write the header.
+	 */
+	void start(const Manifold& manif);
+
+	/**
+	 * \brief Write an output box.
+	 */
+	void add(const SolverOutputBox& sol);
+
+	/**
+	 * \brief Write the summary and close the file.
+	 */
+	void end(const Manifold& manif);
+
+	/**
+	 * \brief Output file name.
+	 */
+	const std::string filename;
+
+	/**
+	 * \brief True if the file is in text format.
+	 */
+	const bool txt;
+
+	/**
+	 * \brief Number of boxes written with status INNER, BOUNDARY, UNKNOWN and PENDING.
+	 */
+	unsigned int nb_boxes[4];
+
+protected:
+	/*
+	 * Write the summary (at the current position).
+	 */
+	void write_summary(const Manifold& manif);
+
+	std::ofstream f;
+
+	/*
+	 * Dimensions of the problem (used to write the boxes).
+	 */
+	Manifold* header;
+
+	/*
+	 * Position of the summary in the file (-1 if the file is not seekable).
+	 */
+	std::streampos summary_pos;
+};
+
+} // end namespace ibex
+
+#endif // __IBEX_MANIFOLD_STREAM_H__
@@ -5,7 +5,7 @@
 // Copyright   : IMT Atlantique (France)
 // License     : See the LICENSE file
 // Created     : May 13, 2012
-// Last Update : Oct 01, 2017
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #include "ibex_Solver.h"
@@ -15,6 +15,7 @@
 #include "ibex_Manifold.h"
 
 #include <cassert>
+#include <cstdio>
 
 using namespace std;
 
@@ -24,13 +25,16 @@ namespace {
 	class EmptyBoxException : Exception { };
 }
 
+const double Solver::default_checkpoint_period = 600;
+
 Solver::Solver(const System& sys, Ctc& ctc, Bsc& bsc, CellBuffer& buffer,
 		const Vector& eps_x_min, const Vector& eps_x_max) :
 		  ctc(ctc), bsc(bsc), buffer(buffer), eps_x_min(eps_x_min), eps_x_max(eps_x_max),
-		  boundary_test(ALL_TRUE), time_limit(-1), cell_limit(-1), trace(0), impact(BitSet::all(ctc.nb_var)),
+		  boundary_test(ALL_TRUE), time_limit(-1), cell_limit(-1), trace(0),
+		  checkpoint_period(default_checkpoint_period), impact(BitSet::all(ctc.nb_var)),
 		  solve_init_box(sys.box), eqs(NULL), ineqs(NULL),
 		  params(sys.nb_var,BitSet::empty(sys.nb_var),false) /* no forced parameter by default */,
-		  manif(NULL), time(0), nb_cells(0) {
+		  manif(NULL), sink(NULL), sink_sol(sys.nb_var), time(0), resumed_time(0), last_checkpoint(0), nb_cells(0) {
 
 	assert(sys.box.size()==ctc.nb_var);
 
@@ -60,12 +64,18 @@ Solver::Solver(const System& sys, Ctc& ctc, Bsc& bsc, CellBuffer& buffer,
 		boundary_test=ALL_FALSE;
 
 	manif = new Manifold(n,m,nb_ineq);
+
+	for (int i=0; i<4; i++) nb_boxes[i]=0;
 }
 
 void Solver::set_params(const VarSet& _params) {
 	params=_params;
 }
 
+void Solver::set_output_sink(SolverOutputSink* _sink) {
+	sink=_sink;
+}
+
 Solver::~Solver() {
 	if (ineqs) {
 		delete ineqs;
@@ -95,12 +105,17 @@ void Solver::start(const IntervalVector& init_box) {
 	buffer.push(root);
 	nb_cells = 1;
 
+	for (int i=0; i<4; i++) nb_boxes[i]=0;
+	if (sink) sink->start(*manif);
+
 	time = 0;
+	resumed_time = 0;
+	last_checkpoint = 0;
 
 	timer.restart();
 }
 
-void Solver::start(const char* input_paving) {
+void Solver::start(const char* input_paving, bool resume) {
 	buffer.flush();
 
 	if (manif) delete manif;
@@ -134,12 +149,36 @@ void Solver::start(const char* input_paving) {
 	manif->unknown.clear();
 	manif->pending.clear();
 
+	nb_boxes[SolverOutputBox::INNER]=manif->inner.size();
+	nb_boxes[SolverOutputBox::BOUNDARY]=manif->boundary.size();
+	nb_boxes[SolverOutputBox::UNKNOWN]=nb_boxes[SolverOutputBox::PENDING]=0;
+
+	if (sink) {
+		// the boxes of the input paving are part of the output
+		sink->start(*manif);
+		for (vector<SolverOutputBox>::const_iterator it=manif->inner.begin(); it!=manif->inner.end(); it++)
+			sink->add(*it);
+		for (vector<SolverOutputBox>::const_iterator it=manif->boundary.begin(); it!=manif->boundary.end(); it++)
+			sink->add(*it);
+		if (!eqs || n!=m) manif->inner.clear(); // see check_sol(...)
+		manif->boundary.clear();
+	}
+
+	resumed_time = resume? manif->time : 0;
+	last_checkpoint = 0;
+
 	timer.restart();
 }
 
 SolverOutputBox* Solver::next() {
 	while (!buffer.empty()) {
-		if (time_limit >0) timer.check(time_limit);
+		// the time of the interrupted search, if any, is included (see #time_limit)
+		if (time_limit >0) timer.check(time_limit-resumed_time);
+
+		if (!checkpoint_file.empty() && timer.get_time()-last_checkpoint>=checkpoint_period) {
+			checkpoint(checkpoint_file.c_str());
+			last_checkpoint = timer.get_time();
+		}
 
 		if (trace==2) cout << buffer << endl;
 
@@ -223,8 +262,8 @@ Solver::Status Solver::solve(const IntervalVector& init_box) {
 	return solve();
 }
 
-Solver::Status Solver::solve(const char* init_paving) {
-	start(init_paving);
+Solver::Status Solver::solve(const char* init_paving, bool resume) {
+	start(init_paving, resume);
 	return solve();
 }
 
@@ -234,9 +273,9 @@ Solver::Status Solver::solve() {
 
 		while (next()!=NULL) { }
 
-		if (manif->unknown.size()>0)
+		if (nb_boxes[SolverOutputBox::UNKNOWN]>0)
 			manif->status = NOT_ALL_VALIDATED;
-		else if (manif->inner.size()>0 || manif->boundary.size()>0)
+		else if (nb_boxes[SolverOutputBox::INNER]>0 || nb_boxes[SolverOutputBox::BOUNDARY]>0)
 			manif->status = SUCCESS;
 		else
 			manif->status = INFEASIBLE;
@@ -253,9 +292,14 @@ Solver::Status Solver::solve() {
 	timer.stop();
 	time = timer.get_time();
 
+	// the last checkpoint is the final manifold
+	if (!checkpoint_file.empty()) checkpoint(checkpoint_file.c_str());
+
 	manif->time += time;
 	manif->nb_cells += nb_cells;
 
+	if (sink) sink->end(*manif);
+
 	return manif->status;
 }
 
@@ -412,6 +456,18 @@ SolverOutputBox& Solver::store_sol(const SolverOutputBox& sol) {
 
 	if (trace >=1) cout << sol << endl;
 
+	nb_boxes[sol.status]++;
+
+	if (sink) {
+		sink->add(sol);
+		// the inner boxes of a well-constrained system are
+		// still required to detect the solutions already found
+		if (!(sol.status==SolverOutputBox::INNER && eqs && n==m)) {
+			sink_sol=sol;
+			return sink_sol;
+		}
+	}
+
 	switch (sol.status) {
 	case SolverOutputBox::INNER    :
 		manif->inner.push_back(sol);
@@ -441,6 +497,44 @@ void Solver::flush() {
 	}
 }
 
+void Solver::checkpoint(const char* filename) {
+	// The cells of the buffer are temporarily added as pending boxes
+	// and the summary is temporarily updated.
+	vector<const Cell*> cells;
+	buffer.get_cells(cells);
+
+	size_t nb_pending=manif->pending.size();
+	for (vector<const Cell*>::const_iterator it=cells.begin(); it!=cells.end(); it++) {
+		SolverOutputBox sol(n);
+		(SolverOutputBox::sol_status&) sol.status = SolverOutputBox::PENDING;
+		sol._existence=(*it)->box;
+		sol._unicity=NULL;
+		manif->pending.push_back(sol);
+	}
+
+	Status status=manif->status;
+	double total_time=manif->time;
+	unsigned int total_nb_cells=manif->nb_cells;
+
+	if (!cells.empty()) manif->status = TIME_OUT;
+	manif->time += timer.get_time();
+	manif->nb_cells += nb_cells;
+
+	string tmp_file=string(filename)+".tmp";
+	manif->write(tmp_file.c_str());
+
+	manif->pending.erase(manif->pending.begin()+nb_pending, manif->pending.end());
+	manif->status = status;
+	manif->time = total_time;
+	manif->nb_cells = total_nb_cells;
+
+#ifdef _WIN32
+	remove(filename); // rename does not overwrite an existing file
+#endif
+	if (rename(tmp_file.c_str(), filename)!=0)
+		ibex_error("[solver]: cannot write checkpoint file.\n");
+}
+
 void Solver::report() {
 
 	switch(manif->status) {
@@ -457,10 +551,10 @@ void Solver::report() {
 
 	cout << "\033[0m" << endl;
 
-	cout << " number of inner boxes:\t\t" << manif->inner.size() << endl;
-	cout << " number of boundary boxes:\t" << manif->boundary.size() << endl;
-	cout << " number of unknown boxes:\t" << manif->unknown.size() << endl;
-	cout << " number of pending boxes:\t" << manif->pending.size() << endl;
+	cout << " number of inner boxes:\t\t" << nb_boxes[SolverOutputBox::INNER] << endl;
+	cout << " number of boundary boxes:\t" << nb_boxes[SolverOutputBox::BOUNDARY] << endl;
+	cout << " number of unknown boxes:\t" << nb_boxes[SolverOutputBox::UNKNOWN] << endl;
+	cout << " number of pending boxes:\t" << nb_boxes[SolverOutputBox::PENDING] << endl;
 	cout << " cpu time used:\t\t\t" << time << "s";
 	if (manif->time!=time)
 		cout << " [total=" << manif->time << "]";
@@ -5,7 +5,7 @@
 // Copyright   : IMT Atlantique (France)
 // License     : See the LICENSE file
 // Created     : May 13, 2012
-// Last Update : Oct 01, 2017
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #ifndef __IBEX_SOLVER_H__
@@ -20,8 +20,10 @@
 #include "ibex_Exception.h"
 #include "ibex_Linear.h"
 #include "ibex_SolverOutputBox.h"
+#include "ibex_SolverOutputSink.h"
 
 #include <vector>
+#include <string>
 
 namespace ibex {
 
@@ -80,6 +82,22 @@ public:
 	 */
 	void set_params(const VarSet& params);
 
+	/**
+	 * \brief Send the output boxes to a sink instead of storing them.
+	 *
+	 * Each output box is sent to the sink as soon as it is found and is not
+	 * stored in the manifold, except the inner boxes of a well-constrained
+	 * system (m=n), which are required to detect the solutions already found.
+	 *
+	 * The sink is notified at the beginning and at the end of solve(...).
+	 * In interactive mode, it is notified by start(...) but the caller has
+	 * to call sink.end(get_manifold()) at the end of the search.
+	 *
+	 * The sink is not owned by the solver. Pass NULL to store the output
+	 * boxes again (default).
+	 */
+	void set_output_sink(SolverOutputSink* sink);
+
 	/**
 	 * \brief Destructor.
 	 */
@@ -112,8 +130,13 @@ public:
 	 * \brief Continue solving of the system.
 	 *
 	 * \param filename - Name of the file containing the input paving;
+	 * \param resume   - true if the paving is a checkpoint of an interrupted
+	 *                   search (see #checkpoint()). In this case, the time of
+	 *                   the interrupted search is included in the time limit.
+	 *                   Otherwise, the search has its own time budget.
+	 *                   By default: false.
 	 */
-	Status solve(const char* filename);
+	Status solve(const char* filename, bool resume=false);
 
 	/**
 	 * \brief Solve the system
@@ -130,13 +153,19 @@ public:
 	void start(const IntervalVector& init_box);
 
 
-	void start(const char* input_paving);
+	/**
+	 * \brief Start solving from a paving (interactive mode).
+	 *
+	 * \see solve(const char*, bool).
+	 */
+	void start(const char* input_paving, bool resume=false);
 
 	/**
 	 * \brief Find the next solution (interactive mode).
 	 *
 	 * \param sol - (output argument) pointer to the new solution (if found). This
-	 *              is just the address of the last element in the "solutions" vector.
+	 *              is just the address of the last element in the "solutions" vector
+	 *              (or of a copy valid until the next call, if there is an output sink).
 	 *              Set to NULL if search is over, time is out or the number of cells
 	 *              exceeds the limit.
 	 *
@@ -155,6 +184,22 @@ public:
 	 */
 	SolverOutputBox* next();
 
+	/**
+	 * \brief Save the state of the current search in a manifold file.
+	 *
+	 * The file contains the output boxes found so far and the cells of the
+	 * buffer as pending boxes, so that the search can be continued with
+	 * solve(filename), possibly on another machine. The status is TIME_OUT
+	 * if the buffer is not empty (interrupted search).
+	 *
+	 * The file is first written in a temporary file ("filename.tmp") which
+	 * is then renamed, so that an interruption during the writing does not
+	 * corrupt a previous checkpoint.
+	 *
+	 * Note: the output boxes sent to an output sink are not saved.
+	 */
+	void checkpoint(const char* filename);
+
 	/**
 	 * \brief Displays on standard output a report of the last call to solve(...).
 	 */
@@ -167,6 +212,14 @@ public:
 	 */
 	const Manifold& get_manifold() const;
 
+	/**
+	 * \brief Number of output boxes of a given status.
+	 *
+	 * Counts the output boxes found since the last call to start(...),
+	 * including those sent to the output sink (if any).
+	 */
+	unsigned int get_nb_boxes(SolverOutputBox::sol_status status) const;
+
 	/**
 	 * \brief Get the time spent.
 	 *
@@ -220,6 +273,11 @@ public:
 	 *
 	 * This parameter allows to bound running time.
 	 * The value can be fixed by the user. By default, it is -1 (no limit).
+	 *
+	 * When the search is resumed from a checkpoint (see solve(const char*, bool)),
+	 * the time of the interrupted search is included: the limit bounds the
+	 * total time (see #get_time()). When it simply starts from an input
+	 * paving, the time of the paving is not included.
 	 */
 
 	double time_limit;
@@ -243,6 +301,26 @@ public:
 	 */
 	int trace;
 
+	/**
+	 * \brief Checkpoint file.
+	 *
+	 * If not empty, the state of the search is saved in this file every
+	 * #checkpoint_period seconds and at the end of solve(...) (see #checkpoint()),
+	 * so that a long search survives an interruption. By default, it is empty
+	 * (no checkpoint).
+	 */
+	std::string checkpoint_file;
+
+	/**
+	 * \brief CPU time between two checkpoints (in seconds).
+	 *
+	 * By default, it is #default_checkpoint_period.
+	 */
+	double checkpoint_period;
+
+	/** Default time between two checkpoints: 600s. */
+	static const double default_checkpoint_period;
+
 
 protected:
 
@@ -342,12 +420,38 @@ protected:
 	 */
 	Manifold* manif;
 
+	/*
+	 * \brief Receiver of the output boxes (NULL if they are stored in the manifold).
+	 */
+	SolverOutputSink* sink;
+
+	/*
+	 * \brief Last output box sent to the sink (see #next()).
+	 */
+	SolverOutputBox sink_sol;
+
+	/*
+	 * \brief Number of output boxes of each status.
+	 */
+	unsigned int nb_boxes[4];
+
 	/*
 	 * \brief CPU running time used to obtain this manifold.
 	 */
 	double time;
 	Timer timer;
 
+	/*
+	 * \brief Time of the interrupted search, if the current one is resumed
+	 * (see #time_limit).
+	 */
+	double resumed_time;
+
+	/*
+	 * \brief Time of the last checkpoint in the current search.
+	 */
+	double last_checkpoint;
+
 	/**
 	 * \brief Number of cells used to obtain this manifold.
 	 */
@@ -356,6 +460,9 @@ protected:
 
 /*============================================ inline implementation ============================================ */
 
+inline unsigned int Solver::get_nb_boxes(SolverOutputBox::sol_status status) const {
+	return nb_boxes[status];
+}
 
 } // end namespace ibex
 
@@ -4,7 +4,7 @@
 // Author      : Gilles Chabert
 // Copyright   : IMT Atlantique (France)
 // License     : See the LICENSE file
-// Last update : Sep 21, 2017
+// Last update : Oct 19, 2026
 //============================================================================
 
 #ifndef __IBEX_SOLVER_OUTPUT_BOX_H__
@@ -127,6 +127,7 @@ public:
 private:
 	friend class Solver;
 	friend class Manifold;
+	friend class ManifoldMap;
 
 	SolverOutputBox(int n);
 
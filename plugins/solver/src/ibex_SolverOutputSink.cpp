@@ -0,0 +1,26 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_SolverOutputSink.cpp
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#include "ibex_SolverOutputSink.h"
+
+namespace ibex {
+
+SolverOutputSink::~SolverOutputSink() {
+
+}
+
+void SolverOutputSink::start(const Manifold&) {
+
+}
+
+void SolverOutputSink::end(const Manifold&) {
+
+}
+
+} // end namespace ibex
@@ -0,0 +1,69 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_SolverOutputSink.h
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#ifndef __IBEX_SOLVER_OUTPUT_SINK_H__
+#define __IBEX_SOLVER_OUTPUT_SINK_H__
+
+#include "ibex_SolverOutputBox.h"
+
+namespace ibex {
+
+class Manifold;
+
+/**
+ * \ingroup strategy
+ *
+ * \brief Receiver of the output boxes of a solver.
+ *
+ * By default, the solver stores all the output boxes in its manifold
+ * (see #Solver::get_manifold()), so that the memory grows with the
+ * number of output boxes and nothing is visible before the end of
+ * the search (unless the trace is activated).
+ *
+ * When a sink is given to the solver (see #Solver::set_output_sink()),
+ * each output box is sent to the sink as soon as it is found and is
+ * not stored in the manifold, so that the memory is bounded by the
+ * cell buffer.
+ */
+class SolverOutputSink {
+public:
+	/**
+	 * \brief Delete this.
+	 */
+	virtual ~SolverOutputSink();
+
+	/**
+	 * \brief Called when the search starts.
+	 *
+	 * The manifold contains the dimensions of the problem (n, m and
+	 * nb_ineq) and the boxes loaded from an input paving, if any.
+	 * Does nothing by default.
+	 */
+	virtual void start(const Manifold& manif);
+
+	/**
+	 * \brief Called for each output box, as soon as it is found.
+	 *
+	 * Pending boxes are sent when the search is interrupted
+	 * (time out or cell overflow).
+	 */
+	virtual void add(const SolverOutputBox& sol)=0;
+
+	/**
+	 * \brief Called when the search is over.
+	 *
+	 * The status, the time and the number of cells of the manifold
+	 * are set. Does nothing by default.
+	 */
+	virtual void end(const Manifold& manif);
+};
+
+} // end namespace ibex
+
+#endif // __IBEX_SOLVER_OUTPUT_SINK_H__
@@ -0,0 +1,46 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_BscTrace.cpp
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#include "ibex_BscTrace.h"
+
+namespace ibex {
+
+BscTrace::BscTrace(Bsc& bsc, SearchTrace& trace) : Bsc(bsc), bsc(bsc), trace(trace) {
+
+}
+
+BisectionPoint BscTrace::choose_var(const Cell& cell) {
+	switch (trace.mode()) {
+	case SearchTrace::RECORD:
+	{
+		BisectionPoint b=bsc.choose_var(cell);
+		trace.bisected(cell,b);
+		return b;
+	}
+	case SearchTrace::REPLAY:
+	{
+		unsigned int var;
+		double pos;
+		bool rel_pos;
+		if (trace.bisection(cell,var,pos,rel_pos))
+			return BisectionPoint(var,pos,rel_pos);
+		trace.nb_mismatches++;
+		return bsc.choose_var(cell);
+	}
+	default:
+		return bsc.choose_var(cell);
+	}
+}
+
+void BscTrace::add_backtrackable(Cell& root) {
+	bsc.add_backtrackable(root);
+	trace.add_backtrackable(root);
+}
+
+} // end namespace ibex
@@ -0,0 +1,66 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_BscTrace.h
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#ifndef __IBEX_BSC_TRACE_H__
+#define __IBEX_BSC_TRACE_H__
+
+#include "ibex_Bsc.h"
+#include "ibex_SearchTrace.h"
+
+namespace ibex {
+
+/**
+ * \ingroup bisector
+ *
+ * \brief Traced bisector.
+ *
+ * This bisector calls another bisector and records its bisection
+ * points in a search trace (RECORD mode) or returns the recorded
+ * bisection points (REPLAY mode). See #ibex::SearchTrace.
+ *
+ * If the trace is OFF, this bisector behaves exactly as the
+ * sub-bisector.
+ */
+class BscTrace : public Bsc {
+public:
+	/**
+	 * \brief Create a traced version of \a bsc.
+	 *
+	 * The precision is the one of \a bsc.
+	 */
+	BscTrace(Bsc& bsc, SearchTrace& trace);
+
+	/**
+	 * \brief Return next variable to be bisected.
+	 *
+	 * In REPLAY mode, if the cell was not bisected in the recorded
+	 * run, the sub-bisector is called (and the mismatch is counted).
+	 */
+	virtual BisectionPoint choose_var(const Cell& cell);
+
+	/**
+	 * \brief Add the backtrackable data of the sub-bisector
+	 *        and of the trace.
+	 */
+	virtual void add_backtrackable(Cell& root);
+
+	/**
+	 * \brief The sub-bisector.
+	 */
+	Bsc& bsc;
+
+	/**
+	 * \brief The trace.
+	 */
+	SearchTrace& trace;
+};
+
+} // end namespace ibex
+
+#endif // __IBEX_BSC_TRACE_H__
@@ -5,7 +5,7 @@
 // Copyright   : Ecole des Mines de Nantes (France)
 // License     : See the LICENSE file
 // Created     : Jul 1, 2012
-// Last Update : Jul 1, 2012
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #include "ibex_CtcAcid.h"
@@ -15,7 +15,11 @@ using namespace std;
 
 namespace ibex {
 
+#ifndef _WIN32 // MinGW does not support threads
+thread_local double CtcAcid::nbvarstat=0;
+#else
 double  CtcAcid::nbvarstat=0;
+#endif
 //const double CtcAcid::default_ctratio=0.005;
 const double CtcAcid::default_ctratio=0.002;
 
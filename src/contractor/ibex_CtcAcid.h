@@ -5,7 +5,7 @@
 // Copyright   : Ecole des Mines de Nantes (France)
 // License     : See the LICENSE file
 // Created     : Jul 1, 2012
-// Last Update : Jul 1, 2012
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #ifndef __IBEX_CTC_ACID_H__
@@ -85,8 +85,13 @@ public :
 	/** the handled constraint system */
 	const System& system;
 
-	/** the average (on all tunings) of the  number of variables to be shaved  : result given at the end of the search*/
+	/** the average (on all tunings) of the  number of variables to be shaved  : result given at the end of the search
+	 *  (local to each thread) */
+#ifndef _WIN32 // MinGW does not support threads
+	static thread_local double nbvarstat;
+#else
 	static double nbvarstat;
+#endif
 
 	/** default ctratio value, set to 0.005 */
 	static const double default_ctratio;
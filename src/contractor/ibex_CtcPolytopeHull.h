@@ -5,7 +5,7 @@
 // Copyright   : IMT Atlantique (France)
 // License     : See the LICENSE file
 // Created     : Oct 31, 2013
-// Last Update : Oct 31, 2013
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #ifndef __IBEX_CTC_POLYTOPE_HULL_H__
@@ -82,6 +82,11 @@ public:
 
 #ifndef _IBEX_WITH_NOLP_
 
+	/**
+	 * \brief Time and number of calls of the LP solver (see #LPSolver::solve_counter).
+	 */
+	Profiler::Counter& lp_solve_counter();
+
 protected:
 
 	/**
@@ -120,6 +125,16 @@ private:
 #endif /// end _IBEX_WITH_NOLP_
 };
 
+/*============================================ inline implementation ============================================ */
+
+#ifndef _IBEX_WITH_NOLP_
+
+inline Profiler::Counter& CtcPolytopeHull::lp_solve_counter() {
+	return mylinearsolver.solve_counter;
+}
+
+#endif
+
 } // end namespace ibex
 
 #endif // __IBEX_CTC_POLYTOPE_HULL_H__
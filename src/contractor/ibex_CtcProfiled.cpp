@@ -0,0 +1,32 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_CtcProfiled.cpp
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#include "ibex_CtcProfiled.h"
+
+namespace ibex {
+
+CtcProfiled::CtcProfiled(Ctc& c) : Ctc(c.nb_var), ctc(c) {
+	input = c.input;
+	output = c.output;
+}
+
+void CtcProfiled::contract(IntervalVector& box) {
+	Profiler::Scope scope(counter);
+
+	if (impact()) {
+		BitSet flags(BitSet::empty(Ctc::NB_OUTPUT_FLAGS));
+		ctc.contract(box,*impact(),flags);
+		if (flags[FIXPOINT]) set_flag(FIXPOINT);
+		if (flags[INACTIVE]) set_flag(INACTIVE);
+	} else {
+		ctc.contract(box);
+	}
+}
+
+} // end namespace ibex
@@ -0,0 +1,50 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_CtcProfiled.h
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#ifndef __IBEX_CTC_PROFILED_H__
+#define __IBEX_CTC_PROFILED_H__
+
+#include "ibex_Ctc.h"
+#include "ibex_Profiler.h"
+
+namespace ibex {
+
+/** \ingroup contractor
+ * \brief Profiled contractor
+ *
+ * This contractor calls another contractor and counts
+ * the time spent and the number of calls (see #Profiler).
+ * The impact and the output flags are forwarded.
+ */
+class CtcProfiled : public Ctc {
+public:
+
+	/**
+	 * \brief Create a profiled version of c.
+	 */
+	CtcProfiled(Ctc& c);
+
+	/**
+	 * \brief Contract a box.
+	 */
+	virtual void contract(IntervalVector& box);
+
+	/**
+	 * \brief The sub-contractor.
+	 */
+	Ctc& ctc;
+
+	/**
+	 * \brief The counter (disabled by default).
+	 */
+	Profiler::Counter counter;
+};
+
+} // end namespace ibex
+#endif // __IBEX_CTC_PROFILED_H__
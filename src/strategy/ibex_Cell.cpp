@@ -17,9 +17,9 @@ using namespace std;
 
 namespace ibex {
 
-Cell::Cell(const IntervalVector& box) : box(box) { }
+Cell::Cell(const IntervalVector& box) : box(box), depth(0) { }
 
-Cell::Cell(const Cell& e) : box(e.box) {
+Cell::Cell(const Cell& e) : box(e.box), depth(e.depth) {
 	for (IBEXMAP(Backtrackable*)::const_iterator it=e.data.begin(); it!=e.data.end(); it++) {
 		data.insert_new(it->first, it->second->copy());
 	}
@@ -43,6 +43,8 @@ pair<Cell*,Cell*> Cell::subcells(const BisectionPoint& b) const {
 		cright = new Cell(b2);
 	}
 
+	cleft->depth = cright->depth = depth+1;
+
 	for (IBEXMAP(Backtrackable*)::const_iterator it=data.begin(); it!=data.end(); it++) {
 		std::pair<Backtrackable*,Backtrackable*> child_data=it->second->down(b);
 		cleft->data.insert_new(it->first,child_data.first);
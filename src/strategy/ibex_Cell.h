@@ -109,6 +109,13 @@ public:
 	 */
 	IntervalVector box;
 
+	/**
+	 * \brief Depth of the cell in the search tree.
+	 *
+	 * The root cell has depth 0.
+	 */
+	unsigned int depth;
+
 	/**
 	 * \brief Other data.
 	 */
@@ -5,7 +5,7 @@
 // Copyright   : Ecole des Mines de Nantes (France)
 // License     : See the LICENSE file
 // Created     : May 15, 2012
-// Last Update : May 15, 2012
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #include "ibex_CellBuffer.h"
@@ -18,6 +18,10 @@ CellBuffer::CellBuffer() : capacity(-1), screen(1) { }
 
 CellBuffer::~CellBuffer() { }
 
+void CellBuffer::get_cells(std::vector<const Cell*>& cells) const {
+	not_implemented("get the cells of this buffer");
+}
+
 std::ostream& CellBuffer::print(std::ostream& os) const{
 	os << "==============================================================================\n";
 	os << "[" << screen++ << "] buffer size=" << size() << " . Cell on the top :\n\n ";
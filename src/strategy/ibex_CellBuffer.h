@@ -5,7 +5,7 @@
 // Copyright   : Ecole des Mines de Nantes (France)
 // License     : See the LICENSE file
 // Created     : May 12, 2012
-// Last Update : May 12, 2012
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #ifndef __IBEX_CELL_BUFFER_H__
@@ -13,6 +13,8 @@
 
 #include "ibex_Cell.h"
 
+#include <vector>
+
 namespace ibex {
 
 /** \ingroup strategy
@@ -83,6 +85,15 @@ class CellBuffer {
 	/** Return the next box (but does not pop it).*/
 	virtual Cell* top() const=0;
 
+	/**
+	 * \brief Add all the cells of the buffer to a vector (without popping them).
+	 *
+	 * The cells are still owned by the buffer and the order is unspecified.
+	 * Used to save the state of a search (see #Solver::checkpoint_file).
+	 * Not implemented by default.
+	 */
+	virtual void get_cells(std::vector<const Cell*>& cells) const;
+
 	/** Count the number of cells pushed since
 	 * the object is created. */
 	//unsigned int nb_cells;
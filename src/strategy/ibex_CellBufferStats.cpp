@@ -0,0 +1,70 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_CellBufferStats.cpp
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#include "ibex_CellBufferStats.h"
+#include "ibex_Profiler.h"
+
+#include <iomanip>
+
+using namespace std;
+
+namespace ibex {
+
+const unsigned int CellBufferStats::default_sampling_period = 1000;
+
+CellBufferStats::CellBufferStats() : enabled(false), sampling_period(default_sampling_period) {
+	reset();
+}
+
+void CellBufferStats::reset() {
+	size=max_size=max_depth=0;
+	nb_pushes=nb_pops=nb_contracted=nb_empty=0;
+	samples.clear();
+	start_time=Profiler::now();
+	_bytes=_max_bytes=_pushed_bytes=0;
+}
+
+void CellBufferStats::sample(unsigned int size) {
+	if (!enabled) return;
+	update_size(size);
+	Sample s;
+	s.time=Profiler::now()-start_time;
+	s.size=size;
+	s.bytes=bytes();
+	s.nb_pushes=nb_pushes;
+	s.nb_pops=nb_pops;
+	s.nb_contracted=nb_contracted;
+	samples.push_back(s);
+}
+
+size_t CellBufferStats::cell_bytes(const Cell& c) {
+	return sizeof(Cell)
+			+ c.box.size()*sizeof(Interval)
+			+ c.data.size()*(sizeof(const char*)+sizeof(Backtrackable*));
+}
+
+ostream& operator<<(ostream& os, const CellBufferStats& s) {
+	os << " max size:            " << s.max_size << " cells" << endl;
+	os << " max memory:          " << s.max_bytes() << " bytes (estimated)" << endl;
+	os << " max depth:           " << s.max_depth << endl;
+	os << " pushed cells:        " << s.nb_pushes << endl;
+	os << " popped cells:        " << s.nb_pops << endl;
+	os << " contracted cells:    " << s.nb_contracted << endl;
+	os << " empty cells:         " << s.nb_empty << endl;
+	if (!s.samples.empty()) {
+		os << " samples (time, size, memory, pushes, pops, contracted):" << endl;
+		for (vector<CellBufferStats::Sample>::const_iterator it=s.samples.begin(); it!=s.samples.end(); it++)
+			os << "  " << setw(12) << it->time << "s " << setw(10) << it->size
+			   << setw(14) << it->bytes << setw(12) << it->nb_pushes
+			   << setw(12) << it->nb_pops << setw(12) << it->nb_contracted << endl;
+	}
+	return os;
+}
+
+} // end namespace ibex
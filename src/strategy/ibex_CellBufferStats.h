@@ -0,0 +1,231 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_CellBufferStats.h
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#ifndef __IBEX_CELL_BUFFER_STATS_H__
+#define __IBEX_CELL_BUFFER_STATS_H__
+
+#include "ibex_Cell.h"
+
+#include <vector>
+#include <iostream>
+
+namespace ibex {
+
+/** \ingroup strategy
+ *
+ * \brief Cell buffer telemetry.
+ *
+ * Counts the cells pushed into and popped from a cell buffer, the cells
+ * removed from the buffer by contraction (upper bounding) and the cells
+ * discarded because they are contracted to the empty set. The size of
+ * the buffer, its memory footprint and the maximal depth of the cells
+ * are also recorded, both as global maxima and as periodic samples.
+ *
+ * The buffer is not aware of this object: the strategy that owns the
+ * buffer (e.g., #ibex::Optimizer) notifies each operation.
+ *
+ * Disabled by default. A disabled object does nothing.
+ */
+class CellBufferStats {
+public:
+
+	/**
+	 * \brief State of the buffer at a given time.
+	 */
+	class Sample {
+	public:
+		/** Time elapsed since the last reset (in seconds). */
+		double time;
+
+		/** Number of cells in the buffer. */
+		unsigned int size;
+
+		/** Estimated memory held by the cells of the buffer (in bytes, see #bytes()). */
+		size_t bytes;
+
+		/** Number of push, pop and contracted cells so far. */
+		unsigned long nb_pushes, nb_pops, nb_contracted;
+	};
+
+	/**
+	 * \brief Create disabled statistics.
+	 */
+	CellBufferStats();
+
+	/**
+	 * \brief Set all the counters to 0 and remove the samples.
+	 */
+	void reset();
+
+	/**
+	 * \brief Record that \a c has been pushed.
+	 *
+	 * \param size - the size of the buffer after the push.
+	 */
+	void push(const Cell& c, unsigned int size);
+
+	/**
+	 * \brief Record that \a c has been popped.
+	 *
+	 * A sample is taken every #sampling_period pops.
+	 *
+	 * \param size - the size of the buffer after the pop.
+	 */
+	void pop(const Cell& c, unsigned int size);
+
+	/**
+	 * \brief Record a contraction of the buffer.
+	 *
+	 * \param size_before - the size of the buffer before contraction
+	 * \param size_after  - the size of the buffer after contraction
+	 */
+	void contract(unsigned int size_before, unsigned int size_after);
+
+	/**
+	 * \brief Record that a cell has been contracted to the empty set.
+	 */
+	void empty_cell();
+
+	/**
+	 * \brief Take a sample now.
+	 */
+	void sample(unsigned int size);
+
+	/**
+	 * \brief Estimated memory held by the buffer (in bytes).
+	 *
+	 * Sum of #cell_bytes(const Cell&) over the cells pushed and not popped.
+	 * The cells removed by contraction are deleted by the buffer itself:
+	 * they are accounted with the average size of the pushed cells.
+	 */
+	size_t bytes() const;
+
+	/**
+	 * \brief Maximal estimated memory held by the buffer (in bytes).
+	 *
+	 * See #bytes().
+	 */
+	size_t max_bytes() const;
+
+	/**
+	 * \brief Estimated memory of a cell (in bytes).
+	 *
+	 * Only the cell structure, the box and the table of backtrackable
+	 * data are taken into account, not the content of the backtrackable
+	 * data (which is not known from this class). This is therefore a
+	 * lower bound.
+	 */
+	static size_t cell_bytes(const Cell& c);
+
+	/** True if the statistics are recorded. */
+	bool enabled;
+
+	/**
+	 * \brief Number of pops between two samples.
+	 *
+	 * The value 0 means no sampling. By default, 1000.
+	 */
+	unsigned int sampling_period;
+
+	/** Current size of the buffer. */
+	unsigned int size;
+
+	/** Maximal size of the buffer. */
+	unsigned int max_size;
+
+	/** Maximal depth of the cells pushed into the buffer. */
+	unsigned int max_depth;
+
+	/** Number of cells pushed. */
+	unsigned long nb_pushes;
+
+	/** Number of cells popped. */
+	unsigned long nb_pops;
+
+	/** Number of cells removed by contraction of the buffer. */
+	unsigned long nb_contracted;
+
+	/** Number of cells contracted to the empty set (never pushed). */
+	unsigned long nb_empty;
+
+	/** The samples. */
+	std::vector<Sample> samples;
+
+	/** \brief Default sampling period (1000). */
+	static const unsigned int default_sampling_period;
+
+private:
+	void update_size(unsigned int size);
+
+	double start_time;
+	size_t _bytes;
+	size_t _max_bytes;
+	size_t _pushed_bytes;
+};
+
+/**
+ * \brief Display the statistics and the samples.
+ */
+std::ostream& operator<<(std::ostream& os, const CellBufferStats& s);
+
+/*============================================ inline implementation ============================================ */
+
+inline void CellBufferStats::update_size(unsigned int size) {
+	this->size=size;
+	if (size>max_size) max_size=size;
+}
+
+inline void CellBufferStats::push(const Cell& c, unsigned int size) {
+	if (enabled) {
+		size_t b=cell_bytes(c);
+		nb_pushes++;
+		_pushed_bytes+=b;
+		_bytes+=b;
+		if (_bytes>_max_bytes) _max_bytes=_bytes;
+		if (c.depth>max_depth) max_depth=c.depth;
+		update_size(size);
+	}
+}
+
+inline void CellBufferStats::pop(const Cell& c, unsigned int size) {
+	if (enabled) {
+		size_t b=cell_bytes(c);
+		nb_pops++;
+		_bytes-= b<_bytes ? b : _bytes;
+		update_size(size);
+		if (sampling_period>0 && nb_pops%sampling_period==0)
+			sample(size);
+	}
+}
+
+inline void CellBufferStats::contract(unsigned int size_before, unsigned int size_after) {
+	if (enabled && size_before>size_after) {
+		size_t b=(size_before-size_after)*(_pushed_bytes/nb_pushes);
+		nb_contracted+=size_before-size_after;
+		// the buffer is empty: no rounding error left
+		_bytes= size_after==0 ? 0 : (b<_bytes ? _bytes-b : 0);
+	}
+	if (enabled) update_size(size_after);
+}
+
+inline void CellBufferStats::empty_cell() {
+	if (enabled) nb_empty++;
+}
+
+inline size_t CellBufferStats::bytes() const {
+	return _bytes;
+}
+
+inline size_t CellBufferStats::max_bytes() const {
+	return _max_bytes;
+}
+
+} // end namespace ibex
+
+#endif // __IBEX_CELL_BUFFER_STATS_H__
@@ -0,0 +1,91 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_CellBufferTrace.cpp
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#include "ibex_CellBufferTrace.h"
+
+using namespace std;
+
+namespace ibex {
+
+CellBufferTrace::CellBufferTrace(CellBuffer& buffer, SearchTrace& trace) : buffer(buffer), trace(trace) {
+
+}
+
+CellBufferTrace::~CellBufferTrace() {
+
+}
+
+void CellBufferTrace::add_backtrackable(Cell& root) {
+	buffer.add_backtrackable(root);
+}
+
+void CellBufferTrace::flush() {
+	buffer.flush();
+	trace.flush();
+}
+
+unsigned int CellBufferTrace::size() const {
+	if (trace.mode()==SearchTrace::REPLAY)
+		return trace.pending().size();
+	else
+		return buffer.size();
+}
+
+bool CellBufferTrace::empty() const {
+	if (trace.mode()==SearchTrace::REPLAY)
+		return trace.empty();
+	else
+		return buffer.empty();
+}
+
+void CellBufferTrace::push(Cell* cell) {
+	if (trace.mode()==SearchTrace::REPLAY)
+		trace.push(cell);
+	else
+		buffer.push(cell);
+}
+
+Cell* CellBufferTrace::pop() {
+	switch (trace.mode()) {
+	case SearchTrace::RECORD:
+	{
+		Cell* c=buffer.pop();
+		trace.popped(*c);
+		return c;
+	}
+	case SearchTrace::REPLAY:
+		return trace.pop();
+	default:
+		return buffer.pop();
+	}
+}
+
+Cell* CellBufferTrace::top() const {
+	if (trace.mode()==SearchTrace::REPLAY)
+		return trace.top();
+	else
+		return buffer.top();
+}
+
+void CellBufferTrace::get_cells(vector<const Cell*>& cells) const {
+	if (trace.mode()==SearchTrace::REPLAY) {
+		for (map<uint32_t,Cell*>::const_iterator it=trace.pending().begin(); it!=trace.pending().end(); it++)
+			cells.push_back(it->second);
+	} else
+		buffer.get_cells(cells);
+}
+
+ostream& CellBufferTrace::print(ostream& os) const {
+	if (trace.mode()==SearchTrace::REPLAY)
+		return CellBuffer::print(os);
+	else
+		return os << buffer;
+}
+
+} // end namespace ibex
@@ -0,0 +1,81 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_CellBufferTrace.h
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#ifndef __IBEX_CELL_BUFFER_TRACE_H__
+#define __IBEX_CELL_BUFFER_TRACE_H__
+
+#include "ibex_CellBuffer.h"
+#include "ibex_SearchTrace.h"
+
+namespace ibex {
+
+/** \ingroup strategy
+ *
+ * \brief Traced cell buffer.
+ *
+ * This buffer calls another buffer and records the cells popped
+ * in a search trace (RECORD mode) or returns the cells in the recorded
+ * order, the sub-buffer being ignored (REPLAY mode).
+ * See #ibex::SearchTrace.
+ *
+ * If the trace is OFF, this buffer behaves exactly as the sub-buffer.
+ */
+class CellBufferTrace : public CellBuffer {
+public:
+	/**
+	 * \brief Create a traced version of \a buffer.
+	 */
+	CellBufferTrace(CellBuffer& buffer, SearchTrace& trace);
+
+	/**
+	 * \brief Delete *this.
+	 */
+	virtual ~CellBufferTrace();
+
+	/** \brief Add backtrackable data required by the sub-buffer. */
+	virtual void add_backtrackable(Cell& root);
+
+	/** \brief Flush the buffer. */
+	virtual void flush();
+
+	/** \brief Return the size of the buffer. */
+	virtual unsigned int size() const;
+
+	/** \brief Return true if the buffer is empty. */
+	virtual bool empty() const;
+
+	/** \brief Push a new cell on the buffer. */
+	virtual void push(Cell* cell);
+
+	/** \brief Pop a cell from the buffer and return it.*/
+	virtual Cell* pop();
+
+	/** \brief Return the next cell (but does not pop it).*/
+	virtual Cell* top() const;
+
+	/** \brief Add the cells of the buffer (or the pending cells, in REPLAY mode) to a vector. */
+	virtual void get_cells(std::vector<const Cell*>& cells) const;
+
+	/**
+	 * \brief The sub-buffer.
+	 */
+	CellBuffer& buffer;
+
+	/**
+	 * \brief The trace.
+	 */
+	SearchTrace& trace;
+
+protected:
+	virtual std::ostream& print(std::ostream& os) const;
+};
+
+} // end namespace ibex
+
+#endif // __IBEX_CELL_BUFFER_TRACE_H__
@@ -41,4 +41,9 @@ Cell* CellList::top() const {
 	return clist.front();
 }
 
+void CellList::get_cells(std::vector<const Cell*>& cells) const {
+	for (std::list<Cell*>::const_iterator it=clist.begin(); it!=clist.end(); it++)
+		cells.push_back(*it);
+}
+
 } // end namespace ibex
@@ -42,6 +42,9 @@ class CellList : public CellBuffer {
   /** Return the next box (but does not pop it).*/
   Cell* top() const;
 
+  /** Add the cells of the list to a vector (from the front to the back). */
+  void get_cells(std::vector<const Cell*>& cells) const;
+
  private:
   /* List of cells */
   std::list<Cell*> clist;
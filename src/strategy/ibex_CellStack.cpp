@@ -5,7 +5,7 @@
 // Copyright   : Ecole des Mines de Nantes (France)
 // License     : See the LICENSE file
 // Created     : May 12, 2012
-// Last Update : May 12, 2012
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #include "ibex_CellStack.h"
@@ -42,4 +42,13 @@ Cell* CellStack::top() const {
 	return cstack.top();
 }
 
+void CellStack::get_cells(std::vector<const Cell*>& cells) const {
+	// std::stack cannot be traversed: a copy of the pointers is popped instead
+	std::stack<Cell*> copy(cstack);
+	while (!copy.empty()) {
+		cells.push_back(copy.top());
+		copy.pop();
+	}
+}
+
 } // end namespace ibex
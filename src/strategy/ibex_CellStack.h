@@ -5,7 +5,7 @@
 // Copyright   : IMT Atlantique (France)
 // License     : See the LICENSE file
 // Created     : May 12, 2012
-// Last Update : May 12, 2012
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #ifndef __IBEX_CELL_STACK_H__
@@ -43,6 +43,9 @@ class CellStack : public CellBuffer {
   /** Return the next box (but does not pop it).*/
   Cell* top() const;
 
+  /** Add the cells of the stack to a vector (from the top to the bottom). */
+  void get_cells(std::vector<const Cell*>& cells) const;
+
  private:
   /* Stack of cells */
   std::stack<Cell*> cstack;
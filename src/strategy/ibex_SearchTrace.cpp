@@ -0,0 +1,250 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_SearchTrace.cpp
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#include "ibex_SearchTrace.h"
+#include "ibex_Exception.h"
+#include "ibex_Random.h"
+
+#include <string.h>
+
+using namespace std;
+
+namespace ibex {
+
+const int SearchTrace::SIGNATURE_LENGTH = 20;
+const char* SearchTrace::SIGNATURE = "IBEX SEARCH TRACE  ";
+const int SearchTrace::FORMAT_VERSION = 1;
+
+namespace {
+
+// flags of an event
+const uint8_t BISECTED = 1;
+const uint8_t REL_POS  = 2;
+const uint8_t ROOT     = 4;
+
+}
+
+SearchTrace::Node::Node() : trace(NULL), id(0) {
+
+}
+
+SearchTrace::Node::Node(SearchTrace* trace, uint32_t id) : trace(trace), id(id) {
+
+}
+
+Backtrackable* SearchTrace::Node::copy() const {
+	return new Node(trace,id);
+}
+
+pair<Backtrackable*,Backtrackable*> SearchTrace::Node::down(const BisectionPoint&) {
+	Node* left=new Node(trace,trace->next_id++);
+	Node* right=new Node(trace,trace->next_id++);
+	return pair<Backtrackable*,Backtrackable*>(left,right);
+}
+
+SearchTrace::SearchTrace() : nb_mismatches(0), _mode(OFF), next_id(0), pos(0), _nb_events(0) {
+	last.bisected=false;
+}
+
+SearchTrace::~SearchTrace() {
+	close();
+}
+
+void SearchTrace::record(const char* filename) {
+	close();
+
+	file.open(filename, ios::out | ios::binary);
+
+	if (file.fail())
+		ibex_error("[search trace]: cannot create output file.\n");
+
+	file.write(SIGNATURE, SIGNATURE_LENGTH*sizeof(char));
+	uint32_t version=FORMAT_VERSION;
+	file.write((char*) &version, sizeof(version));
+
+	_mode=RECORD;
+}
+
+void SearchTrace::replay(const char* filename) {
+	close();
+	read_events(filename);
+	_mode=REPLAY;
+}
+
+void SearchTrace::close() {
+	if (file.is_open()) file.close();
+	flush();
+	events.clear();
+	pos=0;
+	next_id=0;
+	last.bisected=false;
+	nb_mismatches=0;
+	_nb_events=0;
+	_mode=OFF;
+}
+
+void SearchTrace::add_backtrackable(Cell& root) {
+	if (_mode==OFF) return;
+	root.add<Node>();
+	Node& node=root.get<Node>();
+	node.trace=this;
+	node.id=next_id++;
+
+	switch (_mode) {
+	case RECORD:
+	{
+		Event e;
+		e.id=node.id;
+		e.root=true;
+		e.bisected=false;
+		RNG::get_state(e.rng);
+		write_event(e);
+		break;
+	}
+	case REPLAY:
+		// skip the remaining events of the previous run, if any
+		while (pos<events.size() && !events[pos].root) {
+			nb_mismatches++;
+			pos++;
+		}
+		if (pos<events.size() && events[pos].id==node.id) {
+			RNG::set_state(events[pos].rng);
+			pos++;
+		} else
+			nb_mismatches++;
+		break;
+	default:
+		break;
+	}
+}
+
+void SearchTrace::bisected(const Cell& c, const BisectionPoint& b) {
+	last.id=id(c);
+	last.bisected=true;
+	last.var=b.var;
+	last.pos=b.pos;
+	last.rel_pos=b.rel_pos;
+}
+
+void SearchTrace::popped(const Cell& c) {
+	uint32_t i=id(c);
+	if (!last.bisected || last.id!=i) {
+		last.id=i;
+		last.bisected=false;
+	}
+	last.root=false;
+	RNG::get_state(last.rng);
+	write_event(last);
+	last.bisected=false;
+}
+
+void SearchTrace::write_event(const Event& e) {
+	uint8_t flags=(e.bisected? BISECTED : 0) | (e.bisected && e.rel_pos? REL_POS : 0) | (e.root? ROOT : 0);
+	file.write((char*) &e.id, sizeof(e.id));
+	file.write((char*) &flags, sizeof(flags));
+	file.write((char*) e.rng, sizeof(e.rng));
+	if (e.bisected) {
+		file.write((char*) &e.var, sizeof(e.var));
+		file.write((char*) &e.pos, sizeof(e.pos));
+	}
+	_nb_events++;
+}
+
+void SearchTrace::read_events(const char* filename) {
+	ifstream f;
+
+	f.open(filename, ios::in | ios::binary);
+
+	if (f.fail()) ibex_error("[search trace]: cannot open input file.\n");
+
+	char sig[SIGNATURE_LENGTH];
+	f.read(sig, SIGNATURE_LENGTH*sizeof(char));
+	if (f.eof() || strncmp(sig,SIGNATURE,SIGNATURE_LENGTH)!=0)
+		ibex_error("[search trace]: not a \"search trace\" file.");
+
+	uint32_t version;
+	f.read((char*) &version, sizeof(version));
+	if (f.eof() || version!=(uint32_t) FORMAT_VERSION)
+		ibex_error("[search trace]: wrong format version");
+
+	Event e;
+	uint8_t flags;
+	while (f.read((char*) &e.id, sizeof(e.id))) {
+		f.read((char*) &flags, sizeof(flags));
+		f.read((char*) e.rng, sizeof(e.rng));
+		e.bisected=flags & BISECTED;
+		e.rel_pos=flags & REL_POS;
+		e.root=flags & ROOT;
+		if (e.bisected) {
+			f.read((char*) &e.var, sizeof(e.var));
+			f.read((char*) &e.pos, sizeof(e.pos));
+		}
+		if (!f) ibex_error("[search trace]: unexpected end of file.");
+		events.push_back(e);
+	}
+	_nb_events=events.size();
+}
+
+void SearchTrace::push(Cell* c) {
+	cells.insert(make_pair(id(*c),c));
+}
+
+bool SearchTrace::empty() {
+	while (pos<events.size() && !events[pos].root && cells.find(events[pos].id)==cells.end()) {
+		nb_mismatches++;
+		pos++;
+	}
+	// a root event starts the next run
+	return pos==events.size() || events[pos].root;
+}
+
+Cell* SearchTrace::top() {
+	if (empty()) return NULL;
+	return cells.find(events[pos].id)->second;
+}
+
+Cell* SearchTrace::pop() {
+	if (empty()) return NULL;
+	map<uint32_t,Cell*>::iterator it=cells.find(events[pos].id);
+	Cell* c=it->second;
+	cells.erase(it);
+	RNG::set_state(events[pos].rng);
+	pos++;
+	return c;
+}
+
+void SearchTrace::remove(uint32_t id) {
+	map<uint32_t,Cell*>::iterator it=cells.find(id);
+	if (it!=cells.end()) {
+		delete it->second;
+		cells.erase(it);
+	}
+}
+
+void SearchTrace::flush() {
+	for (map<uint32_t,Cell*>::iterator it=cells.begin(); it!=cells.end(); it++)
+		delete it->second;
+	cells.clear();
+}
+
+bool SearchTrace::bisection(const Cell& c, unsigned int& var, double& pos, bool& rel_pos) const {
+	if (this->pos==events.size()) return false;
+	const Event& e=events[this->pos];
+	if (e.id!=id(c) || !e.bisected) return false;
+	var=e.var;
+	pos=e.pos;
+	rel_pos=e.rel_pos;
+	return true;
+}
+
+unsigned long SearchTrace::nb_events() const {
+	return _nb_events;
+}
+
+} // end namespace ibex
@@ -0,0 +1,267 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_SearchTrace.h
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#ifndef __IBEX_SEARCH_TRACE_H__
+#define __IBEX_SEARCH_TRACE_H__
+
+#include "ibex_Cell.h"
+#include "ibex_Backtrackable.h"
+#include "ibex_BisectionPoint.h"
+
+#include <fstream>
+#include <vector>
+#include <map>
+#include <stdint.h>
+
+namespace ibex {
+
+/** \ingroup strategy
+ *
+ * \brief Record and replay of a search tree.
+ *
+ * A search trace is the sequence of cells processed by a strategy
+ * (in the order they are popped from the cell buffer), with the
+ * bisection point of each cell that has been bisected.
+ *
+ * In RECORD mode, the trace is written to a (binary) file. In REPLAY
+ * mode, a trace file is read and the same tree is explored again:
+ * the buffer returns the cells in the recorded order and the bisector
+ * returns the recorded bisection points. This allows to compare the cost
+ * of each node between two builds independently of the search order.
+ *
+ * The trace is plugged into a strategy through a bisector (see #BscTrace)
+ * and a cell buffer (see #CellBufferTrace) sharing the same SearchTrace
+ * object. Both do nothing more than the wrapped operators when the trace
+ * is OFF (the default).
+ *
+ * Cells are identified by their creation order (root cells and
+ * subcells are numbered from 0, in sequence). The state of the random
+ * number generator (see #RNG) at each root cell and after each pop is also
+ * recorded and restored in REPLAY mode, so that randomized operators (e.g., the random choice of
+ * a double heap or random corners in contractors) behave as in the recorded run.
+ *
+ * If the replayed strategy does not behave as the recorded one (e.g.,
+ * a recorded cell is contracted to the empty set in the new build), the
+ * corresponding event is skipped and counted in #nb_mismatches.
+ */
+class SearchTrace {
+public:
+
+	/**
+	 * \brief Mode of the trace.
+	 */
+	typedef enum { OFF, RECORD, REPLAY } Mode;
+
+	/**
+	 * \brief Identifier of a cell (backtrackable data).
+	 *
+	 * Only added to the root cell if the trace is not OFF.
+	 */
+	class Node : public Backtrackable {
+	public:
+		/** Root cell (the trace is set later). */
+		Node();
+
+		Backtrackable* copy() const;
+
+		std::pair<Backtrackable*,Backtrackable*> down(const BisectionPoint& b);
+
+		/** The trace that numbers the cells. */
+		SearchTrace* trace;
+
+		/** Number of the cell. */
+		uint32_t id;
+
+	protected:
+		Node(SearchTrace* trace, uint32_t id);
+	};
+
+	/**
+	 * \brief Create a trace (OFF).
+	 */
+	SearchTrace();
+
+	/**
+	 * \brief Delete this.
+	 *
+	 * Close the trace file and delete the pending cells, if any.
+	 */
+	~SearchTrace();
+
+	/**
+	 * \brief Record the next runs in a file.
+	 *
+	 * The file is created immediately. All the runs are recorded
+	 * in the same file until the trace is closed or deleted.
+	 */
+	void record(const char* filename);
+
+	/**
+	 * \brief Replay the trace recorded in a file.
+	 *
+	 * The file is read immediately. The runs must be performed
+	 * in the same order as when the trace was recorded.
+	 */
+	void replay(const char* filename);
+
+	/**
+	 * \brief Close the trace file and set the trace OFF.
+	 */
+	void close();
+
+	/**
+	 * \brief The current mode.
+	 */
+	Mode mode() const;
+
+	/**
+	 * \brief Number a root cell.
+	 *
+	 * Called by #BscTrace for each root cell. Add the identifier
+	 * of the cell if the trace is not OFF. The state of the random
+	 * number generator is recorded (RECORD) or restored (REPLAY).
+	 */
+	void add_backtrackable(Cell& root);
+
+	/**
+	 * \brief Identifier of a cell.
+	 */
+	static uint32_t id(const Cell& c);
+
+	/* ============================= RECORD mode ============================ */
+
+	/**
+	 * \brief Record that \a c is bisected at \a b.
+	 */
+	void bisected(const Cell& c, const BisectionPoint& b);
+
+	/**
+	 * \brief Record that \a c is popped from the buffer.
+	 */
+	void popped(const Cell& c);
+
+	/* ============================= REPLAY mode ============================ */
+
+	/**
+	 * \brief Store a cell pushed in the buffer.
+	 */
+	void push(Cell* c);
+
+	/**
+	 * \brief True if no recorded event remains for the current run.
+	 *
+	 * Skip the events of the cells that are not pending.
+	 */
+	bool empty();
+
+	/**
+	 * \brief The cell of the next event.
+	 */
+	Cell* top();
+
+	/**
+	 * \brief Remove the cell of the next event and return it.
+	 */
+	Cell* pop();
+
+	/**
+	 * \brief Remove (and delete) a pending cell.
+	 */
+	void remove(uint32_t id);
+
+	/**
+	 * \brief Delete all the pending cells.
+	 */
+	void flush();
+
+	/**
+	 * \brief The pending cells.
+	 */
+	const std::map<uint32_t,Cell*>& pending() const;
+
+	/**
+	 * \brief Get the recorded bisection point of \a c.
+	 *
+	 * Return false if \a c is not the cell of the next event or
+	 * if it was not bisected in the recorded run.
+	 */
+	bool bisection(const Cell& c, unsigned int& var, double& pos, bool& rel_pos) const;
+
+	/* ====================================================================== */
+
+	/**
+	 * \brief Number of recorded (or replayed) events.
+	 */
+	unsigned long nb_events() const;
+
+	/**
+	 * \brief Number of events that could not be replayed.
+	 */
+	unsigned long nb_mismatches;
+
+	/** Signature of a trace file. */
+	static const char* SIGNATURE;
+
+	/** Length of the signature. */
+	static const int SIGNATURE_LENGTH;
+
+	/** Version of the file format. */
+	static const int FORMAT_VERSION;
+
+private:
+	friend class Node;
+
+	SearchTrace(const SearchTrace&); // forbidden
+
+	typedef struct {
+		uint32_t id;
+		bool bisected;
+		uint32_t var;
+		double pos;
+		bool rel_pos;
+		bool root;
+		uint32_t rng[3];
+	} Event;
+
+	void write_event(const Event& e);
+	void read_events(const char* filename);
+
+	Mode _mode;
+	std::ofstream file;
+
+	uint32_t next_id;
+
+	// RECORD: bisection point of the last bisected cell
+	Event last;
+
+	// REPLAY: events, position of the next event and pending cells
+	std::vector<Event> events;
+	size_t pos;
+	std::map<uint32_t,Cell*> cells;
+
+	unsigned long _nb_events;
+};
+
+/*============================================ inline implementation ============================================ */
+
+inline SearchTrace::Mode SearchTrace::mode() const {
+	return _mode;
+}
+
+inline uint32_t SearchTrace::id(const Cell& c) {
+	return c.get<Node>().id;
+}
+
+inline const std::map<uint32_t,Cell*>& SearchTrace::pending() const {
+	return cells;
+}
+
+} // end namespace ibex
+
+#endif // __IBEX_SEARCH_TRACE_H__
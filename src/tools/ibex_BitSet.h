@@ -184,7 +184,9 @@ std::ostream& operator<<(std::ostream& os, const BitSet& b);
 
 /*================================== inline implementations ========================================*/
 
-inline BitSet::BitSet(int n) : bitset(0,n-1,Mistral::BitSet::empt) { }
+// Note: the Mistral bitset of an empty range [0,-1] has no word and its
+// initialisation writes out of the table. An empty set of capacity 1 is created instead.
+inline BitSet::BitSet(int n) : bitset(0,n>0? n-1 : 0,Mistral::BitSet::empt) { }
 
 inline BitSet::BitSet(const BitSet& b) : bitset(b.bitset) { }
 
@@ -194,7 +196,7 @@ inline BitSet BitSet::empty(int n) { return BitSet(n); }
 
 inline BitSet BitSet::all(int n) {
 	BitSet b(n);
-	b.bitset.fill(0,n-1);
+	if (n>0) b.bitset.fill(0,n-1);
 	return b;
 }
 
@@ -5,7 +5,7 @@
 // Copyright   : IMT Atlantique (France)
 // License     : See the LICENSE file
 // Created     : Sep 12, 2014
-// Last Update : Dec 25, 2017
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #ifndef __IBEX_DOUBLE_HEAP_H__
@@ -82,6 +82,13 @@ public:
 	/** \brief Return next data of the second heap  (but does not pop it).*/
 	T* top2() const;
 
+	/**
+	 * \brief Add all the data to a vector (without popping them).
+	 *
+	 * The order is unspecified. Complexity: o(size)
+	 */
+	void get_data(std::vector<const T*>& data) const;
+
 	/**
 	 * \brief Return the minimum (the criterion for the first heap)
 	 *
@@ -356,6 +363,14 @@ T* DoubleHeap<T>::pop2()  {
 
 }
 
+template<class T>
+void DoubleHeap<T>::get_data(std::vector<const T*>& data) const {
+	// all the elements are in both heaps
+	std::vector<HeapElt<T>*> p = heap1->elt();
+	for (typename std::vector<HeapElt<T>*>::const_iterator it=p.begin(); it!=p.end(); it++)
+		data.push_back((*it)->data);
+}
+
 template<class T>
 T* DoubleHeap<T>::top() const {
 	assert(size()>0);
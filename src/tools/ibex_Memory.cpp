@@ -24,6 +24,7 @@ Memory::Object::~Object() {
 #endif
 	case CELL_BUFFER:  delete (CellBuffer*) data; break;
 	case LINEARIZER:   delete (Linearizer*) data; break;
+	case SEARCH_TRACE: delete (SearchTrace*) data; break;
 	default:		   ibex_error("Memory: unknown object type"); break;
 	}
 }
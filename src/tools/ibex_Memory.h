@@ -21,6 +21,7 @@
 #endif
 
 #include "ibex_Linearizer.h"
+#include "ibex_SearchTrace.h"
 
 #include <stdlib.h>
 #include <list>
@@ -63,7 +64,7 @@ public:
 		 * We need to record the type of the object (because the "delete" operator
 		 * requires static type cast).
 		 */
-		enum { CTC, BSC, SYSTEM, LOUP_FINDER, CELL_BUFFER, LINEARIZER } type;
+		enum { CTC, BSC, SYSTEM, LOUP_FINDER, CELL_BUFFER, LINEARIZER, SEARCH_TRACE } type;
 
 		Object(const Ctc* obj) : data(obj), type(CTC) { }
 		Object(const Bsc* obj) : data(obj), type(BSC) { }
@@ -73,6 +74,7 @@ public:
 #endif
 		Object(const CellBuffer* obj) : data(obj), type(CELL_BUFFER) { }
 		Object(const Linearizer* obj) : data(obj), type(LINEARIZER) { }
+		Object(const SearchTrace* obj) : data(obj), type(SEARCH_TRACE) { }
 
 		~Object();
 	};
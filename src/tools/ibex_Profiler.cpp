@@ -0,0 +1,69 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_Profiler.cpp
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#include "ibex_Profiler.h"
+
+#include <chrono>
+#include <iomanip>
+
+using namespace std;
+
+namespace ibex {
+
+Profiler::Profiler() : _enabled(false) {
+
+}
+
+Profiler::~Profiler() {
+	for (vector<Counter*>::iterator it=owned.begin(); it!=owned.end(); it++)
+		delete *it;
+}
+
+Profiler::Counter& Profiler::add(const string& name) {
+	Counter* c=new Counter();
+	owned.push_back(c);
+	add(name,*c);
+	return *c;
+}
+
+void Profiler::add(const string& name, Counter& c) {
+	c.enabled=_enabled;
+	names.push_back(name);
+	counters.push_back(&c);
+}
+
+void Profiler::enable(bool b) {
+	_enabled=b;
+	for (vector<Counter*>::iterator it=counters.begin(); it!=counters.end(); it++)
+		(*it)->enabled=b;
+}
+
+void Profiler::reset() {
+	for (vector<Counter*>::iterator it=counters.begin(); it!=counters.end(); it++)
+		(*it)->reset();
+}
+
+double Profiler::now() {
+	return chrono::duration<double>(chrono::steady_clock::now().time_since_epoch()).count();
+}
+
+ostream& operator<<(ostream& os, const Profiler& p) {
+	size_t w=0;
+	for (int i=0; i<p.size(); i++)
+		if (p.name(i).size()>w) w=p.name(i).size();
+
+	for (int i=0; i<p.size(); i++) {
+		os << " " << left << setw(w) << p.name(i) << right
+		   << "  " << setw(12) << p[i].time << "s  "
+		   << setw(12) << p[i].nb_calls << " calls" << endl;
+	}
+	return os;
+}
+
+} // end namespace ibex
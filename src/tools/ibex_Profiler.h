@@ -0,0 +1,213 @@
+//============================================================================
+//                                  I B E X
+// File        : ibex_Profiler.h
+// Copyright   : IMT Atlantique (France)
+// License     : See the LICENSE file
+// Created     : Oct 19, 2026
+// Last Update : Oct 19, 2026
+//============================================================================
+
+#ifndef __IBEX_PROFILER_H__
+#define __IBEX_PROFILER_H__
+
+#include <string>
+#include <vector>
+#include <iostream>
+
+namespace ibex {
+
+/**
+ * \ingroup tools
+ *
+ * \brief Time and call counters.
+ *
+ * A profiler is a list of named counters. Each counter accumulates the
+ * time spent (wall-clock time) and the number of calls between its start()
+ * and stop() functions.
+ *
+ * A counter is either owned by the profiler (see #add(const std::string&))
+ * or owned by another object (a contractor, a loup finder, etc.) and only
+ * referenced by the profiler (see #add(const std::string&, Counter&)).
+ *
+ * Profiling is disabled by default. A disabled counter does nothing so the
+ * cost of the instrumentation is then a simple test per call.
+ */
+class Profiler {
+public:
+
+	/**
+	 * \brief A time and call counter.
+	 */
+	class Counter {
+	public:
+		/**
+		 * \brief Create a disabled counter.
+		 */
+		Counter();
+
+		/**
+		 * \brief Start counting (if enabled).
+		 *
+		 * Nested calls (e.g., recursive calls) are counted
+		 * but the time is only measured by the outermost call.
+		 */
+		void start();
+
+		/**
+		 * \brief Stop counting (if enabled).
+		 */
+		void stop();
+
+		/**
+		 * \brief Set time and number of calls to 0.
+		 */
+		void reset();
+
+		/** Time spent (in seconds). */
+		double time;
+
+		/** Number of calls. */
+		unsigned long nb_calls;
+
+		/** True if the counter is active. */
+		bool enabled;
+
+	private:
+		double start_time;
+		int depth;
+	};
+
+	/**
+	 * \brief Count a scope.
+	 *
+	 * Start the counter at creation and stop it at destruction
+	 * (including when an exception is raised).
+	 */
+	class Scope {
+	public:
+		Scope(Counter& c);
+		~Scope();
+	private:
+		Counter& c;
+	};
+
+	/**
+	 * \brief Create an empty (disabled) profiler.
+	 */
+	Profiler();
+
+	/**
+	 * \brief Delete this.
+	 */
+	~Profiler();
+
+	/**
+	 * \brief Add a new counter owned by the profiler.
+	 */
+	Counter& add(const std::string& name);
+
+	/**
+	 * \brief Add a reference to a counter.
+	 *
+	 * The counter must outlive the profiler.
+	 */
+	void add(const std::string& name, Counter& c);
+
+	/**
+	 * \brief Enable or disable all the counters.
+	 */
+	void enable(bool b=true);
+
+	/**
+	 * \brief True if the profiler is enabled.
+	 */
+	bool enabled() const;
+
+	/**
+	 * \brief Reset all the counters.
+	 */
+	void reset();
+
+	/**
+	 * \brief Number of counters.
+	 */
+	int size() const;
+
+	/**
+	 * \brief Name of the ith counter.
+	 */
+	const std::string& name(int i) const;
+
+	/**
+	 * \brief The ith counter.
+	 */
+	const Counter& operator[](int i) const;
+
+	/**
+	 * \brief Current wall-clock time (in seconds).
+	 */
+	static double now();
+
+private:
+	Profiler(const Profiler&); // forbidden
+
+	std::vector<std::string> names;
+	std::vector<Counter*> counters;
+	std::vector<Counter*> owned;
+	bool _enabled;
+};
+
+/**
+ * \brief Display the counters (one per line).
+ */
+std::ostream& operator<<(std::ostream& os, const Profiler& p);
+
+/*============================================ inline implementation ============================================ */
+
+inline Profiler::Counter::Counter() : time(0), nb_calls(0), enabled(false), start_time(0), depth(0) { }
+
+inline void Profiler::Counter::start() {
+	if (enabled) {
+		nb_calls++;
+		if (depth++==0) start_time=Profiler::now();
+	}
+}
+
+inline void Profiler::Counter::stop() {
+	if (enabled && depth>0 && --depth==0)
+		time += Profiler::now()-start_time;
+}
+
+inline void Profiler::Counter::reset() {
+	time=0;
+	nb_calls=0;
+	depth=0;
+}
+
+inline Profiler::Scope::Scope(Counter& c) : c(c) {
+	c.start();
+}
+
+inline Profiler::Scope::~Scope() {
+	c.stop();
+}
+
+inline bool Profiler::enabled() const {
+	return _enabled;
+}
+
+inline int Profiler::size() const {
+	return (int) counters.size();
+}
+
+inline const std::string& Profiler::name(int i) const {
+	return names[i];
+}
+
+inline const Profiler::Counter& Profiler::operator[](int i) const {
+	return *counters[i];
+}
+
+} // end namespace ibex
+
+#endif // __IBEX_PROFILER_H__
@@ -40,6 +40,8 @@
 
 #include "ibex_Random.h"
 
+#include <cstddef>
+
 
 //#ifdef  _IBEX_WITH_DIRECT_
 
@@ -49,11 +51,31 @@ uint32_t RNG::x = 123456789;
 uint32_t RNG::y = 362436069;
 uint32_t RNG::z = 521288629;
 
+#ifndef _WIN32 // MinGW does not support threads
+thread_local uint32_t* RNG::local = NULL;
+#else
+uint32_t* RNG::local = NULL;
+#endif
+
+uint32_t& RNG::x_() { return local? local[0] : x; }
+uint32_t& RNG::y_() { return local? local[1] : y; }
+uint32_t& RNG::z_() { return local? local[2] : z; }
+
+RNG::ThreadLocal::ThreadLocal() : previous(local) {
+	get_state(state);
+	local=state;
+}
+
+RNG::ThreadLocal::~ThreadLocal() {
+	local=previous;
+}
+
 bool RNG::srand()
 {
 	/** This function sets the seed for random number generation \c
 	 \return A boolean if the seed is acceptable, that is in [0,UINT32_MAX].
 	 */
+	uint32_t& x=x_();
 	//srand(times(&t)+time(NULL));
 
 	if(x<UINT32_MAX)
@@ -72,6 +94,7 @@ bool RNG::srand(unsigned long s)
 	/** This function sets the seed for random number generation \c 
 	 \return A boolean if the seed is acceptable, that is in [0,UINT32_MAX].
 	 */
+	uint32_t& x=x_();
 	if(s<=UINT32_MAX)
 	{
 		x=s;
@@ -85,6 +108,9 @@ uint32_t RNG::rand () { //period 2^96-1
 	/** This function serves to obtain a random number \c 
 	 \return An integer in the interval [0,UINT32_MAX].
 	 */
+	uint32_t& x=x_();
+	uint32_t& y=y_();
+	uint32_t& z=z_();
  	uint32_t t;
  	x ^= x << 16;
  	x ^= x >> 5;
@@ -98,6 +124,18 @@ uint32_t RNG::rand () { //period 2^96-1
 	return z;
 }
 
+void RNG::get_state(uint32_t state[3]) {
+	state[0]=x_();
+	state[1]=y_();
+	state[2]=z_();
+}
+
+void RNG::set_state(const uint32_t state[3]) {
+	x_()=state[0];
+	y_()=state[1];
+	z_()=state[2];
+}
+
 
 } // end namespace ibex
 
@@ -60,9 +60,45 @@ namespace ibex {
 		static bool srand(unsigned long s);
 		static uint32_t rand();
 		static double rand(double a, double b){return a+((double)(b-a)*RNG::rand())/UINT32_MAX;}
-		
+
+		/** Get the internal state of the generator (3 words). */
+		static void get_state(uint32_t state[3]);
+
+		/** Restore an internal state (obtained with get_state). */
+		static void set_state(const uint32_t state[3]);
+
+		/**
+		 * Generator local to the calling thread.
+		 *
+		 * The state of the generator is shared by all the threads. While an
+		 * object of this class exists, the calling thread uses instead its
+		 * own state (initialized with the shared one), so that the numbers
+		 * it draws do not depend on the other threads. This is used by the
+		 * strategies that run in parallel (e.g., the LLP problems of MitsosSIP).
+		 */
+		class ThreadLocal {
+		public:
+			ThreadLocal();
+			~ThreadLocal();
+		private:
+			uint32_t state[3];
+			uint32_t* previous;
+		};
+
 	private:
+		/* The state of the calling thread: the local state if any, or the shared one. */
+		static uint32_t& x_();
+		static uint32_t& y_();
+		static uint32_t& z_();
+
 		static uint32_t x,y,z;
+
+		/* The local state of the calling thread (NULL if none, see ThreadLocal). */
+#ifndef _WIN32 // MinGW does not support threads
+		static thread_local uint32_t* local;
+#else
+		static uint32_t* local;
+#endif
 	};
 }
 
@@ -5,7 +5,7 @@
 // Copyright   : IMT Atlantique (France)
 // License     : See the LICENSE file
 // Created     : May 13, 2012
-// Last Update : May 13, 2012
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #include "ibex_Timer.h"
@@ -198,12 +198,8 @@ StaticTimer::Time StaticTimer::real_time = 0;
 
 #else
 
-struct rusage StaticTimer::res;
-StaticTimer::Time StaticTimer::virtual_ulapse = 0;
-StaticTimer::Time StaticTimer::virtual_slapse = 0;
 StaticTimer::Time StaticTimer::virtual_utime = 0;
 StaticTimer::Time StaticTimer::virtual_stime = 0;
-long StaticTimer::resident_memory = 0;
 
 #endif // _WIN32     _MSC_VER
 
@@ -217,6 +213,7 @@ long StaticTimer::resident_memory = 0;
 void StaticTimer::start() {
 #ifndef _WIN32
 	//    res = std::clock();
+	struct rusage res;
 	getrusage( RUSAGE_SELF, &res );
 
 	virtual_utime = (Time) res.ru_utime.tv_sec +
@@ -241,14 +238,18 @@ StaticTimer::Time StaticTimer::get_localtime () {
 
 
 
+	// Note: the time is the CPU time of the whole process (all the threads).
+	// Only local variables are written, so that timers can run concurrently
+	// in several threads (e.g., the LLP problems of MitsosSIP).
+	struct rusage res;
 	getrusage( RUSAGE_SELF, &res );
-	virtual_ulapse = (Time) res.ru_utime.tv_sec +
+	Time virtual_ulapse = (Time) res.ru_utime.tv_sec +
 			(Time) res.ru_utime.tv_usec / 1000000.0
 			- virtual_utime;
-	virtual_slapse = (Time) res.ru_stime.tv_sec +
+	Time virtual_slapse = (Time) res.ru_stime.tv_sec +
 			(Time) res.ru_stime.tv_usec / 1000000.0
 			- virtual_stime;
-	resident_memory = res.ru_ixrss;
+	long resident_memory = res.ru_ixrss;
 
 	if (resident_memory > 100000) ibex_error(" Timer: memory limit, out of resident memory "  );
 
@@ -256,7 +257,7 @@ StaticTimer::Time StaticTimer::get_localtime () {
 	//virtual_stime =virtual_slapse ;
 	//local_time += (virtual_ulapse + virtual_slapse);
 
-	local_time = (virtual_ulapse + virtual_slapse);
+	return virtual_ulapse + virtual_slapse;
 
 #else
 	mygettimeofday( &tp);
@@ -5,7 +5,7 @@
 // Copyright   : IMT Atlantique (France)
 // License     : See the LICENSE file
 // Created     : May 13, 2012
-// Last Update : May 13, 2012
+// Last Update : Oct 19, 2026
 //============================================================================
 
 #ifndef __IBEX_TIMER_H__
@@ -79,12 +79,8 @@ class StaticTimer {
   static Time real_time;
 
 #else
-  static struct rusage res;
-  static Time virtual_ulapse;
-  static Time virtual_slapse;
   static Time virtual_utime;
   static Time virtual_stime;
-  static long resident_memory;
 #endif
 };
 
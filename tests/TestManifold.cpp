@@ -0,0 +1,127 @@
+/* ============================================================================
+ * I B E X - Manifold Tests
+ * ============================================================================
+ * Copyright   : IMT Atlantique (France)
+ * License     : This program can be distributed under the terms of the GNU LGPL.
+ *               See the file COPYING.LESSER.
+ *
+ * Created     : Oct 19, 2026
+ * ---------------------------------------------------------------------------- */
+
+#include "TestManifold.h"
+#include "ibex_SystemFactory.h"
+#include "ibex_DefaultSolver.h"
+#include "ibex_ManifoldMap.h"
+
+#include <cstdio>
+
+using namespace std;
+
+namespace ibex {
+
+namespace {
+
+/* Solve x^2+y^2+z^2=1, x+y+z<=1 (with parameters in the proofs) */
+DefaultSolver* new_solver(System*& sys) {
+	const ExprSymbol& x=ExprSymbol::new_("x");
+	const ExprSymbol& y=ExprSymbol::new_("y");
+	const ExprSymbol& z=ExprSymbol::new_("z");
+
+	SystemFactory f;
+	f.add_var(x, Interval(-10,10));
+	f.add_var(y, Interval(-10,10));
+	f.add_var(z, Interval(-10,10));
+	f.add_ctr(sqr(x)+sqr(y)+sqr(z)=1);
+	f.add_ctr(x+y+z<=1);
+	sys=new System(f);
+	return new DefaultSolver(*sys,1e-2,0.5);
+}
+
+bool same_box(const SolverOutputBox& sol1, const SolverOutputBox& sol2) {
+	if (sol1.status!=sol2.status || sol1.existence()!=sol2.existence()) return false;
+	if (sol1.varset==NULL || sol2.varset==NULL) return sol1.varset==sol2.varset;
+	for (int i=0; i<sol1.varset->nb_param; i++)
+		if (sol1.varset->param(i)!=sol2.varset->param(i)) return false;
+	return true;
+}
+
+bool same_boxes(const vector<SolverOutputBox>& v1, const vector<SolverOutputBox>& v2) {
+	if (v1.size()!=v2.size()) return false;
+	for (size_t i=0; i<v1.size(); i++)
+		if (!same_box(v1[i],v2[i])) return false;
+	return true;
+}
+
+}
+
+void TestManifold::map() {
+	System* sys;
+	DefaultSolver* solver=new_solver(sys);
+	solver->solve(sys->box);
+	const Manifold& manif=solver->get_manifold();
+	CPPUNIT_ASSERT(manif.size()>0);
+
+	const char* filename="manifold_map.tmp";
+	manif.write_map(filename);
+	CPPUNIT_ASSERT(ManifoldMap::is_map(filename));
+
+	// read in place
+	{
+		ManifoldMap map(filename);
+		CPPUNIT_ASSERT(map.size()==(size_t) manif.size());
+		CPPUNIT_ASSERT(map.nb_params==2);
+		CPPUNIT_ASSERT(map.status==manif.status);
+		CPPUNIT_ASSERT(map.nb_cells==manif.nb_cells);
+		const SolverOutputBox& sol=manif.inner[0];
+		CPPUNIT_ASSERT(map.box_status(0)==SolverOutputBox::INNER);
+		CPPUNIT_ASSERT(map.box(0)==sol.existence());
+		CPPUNIT_ASSERT(map.bounds(0)[1]==sol.existence()[0].ub());
+		if (sol.varset!=NULL)
+			CPPUNIT_ASSERT(map.params(0)[0]==(uint32_t) sol.varset->param(0)+1);
+	}
+
+	// conversion
+	Manifold manif2(manif.n,manif.m,manif.nb_ineq);
+	manif2.load(filename);
+	CPPUNIT_ASSERT(same_boxes(manif.inner,manif2.inner));
+	CPPUNIT_ASSERT(same_boxes(manif.boundary,manif2.boundary));
+	CPPUNIT_ASSERT(same_boxes(manif.unknown,manif2.unknown));
+	CPPUNIT_ASSERT(same_boxes(manif.pending,manif2.pending));
+	CPPUNIT_ASSERT(manif2.time==manif.time);
+
+	remove(filename);
+	delete solver;
+	delete sys;
+}
+
+void TestManifold::map_append() {
+	System* sys;
+	DefaultSolver* solver=new_solver(sys);
+	solver->solve(sys->box);
+	const Manifold& manif=solver->get_manifold();
+	CPPUNIT_ASSERT(manif.inner.size()>10);
+
+	const char* filename="manifold_map_append.tmp";
+	remove(filename);
+
+	// append the inner boxes 3 by 3, in chunks of 4 boxes
+	Manifold empty(manif.n,manif.m,manif.nb_ineq);
+	for (size_t i=0; i<manif.inner.size(); i+=3) {
+		ManifoldMapWriter writer(filename,true,4);
+		writer.start(empty);
+		for (size_t j=i; j<i+3 && j<manif.inner.size(); j++)
+			writer.add(manif.inner[j]);
+		writer.end(empty);
+	}
+
+	Manifold manif2(manif.n,manif.m,manif.nb_ineq);
+	manif2.load(filename);
+	CPPUNIT_ASSERT(same_boxes(manif.inner,manif2.inner));
+	CPPUNIT_ASSERT(manif2.boundary.empty());
+
+	remove(filename);
+	delete solver;
+	delete sys;
+}
+
+} // end namespace ibex
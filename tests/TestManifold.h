@@ -0,0 +1,38 @@
+/* ============================================================================
+ * I B E X - Manifold Tests
+ * ============================================================================
+ * Copyright   : IMT Atlantique (France)
+ * License     : This program can be distributed under the terms of the GNU LGPL.
+ *               See the file COPYING.LESSER.
+ *
+ * Created     : Oct 19, 2026
+ * ---------------------------------------------------------------------------- */
+
+#ifndef __TEST_MANIFOLD_H__
+#define __TEST_MANIFOLD_H__
+
+#include <cppunit/TestFixture.h>
+#include <cppunit/extensions/HelperMacros.h>
+#include "ibex_Manifold.h"
+#include "utils.h"
+
+namespace ibex {
+
+class TestManifold : public CppUnit::TestFixture {
+
+public:
+
+	CPPUNIT_TEST_SUITE(TestManifold);
+	CPPUNIT_TEST(map);
+	CPPUNIT_TEST(map_append);
+	CPPUNIT_TEST_SUITE_END();
+
+	void map();
+	void map_append();
+};
+
+CPPUNIT_TEST_SUITE_REGISTRATION(TestManifold);
+
+} // namespace ibex
+
+#endif // __TEST_MANIFOLD_H__
@@ -0,0 +1,83 @@
+/* ============================================================================
+ * I B E X - TestProfiler
+ * ============================================================================
+ * Copyright   : IMT Atlantique (FRANCE)
+ * License     : This program can be distributed under the terms of the GNU LGPL.
+ *               See the file COPYING.LESSER.
+ *
+ * Created     : Oct 19, 2026
+ * ---------------------------------------------------------------------------- */
+
+#include "TestProfiler.h"
+#include "ibex_Profiler.h"
+#include "ibex_CtcProfiled.h"
+#include "ibex_CtcFwdBwd.h"
+
+using namespace std;
+
+void TestProfiler::disabled() {
+	Profiler p;
+	Profiler::Counter& c=p.add("c");
+	CPPUNIT_ASSERT(!p.enabled());
+	{ Profiler::Scope s(c); }
+	CPPUNIT_ASSERT(c.nb_calls==0);
+	CPPUNIT_ASSERT(c.time==0);
+}
+
+void TestProfiler::calls() {
+	Profiler p;
+	Profiler::Counter& c1=p.add("c1");
+	Profiler::Counter c2;
+	p.add("c2",c2);
+	p.enable();
+	CPPUNIT_ASSERT(c2.enabled);
+	for (int i=0; i<3; i++) { Profiler::Scope s(c1); }
+	c2.start();
+	c2.stop();
+	CPPUNIT_ASSERT(p.size()==2);
+	CPPUNIT_ASSERT(p.name(0)=="c1");
+	CPPUNIT_ASSERT(p.name(1)=="c2");
+	CPPUNIT_ASSERT(p[0].nb_calls==3);
+	CPPUNIT_ASSERT(p[1].nb_calls==1);
+	CPPUNIT_ASSERT(p[0].time>=0);
+	p.enable(false);
+	CPPUNIT_ASSERT(!c2.enabled);
+}
+
+void TestProfiler::nested() {
+	Profiler p;
+	Profiler::Counter& c=p.add("c");
+	p.enable();
+	{
+		Profiler::Scope s1(c);
+		{ Profiler::Scope s2(c); }
+		// time is only measured by the outermost scope
+		CPPUNIT_ASSERT(c.time==0);
+	}
+	CPPUNIT_ASSERT(c.nb_calls==2);
+}
+
+void TestProfiler::reset() {
+	Profiler p;
+	Profiler::Counter& c=p.add("c");
+	p.enable();
+	{ Profiler::Scope s(c); }
+	p.reset();
+	CPPUNIT_ASSERT(c.nb_calls==0);
+	CPPUNIT_ASSERT(c.time==0);
+	CPPUNIT_ASSERT(c.enabled);
+}
+
+void TestProfiler::ctc_profiled() {
+	Variable x,y;
+	Function f(x,y,x+y);
+	CtcFwdBwd fwdbwd(f);
+	CtcProfiled ctc(fwdbwd);
+	ctc.counter.enabled=true;
+
+	IntervalVector box(2,Interval(-1,1));
+	box[0]=Interval(0.5,1);
+	ctc.contract(box);
+	check(box[1],Interval(-1,-0.5));
+	CPPUNIT_ASSERT(ctc.counter.nb_calls==1);
+}
@@ -0,0 +1,41 @@
+/* ============================================================================
+ * I B E X - TestProfiler
+ * ============================================================================
+ * Copyright   : IMT Atlantique (FRANCE)
+ * License     : This program can be distributed under the terms of the GNU LGPL.
+ *               See the file COPYING.LESSER.
+ *
+ * Created     : Oct 19, 2026
+ * ---------------------------------------------------------------------------- */
+
+#ifndef __TEST_PROFILER_H__
+#define __TEST_PROFILER_H__
+
+#include <cppunit/TestFixture.h>
+#include <cppunit/extensions/HelperMacros.h>
+#include "utils.h"
+
+using namespace ibex;
+
+class TestProfiler : public CppUnit::TestFixture {
+public:
+
+	CPPUNIT_TEST_SUITE(TestProfiler);
+	CPPUNIT_TEST(disabled);
+	CPPUNIT_TEST(calls);
+	CPPUNIT_TEST(nested);
+	CPPUNIT_TEST(reset);
+	CPPUNIT_TEST(ctc_profiled);
+	CPPUNIT_TEST_SUITE_END();
+private:
+
+	void disabled();
+	void calls();
+	void nested();
+	void reset();
+	void ctc_profiled();
+};
+
+CPPUNIT_TEST_SUITE_REGISTRATION(TestProfiler);
+
+#endif // __TEST_PROFILER__
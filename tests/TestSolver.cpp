@@ -16,6 +16,9 @@
 #include "ibex_CellStack.h"
 #include "ibex_CtcHC4.h"
 #include "ibex_Manifold.h"
+#include "ibex_SolverOutputSink.h"
+
+#include <stdio.h>
 
 using namespace std;
 
@@ -188,5 +191,135 @@ void TestSolver::circle4() {
 	CPPUNIT_ASSERT(res==false);
 }
 
+namespace {
+
+class VectorSink : public SolverOutputSink {
+public:
+	VectorSink() : nb_start(0), nb_end(0) { }
+	void start(const Manifold&) { nb_start++; }
+	void add(const SolverOutputBox& sol) { sols.push_back(sol); }
+	void end(const Manifold&) { nb_end++; }
+
+	vector<SolverOutputBox> sols;
+	int nb_start, nb_end;
+};
+
+}
+
+void TestSolver::output_sink() {
+	const ExprSymbol& x=ExprSymbol::new_("x");
+	const ExprSymbol& y=ExprSymbol::new_("y");
+
+	SystemFactory f;
+	f.add_var(x);
+	f.add_var(y);
+	f.add_ctr(sqr(x)+sqr(y)=1);
+	f.add_ctr(x+y<=1);
+	System sys(f);
+	RoundRobin rr(1e-3);
+	CellStack stack;
+	CtcHC4 hc4(sys);
+	Vector prec(2,1e-3);
+	Vector prec_max(2,1e-1);
+	IntervalVector box(2,Interval(-10,10));
+
+	Solver solver(sys,hc4,rr,stack,prec,prec_max);
+	solver.solve(box);
+	const Manifold& manif=solver.get_manifold();
+
+	VectorSink sink;
+	Solver solver2(sys,hc4,rr,stack,prec,prec_max);
+	solver2.set_output_sink(&sink);
+	CPPUNIT_ASSERT(solver2.solve(box)==solver.get_manifold().status);
+
+	// the boxes are sent to the sink in the order they are found
+	CPPUNIT_ASSERT(sink.nb_start==1);
+	CPPUNIT_ASSERT(sink.nb_end==1);
+	CPPUNIT_ASSERT(solver2.get_manifold().size()==0);
+	CPPUNIT_ASSERT(sink.sols.size()==(size_t) manif.size());
+	CPPUNIT_ASSERT(solver2.get_nb_boxes(SolverOutputBox::INNER)==manif.inner.size());
+	CPPUNIT_ASSERT(solver2.get_nb_boxes(SolverOutputBox::BOUNDARY)==manif.boundary.size());
+
+	size_t i=0, j=0;
+	for (vector<SolverOutputBox>::const_iterator it=sink.sols.begin(); it!=sink.sols.end(); it++) {
+		if (it->status==SolverOutputBox::INNER)
+			CPPUNIT_ASSERT(it->existence()==manif.inner[i++].existence());
+		else {
+			CPPUNIT_ASSERT(it->status==SolverOutputBox::BOUNDARY);
+			CPPUNIT_ASSERT(it->existence()==manif.boundary[j++].existence());
+		}
+	}
+}
+
+void TestSolver::checkpoint() {
+	const ExprSymbol& x=ExprSymbol::new_("x");
+	const ExprSymbol& y=ExprSymbol::new_("y");
+
+	SystemFactory f;
+	f.add_var(x);
+	f.add_var(y);
+	f.add_ctr(sqr(x)+sqr(y)=1);
+	f.add_ctr(x+y<=1);
+	System sys(f);
+	RoundRobin rr(1e-3);
+	CellStack stack;
+	CtcHC4 hc4(sys);
+	Vector prec(2,1e-3);
+	Vector prec_max(2,1e-1);
+	IntervalVector box(2,Interval(-10,10));
+
+	const char* filename="solver_checkpoint.tmp";
+
+	// interrupted search
+	Solver solver(sys,hc4,rr,stack,prec,prec_max);
+	solver.start(box);
+	for (int i=0; i<5; i++)
+		CPPUNIT_ASSERT(solver.next()!=NULL);
+	CPPUNIT_ASSERT(!stack.empty());
+	solver.checkpoint(filename);
+
+	Manifold saved(2,1,1);
+	saved.load(filename);
+	CPPUNIT_ASSERT(saved.inner.size()==solver.get_nb_boxes(SolverOutputBox::INNER));
+	CPPUNIT_ASSERT(saved.boundary.size()==solver.get_nb_boxes(SolverOutputBox::BOUNDARY));
+	CPPUNIT_ASSERT(saved.pending.size()==stack.size());
+	CPPUNIT_ASSERT(saved.nb_cells==solver.get_nb_cells());
+	// the manifold of the solver is unchanged
+	CPPUNIT_ASSERT(solver.get_manifold().pending.empty());
+
+	// resumed search
+	Solver solver2(sys,hc4,rr,stack,prec,prec_max);
+	CPPUNIT_ASSERT(solver2.solve(filename,true)==Solver::SUCCESS);
+	const Manifold& manif=solver2.get_manifold();
+	CPPUNIT_ASSERT(manif.pending.empty());
+	CPPUNIT_ASSERT(manif.inner.size()>saved.inner.size());
+	CPPUNIT_ASSERT(manif.nb_cells==saved.nb_cells+solver2.get_nb_cells());
+
+	// the same solutions are found (the boxes may differ)
+	Solver solver3(sys,hc4,rr,stack,prec,prec_max);
+	solver3.solve(box);
+	for (vector<SolverOutputBox>::const_iterator it=solver3.get_manifold().inner.begin(); it!=solver3.get_manifold().inner.end(); it++) {
+		bool found=false;
+		for (vector<SolverOutputBox>::const_iterator it2=manif.inner.begin(); !found && it2!=manif.inner.end(); it2++)
+			found=it->existence().intersects(it2->existence());
+		for (vector<SolverOutputBox>::const_iterator it2=manif.boundary.begin(); !found && it2!=manif.boundary.end(); it2++)
+			found=it->existence().intersects(it2->existence());
+		CPPUNIT_ASSERT(found);
+	}
+
+	// the time limit bounds the total time, including the interrupted search
+	saved.time=10;
+	saved.write(filename);
+	Solver solver4(sys,hc4,rr,stack,prec,prec_max);
+	solver4.time_limit=5;
+	CPPUNIT_ASSERT(solver4.solve(filename,true)==Solver::TIME_OUT);
+
+	// but not if the file is just an input paving
+	Solver solver5(sys,hc4,rr,stack,prec,prec_max);
+	solver5.time_limit=5;
+	CPPUNIT_ASSERT(solver5.solve(filename)==Solver::SUCCESS);
+
+	remove(filename);
+}
 
 } // end namespace
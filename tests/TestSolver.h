@@ -28,12 +28,16 @@ public:
 	CPPUNIT_TEST(circle2);
 	CPPUNIT_TEST(circle3);
 	CPPUNIT_TEST(circle4);
+	CPPUNIT_TEST(output_sink);
+	CPPUNIT_TEST(checkpoint);
 	CPPUNIT_TEST_SUITE_END();
 
 	void circle1();
 	void circle2();
 	void circle3();
 	void circle4();
+	void output_sink();
+	void checkpoint();
 };
 
 CPPUNIT_TEST_SUITE_REGISTRATION(TestSolver);
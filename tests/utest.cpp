@@ -7,15 +7,79 @@
  *
  * Author(s)   : Gilles Chabert
  * Created     : Dec 07, 2011
+ * Last update : Oct 19, 2026
  * ---------------------------------------------------------------------------- */
 
 #include <cppunit/ui/text/TestRunner.h>
 #include <cppunit/extensions/TestFactoryRegistry.h>
+#include <cppunit/TestResult.h>
+#include <cppunit/TestResultCollector.h>
+#include <cppunit/TextTestProgressListener.h>
+#include <cppunit/TextOutputter.h>
 
-int main() {
-	CppUnit::TextUi::TestRunner runner;
+#include <iostream>
+#include <stdexcept>
+#include <string.h>
+
+namespace {
+
+// print the name of all the test cases (leaves of the test tree)
+void list(CppUnit::Test* test) {
+	if (test->getChildTestCount()==0)
+		std::cout << test->getName() << std::endl;
+	else
+		for (int i=0; i<test->getChildTestCount(); i++)
+			list(test->getChildTestAt(i));
+}
+
+}
+
+/*
+ * Usage:
+ *   utest            run all the test cases
+ *   utest --list     print the name of all the test cases, one per line
+ *   utest name...    run only the given test cases (e.g., TestInterval::hull01)
+ */
+int main(int argc, char** argv) {
 	CppUnit::TestFactoryRegistry &registry = CppUnit::TestFactoryRegistry::getRegistry();
-	runner.addTest( registry.makeTest() );
-	bool wasSuccessful = runner.run( "", false );
+
+	if (argc==1) {
+		CppUnit::TextUi::TestRunner runner;
+		runner.addTest( registry.makeTest() );
+		bool wasSuccessful = runner.run( "", false );
+		return !wasSuccessful;
+	}
+
+	CppUnit::Test* root = registry.makeTest();
+
+	if (argc==2 && strcmp(argv[1],"--list")==0) {
+		list(root);
+		delete root;
+		return 0;
+	}
+
+	CppUnit::TestResult controller;
+	CppUnit::TestResultCollector result;
+	controller.addListener(&result);
+	CppUnit::TextTestProgressListener progress;
+	controller.addListener(&progress);
+
+	for (int i=1; i<argc; i++) {
+		CppUnit::Test* test;
+		try {
+			test = root->findTest(argv[i]);
+		} catch(std::invalid_argument&) {
+			std::cerr << "No test named " << argv[i] << std::endl;
+			delete root;
+			return 2;
+		}
+		controller.runTest(test);
+	}
+
+	CppUnit::TextOutputter outputter(&result, std::cout);
+	outputter.write();
+
+	bool wasSuccessful = result.wasSuccessful();
+	delete root;
 	return !wasSuccessful;
 }
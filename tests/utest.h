@@ -7,11 +7,12 @@
  *
  * Author(s)   : Gilles Chabert
  * Created     : Dec 07, 2011
+ * Last update : Oct 19, 2026
  * ---------------------------------------------------------------------------- */
 
 #ifndef UTEST_H_
 #define UTEST_H_
 
-int main();
+int main(int argc, char** argv);
 
 #endif /* UTEST_H_ */
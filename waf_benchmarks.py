@@ -1,8 +1,15 @@
-import os, sys, re, math, shutil, collections, logging, math
+import os, sys, re, math, shutil, collections, logging, math, array
 import ibexutils
-from waflib import TaskGen, Task, Utils, Configure, Build, Logs, Errors
+from waflib import TaskGen, Task, Utils, Configure, Build, Logs, Errors, Context
 benchlock = Utils.threading.Lock()
 
+# numpy is optional: if available, it is used to aggregate the columns of the
+# result tables, else pure python is used.
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
 BENCHS_DEFAULT_ARGS = {"time_limit": "5", "prec_ndigits_max": "6",
                        "prec_ndigits_min": "1", "iter": "3"}
 BENCHS_ARGS_NAME = BENCHS_DEFAULT_ARGS.keys()
@@ -11,6 +18,18 @@ BENCHS_ARGS_FORMAT = " ; ".join("%s = {%s}" % (k, k) for k in BENCHS_ARGS_NAME)
 BENCHS_INSTABLE_FACTOR = 2
 BENCHS_CMP_REGRESSION_FACTOR = 1.05
 BENCHS_CMP_IMPROVMENT_FACTOR = 1/BENCHS_CMP_REGRESSION_FACTOR
+BENCHS_PROFILE_NB_HOT_FUNCTIONS = 20
+BENCHS_PGO_REF_FILE = "benchmarks.pgo_ref.txt"
+# Components of ibex whose share of the samples is reported when profiling. A
+# sample is attributed to a component if one of the frames of its stack matches
+# the regular expression.
+BENCHS_PROFILE_COMPONENTS = collections.OrderedDict ()
+BENCHS_PROFILE_COMPONENTS["HC4Revise"] = "HC4Revise"
+BENCHS_PROFILE_COMPONENTS["LoupFinder"] = "LoupFinder"
+BENCHS_PROFILE_COMPONENTS["LP"] = "LPSolver|LPWrapper|soplex|Clp|CPX"
+BENCHS_PROFILE_COMPONENTS["Cell buffer"] = "CellHeap|CellDoubleHeap|CellBeamSearch|SharedHeap|DoubleHeap|CellStack"
+BENCHS_PROFILE_COMPONENTS["Bisector"] = "ibex::(Bsc|LSmear|SmearFunction|RoundRobin|LargestFirst)"
+BENCHS_PROFILE_COMPONENTS["Contractor"] = "ibex::Ctc"
 
 class BenchRef (object):
 	def __init__ (self, string, hash_salt):
@@ -55,7 +74,7 @@ class Bench (Task.Task):
 
 # Class for the task that run the benchmark
 class BenchRun (Bench):
-	run_str = "${BCH_PRECMD} ${SRC[0]} %s --bench-file ${SRC[1]} > ${TGT[0]} 2>&1" % (" ".join("--%s ${BCH_%s}" % (k.replace("_", "-"), k.upper()) for k in BENCHS_ARGS_NAME))
+	run_str = "${BCH_PRECMD} ${SRC[0]} %s --bench-file ${SRC[1]} ${BCH_FLAGS} > ${TGT[0]} 2>&1" % (" ".join("--%s ${BCH_%s}" % (k.replace("_", "-"), k.upper()) for k in BENCHS_ARGS_NAME))
 
 	def __str__ (self):
 		return self.inputs[1].path_from (self.inputs[1].ctx.launch_node())
@@ -63,6 +82,14 @@ class BenchRun (Bench):
 	def keyword (self):
 		return "Benchmarking"
 
+# Class for the task that run the benchmark under a sampling profiler (perf or
+# callgrind). The second output is the raw data file of the profiler.
+class BenchProfileRun (BenchRun):
+	run_str = "${BCH_PRECMD} ${BCH_PROFILER} ${BCH_PROFILER_OUTFLAG}=${TGT[1]} ${BCH_PROFILER_SEP} ${SRC[0]} %s --bench-file ${SRC[1]} ${BCH_FLAGS} > ${TGT[0]} 2>&1" % (" ".join("--%s ${BCH_%s}" % (k.replace("_", "-"), k.upper()) for k in BENCHS_ARGS_NAME))
+
+	def keyword (self):
+		return "Profiling"
+
 # Class for the task that parses the output of the benchmark and produces a
 # .data file
 class BenchData (Bench):
@@ -78,21 +105,36 @@ class BenchData (Bench):
 	RESULTS_PATTERN = "(%s) = (.*)" % "|".join(KEYS_TYPE.keys())
 	RESULTS_RE = re.compile (RESULTS_PATTERN)
 	RESULTS_FORMAT = PREFIX + " ; ".join("%s = {%s}" % (k,k) for k in KEYS_TYPE.keys())
+	# Optional keys: time and number of calls of each phase/component of the
+	# optimizer (see Optimizer::profiler, only with --benchs-phase-counters)
+	# and cell buffer statistics (see Optimizer::buffer_stats, only with
+	# --benchs-buffer-stats)
+	EXTRA_KEYS_PATTERN = "((?:time|calls|buffer)_\\w+) = (.*)"
+	EXTRA_KEYS_RE = re.compile (EXTRA_KEYS_PATTERN)
 
 	@classmethod
 	def parse_bench_line (cls, line):
 		if line.startswith (cls.PREFIX):
-			D = {}
+			D = collections.OrderedDict ()
 			line = line[len(cls.PREFIX):]
 			for part in line.split (" ; "):
 				m = cls.RESULTS_RE.match (part)
+				mx = cls.EXTRA_KEYS_RE.match (part)
 				if m:
 					k = str(m.group(1))
 					D[k] = cls.KEYS_TYPE[k](m.group(2))
+				elif mx:
+					D[str(mx.group(1))] = float(mx.group(2))
 			return D
 		else:
 			return None
 
+	@classmethod
+	def format_bench_line (cls, D):
+		L = [ cls.RESULTS_FORMAT.format (**D) ]
+		L.extend ("%s = %s" % (k, v) for k, v in D.items() if not k in cls.KEYS_TYPE)
+		return " ; ".join (L)
+
 	def run (self):
 		# Get the data and write the data file from the results_file
 		data = []
@@ -113,13 +155,151 @@ class BenchData (Bench):
 			# Add the result of the current bench file
 			cur_bench_results = self.generator.bld.bench_results[BenchCurrentRef()]
 			k = self.inputs[0].change_ext('').relpath()
-			cur_bench_results[self.generator.name]["data"][k] = data
+			cur_bench_results[self.generator.name]["data"].extend (k, data)
 		finally:
 			benchlock.release()
 
 	def keyword (self):
 		return "Parsing results from"
 
+# Columnar storage of the results of the benchmarks of one group. Each key of
+# BenchData.KEYS_TYPE is stored in its own array of doubles (missing values are
+# NaN) and the rows are indexed by file and by eps, so that aggregations never
+# need to rescan the whole table.
+class ResultTable (object):
+	KEYS_TYPE = BenchData.KEYS_TYPE
+
+	def __init__ (self):
+		self.columns = collections.OrderedDict ()
+		for k in self.KEYS_TYPE.keys():
+			self.columns[k] = array.array ("d")
+		self.index = collections.OrderedDict () # file -> { eps: [rows] }
+
+	def __len__ (self):
+		return len (self.columns["eps"])
+
+	def __contains__ (self, filename):
+		return filename in self.index
+
+	def add_file (self, filename):
+		if not filename in self.index:
+			self.index[filename] = collections.OrderedDict ()
+		return self.index[filename]
+
+	def append (self, filename, row):
+		eps_index = self.add_file (filename)
+		i = len (self)
+		for k in row.keys():
+			if not k in self.columns: # optional key seen for the first time
+				self.columns[k] = array.array ("d", [ float ("NaN") ] * i)
+		for k, col in self.columns.items():
+			col.append (float (row.get (k, "NaN")))
+		eps_index.setdefault (self.columns["eps"][i], []).append (i)
+
+	def extend (self, filename, rows):
+		self.add_file (filename)
+		for row in rows:
+			self.append (filename, row)
+
+	def files (self):
+		return list (self.index.keys())
+
+	# Return the optional keys (see BenchData.EXTRA_KEYS_PATTERN)
+	def extra_keys (self):
+		return [ k for k in self.columns.keys() if not k in self.KEYS_TYPE ]
+
+	# Return the values of eps for the given file, in decreasing order
+	def eps (self, filename):
+		return sorted (self.index.get (filename, {}).keys(), reverse = True)
+
+	# Return the indices of the rows of the given file. If eps is not None, only
+	# rows with a value of eps at distance at most tol from eps are returned.
+	def rows_index (self, filename, eps = None, tol = 0.0):
+		eps_index = self.index.get (filename, {})
+		if eps is None:
+			return sorted (i for L in eps_index.values() for i in L)
+		elif tol == 0.0:
+			return eps_index.get (eps, [])
+		else:
+			return sorted (i for e, L in eps_index.items() if abs(e-eps) <= tol
+			                 for i in L)
+
+	def column (self, key, rows):
+		col = self.columns[key]
+		if numpy is None:
+			return [ col[i] for i in rows ]
+		else:
+			return numpy.frombuffer (col, dtype = numpy.float64)[rows]
+
+	# Return the rows of the given file as a list of dicts
+	def rows (self, filename):
+		L = []
+		for i in self.rows_index (filename):
+			D = collections.OrderedDict ()
+			for k, t in self.KEYS_TYPE.items():
+				v = self.columns[k][i]
+				D[k] = v if math.isnan (v) else t(v)
+			for k in self.extra_keys():
+				v = self.columns[k][i]
+				if not math.isnan (v):
+					D[k] = v
+			L.append (D)
+		return L
+
+	# Return (min, mean, max) of the column 'key' for the given file and eps (see
+	# rows_index), missing values (NaN) are ignored. Return None if there is no
+	# such row.
+	def aggregate (self, filename, key, eps = None, tol = 0.0):
+		rows = self.rows_index (filename, eps, tol)
+		if not rows or not key in self.columns:
+			return None
+		values = self.column (key, rows)
+		if numpy is None:
+			values = [ v for v in values if not math.isnan (v) ]
+			if not values:
+				return None
+			return (min (values), sum (values)/len (values), max (values))
+		else:
+			values = values[~numpy.isnan (values)]
+			if len (values) == 0:
+				return None
+			return (values.min(), values.mean(), values.max())
+
+	# Return (min, mean, max) of the column 'key' for each eps of the given file,
+	# as a list of (eps, (min, mean, max)) with eps in decreasing order.
+	def aggregate_by_eps (self, filename, key):
+		return [ (eps, self.aggregate (filename, key, eps))
+		                                          for eps in self.eps (filename) ]
+
+	# Return the interval [uplo, loup] of the given file: the maximum of the uplo
+	# column and the minimum of the loup column.
+	def uplo_loup (self, filename):
+		uplo = self.aggregate (filename, "uplo")
+		loup = self.aggregate (filename, "loup")
+		return (uplo[2] if uplo else float ("NaN"), loup[0] if loup else float ("NaN"))
+
+	# Return, for each eps common to the given file in both tables, the ratios
+	# min(time1)/max(time0) and max(time1)/min(time0) as a list of dicts with the
+	# keys of BenchCmp.KEYS_TYPE, with eps in decreasing order. The ratios are NaN
+	# if all the times of a table are NaN.
+	@staticmethod
+	def time_ratios (table0, table1, filename):
+		L = []
+		eps1 = set (table1.eps (filename))
+		for eps in table0.eps (filename):
+			if eps in eps1:
+				t0 = table0.aggregate (filename, "time", eps)
+				t1 = table1.aggregate (filename, "time", eps)
+				if t0 is None or t1 is None:
+					nan = float ("NaN")
+					L.append ({ "eps": eps, "rm1M0": nan, "rM1m0": nan })
+					continue
+				m0, _, M0 = t0
+				m1, _, M1 = t1
+				# we always have rm1M0 < rM1m0
+				L.append ({ "eps": eps, "rm1M0": m1/M0, "rM1m0": M1/m0 })
+		return L
+
 # Class for the task that generates the graph from the .data file
 class BenchGraph (Bench):
 	run_str = "${BCH_PRECMD} ${GNUPLOT} -e ${tsk.eargs()} ${BCH_GRAPHFILE}"
@@ -156,13 +336,15 @@ class BenchSummary (BenchData):
 
 		strargs = BENCHS_ARGS_FORMAT.format (**results["args"])
 		lst = [ "##### Group: %s [ %s ]" % (groupname, strargs) ]
-		for k, d in results["data"].items():
+		table = results["data"]
+		for k in table.files():
 			lst.append("### File: %s" % k)
-			for m in d:
-				lst.append (self.RESULTS_FORMAT.format (**m))
+			for m in table.rows (k):
+				lst.append (self.format_bench_line (m))
+			if len (table.rows_index (k)) == 0:
+				continue
 			# check [uplo, loup] interval
-			uplo = max (d["uplo"] for d in d)
-			loup = min (d["loup"] for d in d)
+			uplo, loup = table.uplo_loup (k)
 			if uplo > loup:
 				err_fmt = "empty [uplo, loup] interval for %s:" + os.linesep
 				err_fmt += "    * group '%s'" + os.linesep
@@ -201,30 +383,19 @@ class BenchCmp (Bench):
 		outstr = "####### data0 from %s" % self.k0 + os.linesep
 		outstr += "####### data1 from %s" % self.k1 + os.linesep
 		outstr += "##### Group: %s" % self.generator.name + os.linesep
-		for f in set(self.data0.keys()) & set(self.data1.keys()):
-			data = []
+		for f in set(self.data0.files()) & set(self.data1.files()):
 			outstr += "### File: %s" % f + os.linesep
-			fdata0 = self.data0[f]
-			fdata1 = self.data1[f]
-			eps0 = set(d["eps"] for d in fdata0)
-			eps1 = set(d["eps"] for d in fdata1)
-			for eps in reversed(sorted(eps0 | eps1)):
-				time0 = set (d["time"] for d in fdata0 if d["eps"] == eps)
-				time1 = set (d["time"] for d in fdata1 if d["eps"] == eps)
-				rm1M0 = min(time1)/max(time0)
-				rM1m0 = max(time1)/min(time0)
-				# we always have rm1M0 < rM1m0
-				data.append ( { "eps": eps, "rm1M0": rm1M0, "rM1m0": rM1m0 } )
+			data = ResultTable.time_ratios (self.data0, self.data1, f)
 
 			outstr += os.linesep.join (self.CMP_FORMAT.format (**d) for d in data)
 			outstr += os.linesep
 			bench_cmp[groupname][f] = data
 
+			if not self.data0.rows_index (f) or not self.data1.rows_index (f):
+				continue
 			# check intersection of [uplo, loup]
-			uplo0 = max (d["uplo"] for d in fdata0)
-			loup0 = min (d["loup"] for d in fdata0)
-			uplo1 = max (d["uplo"] for d in fdata1)
-			loup1 = min (d["loup"] for d in fdata1)
+			uplo0, loup0 = self.data0.uplo_loup (f)
+			uplo1, loup1 = self.data1.uplo_loup (f)
 			if uplo1 > loup0 or uplo0 > loup1:
 				err_fmt = "[uplo, loup] intervals do not intersect:" + os.linesep
 				err_fmt += "    * group '%s'" + os.linesep
@@ -242,21 +413,19 @@ class BenchCmp (Bench):
 
 # Class for the task that generates the scatter plot for comparison
 class BenchScatterPlotData (Bench):
-	def get_time (self, L):
-		T = [ l for l in L if abs(l["eps"]-self.eps) <= 1e-6 ]
-		if len(T) == 0:
+	def get_time (self, table, filename):
+		T = table.aggregate (filename, "time", self.eps, tol = 1e-6)
+		if T is None:
 			return self.env.BCH_TIME_LIMIT
 		else:
-			return max(t["time"] for t in T)
+			return T[2]
 
 	def run (self):
 		groupname = self.generator.name
 		outstr = "benchfile %s %s" % (self.k0, self.k1) + os.linesep
-		for f in set(self.data0.keys()) & set(self.data1.keys()):
-			fdata0 = self.data0[f]
-			fdata1 = self.data1[f]
-			t0 = self.get_time (fdata0)
-			t1 = self.get_time (fdata1)
+		for f in set(self.data0.files()) & set(self.data1.files()):
+			t0 = self.get_time (self.data0, f)
+			t1 = self.get_time (self.data1, f)
 			outstr += "%s %s %s" % (f, t0, t1) + os.linesep
 		self.outputs[0].write (outstr)
 
@@ -277,6 +446,150 @@ class BenchScatterPlotGraph (BenchGraph):
 		L.extend("%s='%s'"%(k,self.env["BCH_"+k.upper()]) for k in BENCHS_ARGS_NAME)
 		return (";".join (L)).replace (" ", "\_") # spaces break the command line
 
+# Fold the output of 'perf script' into a Counter of stacks. A stack is a
+# string of function names separated by ';', starting from the root.
+def profile_fold_perf (text):
+	stacks = collections.Counter ()
+	frames = []
+	for l in text.splitlines() + [ "" ]:
+		if not l.strip():
+			if frames:
+				stacks[";".join (reversed (frames))] += 1
+			frames = []
+		elif l[0].isspace(): # a frame: "addr symbol+offset (dso)"
+			parts = l.strip().split (None, 1)
+			sym = parts[1] if len (parts) > 1 else "[unknown]"
+			sym = sym.rsplit (" (", 1)[0]
+			sym = re.sub ("\\+0x[0-9a-f]+$", "", sym)
+			frames.append (sym.replace (";", ":"))
+	return stacks
+
+# Fold the output file of callgrind into a Counter of stacks. Callgrind only
+# records caller/callee pairs, not full stacks, so each "stack" is a single
+# function and the count is the self cost (first event, usually Ir).
+def profile_fold_callgrind (text):
+	stacks = collections.Counter ()
+	names = {}
+	def name (s):
+		m = re.match ("^\\((\\d+)\\)(?: (.*))?$", s)
+		if m is None:
+			return s
+		elif m.group(2) is not None:
+			names[m.group(1)] = m.group(2)
+		return names.get (m.group(1), s)
+
+	fn = None
+	after_calls = False
+	for l in text.splitlines():
+		if l.startswith ("fn="):
+			fn = name (l[3:]).replace (";", ":")
+		elif l.startswith ("cfn="):
+			name (l[4:]) # only to record the compressed name
+		elif l.startswith ("calls="):
+			after_calls = True
+		elif l and (l[0].isdigit() or l[0] in "+-*") and fn is not None:
+			if after_calls: # inclusive cost of the call, not a self cost
+				after_calls = False
+			else:
+				costs = l.split()
+				if len (costs) > 1:
+					stacks[fn] += int (costs[1])
+	return stacks
+
+# Return (total, self, inclusive) where total is the total number of samples,
+# self (resp. inclusive) is a Counter of the number of samples where a function
+# is the leaf (resp. is anywhere in the stack).
+def profile_hot_functions (stacks):
+	total = 0
+	self_count = collections.Counter ()
+	incl_count = collections.Counter ()
+	for stack, n in stacks.items():
+		frames = stack.split (";")
+		total += n
+		self_count[frames[-1]] += n
+		for f in set (frames):
+			incl_count[f] += n
+	return total, self_count, incl_count
+
+# Return the number of samples attributed to each of BENCHS_PROFILE_COMPONENTS
+def profile_components (stacks):
+	res = collections.OrderedDict ((c, 0) for c in BENCHS_PROFILE_COMPONENTS)
+	regexps = [ (c, re.compile (r)) for c, r in BENCHS_PROFILE_COMPONENTS.items() ]
+	for stack, n in stacks.items():
+		for c, r in regexps:
+			if r.search (stack):
+				res[c] += n
+	return res
+
+def profile_format_table (title, stacks, nb = BENCHS_PROFILE_NB_HOT_FUNCTIONS):
+	total, self_count, incl_count = profile_hot_functions (stacks)
+	lst = [ "##### Profile: %s (%d samples)" % (title, total) ]
+	if total == 0:
+		return lst
+	lst.append ("### Components (inclusive)")
+	for c, n in profile_components (stacks).items():
+		lst.append ("%6.2f%%  %s" % (100.0*n/total, c))
+	lst.append ("### Hot functions (self, inclusive)")
+	for f, n in self_count.most_common (nb):
+		lst.append ("%6.2f%% %6.2f%%  %s" % (100.0*n/total, 100.0*incl_count[f]/total, f))
+	return lst
+
+def profile_write_folded (node_or_path, stacks):
+	s = os.linesep.join ("%s %d" % (k, n) for k, n in sorted (stacks.items()))
+	if isinstance (node_or_path, str):
+		with open (node_or_path, "w") as f:
+			f.write (s + os.linesep)
+	else:
+		node_or_path.write (s + os.linesep)
+
+# Class for the task that folds the stacks of the raw data of the profiler and
+# produces a .folded file (the input format of flame graphs)
+class BenchProfileFold (Bench):
+	def run (self):
+		bld = self.generator.bld
+		if bld.profiler == "perf":
+			cmd = self.env.PERF + [ "script", "-i", self.inputs[0].abspath() ]
+			out = bld.cmd_and_log (cmd, quiet = Context.BOTH)
+			stacks = profile_fold_perf (ibexutils.to_unicode (out))
+		else:
+			text = ibexutils.to_unicode (self.inputs[0].read())
+			stacks = profile_fold_callgrind (text)
+		profile_write_folded (self.outputs[0], stacks)
+
+		benchlock.acquire()
+		try:
+			k = self.inputs[0].change_ext('').relpath()
+			group_profiles = bld.bench_profiles.setdefault (self.generator.name, {})
+			group_profiles[k] = stacks
+		finally:
+			benchlock.release()
+
+	def keyword (self):
+		return "Folding profile from"
+
+# Class for the task that aggregates the profiles of all files of a group. The
+# first output is the table of hot functions, the second one the folded stacks.
+class BenchProfileSummary (Bench):
+	def run (self):
+		groupname = self.generator.name
+		stacks = collections.Counter ()
+		for k, s in self.generator.bld.bench_profiles.get (groupname, {}).items():
+			stacks.update (s)
+
+		lst = profile_format_table ("group %s" % groupname, stacks)
+		self.outputs[0].write (os.linesep.join (lst) + os.linesep)
+		profile_write_folded (self.outputs[1], stacks)
+
+	def keyword (self):
+		return "Writing profile of '%s' into" % self.generator.name
+
+# Class for the task that generates a flame graph from a .folded file
+class BenchFlameGraph (Bench):
+	run_str = "${FLAMEGRAPH} ${SRC[0]} > ${TGT[0]}"
+
+	def keyword (self):
+		return "Generating flame graph from"
+
 @Configure.conf
 def parse_summary_file (bch, filename):
 	# deactivate logger for this function
@@ -295,14 +608,16 @@ def parse_summary_file (bch, filename):
 				mf = filematch.match (l)
 				if ms:
 					curgroup = str(ms.group(1))
-					data[curgroup] = {"args": {}, "data": {}}
+					data[curgroup] = {"args": {}, "data": ResultTable()}
 					for k, v in ms.groupdict().items():
 						data[curgroup]["args"][str(k)] = str(v)
 				elif mf:
 					curfile = str(mf.group(1))
-					data[curgroup]["data"][curfile] = []
+					data[curgroup]["data"].add_file (curfile)
 				else:
-					data[curgroup]["data"][curfile].append (BenchData.parse_bench_line(l))
+					D = BenchData.parse_bench_line (l)
+					if not D is None:
+						data[curgroup]["data"].append (curfile, D)
 	except UnboundLocalError:
 		bch.end_msg ("error, the file is not correctly formatted", color="RED")
 		return 1
@@ -340,7 +655,7 @@ def benchmarks_process_options (self):
 			self.bld.bench_results[BenchCurrentRef()] = {}
 
 		# Create the dict for the current group
-		group_dict = { "args": args, "data": {} }
+		group_dict = { "args": args, "data": ResultTable() }
 		self.bld.bench_results[BenchCurrentRef()][self.name] = group_dict
 
 	# Get the name of the binary used for benchmarking: this is given by the
@@ -373,6 +688,19 @@ def benchmarks_gather_data (self):
 		for t in prev_tasks:
 			tsk.set_run_after (t)
 
+		# Profile of the group
+		if self.bld.profile:
+			proflogdata = (self.name, "profile", "log")
+			proflognode = self.bld.bldnode.make_node (filenameformat % proflogdata)
+			folddata = (self.name, "profile", "folded")
+			foldnode = self.bld.bldnode.make_node (filenameformat % folddata)
+			tsk = self.create_task ('BenchProfileSummary', [], [proflognode, foldnode])
+			for t in prev_tasks:
+				tsk.set_run_after (t)
+			if self.env.FLAMEGRAPH:
+				svgnode = foldnode.change_ext ('.svg')
+				self.create_task ('BenchFlameGraph', foldnode, svgnode)
+
 	# Comparison
 	cmp_key_set = set()
 	for cmp_key, cmp_data in self.bld.bench_results.items():
@@ -434,7 +762,16 @@ def add_bch (self, node):
 	if not self.bld.cmp_only:
 		# Create the task that run the bench
 		resnode = node.change_ext ('.bench_result', '.bch')
-		self.create_task ('BenchRun', [self.bintask.outputs[0], node], resnode)
+		if self.bld.profile:
+			profnode = node.change_ext ('.%s' % self.bld.profiler, '.bch')
+			outputs = [ resnode, profnode ]
+			self.create_task ('BenchProfileRun', [self.bintask.outputs[0], node], outputs)
+
+			# Create the task that fold the stacks of the profile
+			foldnode = node.change_ext ('.folded', '.bch')
+			self.create_task ('BenchProfileFold', profnode, foldnode)
+		else:
+			self.create_task ('BenchRun', [self.bintask.outputs[0], node], resnode)
 
 		# Create the task that parse the result
 		datanode = node.change_ext ('.data', '.bch')
@@ -459,18 +796,34 @@ def benchmarks_format_output (bch):
 			bch.msg ("===== %s =====" % groupname, "==========", color = "NORMAL")
 			for k,v in groupdict["args"].items():
 				bch.msg ("args: %s" % k, v, color = "NORMAL")
-			for f, data in sorted(groupdict["data"].items(), key = lambda x:x[0]):
+			table = groupdict["data"]
+			for f in sorted(table.files()):
 				bch.msg (f, "  min      av      max", color = "CYAN")
-				for eps in reversed(sorted(set(d["eps"] for d in data))):
-					eps_data = set (d["time"] for d in data if d["eps"] == eps)
-					m = min (eps_data)
-					M = max (eps_data)
-					av = sum (eps_data)/len(eps_data)
+				for eps, (m, av, M) in table.aggregate_by_eps (f, "time"):
 					if M/m > BENCHS_INSTABLE_FACTOR:
 						c = "YELLOW"
 					else:
 						c = "NORMAL"
 					bch.msg ("  eps = %.1e" % eps, "%.2e %.2e %.2e" % (m, av, M), color=c)
+				# mean time and number of calls of each phase/component, if any
+				for k in table.extra_keys():
+					if k.startswith ("time_"):
+						name = k[len("time_"):]
+						T = table.aggregate (f, k)
+						N = table.aggregate (f, "calls_" + name)
+						if T is None:
+							continue
+						msg_e = "%.2e" % T[1]
+						if not N is None:
+							msg_e += " (%d calls)" % N[1]
+						bch.msg ("  %s" % name, msg_e, color = "NORMAL")
+				# mean of the cell buffer statistics, if any
+				for k in table.extra_keys():
+					if k.startswith ("buffer_"):
+						B = table.aggregate (f, k)
+						if not B is None:
+							bch.msg ("  %s" % k, "%.3g (max %.3g)" % (B[1], B[2]),
+							         color = "NORMAL")
 
 	for k, D in bch.bench_cmp.items():
 		bch.msg ("", "", color="NORMAL")
@@ -492,6 +845,31 @@ def benchmarks_format_output (bch):
 						c = "NORMAL"
 					bch.msg (msg_s, msg_e, color = c)
 
+	if bch.profile:
+		stacks = collections.Counter ()
+		for groupname, group_profiles in sorted(bch.bench_profiles.items()):
+			for f, s in group_profiles.items():
+				stacks.update (s)
+		lst = profile_format_table ("all groups", stacks)
+		proflog = os.path.join (bch.bldnode.abspath(), "benchmarks.profile.log")
+		with open (proflog, "w") as f:
+			f.write (os.linesep.join (lst) + os.linesep)
+		foldfile = os.path.join (bch.bldnode.abspath(), "benchmarks.profile.folded")
+		profile_write_folded (foldfile, stacks)
+		if bch.env.FLAMEGRAPH:
+			svgfile = foldfile[:-len(".folded")] + ".svg"
+			cmd = " ".join (bch.env.FLAMEGRAPH + [ foldfile, ">", svgfile ])
+			if bch.exec_command (cmd):
+				Logs.warn ("Could not generate flame graph %s" % svgfile)
+
+		bch.msg ("", "", color="NORMAL")
+		bch.msg ("##### Profile #####", "##########", color = "NORMAL")
+		bch.msg ("profiler", bch.profiler, color = "NORMAL")
+		bch.msg ("hot functions", proflog, color = "NORMAL")
+		bch.msg ("folded stacks", foldfile, color = "NORMAL")
+		for l in lst[1:]:
+			Logs.pprint ("NORMAL", l)
+
 	if bch.bench_errors:
 		sep = os.linesep + "  - "
 		bch.fatal (sep.join (["Benchmarks errors:"] + bch.bench_errors))
@@ -541,6 +919,24 @@ def options (opt):
 	                dest = "BENCHS_WITH_GRAPHS")
 	grp.add_option ("--benchs-precmd", action = "store", dest = 'BENCHS_PRECMD',
 	                help = "Prefix the benchmarks command with this string")
+	grp.add_option ("--benchs-buffer-stats", action = "store_true",
+	                help = "Report cell buffer statistics (size, memory, depth, "
+	                       "pushed/popped/contracted cells)",
+	                dest = "BENCHS_BUFFER_STATS")
+	grp.add_option ("--benchs-phase-counters", action = "store_true",
+	                help = "Report the time and number of calls of each phase/"
+	                       "component of the optimizer (this perturbs the "
+	                       "reported times)",
+	                dest = "BENCHS_PHASE_COUNTERS")
+	grp.add_option ("--benchs-profile", action = "store_true",
+	                help = "Profile the benchmarks (with perf if available, else "
+	                       "with callgrind) and aggregate the hot functions",
+	                dest = "BENCHS_PROFILE")
+	grp.add_option ("--pgo-train", help = "Categories of the benchmarks used to "
+	                "train the profile-guided optimization (see 'waf pgo') [ "
+	                "default: easy ]", action = "callback",
+	                callback = parse_cat_callback, type = str, default = ["easy"],
+	                dest = "PGO_TRAIN")
 
 ######################
 ##### configure ######
@@ -548,6 +944,11 @@ def options (opt):
 def configure (conf):
 	conf.find_program ("gnuplot", var = "GNUPLOT", mandatory = False)
 
+	# Sampling profilers used by --benchs-profile
+	conf.find_program ("perf", var = "PERF", mandatory = False)
+	conf.find_program ("valgrind", var = "VALGRIND", mandatory = False)
+	conf.find_program ("flamegraph.pl", var = "FLAMEGRAPH", mandatory = False)
+
 ######################
 ##### benchmarks #####
 ######################
@@ -605,3 +1006,47 @@ def benchmarks (bch):
 	# We need GNUPLOT to generate graphs
 	if bch.with_graphs and not bch.env.GNUPLOT:
 		bch.fatal ("gnuplot is required for the option '--benchs-with-graphs'")
+
+	# Handle --benchs-buffer-stats option
+	if bch.options.BENCHS_BUFFER_STATS:
+		bch.env.append_value ("BCH_FLAGS", "--buffer-stats")
+
+	# Handle --benchs-phase-counters option
+	if bch.options.BENCHS_PHASE_COUNTERS:
+		bch.env.append_value ("BCH_FLAGS", "--phase-counters")
+
+	# Handle --benchs-profile option
+	bch.profile = bch.options.BENCHS_PROFILE and not bch.cmp_only
+	if bch.profile:
+		if bch.env.PERF:
+			bch.profiler = "perf"
+			bch.env.BCH_PROFILER = bch.env.PERF + [ "record", "-g" ]
+			bch.env.BCH_PROFILER_OUTFLAG = "--output"
+			bch.env.BCH_PROFILER_SEP = "--"
+		elif bch.env.VALGRIND:
+			bch.profiler = "callgrind"
+			bch.env.BCH_PROFILER = bch.env.VALGRIND + [ "--tool=callgrind" ]
+			bch.env.BCH_PROFILER_OUTFLAG = "--callgrind-out-file"
+			bch.env.BCH_PROFILER_SEP = ""
+		else:
+			bch.fatal ("perf or valgrind is required for the option '--benchs-profile'")
+
+	# Stages of the profile-guided optimization (see 'pgo' in the main wscript):
+	# the results of the reference stage are saved and compared with the ones of
+	# the optimized library.
+	bch.pgo_stage = getattr (bch, "pgo_stage", None)
+	if bch.pgo_stage:
+		if bch.cmp_only:
+			bch.fatal ("--benchs-cmp-only cannot be used with the 'pgo' command")
+		bch.profile = False
+		reffile = os.path.join (bch.bldnode.abspath(), BENCHS_PGO_REF_FILE)
+		if bch.pgo_stage == "off":
+			if os.path.exists (reffile):
+				os.remove (reffile)
+			bch.savefile = reffile
+		elif bch.pgo_stage == "generate":
+			bch.categories = bch.options.PGO_TRAIN
+			bch.savefile = None
+			bch.bench_results = {} # no comparison for the training
+		elif not os.path.isfile (reffile) or bch.parse_summary_file (reffile) != 0:
+			bch.fatal ("Benchmarks: no reference results in %s" % reffile)